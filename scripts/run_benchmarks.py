@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Run scripted-provider FLY benchmarks and compare against a baseline."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Allow direct execution from repository root without installation.
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark FLY orchestration with a scripted LLM provider.",
+    )
+    parser.add_argument(
+        "--fixtures-root",
+        type=Path,
+        default=REPO_ROOT / "benchmarks" / "fixtures",
+        help="Benchmark fixture directory (default: benchmarks/fixtures)",
+    )
+    parser.add_argument(
+        "--fixture",
+        action="append",
+        default=[],
+        help="Only run the named fixture (repeatable)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per fixture; the report uses medians (default: 3)",
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiply recorded model latency (0 disables it; default: 1.0)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit the full JSON report on stdout",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Write the JSON report to this path",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Compare against a previously saved report; exit 1 on regression",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative increase over baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        help="Write this run's report as the new baseline",
+    )
+    return parser
+
+
+def _isolate_user_dirs(root: Path) -> None:
+    """Keep benchmark runs from reading or writing real user state."""
+    for name in ("XDG_CONFIG_HOME", "XDG_DATA_HOME", "XDG_STATE_HOME"):
+        path = root / name.lower()
+        path.mkdir(parents=True, exist_ok=True)
+        os.environ[name] = str(path)
+
+
+def _render_text(report: dict[str, Any]) -> str:
+    lines = [f"Python {report['python']} on {report['platform']}", ""]
+    for name, fixture in report["fixtures"].items():
+        summary = fixture["summary"]
+        lines.append(
+            f"{name}: {', '.join(summary['results'])} "
+            f"(median of {len(fixture['samples'])})"
+        )
+        lines.append(
+            f"  wall {summary['wall_seconds']:.3f}s  "
+            f"overhead {summary['overhead_seconds']:.3f}s  "
+            f"cpu {summary['cpu_seconds']:.3f}s  "
+            f"child cpu {summary['child_cpu_seconds']:.3f}s"
+        )
+        lines.append(
+            f"  peak rss {summary['peak_rss_kb'] / 1024:.1f} MiB  "
+            f"file opens {summary['file_opens']:g} "
+            f"({summary['file_reads']:g} read / {summary['file_writes']:g} write)"
+        )
+        phases = "  ".join(
+            f"{phase} {seconds:.3f}s" for phase, seconds in summary["phases"].items()
+        )
+        lines.append(f"  phases: {phases}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    logging.basicConfig(level=logging.WARNING)
+    with tempfile.TemporaryDirectory(prefix="waypoints-bench-home-") as home:
+        _isolate_user_dirs(Path(home))
+        from waypoints.benchmarks import (
+            build_report,
+            compare_to_baseline,
+            discover_fixtures,
+            run_benchmarks,
+        )
+
+        fixtures = discover_fixtures(args.fixtures_root)
+        if args.fixture:
+            fixtures = [f for f in fixtures if f.name in set(args.fixture)]
+        if not fixtures:
+            parser.error(f"No benchmark fixtures found in {args.fixtures_root}")
+
+        results = run_benchmarks(
+            fixtures,
+            repeat=args.repeat,
+            latency_scale=args.latency_scale,
+        )
+    report = build_report(results)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(_render_text(report))
+    for path in (args.output, args.save_baseline):
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    exit_code = 0
+    if any(
+        result != "success"
+        for fixture in report["fixtures"].values()
+        for result in fixture["summary"]["results"]
+    ):
+        exit_code = 1
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(report, baseline, tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression.describe()}", file=sys.stderr)
+        if regressions:
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -51,6 +51,24 @@ def _build_parser() -> argparse.ArgumentParser:
         default=600,
         help="Per-case smoke test timeout in seconds (default: 600)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Run up to N smoke tests concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run cases even if unchanged since their last passing run",
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        default=None,
+        help="Result cache location (default: ~/.cache/waypoints/flight-tests)",
+    )
     return parser
 
 
@@ -63,6 +81,8 @@ def _result_to_dict(result: Any) -> dict[str, Any]:
         "return_code": result.return_code,
         "stdout": result.stdout,
         "stderr": result.stderr,
+        "duration_seconds": result.duration_seconds,
+        "cached": result.cached,
     }
 
 
@@ -89,6 +109,7 @@ def _exit_code(results: list[Any]) -> int:
 
 def main() -> int:
     from waypoints.flight_tests import (
+        FlightTestResultCache,
         discover_flight_tests,
         execute_flight_tests,
         parse_level_selector,
@@ -101,15 +122,23 @@ def main() -> int:
         selected_levels = parse_level_selector(args.level)
     except ValueError as exc:
         parser.error(str(exc))
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     discovered = discover_flight_tests(args.suite_root)
     selected = [case for case in discovered if case.level in selected_levels]
 
+    result_cache = None
+    if args.execute and not args.no_cache:
+        result_cache = FlightTestResultCache(args.cache_file)
+
     results = execute_flight_tests(
         selected,
         generated_projects_root=args.projects_root,
         execute=args.execute,
         timeout_seconds=args.timeout_seconds,
+        jobs=args.jobs,
+        result_cache=result_cache,
     )
 
     if args.json:
@@ -117,6 +146,7 @@ def main() -> int:
             "suite_root": str(args.suite_root),
             "projects_root": str(args.projects_root),
             "execute": args.execute,
+            "jobs": args.jobs,
             "levels": sorted(selected_levels),
             "results": [_result_to_dict(result) for result in results],
         }
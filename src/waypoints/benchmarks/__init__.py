@@ -0,0 +1,25 @@
+"""Scripted-provider benchmarks for end-to-end FLY orchestration."""
+
+from waypoints.benchmarks.harness import (
+    BenchmarkFixture,
+    BenchmarkRegression,
+    BenchmarkResult,
+    BenchmarkSample,
+    build_report,
+    compare_to_baseline,
+    discover_fixtures,
+    run_benchmarks,
+    run_fixture,
+)
+
+__all__ = [
+    "BenchmarkFixture",
+    "BenchmarkRegression",
+    "BenchmarkResult",
+    "BenchmarkSample",
+    "build_report",
+    "compare_to_baseline",
+    "discover_fixtures",
+    "run_benchmarks",
+    "run_fixture",
+]
@@ -0,0 +1,459 @@
+"""End-to-end FLY benchmarks driven by a scripted provider.
+
+A benchmark fixture pairs a waypoint (plus spec and validation overrides)
+with a recorded transcript. Each run creates a scratch project, replays the
+transcript through :class:`~waypoints.llm.providers.scripted.ScriptedProvider`
+and drives the real :class:`~waypoints.fly.executor.WaypointExecutor` and
+receipt finalizer, so the measurements capture orchestration overhead
+independently of model latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from waypoints.fly.types import ExecutionContext
+from waypoints.llm.providers.scripted import (
+    ScriptedLatency,
+    ScriptedProvider,
+    ScriptedTranscript,
+)
+from waypoints.models.project import Project
+from waypoints.models.waypoint import Waypoint
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX hosts
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_SCHEMA_VERSION = 1
+FIXTURE_FILENAME = "fixture.json"
+DEFAULT_TOLERANCE = 0.25
+
+# Metrics compared against a baseline, with the absolute slack below which a
+# relative increase is treated as noise.
+COMPARED_METRICS: dict[str, float] = {
+    "wall_seconds": 0.05,
+    "cpu_seconds": 0.05,
+    "file_opens": 5,
+    "peak_rss_kb": 4096,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkFixture:
+    """A benchmark scenario loaded from ``<dir>/fixture.json``."""
+
+    name: str
+    path: Path
+    spec: str
+    idea: str
+    waypoint: dict[str, Any]
+    transcript_path: Path
+    validation_overrides: dict[str, str] = field(default_factory=dict)
+    latency: ScriptedLatency = field(default_factory=ScriptedLatency)
+    seed_dir: Path | None = None
+
+    @classmethod
+    def load(cls, fixture_dir: Path) -> BenchmarkFixture:
+        data = json.loads((fixture_dir / FIXTURE_FILENAME).read_text("utf-8"))
+        idea = str(data.get("idea", ""))
+        if idea_file := data.get("idea_file"):
+            idea = (fixture_dir / idea_file).read_text(encoding="utf-8").strip()
+        seed = data.get("seed_dir")
+        return cls(
+            name=str(data.get("name") or fixture_dir.name),
+            path=fixture_dir,
+            spec=str(data.get("spec", "")),
+            idea=idea,
+            waypoint=dict(data["waypoint"]),
+            transcript_path=fixture_dir / data.get("transcript", "transcript.json"),
+            validation_overrides=dict(data.get("validation_overrides") or {}),
+            latency=ScriptedLatency.from_dict(data.get("latency") or {}),
+            seed_dir=fixture_dir / seed if seed else None,
+        )
+
+
+def discover_fixtures(root: Path) -> list[BenchmarkFixture]:
+    """Load every fixture directory under ``root``."""
+    if not root.exists():
+        return []
+    return [
+        BenchmarkFixture.load(candidate)
+        for candidate in sorted(root.iterdir())
+        if (candidate / FIXTURE_FILENAME).is_file()
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkSample:
+    """Measurements from one fixture run."""
+
+    result: str
+    wall_seconds: float
+    cpu_seconds: float
+    child_cpu_seconds: float
+    peak_rss_kb: int
+    file_reads: int
+    file_writes: int
+    model_latency_seconds: float
+    llm_calls: dict[str, int]
+    phases: dict[str, float]
+
+    @property
+    def file_opens(self) -> int:
+        return self.file_reads + self.file_writes
+
+    @property
+    def overhead_seconds(self) -> float:
+        """Wall time not spent in simulated model latency."""
+        return max(0.0, self.wall_seconds - self.model_latency_seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "result": self.result,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "child_cpu_seconds": self.child_cpu_seconds,
+            "peak_rss_kb": self.peak_rss_kb,
+            "file_reads": self.file_reads,
+            "file_writes": self.file_writes,
+            "file_opens": self.file_opens,
+            "model_latency_seconds": self.model_latency_seconds,
+            "overhead_seconds": self.overhead_seconds,
+            "llm_calls": dict(self.llm_calls),
+            "phases": dict(self.phases),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """All samples for one fixture."""
+
+    fixture: str
+    samples: tuple[BenchmarkSample, ...]
+
+    def summary(self) -> dict[str, Any]:
+        """Median of each metric across samples."""
+        rows = [sample.to_dict() for sample in self.samples]
+        summary: dict[str, Any] = {
+            "results": sorted({row["result"] for row in rows}),
+            "llm_calls": rows[0]["llm_calls"] if rows else {},
+        }
+        for key in (
+            "wall_seconds",
+            "cpu_seconds",
+            "child_cpu_seconds",
+            "peak_rss_kb",
+            "file_reads",
+            "file_writes",
+            "file_opens",
+            "model_latency_seconds",
+            "overhead_seconds",
+        ):
+            summary[key] = statistics.median(row[key] for row in rows)
+        phase_names = sorted({name for row in rows for name in row["phases"]})
+        summary["phases"] = {
+            name: statistics.median(row["phases"].get(name, 0.0) for row in rows)
+            for name in phase_names
+        }
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "fixture": self.fixture,
+            "summary": self.summary(),
+            "samples": [sample.to_dict() for sample in self.samples],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkRegression:
+    """A metric that exceeded the baseline beyond tolerance."""
+
+    fixture: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def describe(self) -> str:
+        return (
+            f"{self.fixture}: {self.metric} {self.baseline:g} -> {self.current:g} "
+            f"({self.ratio:.2f}x)"
+        )
+
+
+@dataclass
+class _BenchmarkProject(Project):
+    """Project rooted in a scratch directory instead of the projects root."""
+
+    root: Path = field(default_factory=Path.cwd, kw_only=True)
+
+    def get_path(self) -> Path:
+        return self.root
+
+
+class _PhaseTimer:
+    """Attributes wall time to phases based on executor progress events."""
+
+    def __init__(self) -> None:
+        self._phase = "prepare"
+        self._started = time.perf_counter()
+        self.durations: dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        if phase == self._phase:
+            return
+        now = time.perf_counter()
+        self.durations[self._phase] = (
+            self.durations.get(self._phase, 0.0) + now - self._started
+        )
+        self._phase, self._started = phase, now
+
+    def on_progress(self, ctx: ExecutionContext) -> None:
+        if ctx.step in {"executing", "streaming", "tool_use"}:
+            self.mark("builder")
+        elif ctx.step == "finalizing":
+            if ctx.output.startswith("Verifying"):
+                self.mark("verifier")
+            elif self._phase != "verifier":
+                self.mark("host_validation")
+
+    def finish(self) -> dict[str, float]:
+        self.mark("done")
+        return dict(self.durations)
+
+
+class _FileIOCounter:
+    """Counts ``open`` audit events while active.
+
+    Audit hooks cannot be removed, so a single hook is installed lazily and
+    gated by the ``active`` flag.
+    """
+
+    active: _FileIOCounter | None = None
+    _installed = False
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.writes = 0
+
+    @classmethod
+    def _hook(cls, event: str, args: tuple[Any, ...]) -> None:
+        counter = cls.active
+        if counter is None or event != "open":
+            return
+        mode = args[1] if len(args) > 1 else None
+        flags = args[2] if len(args) > 2 else 0
+        writing = (
+            any(ch in mode for ch in "wax+")
+            if isinstance(mode, str)
+            else bool(flags & (os.O_WRONLY | os.O_RDWR))
+        )
+        if writing:
+            counter.writes += 1
+        else:
+            counter.reads += 1
+
+    @classmethod
+    @contextmanager
+    def counting(cls) -> Iterator[_FileIOCounter]:
+        if not cls._installed:
+            sys.addaudithook(cls._hook)
+            cls._installed = True
+        counter = cls()
+        cls.active = counter
+        try:
+            yield counter
+        finally:
+            cls.active = None
+
+
+def _child_cpu_seconds() -> float:
+    if resource is None:
+        return 0.0
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss_kb() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and KiB on Linux.
+    return int(peak // 1024) if sys.platform == "darwin" else int(peak)
+
+
+def _prepare_project(fixture: BenchmarkFixture, project_dir: Path) -> Project:
+    from waypoints.git.config import Checklist
+
+    if fixture.seed_dir is not None:
+        shutil.copytree(fixture.seed_dir, project_dir, dirs_exist_ok=True)
+    now = datetime.now(UTC)
+    project = _BenchmarkProject(
+        name=fixture.name,
+        slug=fixture.name.lower(),
+        created_at=now,
+        updated_at=now,
+        initial_idea=fixture.idea,
+        root=project_dir,
+    )
+    project.save()
+    (project.get_docs_path() / "product-spec.md").write_text(
+        fixture.spec, encoding="utf-8"
+    )
+    Checklist(validation_overrides=dict(fixture.validation_overrides)).save(project)
+    return project
+
+
+def run_fixture(
+    fixture: BenchmarkFixture,
+    *,
+    work_dir: Path,
+    latency_scale: float = 1.0,
+) -> BenchmarkSample:
+    """Run one fixture end to end in ``work_dir`` and measure it."""
+    from waypoints.fly.executor import WaypointExecutor
+    from waypoints.fly.intervention import InterventionNeededError
+    from waypoints.fly.types import ExecutionResult
+    from waypoints.llm.client import use_provider
+    from waypoints.llm.metrics import MetricsCollector
+
+    project = _prepare_project(fixture, work_dir)
+    latency = ScriptedLatency(
+        first_event_ms=fixture.latency.first_event_ms * latency_scale,
+        per_event_ms=fixture.latency.per_event_ms * latency_scale,
+    )
+    provider = ScriptedProvider(
+        ScriptedTranscript.load(fixture.transcript_path), latency=latency
+    )
+    waypoint = Waypoint.from_dict(dict(fixture.waypoint))
+    timer = _PhaseTimer()
+
+    child_cpu_before = _child_cpu_seconds()
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+    with use_provider(provider), _FileIOCounter.counting() as io_counter:
+        executor = WaypointExecutor(
+            project=project,
+            waypoint=waypoint,
+            spec=fixture.spec,
+            on_progress=timer.on_progress,
+            metrics_collector=MetricsCollector(project),
+        )
+        try:
+            outcome: str = asyncio.run(executor.execute()).value
+        except InterventionNeededError as exc:
+            outcome = f"intervention:{exc.intervention.type.value}"
+    wall_seconds = time.perf_counter() - wall_before
+    cpu_seconds = time.process_time() - cpu_before
+
+    if outcome != ExecutionResult.SUCCESS.value:
+        logger.warning("Benchmark %s finished with %s", fixture.name, outcome)
+    return BenchmarkSample(
+        result=outcome,
+        wall_seconds=wall_seconds,
+        cpu_seconds=cpu_seconds,
+        child_cpu_seconds=_child_cpu_seconds() - child_cpu_before,
+        peak_rss_kb=_peak_rss_kb(),
+        file_reads=io_counter.reads,
+        file_writes=io_counter.writes,
+        model_latency_seconds=provider.usage.total_latency_seconds,
+        llm_calls=dict(provider.usage.calls),
+        phases=timer.finish(),
+    )
+
+
+def run_benchmarks(
+    fixtures: list[BenchmarkFixture],
+    *,
+    repeat: int = 3,
+    latency_scale: float = 1.0,
+    work_root: Path | None = None,
+) -> list[BenchmarkResult]:
+    """Run each fixture ``repeat`` times in fresh scratch projects."""
+    results: list[BenchmarkResult] = []
+    with tempfile.TemporaryDirectory(
+        prefix="waypoints-bench-", dir=work_root
+    ) as scratch:
+        for fixture in fixtures:
+            samples: list[BenchmarkSample] = []
+            for attempt in range(max(1, repeat)):
+                work_dir = Path(scratch) / f"{fixture.name}-{attempt + 1}"
+                work_dir.mkdir()
+                samples.append(
+                    run_fixture(fixture, work_dir=work_dir, latency_scale=latency_scale)
+                )
+            results.append(
+                BenchmarkResult(fixture=fixture.name, samples=tuple(samples))
+            )
+    return results
+
+
+def build_report(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """JSON-compatible report for a benchmark session."""
+    return {
+        "schema_version": BENCHMARK_SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixtures": {result.fixture: result.to_dict() for result in results},
+    }
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[BenchmarkRegression]:
+    """List metrics that grew more than ``tolerance`` over the baseline.
+
+    Fixtures missing from either report are ignored.
+    """
+    regressions: list[BenchmarkRegression] = []
+    baseline_fixtures = baseline.get("fixtures") or {}
+    for name, current in (report.get("fixtures") or {}).items():
+        previous = baseline_fixtures.get(name)
+        if not previous:
+            continue
+        current_summary = current.get("summary") or {}
+        previous_summary = previous.get("summary") or {}
+        for metric, slack in COMPARED_METRICS.items():
+            before = previous_summary.get(metric)
+            after = current_summary.get(metric)
+            if not isinstance(before, (int, float)):
+                continue
+            if not isinstance(after, (int, float)):
+                continue
+            if after > before * (1 + tolerance) and after - before > slack:
+                regressions.append(
+                    BenchmarkRegression(
+                        fixture=name,
+                        metric=metric,
+                        baseline=float(before),
+                        current=float(after),
+                    )
+                )
+    return regressions
@@ -8,41 +8,19 @@ import os
 from collections.abc import Callable, Sequence
 from pathlib import Path
 
-from waypoints.cli.commands import (
-    cmd_compare,
-    cmd_export,
-    cmd_import,
-    cmd_memory,
-    cmd_run,
-    cmd_tui,
-    cmd_verify,
-    cmd_view,
-)
+from waypoints.cli.commands import COMMAND_REGISTRY, load_command
 from waypoints.cli.parser import parse_args
 
 logger = logging.getLogger(__name__)
 
 
 def dispatch(args: argparse.Namespace) -> int:
-    """Route parsed args to the correct command handler."""
-    command_handlers: dict[str, Callable[[argparse.Namespace], int]] = {
-        "export": cmd_export,
-        "import": cmd_import,
-        "run": cmd_run,
-        "compare": cmd_compare,
-        "view": cmd_view,
-        "verify": cmd_verify,
-        "memory": cmd_memory,
-    }
+    """Route parsed args to the correct command handler.
 
-    if args.command is None:
-        return cmd_tui(args)
-
-    handler = command_handlers.get(args.command)
-    if handler is None:
-        return cmd_tui(args)
-
-    return handler(args)
+    Only the selected handler's module is imported.
+    """
+    command = args.command if args.command in COMMAND_REGISTRY else "tui"
+    return load_command(command)(args)
 
 
 def run(
@@ -53,6 +31,11 @@ def run(
     """Parse args, apply shared CLI setup, and execute command."""
     args = parse_args(argv)
 
+    if args.profile_startup:
+        from waypoints.cli.startup_profile import profile_startup
+
+        return profile_startup(args.command)
+
     if args.workdir:
         workdir = args.workdir.resolve()
         workdir.mkdir(parents=True, exist_ok=True)
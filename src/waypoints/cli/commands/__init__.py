@@ -1,21 +1,77 @@
-"""CLI command handlers."""
+"""CLI command handlers.
+
+Handler modules pull in heavy dependencies (Textual, the FLY executor,
+genspec, provider SDKs), so they are imported only when their command is
+dispatched. Attribute access such as ``commands.cmd_export`` still works
+and triggers the same lazy import.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .compare import cmd_compare as cmd_compare
+    from .export import cmd_export as cmd_export
+    from .gc import cmd_gc as cmd_gc
+    from .import_cmd import cmd_import as cmd_import
+    from .memory import cmd_memory as cmd_memory
+    from .run import cmd_run as cmd_run
+    from .tui import cmd_tui as cmd_tui
+    from .verify import cmd_verify as cmd_verify
+    from .view import cmd_view as cmd_view
+
+CommandHandler = Callable[[argparse.Namespace], int]
+
+# Command name -> (handler module relative to this package, handler name).
+COMMAND_REGISTRY: dict[str, tuple[str, str]] = {
+    "compare": (".compare", "cmd_compare"),
+    "export": (".export", "cmd_export"),
+    "gc": (".gc", "cmd_gc"),
+    "import": (".import_cmd", "cmd_import"),
+    "memory": (".memory", "cmd_memory"),
+    "run": (".run", "cmd_run"),
+    "tui": (".tui", "cmd_tui"),
+    "verify": (".verify", "cmd_verify"),
+    "view": (".view", "cmd_view"),
+}
+
+_HANDLER_COMMANDS = {handler: name for name, (_, handler) in COMMAND_REGISTRY.items()}
+
+
+def load_command(name: str) -> CommandHandler:
+    """Import and return the handler for command ``name``.
+
+    Raises:
+        KeyError: If ``name`` is not a registered command.
+    """
+    module_name, handler_name = COMMAND_REGISTRY[name]
+    module = importlib.import_module(module_name, __name__)
+    handler: CommandHandler = getattr(module, handler_name)
+    return handler
+
+
+def __getattr__(name: str) -> CommandHandler:
+    command = _HANDLER_COMMANDS.get(name)
+    if command is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return load_command(command)
 
-from .compare import cmd_compare
-from .export import cmd_export
-from .import_cmd import cmd_import
-from .memory import cmd_memory
-from .run import cmd_run
-from .tui import cmd_tui
-from .verify import cmd_verify
-from .view import cmd_view
 
 __all__ = [
+    "COMMAND_REGISTRY",
+    "CommandHandler",
     "cmd_compare",
     "cmd_export",
+    "cmd_gc",
     "cmd_import",
     "cmd_memory",
     "cmd_run",
     "cmd_tui",
     "cmd_verify",
     "cmd_view",
+    "load_command",
 ]
@@ -6,11 +6,13 @@ import argparse
 import json
 import sys
 
+from waypoints.cli.context import apply_response_cache_flag
 from waypoints.verify.compare import compare_flight_plans, compare_specs
 
 
 def cmd_compare(args: argparse.Namespace) -> int:
     """Compare two artifacts for semantic equivalence."""
+    apply_response_cache_flag(args)
     if not args.artifact_a.exists():
         print(f"Error: File not found: {args.artifact_a}", file=sys.stderr)
         return 1
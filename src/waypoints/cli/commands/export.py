@@ -20,7 +20,12 @@ def cmd_export(args: argparse.Namespace) -> int:
 
     if args.bundle:
         output_path = args.output or Path(f"{args.project}.genspec.zip")
-        export_bundle(spec, output_path)
+        export_bundle(
+            spec,
+            output_path,
+            compresslevel=getattr(args, "compress_level", None),
+            compression=getattr(args, "compression", "deflate"),
+        )
         print(f"Exported bundle with {step_count} steps to {output_path}")
     else:
         output_path = args.output or Path(f"{args.project}.genspec.jsonl")
@@ -0,0 +1,46 @@
+"""GC command for project evidence blob storage."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from waypoints.config.project_root import get_projects_root
+from waypoints.git.receipt_index import ReceiptIndex
+from waypoints.models.blob_store import BlobCompressionUnavailableError, blob_store_for
+from waypoints.models.project import Project
+
+
+def cmd_gc(args: argparse.Namespace) -> int:
+    """Remove evidence blobs no receipt or attachment still uses."""
+    projects: list[Project]
+    if not args.project:
+        projects = Project.list_all()
+        if not projects:
+            print("No projects found to collect.")
+            return 0
+    else:
+        projects_root = get_projects_root()
+        if not (projects_root / args.project).exists():
+            print(f"Error: Project '{args.project}' not found", file=sys.stderr)
+            print(f"  Looked in: {projects_root}", file=sys.stderr)
+            return 1
+        projects = [Project.load(args.project)]
+
+    for project in projects:
+        project_root = project.get_path()
+        referenced = ReceiptIndex(project_root / "receipts").referenced_blobs()
+        try:
+            stats = blob_store_for(project_root).gc(
+                referenced, compress=args.compress, dry_run=args.dry_run
+            )
+        except BlobCompressionUnavailableError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        verb = "would remove" if args.dry_run else "removed"
+        print(
+            f"{project.slug}: {verb} {stats.removed}/{stats.scanned} blobs "
+            f"({stats.freed_bytes} bytes), compressed {stats.compressed} "
+            f"(saved {stats.compressed_saved_bytes} bytes)"
+        )
+    return 0
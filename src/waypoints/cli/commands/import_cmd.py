@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import sys
 
+from waypoints.cli.context import apply_response_cache_flag
 from waypoints.genspec.importer import (
     create_project_from_spec,
     import_from_file,
@@ -16,6 +17,7 @@ from .run import cmd_run
 
 def cmd_import(args: argparse.Namespace) -> int:
     """Import a generative specification to create a new project."""
+    apply_response_cache_flag(args)
     try:
         spec = import_from_file(args.file)
     except FileNotFoundError:
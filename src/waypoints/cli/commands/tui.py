@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import argparse
 
-from waypoints.tui.app import WaypointsApp
-
 
 def cmd_tui(args: argparse.Namespace) -> int:
     """Launch the TUI application."""
     del args
+    # Deferred: Textual and every screen take most of the CLI import time.
+    from waypoints.tui.app import WaypointsApp
+
     app = WaypointsApp()
     app.run()
     return 0
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 import argparse
 
+from waypoints.cli.context import apply_response_cache_flag
 from waypoints.verify.orchestrator import run_verification
 
 
 def cmd_verify(args: argparse.Namespace) -> int:
     """Verify genspec reproducibility."""
+    apply_response_cache_flag(args)
     return run_verification(
         genspec_dir=args.genspec_dir,
         bootstrap=args.bootstrap,
@@ -5,13 +5,23 @@ from __future__ import annotations
 import argparse
 import sys
 
-from waypoints.genspec.viewer import ViewOptions, load_genspec, render_view
+from waypoints.genspec.viewer import (
+    ViewOptions,
+    load_genspec,
+    load_genspec_outline,
+    render_view,
+)
 
 
 def cmd_view(args: argparse.Namespace) -> int:
     """View a genspec JSONL file or bundle."""
+    step_count: int | None = None
     try:
-        spec, metadata, checksums = load_genspec(args.path)
+        if args.no_steps:
+            outline, metadata, checksums = load_genspec_outline(args.path)
+            spec, step_count = outline.spec, outline.step_count
+        else:
+            spec, metadata, checksums = load_genspec(args.path)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -22,6 +32,6 @@ def cmd_view(args: argparse.Namespace) -> int:
         show_preview=not args.no_preview,
         preview_lines=args.preview_lines,
     )
-    output = render_view(spec, metadata, checksums, options)
+    output = render_view(spec, metadata, checksums, options, step_count=step_count)
     print(output)
     return 0
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 
 from waypoints.config.project_root import get_projects_root
+from waypoints.llm.response_cache import enable_response_cache
 from waypoints.models.project import Project
 
 
@@ -29,3 +31,9 @@ def load_project_or_error(slug: str) -> Project | None:
     except FileNotFoundError:
         print(f"Error: Could not load project '{slug}'", file=sys.stderr)
         return None
+
+
+def apply_response_cache_flag(args: argparse.Namespace) -> None:
+    """Enable the LLM response cache when ``--response-cache`` was passed."""
+    if getattr(args, "response_cache", False):
+        enable_response_cache()
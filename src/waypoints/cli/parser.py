@@ -18,6 +18,14 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Working directory for project artifacts (default: current directory)",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help=(
+            "Report import-time breakdown for starting the given command "
+            "(default: TUI) instead of running it"
+        ),
+    )
 
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -42,6 +50,19 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Export as a genspec bundle zip (default: {project}.genspec.zip)",
     )
+    export_parser.add_argument(
+        "--compress-level",
+        type=int,
+        choices=range(10),
+        metavar="0-9",
+        help="Bundle compression level (default: 6 for deflate, 3 for zstd)",
+    )
+    export_parser.add_argument(
+        "--compression",
+        choices=("deflate", "zstd"),
+        default="deflate",
+        help="Bundle compression (zstd is faster but needs a newer zip reader)",
+    )
 
     # Import command
     import_parser = subparsers.add_parser(
@@ -69,6 +90,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Immediately execute waypoints after import",
     )
+    import_parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Reuse cached LLM responses for identical requests",
+    )
 
     # Run command (headless execution)
     run_parser = subparsers.add_parser(
@@ -120,6 +146,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show streaming LLM output",
     )
+    compare_parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Reuse cached LLM responses for identical requests",
+    )
 
     # Verify command
     verify_parser = subparsers.add_parser(
@@ -147,6 +178,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Show detailed progress",
     )
+    verify_parser.add_argument(
+        "--response-cache",
+        action="store_true",
+        help="Reuse cached LLM responses for identical requests",
+    )
 
     # View command (genspec inspection)
     view_parser = subparsers.add_parser(
@@ -231,6 +267,27 @@ def build_parser() -> argparse.ArgumentParser:
         help="Only refresh waypoints with missing/stale spec context",
     )
 
+    # GC command
+    gc_parser = subparsers.add_parser(
+        "gc",
+        help="Remove unreferenced evidence blobs",
+    )
+    gc_parser.add_argument(
+        "project",
+        nargs="?",
+        help="Project slug to collect (default: all projects)",
+    )
+    gc_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be removed without deleting anything",
+    )
+    gc_parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="Also zstd-compress large blobs referenced only by old receipts",
+    )
+
     return parser
 
 
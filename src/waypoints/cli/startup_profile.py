@@ -0,0 +1,128 @@
+"""Import-time profile for CLI startup (``waypoints --profile-startup``).
+
+Headless pipelines invoke the CLI many times, so the import cost paid before
+a command does any work matters. This re-imports the entrypoint and the
+selected command's handler in a fresh interpreter under ``-X importtime``
+and summarizes where the time went, without running the command itself.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TextIO
+
+DEFAULT_TOP_MODULES = 20
+
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<name>\s*\S+)$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTiming:
+    """One ``-X importtime`` record, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        """Top-level distribution package the module belongs to."""
+        return self.module.split(".", 1)[0]
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse ``-X importtime`` stderr into records, ignoring other lines."""
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        name = match.group("name")
+        module = name.lstrip()
+        # The first indent is a single separator space; each level adds two.
+        depth = (len(name) - len(module) - 1) // 2
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(match.group("self")),
+                cumulative_us=int(match.group("cumulative")),
+                depth=depth,
+            )
+        )
+    return timings
+
+
+def format_startup_report(
+    command: str,
+    timings: list[ImportTiming],
+    *,
+    top: int = DEFAULT_TOP_MODULES,
+) -> str:
+    """Render totals, a per-package rollup, and the slowest modules."""
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    by_package: dict[str, int] = defaultdict(int)
+    for timing in timings:
+        by_package[timing.package] += timing.self_us
+
+    lines = [
+        f"Startup import profile for `waypoints {command}`",
+        f"  {len(timings)} modules, {total_us / 1000:.1f} ms total",
+        "",
+        "By package (self time):",
+    ]
+    packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)
+    for package, self_us in packages[:top]:
+        lines.append(f"  {self_us / 1000:9.1f} ms  {package}")
+    lines.extend(["", "Slowest modules (self ms | cumulative ms | module):"])
+    slowest = sorted(timings, key=lambda t: t.self_us, reverse=True)
+    for timing in slowest[:top]:
+        lines.append(
+            f"  {timing.self_us / 1000:9.1f} | {timing.cumulative_us / 1000:9.1f}"
+            f" | {timing.module}"
+        )
+    return "\n".join(lines)
+
+
+def profile_startup(
+    command: str | None,
+    *,
+    top: int = DEFAULT_TOP_MODULES,
+    stream: TextIO | None = None,
+) -> int:
+    """Profile importing the CLI and ``command``'s handler; return exit code."""
+    out = stream or sys.stdout
+    name = command or "tui"
+    code = (
+        "import waypoints.main\n"
+        "from waypoints.cli.commands import load_command\n"
+        f"load_command({name!r})\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    timings = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        errors = [
+            line
+            for line in result.stderr.splitlines()
+            if not _IMPORTTIME_LINE.match(line)
+        ]
+        print(f"Startup profile failed for `waypoints {name}`:", file=sys.stderr)
+        print("\n".join(errors[-20:]), file=sys.stderr)
+        return result.returncode
+    print(format_startup_report(name, timings, top=top), file=out)
+    return 0
@@ -276,6 +276,22 @@ class Settings:
         llm["use_web_auth"] = value
         self.set("llm", llm)
 
+    @property
+    def llm_rate_limits(self) -> dict[str, dict[str, Any]]:
+        """Per-lane LLM scheduler limits.
+
+        Keys are ``"<provider>/<model>"`` or ``"<provider>"``; values may set
+        ``requests_per_minute``, ``tokens_per_minute``,
+        ``initial_concurrency`` and ``max_concurrency``.
+        """
+        llm = self._data.get("llm", {})
+        raw = llm.get("rate_limits", {})
+        if not isinstance(raw, dict):
+            return {}
+        return {
+            str(key): value for key, value in raw.items() if isinstance(value, dict)
+        }
+
     # --- Fly Multi-Agent Rollout Settings ---
 
     def _get_fly_settings(self) -> dict[str, Any]:
@@ -388,6 +404,44 @@ class Settings:
         fly["multi_agent"] = multi_agent
         self._set_fly_settings(fly)
 
+    @property
+    def fly_multi_agent_speculative_verifier(self) -> bool:
+        """Whether the verifier may start while host validations still run."""
+        fly = self._get_fly_settings()
+        multi_agent = fly.get("multi_agent", {})
+        if not isinstance(multi_agent, dict):
+            return True
+        return bool(multi_agent.get("speculative_verifier", True))
+
+    @fly_multi_agent_speculative_verifier.setter
+    def fly_multi_agent_speculative_verifier(self, value: bool) -> None:
+        fly = self._get_fly_settings()
+        multi_agent = fly.get("multi_agent", {})
+        if not isinstance(multi_agent, dict):
+            multi_agent = {}
+        multi_agent["speculative_verifier"] = bool(value)
+        fly["multi_agent"] = multi_agent
+        self._set_fly_settings(fly)
+
+    @property
+    def fly_multi_agent_isolated_validation(self) -> bool:
+        """Whether host validations run in a frozen workspace snapshot."""
+        fly = self._get_fly_settings()
+        multi_agent = fly.get("multi_agent", {})
+        if not isinstance(multi_agent, dict):
+            return False
+        return bool(multi_agent.get("isolated_validation", False))
+
+    @fly_multi_agent_isolated_validation.setter
+    def fly_multi_agent_isolated_validation(self, value: bool) -> None:
+        fly = self._get_fly_settings()
+        multi_agent = fly.get("multi_agent", {})
+        if not isinstance(multi_agent, dict):
+            multi_agent = {}
+        multi_agent["isolated_validation"] = bool(value)
+        fly["multi_agent"] = multi_agent
+        self._set_fly_settings(fly)
+
     @property
     def fly_context_prompt_budget_chars(self) -> int:
         """Prompt context budget for builder/verifier context slices."""
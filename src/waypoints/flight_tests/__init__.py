@@ -1,5 +1,9 @@
 """Flight test discovery and execution helpers."""
 
+from waypoints.flight_tests.result_cache import (
+    FlightTestResultCache,
+    fingerprint_flight_test,
+)
 from waypoints.flight_tests.runner import (
     FlightTestCase,
     FlightTestResult,
@@ -13,9 +17,11 @@ from waypoints.flight_tests.runner import (
 __all__ = [
     "FlightTestCase",
     "FlightTestResult",
+    "FlightTestResultCache",
     "FlightTestStatus",
     "discover_flight_tests",
     "execute_flight_tests",
+    "fingerprint_flight_test",
     "parse_level_selector",
     "validate_flight_test_case",
 ]
@@ -0,0 +1,137 @@
+"""Remember which flight test inputs last passed so unchanged cases can skip."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from waypoints.config.paths import get_paths
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_SCHEMA_VERSION = 1
+
+# Directories inside a generated project that do not affect smoke tests but
+# churn between runs (tool caches, virtualenvs, VCS metadata).
+FINGERPRINT_IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "target",
+    }
+)
+
+
+def default_result_cache_path() -> Path:
+    """Default on-disk location of the flight test result cache."""
+    return get_paths().global_cache_dir / "flight-tests" / "passing.json"
+
+
+def fingerprint_flight_test(smoke_test_script: Path, project_path: Path) -> str:
+    """Hash the smoke script and generated project tree.
+
+    Files are visited in sorted relative-path order so the digest is stable
+    across filesystems; ignored directories are pruned.
+    """
+    digest = hashlib.sha256()
+    digest.update(b"script\0")
+    digest.update(_file_digest(smoke_test_script))
+
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs if d not in FINGERPRINT_IGNORED_DIRS)
+        root_path = Path(root)
+        for name in sorted(files):
+            file_path = root_path / name
+            if file_path.is_symlink() or not file_path.is_file():
+                continue
+            relative = file_path.relative_to(project_path).as_posix()
+            digest.update(b"\0file\0" + relative.encode("utf-8") + b"\0")
+            digest.update(_file_digest(file_path))
+    return digest.hexdigest()
+
+
+def _file_digest(path: Path) -> bytes:
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").digest()
+
+
+class FlightTestResultCache:
+    """Fingerprints of the last passing run per flight test case."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or default_result_cache_path()
+        self._passing: dict[str, str] = {}
+        self._dirty = False
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        """Location of the cache file."""
+        return self._path
+
+    def is_unchanged_pass(self, case_id: str, fingerprint: str) -> bool:
+        """Whether the case last passed with exactly these inputs."""
+        return self._passing.get(case_id) == fingerprint
+
+    def record_pass(self, case_id: str, fingerprint: str) -> None:
+        """Remember a passing run."""
+        if self._passing.get(case_id) != fingerprint:
+            self._passing[case_id] = fingerprint
+            self._dirty = True
+
+    def forget(self, case_id: str) -> None:
+        """Drop a case so its next run always executes."""
+        if self._passing.pop(case_id, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist pending updates atomically."""
+        if not self._dirty:
+            return
+        payload = {
+            "schema_version": RESULT_CACHE_SCHEMA_VERSION,
+            "passing": dict(sorted(self._passing.items())),
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
+            Path(temp_name).replace(self._path)
+            self._dirty = False
+        except OSError as exc:
+            logger.warning(
+                "Failed to persist flight test cache %s: %s", self._path, exc
+            )
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(
+                "Ignoring unreadable flight test cache %s: %s", self._path, exc
+            )
+            return
+        if not isinstance(raw, dict):
+            return
+        if raw.get("schema_version") != RESULT_CACHE_SCHEMA_VERSION:
+            return
+        passing = raw.get("passing")
+        if isinstance(passing, dict):
+            self._passing = {
+                str(key): value
+                for key, value in passing.items()
+                if isinstance(value, str)
+            }
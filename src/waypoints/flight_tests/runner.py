@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import math
 import os
 import re
+import shlex
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+from waypoints.flight_tests.result_cache import (
+    FlightTestResultCache,
+    fingerprint_flight_test,
+)
 from waypoints.runtime import TimeoutDomain, get_command_runner
+from waypoints.runtime.command_runner import CommandRunner
+from waypoints.runtime.timeout_history import (
+    TimeoutHistory,
+    build_command_key,
+    get_timeout_history,
+)
 
 CASE_DIR_PATTERN = re.compile(r"^L(?P<level>\d+)-(?P<slug>[a-z0-9][a-z0-9-]*)$")
 LEVEL_TOKEN_PATTERN = re.compile(r"^L(?P<level>\d+)$")
@@ -52,6 +66,8 @@ class FlightTestResult:
     return_code: int | None = None
     stdout: str = ""
     stderr: str = ""
+    duration_seconds: float | None = None
+    cached: bool = False
 
 
 def parse_level_selector(selector: str) -> set[int]:
@@ -140,97 +156,188 @@ def execute_flight_tests(
     generated_projects_root: Path,
     execute: bool,
     timeout_seconds: int,
+    jobs: int = 1,
+    result_cache: FlightTestResultCache | None = None,
+    timeout_history: TimeoutHistory | None = None,
 ) -> list[FlightTestResult]:
-    """Execute (or plan) smoke tests for discovered cases."""
-    results: list[FlightTestResult] = []
-    command_runner = get_command_runner()
+    """Execute (or plan) smoke tests for discovered cases.
 
-    for case in cases:
+    With ``jobs > 1`` smoke tests run concurrently, each with its own
+    temporary directory and environment. Cases are started longest-first
+    according to ``timeout_history`` (unknown durations first) so slow
+    cases do not end up on the critical path; results are always returned
+    in input order.
+
+    When ``result_cache`` is given, a case whose smoke script and generated
+    project are byte-identical to its last passing run is skipped, and new
+    passes are recorded.
+    """
+    results: dict[int, FlightTestResult] = {}
+    runnable: list[tuple[int, FlightTestCase, Path, str | None]] = []
+
+    for position, case in enumerate(cases):
         validation_issues = validate_flight_test_case(case)
         if validation_issues:
-            results.append(
-                FlightTestResult(
-                    case=case,
-                    status=FlightTestStatus.ERROR,
-                    message="; ".join(validation_issues),
-                )
+            results[position] = FlightTestResult(
+                case=case,
+                status=FlightTestStatus.ERROR,
+                message="; ".join(validation_issues),
             )
             continue
 
         if not execute:
-            results.append(
-                FlightTestResult(
-                    case=case,
-                    status=FlightTestStatus.PLANNED,
-                    message="planned (use --execute to run smoke test)",
-                )
+            results[position] = FlightTestResult(
+                case=case,
+                status=FlightTestStatus.PLANNED,
+                message="planned (use --execute to run smoke test)",
             )
             continue
 
         project_path = generated_projects_root / case.project_dir_name
         if not project_path.exists():
-            results.append(
-                FlightTestResult(
+            results[position] = FlightTestResult(
+                case=case,
+                status=FlightTestStatus.SKIPPED,
+                message=f"generated project not found: {project_path}",
+            )
+            continue
+
+        fingerprint: str | None = None
+        if result_cache is not None:
+            fingerprint = fingerprint_flight_test(case.smoke_test_script, project_path)
+            if result_cache.is_unchanged_pass(case.case_id, fingerprint):
+                results[position] = FlightTestResult(
                     case=case,
                     status=FlightTestStatus.SKIPPED,
-                    message=f"generated project not found: {project_path}",
+                    message="unchanged since last pass",
+                    cached=True,
                 )
+                continue
+
+        runnable.append((position, case, project_path, fingerprint))
+
+    if runnable:
+        command_runner = get_command_runner()
+        history = timeout_history or get_timeout_history()
+        runnable.sort(
+            key=lambda item: _expected_duration(history, item[1], item[2]),
+            reverse=True,
+        )
+
+        def run(item: tuple[int, FlightTestCase, Path, str | None]) -> None:
+            position, case, project_path, _ = item
+            results[position] = _run_smoke_test(
+                case,
+                project_path=project_path,
+                timeout_seconds=timeout_seconds,
+                command_runner=command_runner,
             )
-            continue
 
+        if jobs > 1 and len(runnable) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(jobs, len(runnable)),
+                thread_name_prefix="flight-test",
+            ) as pool:
+                list(pool.map(run, runnable))
+        else:
+            for item in runnable:
+                run(item)
+
+    if result_cache is not None:
+        for position, case, _, fingerprint in runnable:
+            if results[position].status == FlightTestStatus.PASSED and fingerprint:
+                result_cache.record_pass(case.case_id, fingerprint)
+            else:
+                result_cache.forget(case.case_id)
+        result_cache.save()
+
+    return [results[position] for position in range(len(cases))]
+
+
+def _smoke_test_command(case: FlightTestCase) -> list[str]:
+    return ["bash", str(case.smoke_test_script)]
+
+
+def _smoke_test_key(case: FlightTestCase, project_path: Path) -> str:
+    """Timeout-history key, matching the one CommandRunner derives."""
+    return build_command_key(
+        TimeoutDomain.FLIGHT_TEST,
+        shlex.join(_smoke_test_command(case)),
+        cwd=project_path.resolve(),
+    )
+
+
+def _expected_duration(
+    history: TimeoutHistory, case: FlightTestCase, project_path: Path
+) -> float:
+    snapshot = history.snapshot(_smoke_test_key(case, project_path))
+    if snapshot.runs == 0:
+        return math.inf
+    if snapshot.p90_duration_seconds is not None:
+        return snapshot.p90_duration_seconds
+    return snapshot.max_duration_seconds
+
+
+def _run_smoke_test(
+    case: FlightTestCase,
+    *,
+    project_path: Path,
+    timeout_seconds: int,
+    command_runner: CommandRunner,
+) -> FlightTestResult:
+    """Run one smoke test in its own temp dir and environment."""
+    with tempfile.TemporaryDirectory(
+        prefix=f"waypoints-flight-{case.case_id}-"
+    ) as case_tmp:
         env = {
             **os.environ,
+            "TMPDIR": case_tmp,
+            "TMP": case_tmp,
+            "TEMP": case_tmp,
             "WAYPOINTS_FLIGHT_TEST_ID": case.case_id,
             "WAYPOINTS_FLIGHT_TEST_LEVEL": f"L{case.level}",
             "WAYPOINTS_FLIGHT_TEST_PROJECT": str(project_path),
+            "WAYPOINTS_FLIGHT_TEST_TMPDIR": case_tmp,
         }
 
         try:
             completed = command_runner.run(
-                command=["bash", str(case.smoke_test_script)],
+                command=_smoke_test_command(case),
                 domain=TimeoutDomain.FLIGHT_TEST,
                 cwd=project_path,
                 env=env,
                 requested_timeout_seconds=float(timeout_seconds),
+                command_key=_smoke_test_key(case, project_path),
             )
         except OSError as exc:
-            results.append(
-                FlightTestResult(
-                    case=case,
-                    status=FlightTestStatus.ERROR,
-                    message=f"failed to execute smoke test: {exc}",
-                )
-            )
-            continue
-        if completed.timed_out:
-            results.append(
-                FlightTestResult(
-                    case=case,
-                    status=FlightTestStatus.ERROR,
-                    message=f"timed out after {timeout_seconds}s",
-                    return_code=completed.effective_exit_code,
-                    stdout=completed.stdout,
-                    stderr=completed.stderr,
-                )
-            )
-            continue
-
-        status = (
-            FlightTestStatus.PASSED
-            if completed.effective_exit_code == 0
-            else FlightTestStatus.FAILED
-        )
-        results.append(
-            FlightTestResult(
+            return FlightTestResult(
                 case=case,
-                status=status,
-                message=(
-                    "ok" if status == FlightTestStatus.PASSED else "smoke test failed"
-                ),
-                return_code=completed.effective_exit_code,
-                stdout=completed.stdout,
-                stderr=completed.stderr,
+                status=FlightTestStatus.ERROR,
+                message=f"failed to execute smoke test: {exc}",
             )
+
+    if completed.timed_out:
+        return FlightTestResult(
+            case=case,
+            status=FlightTestStatus.ERROR,
+            message=f"timed out after {timeout_seconds}s",
+            return_code=completed.effective_exit_code,
+            stdout=completed.stdout,
+            stderr=completed.stderr,
+            duration_seconds=completed.total_duration_seconds,
         )
 
-    return results
+    status = (
+        FlightTestStatus.PASSED
+        if completed.effective_exit_code == 0
+        else FlightTestStatus.FAILED
+    )
+    return FlightTestResult(
+        case=case,
+        status=status,
+        message=("ok" if status == FlightTestStatus.PASSED else "smoke test failed"),
+        return_code=completed.effective_exit_code,
+        stdout=completed.stdout,
+        stderr=completed.stderr,
+        duration_seconds=completed.total_duration_seconds,
+    )
@@ -10,21 +10,27 @@ from waypoints.fly.protocol import ClarificationRequest, ClarificationResponse,
 from waypoints.fly.types import _LoopState
 
 MAX_CLARIFICATION_ROUNDS = 2
-_CLARIFICATION_REQUEST_PATTERN = re.compile(
+CLARIFICATION_REQUEST_PATTERN = re.compile(
     r"<clarification-request>\s*(\{.*?\})\s*</clarification-request>",
     re.DOTALL,
 )
 
 
+def parse_clarification_payload(raw: str) -> dict[str, Any] | None:
+    """Parse the JSON body of one ``<clarification-request>`` tag."""
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
 def extract_clarification_payloads(text: str) -> list[dict[str, Any]]:
     """Extract structured clarification payloads from model output tags."""
     payloads: list[dict[str, Any]] = []
-    for match in _CLARIFICATION_REQUEST_PATTERN.findall(text):
-        try:
-            parsed = json.loads(match)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(parsed, dict):
+    for match in CLARIFICATION_REQUEST_PATTERN.findall(text):
+        parsed = parse_clarification_payload(match)
+        if parsed is not None:
             payloads.append(parsed)
     return payloads
 
@@ -55,59 +61,57 @@ def build_clarification_response(
     )
 
 
-def handle_clarification_requests(
+def handle_clarification_payload(
     state: _LoopState,
+    payload: dict[str, Any],
     *,
     waypoint_id: str,
     log_artifact: Callable[[object], None],
 ) -> None:
-    """Capture clarification requests and emit orchestrator responses."""
-    for payload in extract_clarification_payloads(state.full_output):
-        signature = json.dumps(payload, sort_keys=True)
-        if signature in state.clarification_signatures:
-            continue
-        state.clarification_signatures.add(signature)
-
-        question = str(
-            payload.get("question") or payload.get("blocking_question") or ""
-        )
-        context = str(payload.get("context") or payload.get("decision_context", ""))
-        raw_confidence = payload.get("confidence", payload.get("confidence_level", 0))
-        try:
-            confidence = float(raw_confidence)
-        except (TypeError, ValueError):
-            confidence = 0.0
-        options_raw = payload.get("options") or payload.get("requested_options")
-        options: tuple[str, ...] = ()
-        if isinstance(options_raw, list):
-            options = tuple(str(item) for item in options_raw if str(item).strip())
-
-        request = ClarificationRequest(
-            waypoint_id=waypoint_id,
-            produced_by_role=FlyRole.BUILDER,
-            source_refs=("execution-output",),
-            blocking_question=question,
-            decision_context=context,
-            confidence_level=confidence,
-            requested_options=options,
-        )
-        log_artifact(request)
-
-        state.clarification_rounds += 1
-        state.unresolved_clarification = True
-        if state.clarification_rounds > MAX_CLARIFICATION_ROUNDS:
-            state.clarification_exhausted = True
-            state.next_reason_code = "clarification_budget_exhausted"
-            state.next_reason_detail = (
-                "Clarification rounds exhausted. Escalate to intervention."
-            )
-            continue
-
-        response = build_clarification_response(request)
-        log_artifact(response)
-        state.unresolved_clarification = False
-        state.next_reason_code = "clarification_resolved"
+    """Handle one clarification request, ignoring repeats of the same payload."""
+    signature = json.dumps(payload, sort_keys=True)
+    if signature in state.clarification_signatures:
+        return
+    state.clarification_signatures.add(signature)
+
+    question = str(payload.get("question") or payload.get("blocking_question") or "")
+    context = str(payload.get("context") or payload.get("decision_context", ""))
+    raw_confidence = payload.get("confidence", payload.get("confidence_level", 0))
+    try:
+        confidence = float(raw_confidence)
+    except (TypeError, ValueError):
+        confidence = 0.0
+    options_raw = payload.get("options") or payload.get("requested_options")
+    options: tuple[str, ...] = ()
+    if isinstance(options_raw, list):
+        options = tuple(str(item) for item in options_raw if str(item).strip())
+
+    request = ClarificationRequest(
+        waypoint_id=waypoint_id,
+        produced_by_role=FlyRole.BUILDER,
+        source_refs=("execution-output",),
+        blocking_question=question,
+        decision_context=context,
+        confidence_level=confidence,
+        requested_options=options,
+    )
+    log_artifact(request)
+
+    state.clarification_rounds += 1
+    state.unresolved_clarification = True
+    if state.clarification_rounds > MAX_CLARIFICATION_ROUNDS:
+        state.clarification_exhausted = True
+        state.next_reason_code = "clarification_budget_exhausted"
         state.next_reason_detail = (
-            "Clarification resolved by orchestrator guidance; continue with "
-            "explicit policy constraints."
+            "Clarification rounds exhausted. Escalate to intervention."
         )
+        return
+
+    response = build_clarification_response(request)
+    log_artifact(response)
+    state.unresolved_clarification = False
+    state.next_reason_code = "clarification_resolved"
+    state.next_reason_detail = (
+        "Clarification resolved by orchestrator guidance; continue with "
+        "explicit policy constraints."
+    )
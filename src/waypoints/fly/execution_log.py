@@ -7,6 +7,9 @@ Each execution creates a log file: fly-{waypoint_id}-{timestamp}.jsonl
 """
 
 import json
+import logging
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
@@ -20,6 +23,55 @@ if TYPE_CHECKING:
     from waypoints.models.project import Project
     from waypoints.models.waypoint import Waypoint
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutionCompleted:
+    """Event published when an execution log records its completion."""
+
+    project_slug: str
+    log_path: Path
+    waypoint_id: str
+    result: str
+    duration_seconds: int
+
+
+type ExecutionCompletedListener = Callable[[ExecutionCompleted], None]
+
+_completion_listeners: list[ExecutionCompletedListener] = []
+_completion_listeners_lock = threading.Lock()
+
+
+def subscribe_execution_completed(
+    listener: ExecutionCompletedListener,
+) -> Callable[[], None]:
+    """Call ``listener`` for every completed execution log.
+
+    Listeners run on the thread that wrote the completion record (the FLY
+    worker), so they must be cheap and thread-safe. Returns a function that
+    removes the subscription.
+    """
+    with _completion_listeners_lock:
+        _completion_listeners.append(listener)
+
+    def unsubscribe() -> None:
+        with _completion_listeners_lock:
+            if listener in _completion_listeners:
+                _completion_listeners.remove(listener)
+
+    return unsubscribe
+
+
+def _publish_execution_completed(event: ExecutionCompleted) -> None:
+    with _completion_listeners_lock:
+        listeners = list(_completion_listeners)
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Execution completion listener failed")
+
 
 @dataclass
 class ExecutionEntry:
@@ -289,15 +341,26 @@ class ExecutionLogWriter:
 
     def log_completion(self, result: str) -> None:
         """Log execution completion with final result."""
+        completed_at = datetime.now(UTC)
+        duration = (completed_at - self.started_at).total_seconds()
         entry = {
             "type": "completion",
             "result": result,
             "total_cost_usd": self.total_cost_usd,
             "started_at": self.started_at.isoformat(),
-            "completed_at": datetime.now(UTC).isoformat(),
-            "duration_seconds": (datetime.now(UTC) - self.started_at).total_seconds(),
+            "completed_at": completed_at.isoformat(),
+            "duration_seconds": duration,
         }
         self._append(entry)
+        _publish_execution_completed(
+            ExecutionCompleted(
+                project_slug=self.project.slug,
+                log_path=self.file_path,
+                waypoint_id=self.waypoint.id,
+                result=result,
+                duration_seconds=int(duration),
+            )
+        )
 
     def log_intervention_needed(
         self, iteration: int, intervention_type: str, reason: str
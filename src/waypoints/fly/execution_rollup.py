@@ -0,0 +1,175 @@
+"""Persisted execution-time rollup over FLY execution logs.
+
+Summing execution time means loading every execution log, which gets slower
+with each waypoint run. The rollup keeps one ``(mtime, size, seconds)``
+entry per log in ``sessions/fly/execution-time.json``: a cold start only
+re-reads logs whose stat fingerprint changed, and completion events from
+:class:`~waypoints.fly.execution_log.ExecutionLogWriter` update the total in
+place without touching other logs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from waypoints.fly.execution_log import ExecutionCompleted, ExecutionLogReader
+
+if TYPE_CHECKING:
+    from waypoints.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_FILENAME = "execution-time.json"
+ROLLUP_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class _LogRollup:
+    mtime_ns: int
+    size: int
+    seconds: int
+
+
+class ExecutionTimeRollup:
+    """Total completed execution time for one project, kept incrementally."""
+
+    def __init__(self, project: Project) -> None:
+        self._project = project
+        self._path = project.get_sessions_path() / "fly" / ROLLUP_FILENAME
+        self._entries: dict[str, _LogRollup] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, project: Project) -> ExecutionTimeRollup:
+        """Cold-start from the persisted rollup, re-reading only changed logs."""
+        rollup = cls(project)
+        rollup._entries = rollup._read()
+        rollup.refresh()
+        return rollup
+
+    @property
+    def path(self) -> Path:
+        """Location of the persisted rollup."""
+        return self._path
+
+    @property
+    def total_seconds(self) -> int:
+        """Completed execution time across all logs, in seconds."""
+        return self._total
+
+    def refresh(self) -> None:
+        """Reconcile entries with the logs on disk and persist any change."""
+        with self._lock:
+            current: dict[str, _LogRollup] = {}
+            for log_path in ExecutionLogReader.list_logs(self._project):
+                try:
+                    stat = log_path.stat()
+                except OSError:
+                    continue
+                cached = self._entries.get(log_path.name)
+                if (
+                    cached is not None
+                    and cached.mtime_ns == stat.st_mtime_ns
+                    and cached.size == stat.st_size
+                ):
+                    current[log_path.name] = cached
+                    continue
+                seconds = _log_seconds(log_path)
+                try:
+                    # Loading may migrate a legacy log in place; fingerprint
+                    # the file as it is after that rewrite.
+                    stat = log_path.stat()
+                except OSError:
+                    continue
+                current[log_path.name] = _LogRollup(
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                    seconds=seconds,
+                )
+            changed = current != self._entries
+            self._entries = current
+            self._total = sum(entry.seconds for entry in current.values())
+            if changed:
+                self._write()
+
+    def record(self, event: ExecutionCompleted) -> bool:
+        """Apply one completion event; return whether it was for this project."""
+        if event.project_slug != self._project.slug:
+            return False
+        with self._lock:
+            try:
+                stat = event.log_path.stat()
+                mtime_ns, size = stat.st_mtime_ns, stat.st_size
+            except OSError:
+                # Unknown fingerprint: the next cold start re-reads the log.
+                mtime_ns, size = -1, -1
+            previous = self._entries.get(event.log_path.name)
+            self._entries[event.log_path.name] = _LogRollup(
+                mtime_ns=mtime_ns,
+                size=size,
+                seconds=event.duration_seconds,
+            )
+            self._total += event.duration_seconds - (
+                previous.seconds if previous else 0
+            )
+            self._write()
+        return True
+
+    def _read(self) -> dict[str, _LogRollup]:
+        if not self._path.exists():
+            return {}
+        try:
+            raw = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Ignoring unreadable rollup %s: %s", self._path, exc)
+            return {}
+        if not isinstance(raw, dict):
+            return {}
+        if raw.get("schema_version") != ROLLUP_SCHEMA_VERSION:
+            return {}
+        logs = raw.get("logs")
+        if not isinstance(logs, dict):
+            return {}
+        entries: dict[str, _LogRollup] = {}
+        for name, value in logs.items():
+            if not isinstance(value, list) or len(value) != 3:
+                continue
+            if not all(isinstance(item, int) for item in value):
+                continue
+            entries[str(name)] = _LogRollup(*value)
+        return entries
+
+    def _write(self) -> None:
+        payload = {
+            "schema_version": ROLLUP_SCHEMA_VERSION,
+            "logs": {
+                name: [entry.mtime_ns, entry.size, entry.seconds]
+                for name, entry in sorted(self._entries.items())
+            },
+        }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            Path(temp_name).replace(self._path)
+        except OSError as exc:
+            logger.warning("Failed to persist rollup %s: %s", self._path, exc)
+
+
+def _log_seconds(log_path: Path) -> int:
+    try:
+        log = ExecutionLogReader.load(log_path)
+    except Exception:
+        return 0
+    if log.completed_at and log.started_at:
+        return int((log.completed_at - log.started_at).total_seconds())
+    return 0
@@ -12,7 +12,7 @@ from waypoints.fly.clarification_runtime import (
     MAX_CLARIFICATION_ROUNDS as _MAX_CLARIFICATION_ROUNDS,
 )
 from waypoints.fly.clarification_runtime import (
-    handle_clarification_requests as _handle_clarification_requests_runtime,
+    handle_clarification_payload as _handle_clarification_payload_runtime,
 )
 from waypoints.fly.context_envelope import (
     apply_context_envelope,
@@ -24,8 +24,6 @@ from waypoints.fly.escalation_policy import (
     detect_protocol_issues,
 )
 from waypoints.fly.evidence import (
-    CRITERION_PATTERN,
-    VALIDATION_PATTERN,
     FileOperation,
 )
 from waypoints.fly.evidence import (
@@ -44,9 +42,13 @@ from waypoints.fly.execution_log import ExecutionLogWriter
 from waypoints.fly.executor_runtime import (
     apply_stream_complete_metrics,
     build_protocol_progress_payload,
+    capture_workspace_before,
     dedupe_non_blank,
     log_iteration_end_with_usage,
+    log_workspace_provenance,
     persist_waypoint_memory,
+    record_criterion,
+    record_reported_validation,
     summarize_failed_bash_command,
     truncate_output_tail,
     validate_no_external_changes,
@@ -72,15 +74,17 @@ from waypoints.fly.kickoff_prompt import (
 from waypoints.fly.protocol import (
     FlyRole,
     GuidancePacket,
-    parse_stage_reports,
-)
-from waypoints.fly.provenance import (
-    WorkspaceDiffSummary,
-    WorkspaceSnapshot,
-    capture_workspace_snapshot,
-    summarize_workspace_diff,
+    StageReport,
 )
+from waypoints.fly.provenance import WorkspaceDiffSummary, WorkspaceSnapshot
 from waypoints.fly.stack import ValidationCommand
+from waypoints.fly.stream_parser import (
+    ClarificationTag,
+    CompletionMarkerScanner,
+    CriterionTag,
+    StageReportTag,
+    ValidationTag,
+)
 from waypoints.fly.types import (
     ExecutionContext,
     ExecutionResult,
@@ -371,7 +375,8 @@ class WaypointExecutor:
     ) -> tuple[str, float | None]:
         """Run one agent iteration, updating loop state with streamed evidence."""
         assert self._log_writer is not None
-        iteration_output = ""
+        iteration_chunks: list[str] = []
+        marker_scanner = CompletionMarkerScanner(s.completion_marker)
         iteration_cost: float | None = None
         iteration_file_ops: list[FileOperation] = []
         s.iter_scope_drift_detected = False
@@ -381,6 +386,10 @@ class WaypointExecutor:
             None,
             None,
         )
+        # Text streamed after a completion claim in the previous iteration was
+        # not parsed yet; catch up before this iteration's output arrives.
+        self._consume_protocol_tags(s)
+        s.iter_criteria_indices = set()
 
         async for chunk in agent_query(
             prompt=iter_prompt,
@@ -403,10 +412,11 @@ class WaypointExecutor:
             waypoint_id=self.waypoint.id,
         ):
             if isinstance(chunk, StreamChunk):
-                iteration_output = self._handle_stream_text_chunk(
+                self._handle_stream_text_chunk(
                     s=s,
                     chunk=chunk,
-                    iteration_output=iteration_output,
+                    iteration_chunks=iteration_chunks,
+                    marker_scanner=marker_scanner,
                 )
 
             elif isinstance(chunk, StreamToolUse):
@@ -422,51 +432,40 @@ class WaypointExecutor:
                     chunk=chunk,
                 )
 
-        return iteration_output, iteration_cost
+        return "".join(iteration_chunks), iteration_cost
 
     def _handle_stream_text_chunk(
         self,
         *,
         s: _LoopState,
         chunk: StreamChunk,
-        iteration_output: str,
-    ) -> str:
+        iteration_chunks: list[str],
+        marker_scanner: CompletionMarkerScanner,
+    ) -> None:
         """Process a streamed text chunk and update completion/progress state."""
         assert self._log_writer is not None
-        next_output = iteration_output + chunk.text
-        s.full_output += chunk.text
-
-        if not s.completion_detected:
-            self._parse_evidence(s)
-            self._parse_stage_reports(s)
-            if (
-                settings.fly_multi_agent_enabled
-                and settings.fly_multi_agent_clarification_required
-            ):
-                self._handle_clarification_requests(s)
-
-            if s.completion_marker in next_output:
-                logger.info("Completion marker found!")
-                s.completion_detected = True
-                s.completion_iteration = s.iteration
-                s.completion_output = next_output
-                criterion_matches = CRITERION_PATTERN.findall(next_output)
-                s.completion_criteria = {int(m[0]) for m in criterion_matches}
-                self._log_writer.log_completion_detected(s.iteration)
-
+        iteration_chunks.append(chunk.text)
+        s.output_chunks.append(chunk.text)
         if s.completion_detected:
-            return next_output
+            return
+
+        self._consume_protocol_tags(s)
+        if marker_scanner.feed(chunk.text):
+            logger.info("Completion marker found!")
+            s.completion_detected = True
+            s.completion_iteration = s.iteration
+            s.completion_output = "".join(iteration_chunks)
+            s.completion_criteria = set(s.iter_criteria_indices)
+            self._log_writer.log_completion_detected(s.iteration)
+            return
 
-        criterion_matches = CRITERION_PATTERN.findall(s.full_output)
-        completed_indices = {int(m[0]) for m in criterion_matches}
         self._report_progress(
             s.iteration,
             self.max_iterations,
             "streaming",
             chunk.text,
-            criteria_completed=completed_indices,
+            criteria_completed=set(s.captured_criteria),
         )
-        return next_output
 
     def _handle_stream_tool_use_chunk(
         self,
@@ -556,74 +555,55 @@ class WaypointExecutor:
         )
         return iteration_cost
 
-    def _parse_evidence(self, s: _LoopState) -> None:
-        """Parse validation and criterion evidence from accumulated output."""
-        for match in VALIDATION_PATTERN.findall(s.full_output):
-            command, _, _ = match
-            normalized_command = command.strip()
-            if not normalized_command:
-                continue
-            if normalized_command in s.reported_validation_commands:
-                continue
-            s.reported_validation_commands.append(normalized_command)
-            category = _detect_validation_category(normalized_command)
-            if category:
-                logger.info(
-                    "Model reported validation command for %s: %s",
-                    category,
-                    normalized_command,
-                )
-
-        for match in CRITERION_PATTERN.findall(s.full_output):
-            index, status, text, evidence = match
-            idx = int(index)
-            if idx not in s.captured_criteria:
-                s.captured_criteria[idx] = CriterionVerification(
-                    index=idx,
-                    criterion=text.strip(),
-                    status=status,
-                    evidence=evidence.strip(),
-                    verified_at=datetime.now(UTC),
-                )
-                logger.info(
-                    "Captured criterion verification: [%d] %s",
-                    idx,
-                    status,
+    def _consume_protocol_tags(self, s: _LoopState) -> None:
+        """Feed unparsed output to the stream parser and act on new tags."""
+        if s.parsed_output_chunks == len(s.output_chunks):
+            return
+        pending = "".join(s.output_chunks[s.parsed_output_chunks :])
+        s.parsed_output_chunks = len(s.output_chunks)
+        clarification_enabled = (
+            settings.fly_multi_agent_enabled
+            and settings.fly_multi_agent_clarification_required
+        )
+        for tag in s.protocol_parser.feed(pending):
+            if isinstance(tag, ValidationTag):
+                record_reported_validation(s, tag, logger=logger)
+            elif isinstance(tag, CriterionTag):
+                record_criterion(s, tag, logger=logger)
+            elif isinstance(tag, StageReportTag):
+                self._record_stage_report(s, tag.report)
+            elif isinstance(tag, ClarificationTag) and clarification_enabled:
+                _handle_clarification_payload_runtime(
+                    s,
+                    tag.payload,
+                    waypoint_id=self.waypoint.id,
+                    log_artifact=self._log_protocol_artifact_if_supported,
                 )
 
-    def _parse_stage_reports(self, s: _LoopState) -> None:
-        """Parse structured stage reports from accumulated output."""
+    def _record_stage_report(self, s: _LoopState, report: StageReport) -> None:
+        """Log a structured stage report once."""
         assert self._log_writer is not None
-        for report in parse_stage_reports(s.full_output):
-            key = (
-                report.stage,
-                report.success,
-                report.output,
-                tuple(report.artifacts),
-                report.next_stage,
-            )
-            if key in s.logged_stage_reports:
-                continue
-            s.logged_stage_reports.add(key)
-            s.iter_stage_reports_logged += 1
-            self._log_writer.log_stage_report(s.iteration, report)
-            output = report.output.strip()
-            if len(output) > 400:
-                output = output[:400] + "..."
-            summary = f"{report.stage.value}: {output}".strip()
-            self._report_progress(
-                s.iteration,
-                self.max_iterations,
-                "stage",
-                summary,
-            )
-
-    def _handle_clarification_requests(self, s: _LoopState) -> None:
-        """Capture clarification requests and emit orchestrator responses."""
-        _handle_clarification_requests_runtime(
-            s,
-            waypoint_id=self.waypoint.id,
-            log_artifact=self._log_protocol_artifact_if_supported,
+        key = (
+            report.stage,
+            report.success,
+            report.output,
+            tuple(report.artifacts),
+            report.next_stage,
+        )
+        if key in s.logged_stage_reports:
+            return
+        s.logged_stage_reports.add(key)
+        s.iter_stage_reports_logged += 1
+        self._log_writer.log_stage_report(s.iteration, report)
+        output = report.output.strip()
+        if len(output) > 400:
+            output = output[:400] + "..."
+        summary = f"{report.stage.value}: {output}".strip()
+        self._report_progress(
+            s.iteration,
+            self.max_iterations,
+            "stage",
+            summary,
         )
 
     def _log_protocol_artifact_if_supported(self, artifact: Any) -> None:
@@ -761,8 +741,7 @@ class WaypointExecutor:
     ) -> None:
         """Log iteration output and update criteria after a non-completion iteration."""
         assert self._log_writer is not None
-        final_criteria = CRITERION_PATTERN.findall(s.full_output)
-        final_completed = {int(m[0]) for m in final_criteria}
+        final_completed = set(s.captured_criteria)
         self._log_writer.log_output(s.iteration, iteration_output, final_completed)
         log_iteration_end_with_usage(
             log_writer=self._log_writer,
@@ -1232,14 +1211,7 @@ class WaypointExecutor:
         self, project_path: Path
     ) -> WorkspaceSnapshot | None:
         """Capture the workspace state before execution for provenance."""
-        try:
-            return capture_workspace_snapshot(project_path)
-        except Exception:
-            logger.exception(
-                "Failed to capture workspace snapshot before executing %s",
-                self.waypoint.id,
-            )
-            return None
+        return capture_workspace_before(project_path, self.waypoint.id, logger=logger)
 
     def _log_workspace_provenance(
         self,
@@ -1251,21 +1223,15 @@ class WaypointExecutor:
         """Write a workspace diff summary into the execution log."""
         if before_snapshot is None or self._log_writer is None:
             return None
-        try:
-            after_snapshot = capture_workspace_snapshot(project_path)
-            summary = summarize_workspace_diff(before_snapshot, after_snapshot)
-            self._log_writer.log_workspace_diff(
-                iteration=iteration,
-                result=result,
-                summary=summary.to_dict(),
-            )
-            return summary
-        except Exception:
-            logger.exception(
-                "Failed to log workspace provenance for %s",
-                self.waypoint.id,
-            )
-            return None
+        return log_workspace_provenance(
+            self._log_writer,
+            project_path,
+            before_snapshot,
+            waypoint_id=self.waypoint.id,
+            iteration=iteration,
+            result=result,
+            logger=logger,
+        )
 
 
 async def execute_waypoint(
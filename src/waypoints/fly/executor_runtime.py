@@ -7,13 +7,21 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable, Protocol, Sequence
 
-from waypoints.fly.evidence import FileOperation
-from waypoints.fly.provenance import WorkspaceDiffSummary
+from waypoints.fly.evidence import FileOperation, detect_validation_category
+from waypoints.fly.provenance import (
+    WorkspaceDiffSummary,
+    WorkspaceSnapshot,
+    capture_workspace_snapshot,
+    refresh_workspace_snapshot,
+    summarize_workspace_diff,
+)
+from waypoints.fly.stream_parser import CriterionTag, ValidationTag
 from waypoints.fly.types import ExecutionMetricsUpdate, _LoopState
 from waypoints.git.receipt import CapturedEvidence, CriterionVerification
 from waypoints.llm.providers.base import StreamComplete
 from waypoints.memory import WaypointMemoryRecord, save_waypoint_memory
 from waypoints.models.waypoint import Waypoint
+from waypoints.runtime.fs_watcher import get_workspace_watcher
 
 if TYPE_CHECKING:
     from waypoints.fly.execution_log import ExecutionLogWriter
@@ -203,6 +211,42 @@ def apply_stream_complete_metrics(
     return chunk.cost_usd
 
 
+def record_reported_validation(
+    loop_state: _LoopState,
+    tag: ValidationTag,
+    *,
+    logger: logging.Logger,
+) -> None:
+    """Remember a validation command the model reported running."""
+    command = tag.command.strip()
+    if not command or command in loop_state.reported_validation_commands:
+        return
+    loop_state.reported_validation_commands.append(command)
+    category = detect_validation_category(command)
+    if category:
+        logger.info("Model reported validation command for %s: %s", category, command)
+
+
+def record_criterion(
+    loop_state: _LoopState,
+    tag: CriterionTag,
+    *,
+    logger: logging.Logger,
+) -> None:
+    """Capture the first verification reported for each criterion."""
+    loop_state.iter_criteria_indices.add(tag.index)
+    if tag.index in loop_state.captured_criteria:
+        return
+    loop_state.captured_criteria[tag.index] = CriterionVerification(
+        index=tag.index,
+        criterion=tag.text.strip(),
+        status=tag.status,
+        evidence=tag.evidence.strip(),
+        verified_at=datetime.now(UTC),
+    )
+    logger.info("Captured criterion verification: [%d] %s", tag.index, tag.status)
+
+
 def log_iteration_end_with_usage(
     *,
     log_writer: "ExecutionLogWriter",
@@ -219,6 +263,54 @@ def log_iteration_end_with_usage(
     )
 
 
+def capture_workspace_before(
+    project_path: Path, waypoint_id: str, *, logger: logging.Logger
+) -> WorkspaceSnapshot | None:
+    """Snapshot the workspace before execution, tagged with the watcher seq."""
+    try:
+        return capture_workspace_snapshot(
+            project_path, watcher=get_workspace_watcher(project_path)
+        )
+    except Exception:
+        logger.exception(
+            "Failed to capture workspace snapshot before executing %s", waypoint_id
+        )
+        return None
+
+
+def log_workspace_provenance(
+    log_writer: ExecutionLogWriter,
+    project_path: Path,
+    before: WorkspaceSnapshot,
+    *,
+    waypoint_id: str,
+    iteration: int,
+    result: str,
+    logger: logging.Logger,
+) -> WorkspaceDiffSummary | None:
+    """Write a workspace diff summary into the execution log.
+
+    The after-snapshot re-reads only files the workspace watcher saw change.
+    """
+    try:
+        watcher = get_workspace_watcher(project_path)
+        after = (
+            refresh_workspace_snapshot(before, project_path, watcher)
+            if watcher is not None
+            else capture_workspace_snapshot(project_path)
+        )
+        summary = summarize_workspace_diff(before, after)
+        log_writer.log_workspace_diff(
+            iteration=iteration,
+            result=result,
+            summary=summary.to_dict(),
+        )
+        return summary
+    except Exception:
+        logger.exception("Failed to log workspace provenance for %s", waypoint_id)
+        return None
+
+
 def persist_waypoint_memory(
     *,
     project_path: Path,
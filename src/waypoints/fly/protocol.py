@@ -62,20 +62,27 @@ STAGE_REPORT_PATTERN = re.compile(
 )
 
 
+def parse_stage_report(payload: str) -> StageReport | None:
+    """Parse the JSON body of one ``<execution-stage>`` tag."""
+    try:
+        data = json.loads(payload)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    try:
+        return StageReport.from_dict(data)
+    except (ValueError, KeyError):
+        return None
+
+
 def parse_stage_reports(text: str) -> list[StageReport]:
     """Parse structured stage reports from model output."""
     reports: list[StageReport] = []
     for match in STAGE_REPORT_PATTERN.findall(text):
-        try:
-            data = json.loads(match)
-        except json.JSONDecodeError:
-            continue
-        if not isinstance(data, dict):
-            continue
-        try:
-            reports.append(StageReport.from_dict(data))
-        except (ValueError, KeyError):
-            continue
+        report = parse_stage_report(match)
+        if report is not None:
+            reports.append(report)
     return reports
 
 
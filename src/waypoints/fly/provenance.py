@@ -16,6 +16,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Final, Literal
 
+from waypoints.runtime.fs_watcher import WorkspaceWatcher
+
 ChangeType = Literal["added", "modified", "deleted"]
 
 _IGNORED_DIRS: Final[set[str]] = {
@@ -31,6 +33,7 @@ _IGNORED_DIRS: Final[set[str]] = {
     "node_modules",
     "sessions",
     "receipts",
+    ".waypoints",
 }
 
 _IGNORED_FILES: Final[set[str]] = {
@@ -59,6 +62,8 @@ class WorkspaceSnapshot:
 
     captured_at: datetime
     files: dict[str, FileSnapshot]
+    # Watcher journal position at capture time, when captured with a watcher.
+    watch_seq: int | None = None
 
 
 @dataclass(frozen=True)
@@ -130,8 +135,15 @@ class WorkspaceDiffSummary:
         }
 
 
-def capture_workspace_snapshot(project_path: Path) -> WorkspaceSnapshot:
-    """Capture a lightweight snapshot of workspace files."""
+def capture_workspace_snapshot(
+    project_path: Path, *, watcher: WorkspaceWatcher | None = None
+) -> WorkspaceSnapshot:
+    """Capture a lightweight snapshot of workspace files.
+
+    With a ``watcher``, the snapshot records the journal position so a later
+    :func:`refresh_workspace_snapshot` only re-reads files changed since.
+    """
+    watch_seq = watcher.seq if watcher is not None else None
     files: dict[str, FileSnapshot] = {}
 
     for file_path in _iter_workspace_files(project_path):
@@ -140,7 +152,51 @@ def capture_workspace_snapshot(project_path: Path) -> WorkspaceSnapshot:
         if snapshot is not None:
             files[rel_path] = snapshot
 
-    return WorkspaceSnapshot(captured_at=datetime.now(UTC), files=files)
+    return WorkspaceSnapshot(
+        captured_at=datetime.now(UTC), files=files, watch_seq=watch_seq
+    )
+
+
+def refresh_workspace_snapshot(
+    previous: WorkspaceSnapshot,
+    project_path: Path,
+    watcher: WorkspaceWatcher,
+) -> WorkspaceSnapshot:
+    """Snapshot the workspace by re-reading only files changed since ``previous``.
+
+    Falls back to a full capture when ``previous`` has no journal position or
+    the watcher cannot vouch for every change since it.
+    """
+    if previous.watch_seq is None:
+        return capture_workspace_snapshot(project_path, watcher=watcher)
+    changes = watcher.changes_since(previous.watch_seq)
+    if not changes.complete:
+        return capture_workspace_snapshot(project_path, watcher=watcher)
+
+    files = dict(previous.files)
+    for change in changes.changes:
+        if not _is_tracked_path(change.path):
+            continue
+        if change.is_dir:
+            if change.kind == "deleted":
+                prefix = f"{change.path}/"
+                for rel_path in [p for p in files if p.startswith(prefix)]:
+                    del files[rel_path]
+            continue
+        file_path = project_path / change.path
+        snapshot = (
+            None
+            if file_path.is_symlink() or not file_path.is_file()
+            else _snapshot_file(file_path)
+        )
+        if snapshot is None:
+            files.pop(change.path, None)
+        else:
+            files[change.path] = snapshot
+
+    return WorkspaceSnapshot(
+        captured_at=datetime.now(UTC), files=files, watch_seq=changes.seq
+    )
 
 
 def summarize_workspace_diff(
@@ -286,6 +342,14 @@ def _iter_workspace_files(project_path: Path) -> Iterator[Path]:
             yield file_path
 
 
+def _is_tracked_path(rel_path: str) -> bool:
+    """Whether a root-relative path is covered by workspace snapshots."""
+    *dirs, name = rel_path.split("/")
+    if any(part in _IGNORED_DIRS for part in dirs):
+        return False
+    return name not in _IGNORED_FILES and name not in _IGNORED_DIRS
+
+
 def _snapshot_file(path: Path) -> FileSnapshot | None:
     """Capture state for a single file."""
     try:
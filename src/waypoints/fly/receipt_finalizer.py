@@ -5,10 +5,12 @@ running host validation commands, building receipts from captured evidence,
 and verifying receipts with an LLM judge.
 """
 
+import asyncio
 import logging
 import os
 import re
 from collections.abc import Callable
+from contextlib import suppress
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -30,13 +32,20 @@ from waypoints.fly.executor_runtime import build_metrics_progress_payload
 from waypoints.fly.protocol import FlyRole, GuidancePacket
 from waypoints.fly.skills import resolve_attached_skills
 from waypoints.fly.stack import ValidationCommand
+from waypoints.fly.workspace_snapshot import (
+    WorkspaceSnapshot,
+    create_workspace_snapshot,
+)
 from waypoints.git.receipt import (
     CapturedEvidence,
+    ChecklistReceipt,
     CriterionVerification,
     ReceiptBuilder,
 )
+from waypoints.git.receipt_index import ReceiptIndex
 from waypoints.llm.client import StreamChunk, StreamComplete, agent_query
 from waypoints.llm.prompts import build_verification_prompt
+from waypoints.models.blob_store import blob_store_for
 from waypoints.models.waypoint import Waypoint
 from waypoints.runtime import CommandEvent, TimeoutDomain, get_command_runner
 
@@ -74,6 +83,18 @@ def _format_timeout_events(events: list[CommandEvent]) -> str:
     return "\n".join(lines)
 
 
+@dataclass(frozen=True)
+class _VerifierOutcome:
+    """Raw result of one verifier turn, before any of it is logged."""
+
+    output: str = ""
+    cost_usd: float | None = None
+    tokens_in: int | None = None
+    tokens_out: int | None = None
+    cached_tokens_in: int | None = None
+    error: str | None = None
+
+
 @dataclass(frozen=True)
 class FinalizeFailure:
     """Diagnostic payload describing why receipt finalization failed."""
@@ -89,6 +110,12 @@ class ReceiptFinalizer:
     1. Resolve and run validation commands on the host
     2. Build a receipt from captured evidence
     3. Verify the receipt with an LLM judge
+
+    When the builder already ran every validation command and all of them
+    passed, steps 1 and 3 overlap: the verifier judges a provisional receipt
+    built from that evidence while the host commands run in a worker thread.
+    A host failure cancels the verifier; otherwise its verdict is applied to
+    the final receipt.
     """
 
     def __init__(
@@ -218,6 +245,25 @@ class ReceiptFinalizer:
 
         return commands
 
+    def _freeze_workspace(self, project_path: Path) -> WorkspaceSnapshot | None:
+        """Snapshot the workspace for host validation when isolation is on.
+
+        Falls back to the live directory if the snapshot cannot be made.
+        """
+        if not settings.fly_multi_agent_isolated_validation:
+            return None
+        try:
+            snapshot = create_workspace_snapshot(project_path)
+        except OSError as exc:
+            logger.warning("Validating in live workspace; snapshot failed: %s", exc)
+            return None
+        self._log_writer.log_finalize_tool_call(
+            "WorkspaceSnapshot",
+            {"path": str(snapshot.path)},
+            f"method={snapshot.method}",
+        )
+        return snapshot
+
     def run_validation_commands(
         self, project_path: Path, commands: list[ValidationCommand]
     ) -> dict[str, CapturedEvidence]:
@@ -340,8 +386,6 @@ class ReceiptFinalizer:
         verifier_guidance: GuidancePacket | None = None,
     ) -> str:
         """Build the LLM verification prompt for a receipt."""
-        from waypoints.git.receipt import ChecklistReceipt
-
         receipt = ChecklistReceipt.load(receipt_path)
         return build_verification_prompt(receipt, guidance_packet=verifier_guidance)
 
@@ -459,7 +503,87 @@ class ReceiptFinalizer:
             self._set_failure("No validation commands provided.")
             return False
 
-        host_evidence = self.run_validation_commands(project_path, commands_to_run)
+        verifier_enabled = (
+            settings.fly_multi_agent_enabled
+            and settings.fly_multi_agent_verifier_enabled
+        )
+        speculative_evidence = (
+            self._speculative_evidence(
+                commands_to_run, tool_validation_evidence, tool_validation_categories
+            )
+            if verifier_enabled and settings.fly_multi_agent_speculative_verifier
+            else None
+        )
+        verifier_guidance: GuidancePacket | None = None
+        speculation: asyncio.Task[_VerifierOutcome] | None = None
+        if speculative_evidence is not None:
+            # Announced only once host validation passes; a cancelled
+            # speculation leaves nothing in the execution log.
+            verifier_guidance = self._build_verifier_guidance_packet(project_path)
+            speculative_receipt = self._build_speculative_receipt(
+                speculative_evidence, captured_criteria, soft_evidence
+            )
+            speculation = asyncio.create_task(
+                self._run_verifier(
+                    project_path,
+                    build_verification_prompt(
+                        speculative_receipt, guidance_packet=verifier_guidance
+                    ),
+                    max_iterations,
+                )
+            )
+
+        snapshot = self._freeze_workspace(project_path)
+        validation_path = snapshot.path if snapshot else project_path
+        host_commands = (
+            snapshot.map_commands(commands_to_run) if snapshot else commands_to_run
+        )
+        try:
+            if speculation is None:
+                host_evidence = self.run_validation_commands(
+                    validation_path, host_commands
+                )
+            else:
+                host_evidence = await asyncio.to_thread(
+                    self.run_validation_commands, validation_path, host_commands
+                )
+            if snapshot is not None:
+                snapshot.remove()
+                snapshot = None
+            return await self._finalize_host_evidence(
+                project_path,
+                receipt_builder,
+                host_evidence,
+                captured_criteria,
+                soft_evidence,
+                soft_missing,
+                verifier_enabled,
+                speculation,
+                verifier_guidance,
+                max_iterations,
+            )
+        finally:
+            if snapshot is not None:
+                snapshot.remove()
+            if speculation is not None and not speculation.done():
+                speculation.cancel()
+                with suppress(asyncio.CancelledError):
+                    await speculation
+
+    async def _finalize_host_evidence(
+        self,
+        project_path: Path,
+        receipt_builder: ReceiptBuilder,
+        host_evidence: dict[str, CapturedEvidence],
+        captured_criteria: dict[int, CriterionVerification],
+        soft_evidence: dict[str, CapturedEvidence],
+        soft_missing: bool,
+        verifier_enabled: bool,
+        speculation: "asyncio.Task[_VerifierOutcome] | None",
+        verifier_guidance: GuidancePacket | None,
+        max_iterations: int,
+    ) -> bool:
+        """Build the receipt from host evidence, then gate it on the verifier."""
         for category, evidence in host_evidence.items():
             receipt_builder.capture(category, evidence)
 
@@ -484,8 +608,6 @@ class ReceiptFinalizer:
         receipt_path = self._save_receipt(receipt_builder, soft_evidence or None)
 
         # Quick check: if any commands failed, receipt is invalid
-        from waypoints.git.receipt import ChecklistReceipt
-
         receipt = ChecklistReceipt.load(receipt_path)
         if not receipt.is_valid():
             failed = receipt.failed_items()
@@ -517,9 +639,7 @@ class ReceiptFinalizer:
             return False
 
         # LLM verification
-        if not settings.fly_multi_agent_enabled or (
-            not settings.fly_multi_agent_verifier_enabled
-        ):
+        if not verifier_enabled:
             self._log_writer.log_finalize_end()
             self._log_writer.log_receipt_validated(
                 str(receipt_path),
@@ -529,9 +649,18 @@ class ReceiptFinalizer:
             self._last_failure = None
             return True
 
-        verifier_result = await self._verify_with_llm(
-            project_path, receipt_path, max_iterations
-        )
+        if speculation is None:
+            verifier_result = await self._verify_with_llm(
+                project_path, receipt_path, max_iterations
+            )
+        else:
+            verifier_result = await self._settle_speculation(
+                project_path,
+                receipt_path,
+                speculation,
+                verifier_guidance,
+                max_iterations,
+            )
         if verifier_result:
             return True
 
@@ -614,10 +743,98 @@ class ReceiptFinalizer:
         )
         return True
 
+    def _speculative_evidence(
+        self,
+        commands_to_run: list[ValidationCommand],
+        tool_validation_evidence: dict[str, CapturedEvidence],
+        tool_validation_categories: dict[str, CapturedEvidence],
+    ) -> dict[str, CapturedEvidence] | None:
+        """Map each host command to passing builder evidence, if all have some.
+
+        Speculation only pays off when host validation is expected to agree
+        with what the builder saw, so any missing or failing command disables
+        it and finalization runs the verifier after the host commands.
+        """
+        if not commands_to_run:
+            return None
+        evidence_by_label: dict[str, CapturedEvidence] = {}
+        for cmd in commands_to_run:
+            evidence = tool_validation_evidence.get(_normalize_command(cmd.command))
+            if evidence is None:
+                evidence = tool_validation_categories.get(cmd.name or cmd.category)
+            if evidence is None or evidence.exit_code != 0:
+                return None
+            evidence_by_label[cmd.name or cmd.command] = evidence
+        return evidence_by_label
+
+    def _build_speculative_receipt(
+        self,
+        speculative_evidence: dict[str, CapturedEvidence],
+        captured_criteria: dict[int, CriterionVerification],
+        soft_evidence: dict[str, CapturedEvidence],
+    ) -> ChecklistReceipt:
+        """Build the provisional in-memory receipt the verifier starts from."""
+        builder = ReceiptBuilder(
+            waypoint_id=self._waypoint.id,
+            title=self._waypoint.title,
+            objective=self._waypoint.objective,
+            acceptance_criteria=self._waypoint.acceptance_criteria,
+        )
+        for label, evidence in speculative_evidence.items():
+            builder.capture(label, evidence)
+        for criterion in captured_criteria.values():
+            builder.capture_criterion(criterion)
+        return builder.build(soft_evidence=soft_evidence or None)
+
+    async def _settle_speculation(
+        self,
+        project_path: Path,
+        receipt_path: Path,
+        speculation: "asyncio.Task[_VerifierOutcome]",
+        verifier_guidance: GuidancePacket | None,
+        max_iterations: int,
+    ) -> bool:
+        """Accept the speculative verdict or re-verify the final receipt.
+
+        Speculation only starts when every builder run passed, and a failing
+        host command cancels it before this point, so passing host evidence
+        cannot change the outcome the verifier judged. Only a verifier turn
+        that errored is repeated, this time against the saved receipt.
+        """
+        self._announce_verifier(verifier_guidance, max_iterations)
+        outcome = await speculation
+        if outcome.error is None:
+            return self._apply_verifier_outcome(outcome, receipt_path)
+        logger.info(
+            "Speculative verification failed for %s; re-verifying",
+            self._waypoint.id,
+        )
+        outcome = await self._run_verifier(
+            project_path,
+            self._build_verification_prompt(receipt_path, verifier_guidance),
+            max_iterations,
+        )
+        return self._apply_verifier_outcome(outcome, receipt_path)
+
     async def _verify_with_llm(
         self, project_path: Path, receipt_path: Path, max_iterations: int
     ) -> bool:
         """Ask LLM to verify the receipt evidence."""
+        verifier_guidance = self._build_verifier_guidance_packet(project_path)
+        self._announce_verifier(verifier_guidance, max_iterations)
+        verification_prompt = self._build_verification_prompt(
+            receipt_path,
+            verifier_guidance=verifier_guidance,
+        )
+        outcome = await self._run_verifier(
+            project_path, verification_prompt, max_iterations
+        )
+        return self._apply_verifier_outcome(outcome, receipt_path)
+
+    def _announce_verifier(
+        self, verifier_guidance: GuidancePacket | None, max_iterations: int
+    ) -> None:
+        """Report the verifier step and log its guidance packet."""
         self._progress(
             max_iterations,
             max_iterations,
@@ -626,7 +843,6 @@ class ReceiptFinalizer:
             metadata={"role": FlyRole.VERIFIER.value},
         )
 
-        verifier_guidance = self._build_verifier_guidance_packet(project_path)
         if verifier_guidance is not None:
             log_method = getattr(self._log_writer, "log_protocol_artifact", None)
             if callable(log_method):
@@ -641,10 +857,15 @@ class ReceiptFinalizer:
                     "artifact": verifier_guidance.to_dict(),
                 },
             )
-        verification_prompt = self._build_verification_prompt(
-            receipt_path,
-            verifier_guidance=verifier_guidance,
-        )
+
+    async def _run_verifier(
+        self, project_path: Path, verification_prompt: str, max_iterations: int
+    ) -> _VerifierOutcome:
+        """Run one verifier turn, reporting metrics but logging nothing else.
+
+        Execution-log entries are written by ``_apply_verifier_outcome`` so a
+        speculative turn that gets cancelled or superseded leaves no trace.
+        """
         verification_output = ""
         verification_cost: float | None = None
         verification_tokens_in: int | None = None
@@ -740,12 +961,33 @@ class ReceiptFinalizer:
                     )
         except Exception as e:
             logger.error("Error during receipt verification: %s", e)
-            self._log_writer.log_error(0, f"Verification error: {e}")
-            self._log_writer.log_finalize_end(
+            return _VerifierOutcome(
+                output=verification_output,
                 cost_usd=verification_cost,
                 tokens_in=verification_tokens_in,
                 tokens_out=verification_tokens_out,
                 cached_tokens_in=verification_cached_tokens_in,
+                error=str(e),
+            )
+        return _VerifierOutcome(
+            output=verification_output,
+            cost_usd=verification_cost,
+            tokens_in=verification_tokens_in,
+            tokens_out=verification_tokens_out,
+            cached_tokens_in=verification_cached_tokens_in,
+        )
+
+    def _apply_verifier_outcome(
+        self, outcome: _VerifierOutcome, receipt_path: Path
+    ) -> bool:
+        """Log a verifier turn against the saved receipt and parse its verdict."""
+        if outcome.error is not None:
+            self._log_writer.log_error(0, f"Verification error: {outcome.error}")
+            self._log_writer.log_finalize_end(
+                cost_usd=outcome.cost_usd,
+                tokens_in=outcome.tokens_in,
+                tokens_out=outcome.tokens_out,
+                cached_tokens_in=outcome.cached_tokens_in,
             )
             self._log_writer.log_receipt_validated(
                 str(receipt_path), True, "LLM verification skipped"
@@ -754,13 +996,13 @@ class ReceiptFinalizer:
             return True  # Trust the evidence if LLM verification fails
 
         # Log verification output
-        if verification_output:
-            self._log_writer.log_finalize_output(verification_output)
+        if outcome.output:
+            self._log_writer.log_finalize_output(outcome.output)
 
         # Parse verdict
         verdict_match = re.search(
             r'<receipt-verdict status="(valid|invalid)">(.*?)</receipt-verdict>',
-            verification_output,
+            outcome.output,
             re.DOTALL,
         )
 
@@ -770,10 +1012,10 @@ class ReceiptFinalizer:
             is_valid = status == "valid"
 
             self._log_writer.log_finalize_end(
-                cost_usd=verification_cost,
-                tokens_in=verification_tokens_in,
-                tokens_out=verification_tokens_out,
-                cached_tokens_in=verification_cached_tokens_in,
+                cost_usd=outcome.cost_usd,
+                tokens_in=outcome.tokens_in,
+                tokens_out=outcome.tokens_out,
+                cached_tokens_in=outcome.cached_tokens_in,
             )
             self._log_writer.log_receipt_validated(
                 str(receipt_path), is_valid, reasoning
@@ -793,10 +1035,10 @@ class ReceiptFinalizer:
         else:
             logger.warning("No verdict marker in LLM response, using format validation")
             self._log_writer.log_finalize_end(
-                cost_usd=verification_cost,
-                tokens_in=verification_tokens_in,
-                tokens_out=verification_tokens_out,
-                cached_tokens_in=verification_cached_tokens_in,
+                cost_usd=outcome.cost_usd,
+                tokens_in=outcome.tokens_in,
+                tokens_out=outcome.tokens_out,
+                cached_tokens_in=outcome.cached_tokens_in,
             )
             self._log_writer.log_receipt_validated(
                 str(receipt_path), True, "LLM verdict not found, using format check"
@@ -820,7 +1062,9 @@ class ReceiptFinalizer:
             output_dir=receipts_dir,
             output_prefix=receipt_stem,
             soft_evidence=soft_evidence,
+            blob_store=blob_store_for(self._project.get_path()),
         )
         receipt.save(receipt_path)
+        ReceiptIndex(receipts_dir).record(receipt_path, receipt)
         logger.info("Receipt saved: %s", receipt_path)
         return receipt_path
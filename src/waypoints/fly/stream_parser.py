@@ -0,0 +1,201 @@
+"""Incremental parser for protocol tags in streamed builder output.
+
+The builder interleaves prose with structured tags (``<validation>``,
+``<acceptance-criterion>``, ``<execution-stage>``,
+``<clarification-request>``). Re-running the tag regexes over the whole
+accumulated output on every chunk is quadratic in output length, so this
+parser consumes each chunk once: per tag kind it keeps only the text from
+the earliest still-open tag (or a short tail that might hold a split open
+tag) and emits each complete tag exactly once, in stream order.
+
+Matching uses the same patterns as the batch parsers, so a tag parsed here
+yields the same fields as ``CRITERION_PATTERN.findall`` and friends.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from waypoints.fly.clarification_runtime import (
+    CLARIFICATION_REQUEST_PATTERN,
+    parse_clarification_payload,
+)
+from waypoints.fly.evidence import CRITERION_PATTERN, VALIDATION_PATTERN
+from waypoints.fly.protocol import (
+    STAGE_REPORT_PATTERN,
+    StageReport,
+    parse_stage_report,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationTag:
+    """A model-reported ``<validation>`` block."""
+
+    command: str
+    exit_code: int
+    output: str
+
+
+@dataclass(frozen=True, slots=True)
+class CriterionTag:
+    """A model-reported ``<acceptance-criterion>`` block."""
+
+    index: int
+    status: Literal["verified", "failed"]
+    text: str
+    evidence: str
+
+
+@dataclass(frozen=True, slots=True)
+class StageReportTag:
+    """A well-formed ``<execution-stage>`` report."""
+
+    report: StageReport
+
+
+@dataclass(frozen=True, slots=True)
+class ClarificationTag:
+    """A well-formed ``<clarification-request>`` payload."""
+
+    payload: dict[str, Any]
+
+
+type ProtocolTag = ValidationTag | CriterionTag | StageReportTag | ClarificationTag
+
+
+class _TagScanner:
+    """Finds complete ``open ... close`` blocks of one tag kind across chunks."""
+
+    def __init__(self, open_tag: str, close_tag: str, pattern: re.Pattern[str]):
+        self._open = open_tag
+        self._close = close_tag
+        self._pattern = pattern
+        # Text carried over from earlier chunks: either a short tail that may
+        # hold a split open tag, or (while waiting) everything since the
+        # earliest unclosed open tag, kept as pieces to avoid re-copying.
+        self._pieces: list[str] = []
+        self._waiting = False
+        self._close_tail = ""
+        # Absolute stream offset of the first carried-over character.
+        self._base = 0
+
+    def feed(self, text: str) -> list[tuple[int, re.Match[str]]]:
+        """Consume ``text``; return ``(stream_offset, match)`` for new blocks."""
+        if self._waiting:
+            probe = self._close_tail + text
+            if self._close not in probe:
+                self._pieces.append(text)
+                self._close_tail = _tail(probe, len(self._close) - 1)
+                return []
+            self._waiting = False
+        self._pieces.append(text)
+        buffer = "".join(self._pieces)
+
+        matches: list[tuple[int, re.Match[str]]] = []
+        pos = 0
+        while True:
+            start = buffer.find(self._open, pos)
+            if start < 0:
+                # Keep just enough to recognise an open tag split by a chunk
+                # boundary; never re-keep text that was already matched.
+                keep_from = max(pos, len(buffer) - (len(self._open) - 1))
+                self._carry(buffer, keep_from)
+                return matches
+
+            body_start = start + len(self._open)
+            if buffer.find(self._close, body_start) < 0:
+                self._carry(buffer, start)
+                self._waiting = True
+                self._close_tail = _tail(buffer[body_start:], len(self._close) - 1)
+                return matches
+
+            match = self._pattern.match(buffer, start)
+            if match is None:
+                pos = start + 1
+                continue
+            matches.append((self._base + start, match))
+            pos = match.end()
+
+    def _carry(self, buffer: str, keep_from: int) -> None:
+        self._base += keep_from
+        self._pieces = [buffer[keep_from:]]
+
+
+def _tail(text: str, size: int) -> str:
+    return text[max(0, len(text) - size) :] if size > 0 else ""
+
+
+class StreamProtocolParser:
+    """Consumes streamed text once and emits each protocol tag once."""
+
+    def __init__(self) -> None:
+        self._validation = _TagScanner(
+            "<validation>", "</validation>", VALIDATION_PATTERN
+        )
+        self._criterion = _TagScanner(
+            "<acceptance-criterion>", "</acceptance-criterion>", CRITERION_PATTERN
+        )
+        self._stage = _TagScanner(
+            "<execution-stage>", "</execution-stage>", STAGE_REPORT_PATTERN
+        )
+        self._clarification = _TagScanner(
+            "<clarification-request>",
+            "</clarification-request>",
+            CLARIFICATION_REQUEST_PATTERN,
+        )
+
+    def feed(self, text: str) -> list[ProtocolTag]:
+        """Consume the next piece of output and return newly completed tags."""
+        if not text:
+            return []
+        found: list[tuple[int, ProtocolTag]] = []
+
+        for offset, match in self._validation.feed(text):
+            command, exit_code, output = match.groups()
+            found.append((offset, ValidationTag(command, int(exit_code), output)))
+
+        for offset, match in self._criterion.feed(text):
+            index, raw_status, criterion, evidence = match.groups()
+            status: Literal["verified", "failed"] = (
+                "verified" if raw_status == "verified" else "failed"
+            )
+            found.append(
+                (offset, CriterionTag(int(index), status, criterion, evidence))
+            )
+
+        for offset, match in self._stage.feed(text):
+            report = parse_stage_report(match.group(1))
+            if report is not None:
+                found.append((offset, StageReportTag(report)))
+
+        for offset, match in self._clarification.feed(text):
+            payload = parse_clarification_payload(match.group(1))
+            if payload is not None:
+                found.append((offset, ClarificationTag(payload)))
+
+        found.sort(key=lambda item: item[0])
+        return [tag for _, tag in found]
+
+
+class CompletionMarkerScanner:
+    """Detects a literal completion marker across chunk boundaries."""
+
+    def __init__(self, marker: str) -> None:
+        self._marker = marker
+        self._tail = ""
+        self.found = False
+
+    def feed(self, text: str) -> bool:
+        """Consume ``text``; return whether the marker has been seen."""
+        if self.found or not self._marker:
+            return self.found
+        window = self._tail + text
+        if self._marker in window:
+            self.found = True
+            self._tail = ""
+        else:
+            self._tail = _tail(window, len(self._marker) - 1)
+        return self.found
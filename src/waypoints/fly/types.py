@@ -13,6 +13,7 @@ from waypoints.models.waypoint import Waypoint
 
 if TYPE_CHECKING:
     from waypoints.fly.provenance import WorkspaceSnapshot
+    from waypoints.fly.stream_parser import StreamProtocolParser
     from waypoints.git.receipt import CapturedEvidence, CriterionVerification
 
 
@@ -102,12 +103,27 @@ class ExecutionMetricsUpdate:
 ProgressCallback = Callable[[ExecutionContext], None]
 
 
+def _new_protocol_parser() -> StreamProtocolParser:
+    # Imported lazily: the parser depends on clarification_runtime, which
+    # imports this module.
+    from waypoints.fly.stream_parser import StreamProtocolParser
+
+    return StreamProtocolParser()
+
+
 @dataclass
 class _LoopState:
     """Mutable state accumulated across iterations of the execution loop."""
 
     iteration: int = 0
-    full_output: str = ""
+    # Streamed builder text across all iterations, one entry per chunk.
+    output_chunks: list[str] = field(default_factory=list)
+    # Chunks already fed to ``protocol_parser`` (parsing pauses while a
+    # completion claim is being finalized and resumes on the next iteration).
+    parsed_output_chunks: int = 0
+    protocol_parser: StreamProtocolParser = field(
+        default_factory=_new_protocol_parser, repr=False
+    )
     reported_validation_commands: list[str] = field(default_factory=list)
     captured_criteria: dict[int, "CriterionVerification"] = field(default_factory=dict)
     tool_validation_evidence: dict[str, "CapturedEvidence"] = field(
@@ -142,9 +158,20 @@ class _LoopState:
     # Per-iteration state (reset at start of each _run_iteration)
     iter_scope_drift_detected: bool = False
     iter_stage_reports_logged: int = 0
+    iter_criteria_indices: set[int] = field(default_factory=set)
     iteration_tokens_in: int | None = None
     iteration_tokens_out: int | None = None
     iteration_cached_tokens_in: int | None = None
     last_tool_name: str | None = None
     last_tool_input: dict[str, object] = field(default_factory=dict)
     last_tool_output: str | None = None
+    _joined_output: str = field(default="", init=False, repr=False)
+    _joined_chunk_count: int = field(default=0, init=False, repr=False)
+
+    @property
+    def full_output(self) -> str:
+        """All streamed builder text so far, joined on demand."""
+        if self._joined_chunk_count != len(self.output_chunks):
+            self._joined_output = "".join(self.output_chunks)
+            self._joined_chunk_count = len(self.output_chunks)
+        return self._joined_output
@@ -0,0 +1,149 @@
+"""Frozen copies of a project workspace for host validation.
+
+Host validation commands normally run in the live project directory, so a
+builder that keeps writing (or the next waypoint starting) can change files
+under a running test suite. A snapshot freezes the workspace at completion
+time into ``.waypoints/snapshots/<id>/`` and validations run there instead.
+
+Files are cloned with reflinks (copy-on-write extents) where the filesystem
+supports it and copied otherwise. Hardlinks are never used: tools that
+rewrite files in place would change the snapshot too. Waypoints metadata
+(``sessions/``, ``receipts/``, ``.waypoints/``) is left out.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from waypoints.fly.stack import ValidationCommand
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOTS_DIRNAME = "snapshots"
+SNAPSHOT_EXCLUDED_DIRS = frozenset({"sessions", "receipts", ".waypoints"})
+_FICLONE = 0x40049409  # Linux ioctl: share extents with the source (reflink)
+# Snapshots left behind by a crashed run are removed after this long.
+STALE_SNAPSHOT_SECONDS = 24 * 60 * 60
+_NO_REFLINK_ERRNOS = frozenset(
+    {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WorkspaceSnapshot:
+    """A frozen copy of a project directory."""
+
+    source: Path
+    path: Path
+    method: str  # "reflink" or "copy"
+
+    def map_path(self, path: Path) -> Path:
+        """Translate a path inside the source workspace into the snapshot."""
+        try:
+            return self.path / path.resolve().relative_to(self.source)
+        except ValueError:
+            return path
+
+    def map_commands(
+        self, commands: list[ValidationCommand]
+    ) -> list[ValidationCommand]:
+        """Point command working directories at the snapshot."""
+        return [
+            replace(cmd, cwd=self.map_path(cmd.cwd)) if cmd.cwd else cmd
+            for cmd in commands
+        ]
+
+    def remove(self) -> None:
+        """Delete the snapshot directory."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def create_workspace_snapshot(project_path: Path) -> WorkspaceSnapshot:
+    """Freeze ``project_path`` into a new snapshot directory."""
+    source = project_path.resolve()
+    snapshots_dir = source / ".waypoints" / SNAPSHOTS_DIRNAME
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+    _remove_stale_snapshots(snapshots_dir)
+    target = Path(tempfile.mkdtemp(prefix="snapshot-", dir=snapshots_dir))
+    cloner = _Cloner()
+    try:
+        shutil.copytree(
+            source,
+            target,
+            symlinks=True,
+            ignore=lambda directory, names: _ignored(source, directory, names),
+            copy_function=cloner.copy,
+            dirs_exist_ok=True,
+        )
+    except BaseException:
+        shutil.rmtree(target, ignore_errors=True)
+        raise
+    snapshot = WorkspaceSnapshot(
+        source=source,
+        path=target,
+        method="reflink" if cloner.reflinked else "copy",
+    )
+    logger.info(
+        "Snapshot of %s at %s (%s, %d files)",
+        source,
+        target,
+        snapshot.method,
+        cloner.files,
+    )
+    return snapshot
+
+
+def _remove_stale_snapshots(snapshots_dir: Path) -> None:
+    cutoff = time.time() - STALE_SNAPSHOT_SECONDS
+    for entry in snapshots_dir.iterdir():
+        try:
+            if entry.is_dir() and entry.stat().st_mtime < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
+        except OSError:
+            continue
+
+
+def _ignored(source: Path, directory: str, names: list[str]) -> set[str]:
+    if Path(directory) != source:
+        return set()
+    return {name for name in names if name in SNAPSHOT_EXCLUDED_DIRS}
+
+
+class _Cloner:
+    """``copytree`` copy function that reflinks until the filesystem refuses."""
+
+    def __init__(self) -> None:
+        self.reflink_supported = sys.platform == "linux"
+        self.reflinked = False
+        self.files = 0
+
+    def copy(self, src: str, dst: str) -> str:
+        if not stat.S_ISREG(os.lstat(src).st_mode):
+            return dst  # sockets, FIFOs and devices are not workspace content
+        self.files += 1
+        if self.reflink_supported and self._reflink(src, dst):
+            self.reflinked = True
+            shutil.copystat(src, dst)
+            return dst
+        return str(shutil.copy2(src, dst))
+
+    def _reflink(self, src: str, dst: str) -> bool:
+        import fcntl
+
+        with open(src, "rb") as source, open(dst, "wb") as target:
+            try:
+                fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+                return True
+            except OSError as exc:
+                if exc.errno in _NO_REFLINK_ERRNOS:
+                    self.reflink_supported = False
+                return False
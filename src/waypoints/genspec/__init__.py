@@ -18,6 +18,7 @@ from waypoints.genspec.importer import (
     import_from_file,
     validate_spec,
 )
+from waypoints.genspec.index import GenSpecIndex, load_genspec_index
 from waypoints.genspec.spec import (
     Artifact,
     ArtifactType,
@@ -46,6 +47,7 @@ __all__ = [
     "DecisionType",
     "ExecutionMode",
     "ExecutionResult",
+    "GenSpecIndex",
     "GenerativeSpec",
     "GenerativeStep",
     "OutputType",
@@ -62,5 +64,6 @@ __all__ = [
     "export_project",
     "export_to_file",
     "import_from_file",
+    "load_genspec_index",
     "validate_spec",
 ]
@@ -0,0 +1,144 @@
+"""Per-source cache of converted genspec steps.
+
+Exporting walks every session and FLY execution log and converts them to
+``GenerativeStep`` records. Logs are append-only history, so after the first
+export almost every source is unchanged; re-parsing them makes export time
+grow with project history. The cache stores the converted steps of each
+source under ``.waypoints/export-cache/``, keyed by the source path and
+validated by size/mtime, falling back to a SHA-256 comparison when only the
+mtime changed.
+
+Cached steps are numbered from ``step-001``; the exporter renumbers them to
+their position in the spec.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from waypoints.genspec.spec import GenerativeStep
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CACHE_DIRNAME = "export-cache"
+# Bump when step conversion changes so stale entries are rebuilt.
+EXPORT_CACHE_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class CachedSteps:
+    """Steps converted from one source file."""
+
+    steps: list[GenerativeStep]
+    counter_delta: int
+
+
+class ExportCache:
+    """Converted steps per source file for one project."""
+
+    def __init__(self, project_path: Path, *, exporter_version: str) -> None:
+        self.project_path = project_path
+        self.cache_dir = project_path / ".waypoints" / EXPORT_CACHE_DIRNAME
+        self._exporter = f"{EXPORT_CACHE_SCHEMA_VERSION}:{exporter_version}"
+        self._seen: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: Path) -> CachedSteps | None:
+        """Return cached steps for ``source`` if it is unchanged."""
+        entry_path = self._entry_path(source)
+        self._seen.add(entry_path.name)
+        try:
+            entry = json.loads(entry_path.read_text(encoding="utf-8"))
+            info = source.stat()
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if not isinstance(entry, dict) or entry.get("exporter") != self._exporter:
+            self.misses += 1
+            return None
+
+        if entry.get("size") != info.st_size:
+            self.misses += 1
+            return None
+        if entry.get("mtime_ns") != info.st_mtime_ns:
+            # Touched but possibly unchanged (checkout, copy): compare content.
+            if entry.get("sha256") != _digest(source):
+                self.misses += 1
+                return None
+            entry["mtime_ns"] = info.st_mtime_ns
+            self._write(entry_path, entry)
+
+        try:
+            steps = [GenerativeStep.from_dict(item) for item in entry["steps"]]
+            cached = CachedSteps(steps=steps, counter_delta=int(entry["counter_delta"]))
+        except (KeyError, TypeError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return cached
+
+    def put(self, source: Path, cached: CachedSteps) -> None:
+        """Record the steps converted from ``source``."""
+        entry_path = self._entry_path(source)
+        self._seen.add(entry_path.name)
+        try:
+            info = source.stat()
+            entry = {
+                "exporter": self._exporter,
+                "source": str(source.relative_to(self.project_path)),
+                "size": info.st_size,
+                "mtime_ns": info.st_mtime_ns,
+                "sha256": _digest(source),
+                "counter_delta": cached.counter_delta,
+                "steps": [step.to_dict() for step in cached.steps],
+            }
+            self._write(entry_path, entry)
+        except (OSError, ValueError) as exc:
+            logger.warning("Failed to cache export steps for %s: %s", source, exc)
+
+    def prune(self) -> None:
+        """Delete entries for sources not looked up during this export."""
+        if not self.cache_dir.exists():
+            return
+        for entry_path in self.cache_dir.glob("*.json"):
+            if entry_path.name not in self._seen:
+                entry_path.unlink(missing_ok=True)
+
+    def _entry_path(self, source: Path) -> Path:
+        key = hashlib.sha256(str(source.relative_to(self.project_path)).encode())
+        return self.cache_dir / f"{key.hexdigest()[:24]}.json"
+
+    def _write(self, entry_path: Path, entry: dict[str, Any]) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(tmp_name, entry_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def renumber_steps(steps: list[GenerativeStep], start: int) -> list[GenerativeStep]:
+    """Return ``steps`` with IDs ``step-{start + 1}`` onwards."""
+    return [
+        replace(step, step_id=f"step-{start + offset:03d}")
+        for offset, step in enumerate(steps, start=1)
+    ]
+
+
+def _digest(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
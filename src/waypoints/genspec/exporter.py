@@ -8,11 +8,14 @@ import hashlib
 import json
 import logging
 import zipfile
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from waypoints.fly.execution_log import ExecutionLogReader
+from waypoints.genspec.export_cache import CachedSteps, ExportCache, renumber_steps
 from waypoints.genspec.spec import (
     Artifact,
     ArtifactType,
@@ -29,6 +32,7 @@ from waypoints.genspec.spec import (
     StepOutput,
 )
 from waypoints.models.dialogue import DialogueHistory, MessageRole
+from waypoints.models.document_store import latest_document_path
 from waypoints.models.flight_plan import FlightPlanReader
 from waypoints.models.iteration_request import IterationRequestReader
 from waypoints.models.session import SessionReader
@@ -48,6 +52,13 @@ BUNDLE_ARTIFACT_PATHS = {
     ArtifactType.ITERATION_REQUESTS: "artifacts/iteration-requests.json",
 }
 _ZIP_EPOCH = (2020, 1, 1, 0, 0, 0)
+# Matches zlib's default level, which earlier bundles were written with.
+DEFAULT_BUNDLE_COMPRESSLEVEL = 6
+DEFAULT_ZSTD_BUNDLE_LEVEL = 3
+BUNDLE_COMPRESSIONS = ("deflate", "zstd")
+# Entries are fed to the archive in chunks of at least this size so the
+# hasher thread and the compressor work on large, GIL-free spans.
+_BUNDLE_CHUNK_BYTES = 1024 * 1024
 
 # Mapping from session phase names to genspec Phase enum
 PHASE_MAP = {
@@ -246,11 +257,16 @@ When complete, output the completion marker specified in the instructions.""",
 }
 
 
-def export_project(project: "Project") -> GenerativeSpec:
+def export_project(project: "Project", *, use_cache: bool = True) -> GenerativeSpec:
     """Export a project to a GenerativeSpec.
 
+    Steps converted from unchanged session and execution log files are
+    reused from the project's export cache, so incremental exports only
+    parse sources that are new or changed since the last export.
+
     Args:
         project: The project to export
+        use_cache: Reuse and update cached steps (default True)
 
     Returns:
         GenerativeSpec containing all steps and artifacts
@@ -290,11 +306,23 @@ def export_project(project: "Project") -> GenerativeSpec:
         )
         spec.steps.append(spark_step)
 
+    cache = (
+        ExportCache(project.get_path(), exporter_version=waypoints_version)
+        if use_cache
+        else None
+    )
+
     # Collect steps from session files (SHAPE through CHART phases)
-    step_counter = _collect_session_steps(project, spec, step_counter)
+    step_counter = _collect_session_steps(project, spec, step_counter, cache)
 
     # Collect FLY phase steps from execution logs
-    _collect_fly_steps(project, spec, step_counter)
+    _collect_fly_steps(project, spec, step_counter, cache)
+
+    if cache is not None:
+        cache.prune()
+        logger.info(
+            "Export cache: %d sources reused, %d converted", cache.hits, cache.misses
+        )
 
     # Collect artifacts
     _collect_artifacts(project, spec)
@@ -314,50 +342,138 @@ def export_project(project: "Project") -> GenerativeSpec:
     return spec
 
 
-def export_bundle(spec: GenerativeSpec, path: Path) -> None:
+def export_bundle(
+    spec: GenerativeSpec,
+    path: Path,
+    *,
+    compresslevel: int | None = None,
+    compression: str = "deflate",
+) -> None:
     """Export a GenerativeSpec to a bundle zip.
 
+    The genspec entry is streamed into the archive in chunks, so the
+    serialized spec is never held in memory. Each chunk is hashed on a
+    worker thread while the archive compresses the previous one; hashlib
+    and the zlib/zstd compressors release the GIL, so the two overlap.
+    Output stays byte-for-byte deterministic.
+
     Args:
         spec: The spec to export
         path: Output bundle path
+        compresslevel: Compression level; 0-9 for deflate, lower is faster
+            for large transcripts. Defaults to DEFAULT_BUNDLE_COMPRESSLEVEL
+            (deflate) or DEFAULT_ZSTD_BUNDLE_LEVEL (zstd).
+        compression: "deflate" (readable everywhere) or "zstd" (faster,
+            needs a zip reader with Zstandard support).
     """
     logger.info("Writing genspec bundle to %s", path)
-    files = _build_bundle_files(spec)
-    _write_bundle_zip(path, files)
+    compress_type = _bundle_compress_type(compression)
+    if compresslevel is None:
+        compresslevel = (
+            DEFAULT_BUNDLE_COMPRESSLEVEL
+            if compress_type == zipfile.ZIP_DEFLATED
+            else DEFAULT_ZSTD_BUNDLE_LEVEL
+        )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    artifact_files = _artifact_bundle_files(spec)
+    checksums: dict[str, str] = {}
 
+    with (
+        zipfile.ZipFile(path, mode="w", compression=compress_type) as archive,
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="genspec-hash") as pool,
+    ):
+        writer = _BundleEntryWriter(archive, pool, compress_type, compresslevel)
+        checksums["genspec.jsonl"] = writer.write(
+            "genspec.jsonl", _chunk_lines(_iter_spec_lines(spec))
+        )
 
-def _build_bundle_files(spec: GenerativeSpec) -> dict[str, bytes]:
-    """Build bundle files as a path -> bytes mapping."""
-    files: dict[str, bytes] = {}
-    bundle_files: list[BundleFile] = []
+        for bundle_file, content in artifact_files:
+            checksums[bundle_file.path] = writer.write(bundle_file.path, [content])
 
-    files["genspec.jsonl"] = _serialize_spec(spec).encode("utf-8")
-    bundle_files.append(
-        BundleFile(path="genspec.jsonl", file_type=BundleFileType.GENSPEC)
-    )
+        metadata = _build_bundle_metadata(spec, [f for f, _ in artifact_files])
+        checksums["metadata.json"] = writer.write(
+            "metadata.json", [_serialize_json(metadata.to_dict())]
+        )
 
+        bundle_checksums = BundleChecksums(algorithm="sha256", files=checksums)
+        writer.write("checksums.json", [_serialize_json(bundle_checksums.to_dict())])
+
+
+def _bundle_compress_type(compression: str) -> int:
+    """Map a bundle compression name to a zipfile compression constant."""
+    if compression == "deflate":
+        return zipfile.ZIP_DEFLATED
+    if compression == "zstd":
+        zstd_type = getattr(zipfile, "ZIP_ZSTANDARD", None)
+        if zstd_type is None:
+            raise ValueError("zstd bundles require zipfile Zstandard support")
+        return int(zstd_type)
+    raise ValueError(f"Unknown bundle compression: {compression}")
+
+
+class _BundleEntryWriter:
+    """Writes archive entries while hashing them on a worker thread."""
+
+    def __init__(
+        self,
+        archive: zipfile.ZipFile,
+        hasher: ThreadPoolExecutor,
+        compress_type: int,
+        compresslevel: int,
+    ) -> None:
+        self._archive = archive
+        self._hasher = hasher
+        self._compress_type = compress_type
+        self._compresslevel = compresslevel
+
+    def write(self, file_path: str, chunks: Iterable[bytes]) -> str:
+        """Write one entry from ``chunks`` and return its sha256 checksum."""
+        info = _zip_info(file_path, self._compresslevel, self._compress_type)
+        digest = hashlib.sha256()
+        pending: Future[None] | None = None
+        with self._archive.open(info, "w") as entry:
+            for chunk in chunks:
+                # One chunk in flight keeps updates ordered and memory bounded.
+                if pending is not None:
+                    pending.result()
+                pending = self._hasher.submit(digest.update, chunk)
+                entry.write(chunk)
+        if pending is not None:
+            pending.result()
+        return digest.hexdigest()
+
+
+def _artifact_bundle_files(spec: GenerativeSpec) -> list[tuple[BundleFile, bytes]]:
+    """Collect artifact entries in deterministic path order."""
+    entries: list[tuple[BundleFile, bytes]] = []
     for artifact in spec.artifacts:
         artifact_path = BUNDLE_ARTIFACT_PATHS.get(artifact.artifact_type)
         if not artifact_path:
             continue
-        files[artifact_path] = artifact.content.encode("utf-8")
-        bundle_files.append(
-            BundleFile(
-                path=artifact_path,
-                file_type=BundleFileType.ARTIFACT,
-                artifact_type=artifact.artifact_type,
+        entries.append(
+            (
+                BundleFile(
+                    path=artifact_path,
+                    file_type=BundleFileType.ARTIFACT,
+                    artifact_type=artifact.artifact_type,
+                ),
+                artifact.content.encode("utf-8"),
             )
         )
-
-    bundle_files.append(
-        BundleFile(path="metadata.json", file_type=BundleFileType.METADATA)
-    )
-    bundle_files.append(
-        BundleFile(path="checksums.json", file_type=BundleFileType.CHECKSUMS)
-    )
-
-    bundle_files_sorted = sorted(bundle_files, key=lambda entry: entry.path)
-    metadata = BundleMetadata(
+    return sorted(entries, key=lambda entry: entry[0].path)
+
+
+def _build_bundle_metadata(
+    spec: GenerativeSpec, artifact_files: list[BundleFile]
+) -> BundleMetadata:
+    """Build bundle metadata describing every file in the archive."""
+    bundle_files = [
+        BundleFile(path="genspec.jsonl", file_type=BundleFileType.GENSPEC),
+        *artifact_files,
+        BundleFile(path="metadata.json", file_type=BundleFileType.METADATA),
+        BundleFile(path="checksums.json", file_type=BundleFileType.CHECKSUMS),
+    ]
+    return BundleMetadata(
         schema=BUNDLE_SCHEMA,
         version=BUNDLE_VERSION,
         waypoints_version=spec.waypoints_version,
@@ -366,33 +482,22 @@ def _build_bundle_files(spec: GenerativeSpec) -> dict[str, bytes]:
         model=spec.model,
         model_version=spec.model_version,
         initial_idea=spec.initial_idea or None,
-        files=bundle_files_sorted,
-    )
-    files["metadata.json"] = _serialize_json(metadata.to_dict())
-
-    checksums = BundleChecksums(
-        algorithm="sha256",
-        files=_calculate_checksums(files),
+        files=sorted(bundle_files, key=lambda entry: entry.path),
     )
-    files["checksums.json"] = _serialize_json(checksums.to_dict())
-
-    return files
 
 
-def _serialize_spec(spec: GenerativeSpec) -> str:
-    """Serialize a GenerativeSpec to JSONL."""
-    lines = [json.dumps(spec.to_header_dict())]
+def _iter_spec_lines(spec: GenerativeSpec) -> Iterator[str]:
+    """Yield the JSONL lines of a GenerativeSpec, newline-terminated."""
+    yield json.dumps(spec.to_header_dict()) + "\n"
 
     for step in spec.steps:
-        lines.append(json.dumps(step.to_dict()))
+        yield json.dumps(step.to_dict()) + "\n"
 
     for decision in spec.decisions:
-        lines.append(json.dumps(decision.to_dict()))
+        yield json.dumps(decision.to_dict()) + "\n"
 
     for artifact in spec.artifacts:
-        lines.append(json.dumps(artifact.to_dict()))
-
-    return "\n".join(lines) + "\n"
+        yield json.dumps(artifact.to_dict()) + "\n"
 
 
 def _serialize_json(payload: dict[str, object]) -> bytes:
@@ -400,35 +505,39 @@ def _serialize_json(payload: dict[str, object]) -> bytes:
     return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8") + b"\n"
 
 
-def _calculate_checksums(files: dict[str, bytes]) -> dict[str, str]:
-    """Compute sha256 checksums for each bundle file (excluding checksums.json)."""
-    checksums: dict[str, str] = {}
-    for file_path in sorted(files):
-        if file_path == "checksums.json":
-            continue
-        checksums[file_path] = hashlib.sha256(files[file_path]).hexdigest()
-    return checksums
-
-
-def _write_bundle_zip(path: Path, files: dict[str, bytes]) -> None:
-    """Write bundle zip deterministically."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with zipfile.ZipFile(
-        path,
-        mode="w",
-        compression=zipfile.ZIP_DEFLATED,
-        compresslevel=9,
-    ) as archive:
-        for file_path in sorted(files):
-            info = zipfile.ZipInfo(file_path)
-            info.date_time = _ZIP_EPOCH
-            info.compress_type = zipfile.ZIP_DEFLATED
-            info.external_attr = 0o644 << 16
-            archive.writestr(info, files[file_path])
+def _chunk_lines(lines: Iterable[str]) -> Iterator[bytes]:
+    """Encode lines and group them into chunks of ~_BUNDLE_CHUNK_BYTES."""
+    buffer: list[bytes] = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= _BUNDLE_CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _zip_info(
+    file_path: str, compresslevel: int, compress_type: int = zipfile.ZIP_DEFLATED
+) -> zipfile.ZipInfo:
+    """Build a zip entry header with fixed timestamp and permissions."""
+    info = zipfile.ZipInfo(file_path)
+    info.date_time = _ZIP_EPOCH
+    info.compress_type = compress_type
+    info.compress_level = compresslevel
+    info.external_attr = 0o644 << 16
+    return info
 
 
 def _collect_session_steps(
-    project: "Project", spec: GenerativeSpec, start_counter: int = 0
+    project: "Project",
+    spec: GenerativeSpec,
+    start_counter: int = 0,
+    cache: ExportCache | None = None,
 ) -> int:
     """Collect generative steps from session files.
 
@@ -436,6 +545,7 @@ def _collect_session_steps(
         project: The project to collect from
         spec: The spec to add steps to
         start_counter: Starting step counter (default 0)
+        cache: Export cache for reusing steps of unchanged sessions
 
     Returns:
         The step counter after collecting all session steps.
@@ -454,55 +564,67 @@ def _collect_session_steps(
         if session_file.parent.name == "fly":
             continue
 
-        try:
-            history = SessionReader.load(session_file)
-            phase_name = history.phase or _infer_phase_from_filename(session_file.name)
-            phase = PHASE_MAP.get(phase_name)
-
-            if not phase:
-                logger.debug("Skipping unknown phase: %s", phase_name)
+        converted = cache.get(session_file) if cache is not None else None
+        if converted is None:
+            try:
+                converted = _convert_session_file(session_file)
+            except Exception as e:
+                logger.warning("Error processing session %s: %s", session_file, e)
                 continue
+            if cache is not None:
+                cache.put(session_file, converted)
 
-            # Get the known prompt for this phase
-            known = KNOWN_PROMPTS.get(phase, {})
-            system_prompt = known.get("system_prompt", "")
+        spec.steps.extend(renumber_steps(converted.steps, step_counter))
+        step_counter += converted.counter_delta
 
-            # For QA phases, we create steps for each Q&A pair
-            if phase == Phase.SHAPE_QA:
-                _collect_qa_steps(history, phase, system_prompt, spec, step_counter)
-                assistant_count = len(
-                    [m for m in history.messages if m.role == MessageRole.ASSISTANT]
-                )
-                step_counter += assistant_count
-            else:
-                # For generation phases, create a single step
-                step_counter += 1
-                step = _create_generation_step(
-                    step_id=f"step-{step_counter:03d}",
-                    phase=phase,
-                    history=history,
-                    system_prompt=system_prompt,
-                    session_file=session_file,
-                )
-                if step:
-                    spec.steps.append(step)
+    return step_counter
 
-        except Exception as e:
-            logger.warning("Error processing session %s: %s", session_file, e)
 
-    return step_counter
+def _convert_session_file(session_file: Path) -> CachedSteps:
+    """Convert one session file to steps numbered from ``step-001``."""
+    history = SessionReader.load(session_file)
+    phase_name = history.phase or _infer_phase_from_filename(session_file.name)
+    phase = PHASE_MAP.get(phase_name)
+
+    if not phase:
+        logger.debug("Skipping unknown phase: %s", phase_name)
+        return CachedSteps(steps=[], counter_delta=0)
+
+    # Get the known prompt for this phase
+    known = KNOWN_PROMPTS.get(phase, {})
+    system_prompt = known.get("system_prompt", "")
+
+    # For QA phases, we create steps for each Q&A pair
+    if phase == Phase.SHAPE_QA:
+        assistant_count = len(
+            [m for m in history.messages if m.role == MessageRole.ASSISTANT]
+        )
+        return CachedSteps(
+            steps=_collect_qa_steps(history, phase, system_prompt, 0),
+            counter_delta=assistant_count,
+        )
+
+    # For generation phases, create a single step
+    step = _create_generation_step(
+        step_id="step-001",
+        phase=phase,
+        history=history,
+        system_prompt=system_prompt,
+        session_file=session_file,
+    )
+    return CachedSteps(steps=[step] if step else [], counter_delta=1)
 
 
 def _collect_qa_steps(
     history: DialogueHistory,
     phase: Phase,
     system_prompt: str,
-    spec: GenerativeSpec,
     start_counter: int,
-) -> None:
+) -> list[GenerativeStep]:
     """Collect Q&A conversation steps."""
     messages = history.messages
     step_num = start_counter
+    steps: list[GenerativeStep] = []
 
     # Group messages into user-assistant pairs
     for i, msg in enumerate(messages):
@@ -535,7 +657,9 @@ def _collect_qa_steps(
                         output_type=OutputType.TEXT,
                     ),
                 )
-                spec.steps.append(step)
+                steps.append(step)
+
+    return steps
 
 
 def _create_generation_step(
@@ -606,26 +730,26 @@ def _collect_artifacts(project: "Project", spec: GenerativeSpec) -> None:
     docs_path = project.get_docs_path()
 
     # Collect idea brief
-    brief_files = sorted(docs_path.glob("idea-brief-*.md"), reverse=True)
-    if brief_files:
-        content = brief_files[0].read_text()
+    brief_file = latest_document_path(docs_path, "idea-brief")
+    if brief_file is not None:
+        content = brief_file.read_text()
         spec.artifacts.append(
             Artifact(
                 artifact_type=ArtifactType.IDEA_BRIEF,
                 content=content,
-                file_path=str(brief_files[0].relative_to(project.get_path())),
+                file_path=str(brief_file.relative_to(project.get_path())),
             )
         )
 
     # Collect product spec
-    spec_files = sorted(docs_path.glob("product-spec-*.md"), reverse=True)
-    if spec_files:
-        content = spec_files[0].read_text()
+    spec_file = latest_document_path(docs_path, "product-spec")
+    if spec_file is not None:
+        content = spec_file.read_text()
         spec.artifacts.append(
             Artifact(
                 artifact_type=ArtifactType.PRODUCT_SPEC,
                 content=content,
-                file_path=str(spec_files[0].relative_to(project.get_path())),
+                file_path=str(spec_file.relative_to(project.get_path())),
             )
         )
 
@@ -677,7 +801,10 @@ def _collect_artifacts(project: "Project", spec: GenerativeSpec) -> None:
 
 
 def _collect_fly_steps(
-    project: "Project", spec: GenerativeSpec, step_counter: int
+    project: "Project",
+    spec: GenerativeSpec,
+    step_counter: int,
+    cache: ExportCache | None = None,
 ) -> int:
     """Collect FLY phase steps from execution logs.
 
@@ -687,6 +814,7 @@ def _collect_fly_steps(
         project: The project to collect from
         spec: The spec to add steps to
         step_counter: Current step counter
+        cache: Export cache for reusing steps of unchanged logs
 
     Returns:
         Updated step counter
@@ -695,67 +823,76 @@ def _collect_fly_steps(
     if not fly_dir.exists():
         return step_counter
 
+    for log_file in sorted(fly_dir.glob("*.jsonl")):
+        converted = cache.get(log_file) if cache is not None else None
+        if converted is None:
+            try:
+                converted = _convert_fly_log(log_file)
+            except Exception as e:
+                logger.warning("Error processing fly log %s: %s", log_file, e)
+                continue
+            if cache is not None:
+                cache.put(log_file, converted)
+
+        spec.steps.extend(renumber_steps(converted.steps, step_counter))
+        step_counter += converted.counter_delta
+
+    return step_counter
+
+
+def _convert_fly_log(log_file: Path) -> CachedSteps:
+    """Convert one execution log to steps numbered from ``step-001``."""
     # Get the FLY system prompt template
     known = KNOWN_PROMPTS.get(Phase.FLY, {})
     system_prompt = known.get("system_prompt", "")
 
-    for log_file in sorted(fly_dir.glob("*.jsonl")):
-        try:
-            log = ExecutionLogReader.load(log_file)
-            last_iteration_reason = "initial"
-
-            # Collect ALL iteration_start entries
-            for entry in log.entries:
-                entry_type = entry.metadata.get("type")
-
-                # Track reason from previous events
-                if entry_type == "error":
-                    last_iteration_reason = "error"
-                elif entry_type == "intervention_needed":
-                    last_iteration_reason = entry.metadata.get(
-                        "intervention_type", "intervention"
-                    )
-
-                if entry_type == "iteration_start":
-                    iteration = entry.metadata.get("iteration", 1)
-                    step_counter += 1
-
-                    # Calculate per-iteration cost estimate
-                    total_iterations = sum(
-                        1
-                        for e in log.entries
-                        if e.metadata.get("type") == "iteration_start"
-                    )
-                    per_iter_cost = (
-                        log.total_cost_usd / total_iterations
-                        if total_iterations > 0
-                        else 0.0
-                    )
-
-                    step = GenerativeStep(
-                        step_id=f"step-{step_counter:03d}",
-                        phase=Phase.FLY,
-                        timestamp=entry.timestamp,
-                        input=StepInput(
-                            system_prompt=system_prompt,
-                            user_prompt=entry.metadata.get("prompt", ""),
-                            context={
-                                "waypoint_id": log.waypoint_id,
-                                "waypoint_title": log.waypoint_title,
-                                "iteration": iteration,
-                                "iteration_reason": last_iteration_reason,
-                            },
-                        ),
-                        output=StepOutput(content="", output_type=OutputType.TEXT),
-                        metadata=StepMetadata(cost_usd=per_iter_cost),
-                    )
-                    spec.steps.append(step)
-                    last_iteration_reason = "continue"
-
-        except Exception as e:
-            logger.warning("Error processing fly log %s: %s", log_file, e)
+    log = ExecutionLogReader.load(log_file)
+    last_iteration_reason = "initial"
+    steps: list[GenerativeStep] = []
 
-    return step_counter
+    # Calculate per-iteration cost estimate
+    total_iterations = sum(
+        1 for e in log.entries if e.metadata.get("type") == "iteration_start"
+    )
+    per_iter_cost = (
+        log.total_cost_usd / total_iterations if total_iterations > 0 else 0.0
+    )
+
+    # Collect ALL iteration_start entries
+    for entry in log.entries:
+        entry_type = entry.metadata.get("type")
+
+        # Track reason from previous events
+        if entry_type == "error":
+            last_iteration_reason = "error"
+        elif entry_type == "intervention_needed":
+            last_iteration_reason = entry.metadata.get(
+                "intervention_type", "intervention"
+            )
+
+        if entry_type == "iteration_start":
+            iteration = entry.metadata.get("iteration", 1)
+            step = GenerativeStep(
+                step_id=f"step-{len(steps) + 1:03d}",
+                phase=Phase.FLY,
+                timestamp=entry.timestamp,
+                input=StepInput(
+                    system_prompt=system_prompt,
+                    user_prompt=entry.metadata.get("prompt", ""),
+                    context={
+                        "waypoint_id": log.waypoint_id,
+                        "waypoint_title": log.waypoint_title,
+                        "iteration": iteration,
+                        "iteration_reason": last_iteration_reason,
+                    },
+                ),
+                output=StepOutput(content="", output_type=OutputType.TEXT),
+                metadata=StepMetadata(cost_usd=per_iter_cost),
+            )
+            steps.append(step)
+            last_iteration_reason = "continue"
+
+    return CachedSteps(steps=steps, counter_delta=len(steps))
 
 
 def export_to_file(spec: GenerativeSpec, path: Path) -> None:
@@ -767,7 +904,8 @@ def export_to_file(spec: GenerativeSpec, path: Path) -> None:
     """
     logger.info("Writing genspec to %s", path)
 
-    path.write_text(_serialize_spec(spec), encoding="utf-8")
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.writelines(_iter_spec_lines(spec))
 
     total_lines = 1 + len(spec.steps) + len(spec.decisions) + len(spec.artifacts)
     logger.info("Wrote %d lines to genspec", total_lines)
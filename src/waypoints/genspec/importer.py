@@ -8,11 +8,13 @@ import hashlib
 import json
 import logging
 import zipfile
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from waypoints.config.project_root import get_projects_root
 from waypoints.genspec.spec import (
@@ -31,6 +33,9 @@ from waypoints.models.waypoint import Waypoint, WaypointStatus
 
 logger = logging.getLogger(__name__)
 
+_HASH_CHUNK_SIZE = 1024 * 1024
+_VERIFY_WORKERS = 4
+
 
 @dataclass
 class ValidationResult:
@@ -49,11 +54,29 @@ class ValidationResult:
         return len(self.warnings) > 0
 
 
-def import_from_file(path: Path) -> GenerativeSpec:
-    """Import a GenerativeSpec from a JSONL file.
+STEP_LINE_PREFIX = '{"type": "step"'
+
+GenSpecRecord = GenerativeSpec | GenerativeStep | UserDecision | Artifact
+
+
+@dataclass
+class GenSpecOutline:
+    """Header, decisions and artifacts of a genspec with steps only counted.
+
+    Used by viewers that do not need step bodies, so multi-hundred-MB
+    transcripts can be inspected without parsing every step.
+    """
+
+    spec: GenerativeSpec
+    step_count: int
+
+
+def import_from_file(path: Path, *, include_steps: bool = True) -> GenerativeSpec:
+    """Import a GenerativeSpec from a JSONL file or bundle zip.
 
     Args:
-        path: Path to the genspec.jsonl file
+        path: Path to the genspec.jsonl file or .genspec.zip bundle
+        include_steps: If False, step lines are skipped without parsing
 
     Returns:
         Parsed GenerativeSpec
@@ -62,25 +85,110 @@ def import_from_file(path: Path) -> GenerativeSpec:
         FileNotFoundError: If file doesn't exist
         ValueError: If file format is invalid
     """
+    logger.info("Importing genspec from %s", path)
+    with open_genspec_lines(path) as (lines, source):
+        return import_from_lines(lines, source=source, include_steps=include_steps)
+
+
+def import_outline(path: Path) -> GenSpecOutline:
+    """Load a genspec's header, decisions and artifacts, counting steps."""
+    step_count = 0
+    spec: GenerativeSpec | None = None
+    decisions: list[UserDecision] = []
+    artifacts: list[Artifact] = []
+
+    with open_genspec_lines(path) as (lines, source):
+        for record in iter_genspec_records(lines, source=source, include_steps=False):
+            if record is None:
+                step_count += 1
+            elif isinstance(record, GenerativeSpec):
+                spec = record
+            elif isinstance(record, UserDecision):
+                decisions.append(record)
+            elif isinstance(record, Artifact):
+                artifacts.append(record)
+
+    if spec is None:
+        raise ValueError("Missing header in genspec file")
+    spec.decisions = decisions
+    spec.artifacts = artifacts
+    return GenSpecOutline(spec=spec, step_count=step_count)
+
+
+def iter_steps(path: Path) -> Iterator[GenerativeStep]:
+    """Lazily iterate the steps of a genspec file or bundle.
+
+    Only one step is held in memory at a time.
+    """
+    with open_genspec_lines(path) as (lines, source):
+        for record in iter_genspec_records(lines, source=source):
+            if isinstance(record, GenerativeStep):
+                yield record
+
+
+@contextmanager
+def open_genspec_lines(
+    path: Path, *, verify_checksums: bool = True
+) -> Iterator[tuple[Iterator[str], str]]:
+    """Open a genspec JSONL file or bundle as a stream of lines.
+
+    Bundle entries are decompressed incrementally. When checksums are
+    present, auxiliary files are verified up front and the genspec entry is
+    hashed as it streams; a mismatch raises ``ValueError`` once the stream
+    is exhausted.
+
+    Yields:
+        Tuple of (line iterator, source description for error messages)
+    """
     if not path.exists():
         raise FileNotFoundError(f"Genspec file not found: {path}")
 
-    logger.info("Importing genspec from %s", path)
-    if zipfile.is_zipfile(path):
-        return _import_from_bundle(path)
+    if not zipfile.is_zipfile(path):
+        with open(path, encoding="utf-8") as handle:
+            yield handle, str(path)
+        return
+
+    with zipfile.ZipFile(path) as archive:
+        metadata = _read_bundle_metadata(archive)
+        checksums = _read_bundle_checksums(archive) if verify_checksums else None
+        genspec_path = metadata.genspec_path if metadata else "genspec.jsonl"
+        expected_hash: str | None = None
+        if checksums:
+            expected_hash = checksums.files.get(genspec_path)
+            _verify_bundle_checksums(archive, checksums, skip={genspec_path})
+        try:
+            raw = archive.open(genspec_path)
+        except KeyError as exc:
+            raise ValueError(f"Bundle missing genspec at {genspec_path}") from exc
+        with raw:
+            lines = _iter_hashed_lines(raw, expected_hash, genspec_path)
+            yield lines, f"{path}::{genspec_path}"
+
 
-    with open(path, encoding="utf-8") as handle:
-        return import_from_lines(handle, source=str(path))
+def _iter_hashed_lines(
+    raw: IO[bytes], expected_hash: str | None, file_path: str
+) -> Iterator[str]:
+    """Decode lines from a binary stream while hashing the raw bytes."""
+    digest = hashlib.sha256()
+    for raw_line in raw:
+        digest.update(raw_line)
+        yield raw_line.decode("utf-8")
+    if expected_hash is not None:
+        _check_hash(file_path, expected_hash, digest.hexdigest())
 
 
 def import_from_lines(
-    lines: Iterable[str], *, source: str | None = None
+    lines: Iterable[str],
+    *,
+    source: str | None = None,
+    include_steps: bool = True,
 ) -> GenerativeSpec:
     """Import a GenerativeSpec from JSONL lines.
 
     Args:
         lines: Iterable of JSONL lines
         source: Optional source description for error messages
+        include_steps: If False, step lines are skipped without parsing
 
     Returns:
         Parsed GenerativeSpec
@@ -90,7 +198,53 @@ def import_from_lines(
     decisions: list[UserDecision] = []
     artifacts: list[Artifact] = []
 
+    for record in iter_genspec_records(
+        lines, source=source, include_steps=include_steps
+    ):
+        if isinstance(record, GenerativeSpec):
+            spec = record
+        elif isinstance(record, GenerativeStep):
+            steps.append(record)
+        elif isinstance(record, UserDecision):
+            decisions.append(record)
+        elif isinstance(record, Artifact):
+            artifacts.append(record)
+
+    if spec is None:
+        raise ValueError("Missing header in genspec file")
+
+    spec.steps = steps
+    spec.decisions = decisions
+    spec.artifacts = artifacts
+
+    logger.info(
+        "Imported spec: %d steps, %d decisions, %d artifacts",
+        len(steps),
+        len(decisions),
+        len(artifacts),
+    )
+
+    return spec
+
+
+def iter_genspec_records(
+    lines: Iterable[str],
+    *,
+    source: str | None = None,
+    include_steps: bool = True,
+) -> Iterator[GenSpecRecord | None]:
+    """Parse JSONL lines into genspec records one at a time.
+
+    The header is yielded first as a ``GenerativeSpec`` with no steps,
+    decisions or artifacts attached. When ``include_steps`` is False, each
+    step line yields ``None`` instead of being parsed, so callers can still
+    count steps cheaply.
+    """
     for line_num, line in enumerate(lines):
+        if line_num > 0 and not include_steps and line.startswith(STEP_LINE_PREFIX):
+            yield None
+            continue
+
         line = line.strip()
         if not line:
             continue
@@ -109,54 +263,22 @@ def import_from_lines(
                 raise ValueError(
                     f"Invalid schema: expected 'genspec', got '{data.get('_schema')}'"
                 )
-            spec = GenerativeSpec.from_header_dict(data)
+            yield GenerativeSpec.from_header_dict(data)
             continue
 
         # Parse entry by type
         entry_type = data.get("type")
         if entry_type == "step":
-            steps.append(GenerativeStep.from_dict(data))
+            yield GenerativeStep.from_dict(data) if include_steps else None
         elif entry_type == "decision":
-            decisions.append(UserDecision.from_dict(data))
+            yield UserDecision.from_dict(data)
         elif entry_type == "artifact":
-            artifacts.append(Artifact.from_dict(data))
+            yield Artifact.from_dict(data)
         else:
             logger.warning(
                 "Unknown entry type on line %d: %s", line_num + 1, entry_type
             )
 
-    if spec is None:
-        raise ValueError("Missing header in genspec file")
-
-    spec.steps = steps
-    spec.decisions = decisions
-    spec.artifacts = artifacts
-
-    logger.info(
-        "Imported spec: %d steps, %d decisions, %d artifacts",
-        len(steps),
-        len(decisions),
-        len(artifacts),
-    )
-
-    return spec
-
-
-def _import_from_bundle(path: Path) -> GenerativeSpec:
-    """Import a GenerativeSpec from a bundle zip."""
-    with zipfile.ZipFile(path) as archive:
-        metadata = _read_bundle_metadata(archive)
-        checksums = _read_bundle_checksums(archive)
-        if checksums:
-            _verify_bundle_checksums(archive, checksums)
-        genspec_path = metadata.genspec_path if metadata else "genspec.jsonl"
-        try:
-            content = archive.read(genspec_path).decode("utf-8")
-        except KeyError as exc:
-            raise ValueError(f"Bundle missing genspec at {genspec_path}") from exc
-
-    return import_from_lines(content.splitlines(), source=f"{path}::{genspec_path}")
-
 
 def _read_bundle_metadata(archive: zipfile.ZipFile) -> BundleMetadata | None:
     try:
@@ -175,24 +297,58 @@ def _read_bundle_checksums(archive: zipfile.ZipFile) -> BundleChecksums | None:
 
 
 def _verify_bundle_checksums(
-    archive: zipfile.ZipFile, checksums: BundleChecksums
+    archive: zipfile.ZipFile,
+    checksums: BundleChecksums,
+    skip: set[str] | None = None,
 ) -> None:
+    """Verify bundle entries against their checksums, several at a time.
+
+    Each worker opens its own member stream; decompression and hashing
+    release the GIL. Errors are raised in checksum order.
+    """
     if checksums.algorithm != "sha256":
         raise ValueError(f"Unsupported checksum algorithm: {checksums.algorithm}")
 
-    for file_path, expected_hash in checksums.files.items():
-        try:
-            content = archive.read(file_path)
-        except KeyError as exc:
-            raise ValueError(
-                f"Bundle missing file listed in checksums: {file_path}"
-            ) from exc
-        actual_hash = hashlib.sha256(content).hexdigest()
-        if actual_hash != expected_hash:
-            raise ValueError(
-                f"Checksum mismatch for {file_path}: "
-                f"expected {expected_hash}, got {actual_hash}"
-            )
+    pending = [
+        (file_path, expected_hash)
+        for file_path, expected_hash in checksums.files.items()
+        if not (skip and file_path in skip)
+    ]
+    if not pending:
+        return
+    with ThreadPoolExecutor(
+        max_workers=min(_VERIFY_WORKERS, len(pending)),
+        thread_name_prefix="genspec-verify",
+    ) as pool:
+        results = pool.map(
+            lambda file_path: _hash_bundle_member(archive, file_path),
+            [file_path for file_path, _ in pending],
+        )
+        for (file_path, expected_hash), actual_hash in zip(
+            pending, results, strict=True
+        ):
+            _check_hash(file_path, expected_hash, actual_hash)
+
+
+def _hash_bundle_member(archive: zipfile.ZipFile, file_path: str) -> str:
+    digest = hashlib.sha256()
+    try:
+        with archive.open(file_path) as member:
+            for chunk in iter(lambda: member.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except KeyError as exc:
+        raise ValueError(
+            f"Bundle missing file listed in checksums: {file_path}"
+        ) from exc
+    return digest.hexdigest()
+
+
+def _check_hash(file_path: str, expected_hash: str, actual_hash: str) -> None:
+    if actual_hash != expected_hash:
+        raise ValueError(
+            f"Checksum mismatch for {file_path}: "
+            f"expected {expected_hash}, got {actual_hash}"
+        )
 
 
 def validate_spec(spec: GenerativeSpec) -> ValidationResult:
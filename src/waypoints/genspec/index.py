@@ -0,0 +1,390 @@
+"""Byte-offset index over genspec JSONL files and bundles.
+
+The index records where each step and artifact line lives in the genspec
+stream, together with the small amount of metadata viewers need for labels
+(phase, timestamp, cost, FLY context). Viewers open a genspec through the
+index and load step or artifact bodies only when one is selected.
+
+Indexes are built in a single pass and cached next to the source file as
+``<name>.index.json``; the cache is reused while the source's size and
+modification time are unchanged.
+
+Offsets in a bundle refer to the decompressed genspec member. Seeking a zip
+member re-decompresses it from the start, so the first record loaded from a
+bundle extracts the member once into a temporary file that lives as long as
+the index; later loads seek that file directly.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import tempfile
+import zipfile
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+from waypoints.genspec.spec import (
+    Artifact,
+    ArtifactType,
+    BundleMetadata,
+    GenerativeSpec,
+    GenerativeStep,
+    Phase,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_SCHEMA = "genspec-index"
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".index.json"
+_STEP_CONTEXT_KEYS = ("waypoint_id", "iteration", "iteration_reason")
+_LOADED_STEP_CACHE_SIZE = 16
+
+
+@dataclass(frozen=True, slots=True)
+class StepIndexEntry:
+    """Location and label metadata for one step line."""
+
+    step_id: str
+    phase: Phase
+    timestamp: datetime
+    offset: int
+    length: int
+    cost_usd: float | None = None
+    tokens_in: int | None = None
+    tokens_out: int | None = None
+    context: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "step_id": self.step_id,
+            "phase": self.phase.value,
+            "timestamp": self.timestamp.isoformat(),
+            "offset": self.offset,
+            "length": self.length,
+            "cost_usd": self.cost_usd,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "context": self.context,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StepIndexEntry:
+        return cls(
+            step_id=data["step_id"],
+            phase=Phase(data["phase"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            offset=int(data["offset"]),
+            length=int(data["length"]),
+            cost_usd=data.get("cost_usd"),
+            tokens_in=data.get("tokens_in"),
+            tokens_out=data.get("tokens_out"),
+            context=dict(data.get("context") or {}),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactIndexEntry:
+    """Location and label metadata for one artifact line."""
+
+    artifact_type: ArtifactType
+    chars: int
+    offset: int
+    length: int
+    file_path: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "artifact_type": self.artifact_type.value,
+            "chars": self.chars,
+            "offset": self.offset,
+            "length": self.length,
+            "file_path": self.file_path,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ArtifactIndexEntry:
+        return cls(
+            artifact_type=ArtifactType(data["artifact_type"]),
+            chars=int(data["chars"]),
+            offset=int(data["offset"]),
+            length=int(data["length"]),
+            file_path=data.get("file_path"),
+        )
+
+
+@dataclass
+class GenSpecIndex:
+    """Index of a genspec file with on-demand loading of step bodies."""
+
+    path: Path
+    member: str | None
+    header: GenerativeSpec
+    steps: list[StepIndexEntry] = field(default_factory=list)
+    artifacts: list[ArtifactIndexEntry] = field(default_factory=list)
+    decision_count: int = 0
+    _loaded: OrderedDict[int, GenerativeStep] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _extracted: IO[bytes] | None = field(default=None, init=False, repr=False)
+
+    def steps_by_phase(self, phase: Phase) -> list[StepIndexEntry]:
+        """Get index entries for a phase, in file order."""
+        return [entry for entry in self.steps if entry.phase == phase]
+
+    def phase_counts(self) -> dict[str, int]:
+        """Count steps per phase value."""
+        counts: dict[str, int] = {}
+        for entry in self.steps:
+            counts[entry.phase.value] = counts.get(entry.phase.value, 0) + 1
+        return counts
+
+    def load_step(self, entry: StepIndexEntry) -> GenerativeStep:
+        """Load the full step for an index entry.
+
+        A handful of recently loaded steps are kept so moving the cursor
+        back and forth does not re-read the file.
+        """
+        cached = self._loaded.get(entry.offset)
+        if cached is not None:
+            self._loaded.move_to_end(entry.offset)
+            return cached
+        step = GenerativeStep.from_dict(self._read_record(entry.offset, entry.length))
+        self._loaded[entry.offset] = step
+        if len(self._loaded) > _LOADED_STEP_CACHE_SIZE:
+            self._loaded.popitem(last=False)
+        return step
+
+    def load_artifact(self, entry: ArtifactIndexEntry) -> Artifact:
+        """Load the full artifact for an index entry."""
+        return Artifact.from_dict(self._read_record(entry.offset, entry.length))
+
+    def _read_record(self, offset: int, length: int) -> dict[str, Any]:
+        if self.member is None:
+            with open(self.path, "rb") as handle:
+                handle.seek(offset)
+                raw = handle.read(length)
+        else:
+            stream = self._extracted_member()
+            stream.seek(offset)
+            raw = stream.read(length)
+        data: dict[str, Any] = json.loads(raw.decode("utf-8"))
+        return data
+
+    def _extracted_member(self) -> IO[bytes]:
+        """Decompress the bundle's genspec member once into a temporary file."""
+        if self._extracted is None:
+            extracted = tempfile.TemporaryFile()
+            try:
+                with _open_genspec_stream(self.path, self.member) as stream:
+                    shutil.copyfileobj(stream, extracted)
+            except BaseException:
+                extracted.close()
+                raise
+            self._extracted = extracted
+        return self._extracted
+
+    def to_dict(self, source_size: int, source_mtime_ns: int) -> dict[str, Any]:
+        return {
+            "schema": INDEX_SCHEMA,
+            "version": INDEX_VERSION,
+            "source": {
+                "member": self.member,
+                "size": source_size,
+                "mtime_ns": source_mtime_ns,
+            },
+            "header": self.header.to_header_dict(),
+            "steps": [entry.to_dict() for entry in self.steps],
+            "artifacts": [entry.to_dict() for entry in self.artifacts],
+            "decision_count": self.decision_count,
+        }
+
+    @classmethod
+    def from_dict(cls, path: Path, data: dict[str, Any]) -> GenSpecIndex:
+        source = data.get("source") or {}
+        return cls(
+            path=path,
+            member=source.get("member"),
+            header=GenerativeSpec.from_header_dict(data["header"]),
+            steps=[StepIndexEntry.from_dict(item) for item in data.get("steps", [])],
+            artifacts=[
+                ArtifactIndexEntry.from_dict(item) for item in data.get("artifacts", [])
+            ],
+            decision_count=int(data.get("decision_count", 0)),
+        )
+
+
+def index_path_for(path: Path) -> Path:
+    """Location of the cached index for a genspec file."""
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def load_genspec_index(path: Path, *, use_cache: bool = True) -> GenSpecIndex:
+    """Open a genspec via its byte-offset index, building it if needed.
+
+    Args:
+        path: Path to a genspec.jsonl file or .genspec.zip bundle
+        use_cache: Reuse and persist the index next to the source file
+
+    Raises:
+        FileNotFoundError: If the genspec does not exist
+        ValueError: If the genspec is malformed
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Genspec not found: {path}")
+
+    stat = path.stat()
+    cache_path = index_path_for(path)
+    if use_cache:
+        cached = _load_cached_index(path, cache_path, stat.st_size, stat.st_mtime_ns)
+        if cached is not None:
+            return cached
+
+    index = build_genspec_index(path)
+    if use_cache:
+        try:
+            cache_path.write_text(
+                json.dumps(index.to_dict(stat.st_size, stat.st_mtime_ns)),
+                encoding="utf-8",
+            )
+        except OSError as exc:
+            logger.warning("Could not cache genspec index %s: %s", cache_path, exc)
+    return index
+
+
+def build_genspec_index(path: Path) -> GenSpecIndex:
+    """Scan a genspec once and record the offset of every entry."""
+    member = _bundle_member(path)
+    header: GenerativeSpec | None = None
+    steps: list[StepIndexEntry] = []
+    artifacts: list[ArtifactIndexEntry] = []
+    decision_count = 0
+    source = f"{path}::{member}" if member else str(path)
+
+    with _open_genspec_stream(path, member) as stream:
+        offset = 0
+        for line_num, raw_line in enumerate(stream):
+            line_offset = offset
+            offset += len(raw_line)
+            if not raw_line.strip():
+                continue
+            try:
+                data = json.loads(raw_line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(
+                    f"Invalid JSON on line {line_num + 1} in {source}: {exc}"
+                ) from exc
+
+            if line_num == 0:
+                if data.get("_schema") != "genspec":
+                    raise ValueError(
+                        "Invalid schema: expected 'genspec', "
+                        f"got '{data.get('_schema')}'"
+                    )
+                header = GenerativeSpec.from_header_dict(data)
+                continue
+
+            entry_type = data.get("type")
+            if entry_type == "step":
+                steps.append(_step_entry(data, line_offset, len(raw_line)))
+            elif entry_type == "artifact":
+                artifacts.append(
+                    ArtifactIndexEntry(
+                        artifact_type=ArtifactType(data["artifact_type"]),
+                        chars=len(data.get("content", "")),
+                        offset=line_offset,
+                        length=len(raw_line),
+                        file_path=data.get("file_path"),
+                    )
+                )
+            elif entry_type == "decision":
+                decision_count += 1
+
+    if header is None:
+        raise ValueError("Missing header in genspec file")
+
+    logger.info("Indexed %s: %d steps, %d artifacts", path, len(steps), len(artifacts))
+    return GenSpecIndex(
+        path=path,
+        member=member,
+        header=header,
+        steps=steps,
+        artifacts=artifacts,
+        decision_count=decision_count,
+    )
+
+
+def _step_entry(data: dict[str, Any], offset: int, length: int) -> StepIndexEntry:
+    metadata = data.get("metadata") or {}
+    context = (data.get("input") or {}).get("context") or {}
+    return StepIndexEntry(
+        step_id=data["step_id"],
+        phase=Phase(data["phase"]),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        offset=offset,
+        length=length,
+        cost_usd=metadata.get("cost_usd"),
+        tokens_in=metadata.get("tokens_in"),
+        tokens_out=metadata.get("tokens_out"),
+        context={key: context[key] for key in _STEP_CONTEXT_KEYS if key in context},
+    )
+
+
+def _load_cached_index(
+    path: Path, cache_path: Path, size: int, mtime_ns: int
+) -> GenSpecIndex | None:
+    if not cache_path.exists():
+        return None
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        source = data.get("source") or {}
+        if (
+            data.get("schema") != INDEX_SCHEMA
+            or data.get("version") != INDEX_VERSION
+            or source.get("size") != size
+            or source.get("mtime_ns") != mtime_ns
+        ):
+            return None
+        return GenSpecIndex.from_dict(path, data)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Ignoring unreadable genspec index %s: %s", cache_path, exc)
+        return None
+
+
+def _bundle_member(path: Path) -> str | None:
+    """Name of the genspec entry inside a bundle, or None for plain JSONL."""
+    if not zipfile.is_zipfile(path):
+        return None
+    with zipfile.ZipFile(path) as archive:
+        try:
+            payload = json.loads(archive.read("metadata.json").decode("utf-8"))
+        except KeyError:
+            return "genspec.jsonl"
+    return BundleMetadata.from_dict(payload).genspec_path
+
+
+@contextmanager
+def _open_genspec_stream(path: Path, member: str | None) -> Iterator[IO[bytes]]:
+    """Open the raw genspec byte stream for a sequential read.
+
+    A bundle member is a ``ZipExtFile``: it can seek, but only by
+    decompressing from the start, so it is not used for random access.
+    """
+    if member is None:
+        with open(path, "rb") as handle:
+            yield handle
+        return
+    with zipfile.ZipFile(path) as archive:
+        try:
+            stream = archive.open(member)
+        except KeyError as exc:
+            raise ValueError(f"Bundle missing genspec at {member}") from exc
+        with stream:
+            yield stream
@@ -7,7 +7,13 @@ import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 
-from waypoints.genspec.importer import import_from_lines
+from waypoints.genspec.importer import (
+    GenSpecOutline,
+    import_from_lines,
+    import_outline,
+    open_genspec_lines,
+)
+from waypoints.genspec.index import GenSpecIndex, load_genspec_index
 from waypoints.genspec.spec import BundleChecksums, BundleMetadata, GenerativeSpec
 
 
@@ -23,17 +29,38 @@ class ViewOptions:
 
 def load_genspec(
     path: Path,
+    *,
+    include_steps: bool = True,
 ) -> tuple[GenerativeSpec, BundleMetadata | None, BundleChecksums | None]:
-    """Load a genspec from JSONL file or bundle zip."""
-    if not path.exists():
-        raise FileNotFoundError(f"Genspec not found: {path}")
+    """Load a genspec from JSONL file or bundle zip.
+
+    Bundle entries are streamed rather than read into memory. With
+    ``include_steps=False`` only the header, decisions and artifacts are
+    parsed.
+    """
+    metadata, checksums = _read_bundle_info(path)
+    with open_genspec_lines(path, verify_checksums=False) as (lines, source):
+        spec = import_from_lines(lines, source=source, include_steps=include_steps)
+    return spec, metadata, checksums
+
+
+def load_genspec_outline(
+    path: Path,
+) -> tuple[GenSpecOutline, BundleMetadata | None, BundleChecksums | None]:
+    """Load header, decisions and artifacts, counting steps without parsing."""
+    metadata, checksums = _read_bundle_info(path)
+    return import_outline(path), metadata, checksums
+
 
-    if zipfile.is_zipfile(path):
-        return _load_from_bundle(path)
+def open_genspec_index(
+    path: Path,
+) -> tuple[GenSpecIndex, BundleMetadata | None, BundleChecksums | None]:
+    """Open a genspec through its cached byte-offset index.
 
-    with open(path, encoding="utf-8") as handle:
-        spec = import_from_lines(handle, source=str(path))
-    return spec, None, None
+    Step and artifact bodies are read on demand via the returned index.
+    """
+    metadata, checksums = _read_bundle_info(path)
+    return load_genspec_index(path), metadata, checksums
 
 
 def render_view(
@@ -41,8 +68,15 @@ def render_view(
     metadata: BundleMetadata | None,
     checksums: BundleChecksums | None,
     options: ViewOptions,
+    *,
+    step_count: int | None = None,
 ) -> str:
-    """Render a genspec view for terminal output."""
+    """Render a genspec view for terminal output.
+
+    ``step_count`` overrides ``len(spec.steps)`` when steps were counted
+    but not loaded (see ``load_genspec_outline``).
+    """
+    total_steps = len(spec.steps) if step_count is None else step_count
     lines: list[str] = []
     lines.append("GenSpec View")
     lines.append(f"Source: {'bundle' if metadata else 'jsonl'}")
@@ -55,7 +89,7 @@ def render_view(
         lines.append(f"Model Version: {spec.model_version}")
     lines.append(
         "Steps: "
-        f"{len(spec.steps)}  Decisions: {len(spec.decisions)}  "
+        f"{total_steps}  Decisions: {len(spec.decisions)}  "
         f"Artifacts: {len(spec.artifacts)}"
     )
     if metadata:
@@ -75,23 +109,15 @@ def render_view(
     return "\n".join(lines)
 
 
-def _load_from_bundle(
+def _read_bundle_info(
     path: Path,
-) -> tuple[GenerativeSpec, BundleMetadata | None, BundleChecksums | None]:
-    metadata: BundleMetadata | None = None
-    checksums: BundleChecksums | None = None
-
+) -> tuple[BundleMetadata | None, BundleChecksums | None]:
+    if not path.exists():
+        raise FileNotFoundError(f"Genspec not found: {path}")
+    if not zipfile.is_zipfile(path):
+        return None, None
     with zipfile.ZipFile(path) as archive:
-        metadata = _read_bundle_metadata(archive)
-        checksums = _read_bundle_checksums(archive)
-        genspec_path = metadata.genspec_path if metadata else "genspec.jsonl"
-        try:
-            content = archive.read(genspec_path).decode("utf-8")
-        except KeyError as exc:
-            raise ValueError(f"Missing genspec in bundle: {genspec_path}") from exc
-
-    spec = import_from_lines(content.splitlines(), source=f"{path}::{genspec_path}")
-    return spec, metadata, checksums
+        return _read_bundle_metadata(archive), _read_bundle_checksums(archive)
 
 
 def _read_bundle_metadata(archive: zipfile.ZipFile) -> BundleMetadata | None:
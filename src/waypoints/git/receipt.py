@@ -13,6 +13,9 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from waypoints.git.receipt_index import ReceiptIndex
+from waypoints.models.blob_store import BlobStore
+
 if TYPE_CHECKING:
     from waypoints.models.project import Project
 
@@ -294,18 +297,8 @@ class ReceiptValidator:
         return receipts_dir / f"{safe_id}-*.json"
 
     def find_latest_receipt(self, project: "Project", waypoint_id: str) -> Path | None:
-        """Find the most recent receipt for a waypoint."""
-        receipts_dir = project.get_path() / "receipts"
-        if not receipts_dir.exists():
-            return None
-
-        safe_id = waypoint_id.lower().replace("-", "")
-        matching = sorted(
-            receipts_dir.glob(f"{safe_id}-*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
-        return matching[0] if matching else None
+        """Find the most recent receipt for a waypoint via the receipt index."""
+        return ReceiptIndex(project.get_path() / "receipts").latest(waypoint_id)
 
 
 @dataclass
@@ -339,6 +332,7 @@ def _write_output_file(
     category: str,
     stream: str,
     content: str,
+    blob_store: BlobStore | None = None,
 ) -> str:
     if not content:
         return ""
@@ -347,7 +341,12 @@ def _write_output_file(
     filename = f"{output_prefix}-{safe_category}.{stream}.txt"
     path = output_dir / filename
     output_dir.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    if blob_store is not None:
+        # Reruns repeat the same output; link to one shared copy.
+        digest = blob_store.put_bytes(content.encode("utf-8"))
+        blob_store.materialize(digest, path)
+    else:
+        path.write_text(content, encoding="utf-8")
     return filename
 
 
@@ -410,9 +409,13 @@ class ReceiptBuilder:
         output_prefix: str | None = None,
         max_snippet: int = 2000,
         soft_evidence: dict[str, CapturedEvidence] | None = None,
+        blob_store: BlobStore | None = None,
     ) -> ChecklistReceipt:
         """Build receipt from captured evidence.
 
+        Full outputs are written next to the receipt when ``output_dir`` and
+        ``output_prefix`` are given, as links into ``blob_store`` if provided.
+
         Returns:
             ChecklistReceipt with waypoint context and captured evidence.
         """
@@ -422,10 +425,10 @@ class ReceiptBuilder:
             stderr_path = ""
             if output_dir and output_prefix:
                 stdout_path = _write_output_file(
-                    output_dir, output_prefix, category, "stdout", ev.stdout
+                    output_dir, output_prefix, category, "stdout", ev.stdout, blob_store
                 )
                 stderr_path = _write_output_file(
-                    output_dir, output_prefix, category, "stderr", ev.stderr
+                    output_dir, output_prefix, category, "stderr", ev.stderr, blob_store
                 )
             checklist_items.append(
                 ChecklistItem(
@@ -462,6 +465,7 @@ class ReceiptBuilder:
                         f"soft-{label}",
                         "stdout",
                         ev.stdout,
+                        blob_store,
                     )
                     stderr_path = _write_output_file(
                         output_dir,
@@ -469,6 +473,7 @@ class ReceiptBuilder:
                         f"soft-{label}",
                         "stderr",
                         ev.stderr,
+                        blob_store,
                     )
                 soft_items.append(
                     ChecklistItem(
@@ -496,6 +501,7 @@ class ReceiptBuilder:
                     f"criterion-{criterion.index}",
                     "evidence",
                     criterion.evidence,
+                    blob_store,
                 )
                 evidence = _build_output_snippet(criterion.evidence, max_snippet)
             criteria_list.append(
@@ -0,0 +1,315 @@
+"""Manifest of checklist receipts with O(1) latest-receipt lookup.
+
+Every finalize attempt writes a ``<waypoint>-<timestamp>.json`` receipt, so
+projects with many reruns accumulate thousands of them. Globbing and
+``stat``-ing the directory on every commit gate and debrief gets slower as
+history grows. The index keeps ``receipts/.index/manifest.json``: per
+waypoint, receipt files in order with validity, completion time and
+evidence size.
+
+Only the newest ``KEEP_FULL_RECEIPTS`` receipts per waypoint stay in the
+format written by ``ReceiptBuilder``. Older ones are compacted: their full
+output files are replaced by references into the project blob store, inline
+snippets that duplicate a stored output are dropped, and the JSON is
+rewritten without indentation.
+
+The manifest is trusted while the receipts directory is unchanged since it
+was written; receipts written behind the index's back trigger one rescan.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from waypoints.models.blob_store import blob_store_for
+
+if TYPE_CHECKING:
+    from waypoints.git.receipt import ChecklistReceipt
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIRNAME = ".index"
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+KEEP_FULL_RECEIPTS = 3
+
+_OUTPUT_FIELDS = (
+    ("stdout", "stdout_path"),
+    ("stderr", "stderr_path"),
+    ("evidence", "evidence_path"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ReceiptEntry:
+    """Manifest record for one receipt file."""
+
+    file: str
+    completed_at: str
+    valid: bool | None  # None when the receipt could not be parsed
+    evidence_bytes: int
+    compact: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "file": self.file,
+            "completed_at": self.completed_at,
+            "valid": self.valid,
+            "evidence_bytes": self.evidence_bytes,
+            "compact": self.compact,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ReceiptEntry:
+        return cls(
+            file=str(data["file"]),
+            completed_at=str(data.get("completed_at", "")),
+            valid=data.get("valid"),
+            evidence_bytes=int(data.get("evidence_bytes", 0)),
+            compact=bool(data.get("compact", False)),
+        )
+
+
+def receipt_key(waypoint_id: str) -> str:
+    """Normalize a waypoint ID the way receipt filenames do."""
+    return waypoint_id.lower().replace("-", "")
+
+
+class ReceiptIndex:
+    """Manifest of a project's receipts directory."""
+
+    def __init__(self, receipts_dir: Path) -> None:
+        self.receipts_dir = receipts_dir
+        self._index_path = receipts_dir / INDEX_DIRNAME
+        self._manifest_path = self._index_path / MANIFEST_FILENAME
+        self._blobs = blob_store_for(receipts_dir.parent)
+
+    # ─── Queries ──────────────────────────────────────────────────────
+
+    def latest(self, waypoint_id: str) -> Path | None:
+        """Return the newest receipt for ``waypoint_id``, if any."""
+        entries = self.entries(waypoint_id)
+        return self.receipts_dir / entries[-1].file if entries else None
+
+    def entries(self, waypoint_id: str | None = None) -> list[ReceiptEntry]:
+        """Return receipts for one waypoint (or all), oldest first."""
+        if not self.receipts_dir.exists():
+            return []
+        manifest = self._current_manifest()
+        waypoints: dict[str, list[dict[str, Any]]] = manifest["waypoints"]
+        if waypoint_id is not None:
+            items = waypoints.get(receipt_key(waypoint_id), [])
+        else:
+            items = [item for group in waypoints.values() for item in group]
+        return [ReceiptEntry.from_dict(item) for item in items]
+
+    # ─── Recording ────────────────────────────────────────────────────
+
+    def record(self, receipt_path: Path, receipt: ChecklistReceipt) -> None:
+        """Add a freshly saved receipt and compact that waypoint's older ones."""
+        manifest = self._current_manifest(exclude=receipt_path.name)
+        data = receipt.to_dict()
+        group = manifest["waypoints"].setdefault(_key_for_file(receipt_path), [])
+        group[:] = [item for item in group if item["file"] != receipt_path.name]
+        group.append(self._entry_for(receipt_path, data).to_dict())
+        group.sort(key=lambda item: item["file"])
+
+        for item in group[:-KEEP_FULL_RECEIPTS]:
+            if not item.get("compact"):
+                item.update(self._compact(self.receipts_dir / item["file"]))
+        self._save_manifest(manifest)
+
+    # ─── Compaction ───────────────────────────────────────────────────
+
+    def _compact(self, receipt_path: Path) -> dict[str, Any]:
+        """Rewrite an old receipt compactly; return the manifest fields."""
+        try:
+            data = json.loads(receipt_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning("Skipping compaction of %s: %s", receipt_path, exc)
+            return {"compact": True}
+
+        for item in _evidence_items(data):
+            for inline, path_field in _OUTPUT_FIELDS:
+                rel_path = item.get(path_field)
+                if not rel_path:
+                    continue
+                blob = self._store_blob(self.receipts_dir / rel_path)
+                if blob is None:
+                    continue
+                item[path_field] = blob
+                if inline != "evidence":
+                    item.pop(inline, None)
+
+        _atomic_write(receipt_path, json.dumps(data, separators=(",", ":")))
+        entry = self._entry_for(receipt_path, data)
+        return {"compact": True, "evidence_bytes": entry.evidence_bytes}
+
+    def _store_blob(self, output_path: Path) -> str | None:
+        """Replace an output file by a blob reference; return its relative path."""
+        digest = self._blobs.digest_of(output_path)
+        if digest is None:
+            try:
+                digest = self._blobs.put_file(output_path)
+            except OSError:
+                return None
+            output_path.unlink(missing_ok=True)
+        blob_path = self._blobs.path(digest)
+        if blob_path is None:
+            return None
+        return os.path.relpath(blob_path, self.receipts_dir)
+
+    def referenced_blobs(self) -> set[str]:
+        """Digests of blobs that receipts reference by path."""
+        digests: set[str] = set()
+        for path in self.receipts_dir.glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if not isinstance(data, dict):
+                continue
+            for item in _evidence_items(data):
+                for _, path_field in _OUTPUT_FIELDS:
+                    rel_path = item.get(path_field)
+                    if not rel_path:
+                        continue
+                    digest = self._blobs.digest_of(self.receipts_dir / rel_path)
+                    if digest is not None:
+                        digests.add(digest)
+        return digests
+
+    # ─── Manifest ─────────────────────────────────────────────────────
+
+    def _current_manifest(self, *, exclude: str | None = None) -> dict[str, Any]:
+        """Load the manifest, rescanning if receipts changed behind its back."""
+        manifest = self._load_manifest()
+        if manifest.get("receipts_mtime_ns") == self._receipts_mtime_ns():
+            return manifest
+        self._rescan(manifest, exclude=exclude)
+        if exclude is None:
+            try:
+                self._save_manifest(manifest)
+            except OSError as exc:
+                logger.warning("Failed to update receipt manifest: %s", exc)
+        return manifest
+
+    def _rescan(self, manifest: dict[str, Any], *, exclude: str | None) -> None:
+        """Sync manifest entries with the receipt files on disk."""
+        on_disk = {
+            path.name: path
+            for path in self.receipts_dir.glob("*.json")
+            if path.name != exclude
+        }
+        known: set[str] = set()
+        waypoints: dict[str, list[dict[str, Any]]] = manifest["waypoints"]
+        for key, group in list(waypoints.items()):
+            group[:] = [item for item in group if item["file"] in on_disk]
+            known.update(item["file"] for item in group)
+            if not group:
+                del waypoints[key]
+
+        for name in sorted(on_disk.keys() - known):
+            path = on_disk[name]
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = None
+            group = waypoints.setdefault(_key_for_file(path), [])
+            group.append(self._entry_for(path, data).to_dict())
+            group.sort(key=lambda item: item["file"])
+
+    def _entry_for(self, receipt_path: Path, data: Any) -> ReceiptEntry:
+        if not isinstance(data, dict):
+            return ReceiptEntry(
+                file=receipt_path.name, completed_at="", valid=None, evidence_bytes=0
+            )
+        checklist = data.get("checklist", [])
+        return ReceiptEntry(
+            file=receipt_path.name,
+            completed_at=str(data.get("completed_at", "")),
+            valid=all(
+                item.get("status") in ("passed", "skipped") for item in checklist
+            ),
+            evidence_bytes=self._evidence_bytes(data),
+        )
+
+    def _evidence_bytes(self, data: dict[str, Any]) -> int:
+        """Size of captured output, counting stored outputs at full size."""
+        total = 0
+        for item in _evidence_items(data):
+            for inline, path_field in _OUTPUT_FIELDS:
+                rel_path = item.get(path_field)
+                if rel_path:
+                    try:
+                        path = self._blobs.resolve(self.receipts_dir / rel_path)
+                        total += path.stat().st_size
+                    except OSError:
+                        pass
+                else:
+                    total += len(str(item.get(inline, "")).encode("utf-8"))
+        return total
+
+    def _load_manifest(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"schema_version": MANIFEST_SCHEMA_VERSION, "waypoints": {}}
+        if (
+            not isinstance(data, dict)
+            or data.get("schema_version") != MANIFEST_SCHEMA_VERSION
+            or not isinstance(data.get("waypoints"), dict)
+        ):
+            return {"schema_version": MANIFEST_SCHEMA_VERSION, "waypoints": {}}
+        return data
+
+    def _save_manifest(self, manifest: dict[str, Any]) -> None:
+        # Create the index directory first so its creation does not change
+        # the receipts directory mtime recorded below.
+        self._index_path.mkdir(parents=True, exist_ok=True)
+        manifest["receipts_mtime_ns"] = self._receipts_mtime_ns()
+        _atomic_write(self._manifest_path, json.dumps(manifest, indent=2) + "\n")
+
+    def _receipts_mtime_ns(self) -> int | None:
+        try:
+            return self.receipts_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+def _key_for_file(receipt_path: Path) -> str:
+    """Waypoint key from ``<waypoint>-<YYYYMMDD>-<HHMMSS>.json``."""
+    return receipt_path.stem.rsplit("-", 2)[0]
+
+
+def _evidence_items(data: dict[str, Any]) -> list[dict[str, Any]]:
+    items: list[dict[str, Any]] = []
+    for field_name in ("checklist", "soft_checklist", "criteria_verification"):
+        items.extend(
+            item for item in data.get(field_name, []) if isinstance(item, dict)
+        )
+    return items
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    _atomic_write_bytes(path, content.encode("utf-8"))
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
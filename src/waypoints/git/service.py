@@ -3,17 +3,34 @@
 Handles git init, staging, commits, and tags. This is the "dog" layer -
 it executes git commands but relies on receipt validation to decide
 whether to proceed.
+
+``commit_all`` is the batched path used per waypoint: one
+``git status --porcelain=v2`` scan of the work tree, then plumbing
+(``update-index --stdin``, ``write-tree``, ``commit-tree``, ``update-ref``)
+that never rescans it. Each git invocation is timed.
 """
 
 import logging
+import os
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from waypoints.runtime import TimeoutDomain, get_command_runner
 
 logger = logging.getLogger(__name__)
 
+# Local caches, evidence storage and spilled tool output under the project
+# directory. Also listed in DEFAULT_GITIGNORE, but commit_all excludes them
+# itself because projects initialized before an entry existed have an older
+# .gitignore.
+LOCAL_STORAGE_DIRS = (
+    ".waypoints/blobs",
+    ".waypoints/export-cache",
+    ".waypoints/snapshots",
+    "sessions/tool-output",
+)
+
 # Default .gitignore content for waypoints projects
 DEFAULT_GITIGNORE = """\
 # Waypoints application logs (not project artifacts)
@@ -23,6 +40,12 @@ DEFAULT_GITIGNORE = """\
 # User settings (not project-specific)
 .waypoints/settings.json
 
+# Local caches and evidence storage
+.waypoints/blobs/
+.waypoints/export-cache/
+.waypoints/snapshots/
+sessions/tool-output/
+
 # Build artifacts
 target/
 build/
@@ -58,6 +81,18 @@ Thumbs.db
 """
 
 
+# Hooks `git commit` runs that plumbing commits would skip.
+COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit")
+
+
+@dataclass(frozen=True, slots=True)
+class GitTiming:
+    """Wall time of one git invocation."""
+
+    command: str
+    seconds: float
+
+
 @dataclass
 class GitResult:
     """Result of a git operation."""
@@ -65,6 +100,55 @@ class GitResult:
     success: bool
     message: str
     output: str = ""
+    commit_hash: str | None = None
+    timings: tuple[GitTiming, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True, slots=True)
+class _StatusSnapshot:
+    """Parsed ``git status --porcelain=v2 -z --branch`` output."""
+
+    head: str | None
+    unstaged_paths: tuple[str, ...]
+    has_staged: bool
+    unmerged_paths: tuple[str, ...]
+
+
+def _parse_status_v2(output: str) -> _StatusSnapshot:
+    """Parse porcelain v2 status records (NUL separated, root-relative)."""
+    head: str | None = None
+    unstaged: list[str] = []
+    unmerged: list[str] = []
+    has_staged = False
+    records = iter(output.split("\0"))
+    for record in records:
+        if not record:
+            continue
+        if record.startswith("# branch.oid "):
+            oid = record.removeprefix("# branch.oid ")
+            head = None if oid == "(initial)" else oid
+        elif record.startswith("? "):
+            # Untracked nested repositories are listed as "dir/".
+            unstaged.append(record[2:].rstrip("/"))
+        elif record.startswith("1 "):
+            fields = record.split(" ", 8)
+            has_staged = has_staged or fields[1][0] != "."
+            if fields[1][1] != ".":
+                unstaged.append(fields[8])
+        elif record.startswith("2 "):
+            fields = record.split(" ", 9)
+            original = next(records, "")
+            has_staged = has_staged or fields[1][0] != "."
+            if fields[1][1] != ".":
+                unstaged.extend([fields[9], original])
+        elif record.startswith("u "):
+            unmerged.append(record.split(" ", 10)[10])
+    return _StatusSnapshot(
+        head=head,
+        unstaged_paths=tuple(unstaged),
+        has_staged=has_staged,
+        unmerged_paths=tuple(unmerged),
+    )
 
 
 class GitService:
@@ -77,9 +161,14 @@ class GitService:
             working_dir: Directory to run git commands in. Required.
         """
         self.working_dir = working_dir
+        self._timings: list[GitTiming] | None = None
 
     def _run_git(
-        self, *args: str, check: bool = False
+        self,
+        *args: str,
+        check: bool = False,
+        cwd: Path | None = None,
+        input_text: str | None = None,
     ) -> subprocess.CompletedProcess[str]:
         """Run a git command."""
         cmd = ["git", *args]
@@ -87,8 +176,11 @@ class GitService:
         result = get_command_runner().run(
             command=cmd,
             domain=TimeoutDomain.GIT_OPERATION,
-            cwd=self.working_dir,
+            cwd=cwd or self.working_dir,
+            input_text=input_text,
         )
+        if self._timings is not None:
+            self._timings.append(GitTiming(args[0], result.total_duration_seconds))
         stdout = result.stdout
         stderr = result.stderr
         if result.timed_out:
@@ -152,6 +244,16 @@ class GitService:
                     content + "\n" + DEFAULT_GITIGNORE, encoding="utf-8"
                 )
                 logger.info("Appended waypoints entries to .gitignore")
+            elif missing := [
+                line
+                for line in DEFAULT_GITIGNORE.splitlines()
+                if line.startswith(".waypoints/") and line not in content.splitlines()
+            ]:
+                gitignore_path.write_text(
+                    content.rstrip("\n") + "\n" + "\n".join(missing) + "\n",
+                    encoding="utf-8",
+                )
+                logger.info("Appended waypoints entries to .gitignore")
         else:
             gitignore_path.write_text(DEFAULT_GITIGNORE, encoding="utf-8")
             logger.info("Created .gitignore")
@@ -225,6 +327,125 @@ class GitService:
             logger.error("Commit error: %s", e)
             return GitResult(False, f"Commit error: {e}")
 
+    def commit_all(
+        self,
+        message: str,
+        *,
+        tag_name: str | None = None,
+        tag_message: str | None = None,
+    ) -> GitResult:
+        """Stage every change under the working dir, commit, and optionally tag.
+
+        Equivalent to ``git add . && git commit -m`` (plus ``git tag -a``)
+        but scans the work tree once. The HEAD read from the status header
+        is reused as the commit parent and the expected old ref value. When
+        commit hooks are installed or ``commit.gpgsign`` is set, the commit
+        itself goes through ``git commit`` so hooks run and signing applies.
+        ``LOCAL_STORAGE_DIRS`` are never staged, whatever the project's
+        .gitignore says.
+
+        Args:
+            message: Commit message.
+            tag_name: Annotated tag to create on the new commit.
+            tag_message: Tag message. Defaults to the tag name.
+        """
+        self._timings = []
+        try:
+            result = self._commit_all(message, tag_name, tag_message or tag_name)
+        except Exception as e:
+            logger.error("Commit error: %s", e)
+            result = GitResult(False, f"Commit error: {e}")
+        finally:
+            timings, self._timings = tuple(self._timings), None
+        result.timings = timings
+        logger.info(
+            "git commit_all: %.3fs (%s)",
+            sum(timing.seconds for timing in timings),
+            ", ".join(f"{t.command} {t.seconds:.3f}s" for t in timings),
+        )
+        return result
+
+    def _commit_all(
+        self, message: str, tag_name: str | None, tag_message: str | None
+    ) -> GitResult:
+        paths = self._run_git("rev-parse", "--show-toplevel", "--git-path", "hooks")
+        if paths.returncode != 0:
+            return GitResult(False, f"Not a git repository: {paths.stderr.strip()}")
+        toplevel_line, hooks_line = paths.stdout.splitlines()[:2]
+        toplevel = Path(toplevel_line)
+        hooks_dir = self.working_dir / hooks_line
+
+        status_result = self._run_git(
+            "status",
+            "--porcelain=v2",
+            "-z",
+            "--branch",
+            "--untracked-files=all",
+            "--",
+            ".",
+            *(f":(exclude){path}" for path in LOCAL_STORAGE_DIRS),
+        )
+        if status_result.returncode != 0:
+            return GitResult(False, f"Status failed: {status_result.stderr}")
+        status = _parse_status_v2(status_result.stdout)
+        if status.unmerged_paths:
+            return GitResult(
+                False,
+                "Commit failed: unmerged paths: " + ", ".join(status.unmerged_paths),
+            )
+        if not status.unstaged_paths and not status.has_staged:
+            return GitResult(True, "Nothing to commit")
+
+        if status.unstaged_paths:
+            staged = self._run_git(
+                "update-index",
+                "--add",
+                "--remove",
+                "-z",
+                "--stdin",
+                cwd=toplevel,
+                input_text="".join(f"{path}\0" for path in status.unstaged_paths),
+            )
+            if staged.returncode != 0:
+                return GitResult(False, f"Staging error: {staged.stderr}")
+
+        if _hooks_installed(hooks_dir) or self._signs_commits():
+            committed = self._run_git("commit", "-m", message)
+            if committed.returncode != 0:
+                logger.error("Commit failed: %s", committed.stderr)
+                return GitResult(False, f"Commit failed: {committed.stderr}")
+            commit = self._run_git("rev-parse", "HEAD").stdout.strip()
+        else:
+            tree = self._run_git("write-tree", check=True).stdout.strip()
+            parent = ["-p", status.head] if status.head else []
+            commit = self._run_git(
+                "commit-tree", tree, *parent, "-m", message, check=True
+            ).stdout.strip()
+            subject = message.splitlines()[0] if message else ""
+            reflog = f"commit{'' if status.head else ' (initial)'}: {subject}"
+            old = [status.head] if status.head else []
+            self._run_git("update-ref", "-m", reflog, "HEAD", commit, *old, check=True)
+        logger.info("Created commit: %s", message[:50])
+
+        result = GitResult(True, "Commit created", commit_hash=commit)
+        if tag_name:
+            tagged = self._run_git(
+                "tag", "-a", tag_name, commit, "-m", tag_message or tag_name
+            )
+            if tagged.returncode == 0:
+                logger.info("Created tag: %s", tag_name)
+            elif "already exists" in tagged.stderr:
+                logger.warning("Tag already exists: %s", tag_name)
+            else:
+                logger.error("Tag failed: %s", tagged.stderr)
+                result.message = f"Commit created; tag failed: {tagged.stderr}"
+        return result
+
+    def _signs_commits(self) -> bool:
+        """Whether ``commit.gpgsign`` asks for signed commits."""
+        result = self._run_git("config", "--type=bool", "--get", "commit.gpgsign")
+        return result.returncode == 0 and result.stdout.strip() == "true"
+
     def tag(self, name: str, message: str | None = None) -> GitResult:
         """Create an annotated tag.
 
@@ -293,3 +514,8 @@ class GitService:
         except Exception as e:
             logger.error("Reset error: %s", e)
             return GitResult(False, f"Reset error: {e}")
+
+
+def _hooks_installed(hooks_dir: Path) -> bool:
+    """Whether any hook that ``git commit`` runs is installed."""
+    return any(os.access(hooks_dir / hook, os.X_OK) for hook in COMMIT_HOOKS)
@@ -5,6 +5,7 @@ Supports multiple providers (Anthropic, OpenAI) with a unified interface.
 
 import logging
 from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 # Re-export types from providers for backwards compatibility
@@ -19,6 +20,12 @@ from waypoints.llm.providers.base import (
     extract_reset_time,
     is_retryable_error,
 )
+from waypoints.llm.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    build_response_cache_key,
+    get_response_cache,
+)
 
 if TYPE_CHECKING:
     from waypoints.llm.metrics import MetricsCollector
@@ -38,8 +45,27 @@ __all__ = [
     "extract_reset_time",
     "get_provider",
     "is_retryable_error",
+    "use_provider",
 ]
 
+_provider_override: LLMProvider | None = None
+
+
+@contextmanager
+def use_provider(provider: LLMProvider) -> Iterator[LLMProvider]:
+    """Route every ``get_provider`` call to ``provider`` within the block.
+
+    Used by the benchmark harness to drive the real FLY loop with a
+    scripted provider instead of a network-backed one.
+    """
+    global _provider_override
+    previous = _provider_override
+    _provider_override = provider
+    try:
+        yield provider
+    finally:
+        _provider_override = previous
+
 
 def get_provider(
     provider: str | None = None,
@@ -59,6 +85,9 @@ def get_provider(
     Raises:
         ValueError: If provider is unknown or configuration is invalid.
     """
+    if _provider_override is not None:
+        return _provider_override
+
     from waypoints.config.settings import settings
 
     provider_name = provider or settings.llm_provider
@@ -133,13 +162,59 @@ class ChatClient:
         Yields:
             StreamChunk for each text piece, then StreamComplete at end.
         """
-        return self._provider.stream_message(
+        cache = get_response_cache()
+        if cache is None:
+            return self._provider.stream_message(
+                messages=messages,
+                system=system,
+                max_tokens=max_tokens,
+                metrics_collector=self._metrics,
+                phase=self._phase,
+            )
+        return self._stream_with_cache(cache, messages, system, max_tokens)
+
+    def _stream_with_cache(
+        self,
+        cache: ResponseCache,
+        messages: list[dict[str, str]],
+        system: str,
+        max_tokens: int,
+    ) -> Iterator[StreamChunk | StreamComplete]:
+        """Serve a response from the response cache, filling it on a miss."""
+        key = build_response_cache_key(
+            provider=self._provider.provider_name,
+            model=self._provider.model,
+            system=system,
+            messages=messages,
+            max_tokens=max_tokens,
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Response cache hit (phase=%s, key=%s)", self._phase, key[:12])
+            if cached.full_text:
+                yield StreamChunk(text=cached.full_text)
+            yield StreamComplete(full_text=cached.full_text, cost_usd=0.0)
+            return
+
+        for result in self._provider.stream_message(
             messages=messages,
             system=system,
             max_tokens=max_tokens,
             metrics_collector=self._metrics,
             phase=self._phase,
-        )
+        ):
+            if isinstance(result, StreamComplete):
+                cache.put(
+                    key,
+                    CachedResponse(
+                        full_text=result.full_text,
+                        cost_usd=result.cost_usd,
+                        tokens_in=result.tokens_in,
+                        tokens_out=result.tokens_out,
+                        cached_tokens_in=result.cached_tokens_in,
+                    ),
+                )
+            yield result
 
 
 async def agent_query(
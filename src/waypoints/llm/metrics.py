@@ -125,6 +125,14 @@ class MetricsCollector:
         """
         self.path = project.get_path() / "metrics.jsonl"
         self._calls: list[LLMCall] = []
+        # Maintained on record/load so UI refreshes need not rescan calls.
+        self._cost_by_waypoint: dict[str, float] = {}
+        self._total_cost = 0.0
+        self._total_tokens_in = 0
+        self._total_tokens_out = 0
+        self._total_cached_tokens_in = 0
+        self._has_token_usage = False
+        self._has_cached_token_usage = False
         self._load()
 
     def _load(self) -> None:
@@ -151,7 +159,7 @@ class MetricsCollector:
                     if line_num == 0 and "_schema" in data:
                         continue
 
-                    self._calls.append(LLMCall.from_dict(data))
+                    self._add_call(LLMCall.from_dict(data))
             logger.debug("Loaded %d metrics from %s", len(self._calls), self.path)
         except Exception as e:
             logger.warning("Failed to load metrics from %s: %s", self.path, e)
@@ -162,7 +170,7 @@ class MetricsCollector:
         Args:
             call: The LLMCall to record.
         """
-        self._calls.append(call)
+        self._add_call(call)
         self._append(call)
         logger.debug(
             "Recorded call %s: phase=%s, cost=$%.4f",
@@ -171,6 +179,21 @@ class MetricsCollector:
             call.cost_usd or 0.0,
         )
 
+    def _add_call(self, call: LLMCall) -> None:
+        self._calls.append(call)
+        self._total_cost += call.cost_usd or 0.0
+        self._total_tokens_in += call.tokens_in or 0
+        self._total_tokens_out += call.tokens_out or 0
+        self._total_cached_tokens_in += call.cached_tokens_in or 0
+        if call.tokens_in is not None or call.tokens_out is not None:
+            self._has_token_usage = True
+        if call.cached_tokens_in is not None:
+            self._has_cached_token_usage = True
+        if call.waypoint_id and call.cost_usd is not None:
+            self._cost_by_waypoint[call.waypoint_id] = (
+                self._cost_by_waypoint.get(call.waypoint_id, 0) + call.cost_usd
+            )
+
     def _append(self, call: LLMCall) -> None:
         """Append a call to the metrics file."""
         # Ensure directory exists
@@ -191,22 +214,22 @@ class MetricsCollector:
     @property
     def total_cost(self) -> float:
         """Get total cost across all calls."""
-        return sum(c.cost_usd or 0.0 for c in self._calls)
+        return self._total_cost
 
     @property
     def total_tokens_in(self) -> int:
         """Get total input tokens across all calls."""
-        return sum(c.tokens_in or 0 for c in self._calls)
+        return self._total_tokens_in
 
     @property
     def total_tokens_out(self) -> int:
         """Get total output tokens across all calls."""
-        return sum(c.tokens_out or 0 for c in self._calls)
+        return self._total_tokens_out
 
     @property
     def total_cached_tokens_in(self) -> int:
         """Get total cached input tokens across all calls."""
-        return sum(c.cached_tokens_in or 0 for c in self._calls)
+        return self._total_cached_tokens_in
 
     @property
     def total_calls(self) -> int:
@@ -215,14 +238,11 @@ class MetricsCollector:
 
     def has_token_usage_data(self) -> bool:
         """Whether any call captured input or output token usage."""
-        return any(
-            call.tokens_in is not None or call.tokens_out is not None
-            for call in self._calls
-        )
+        return self._has_token_usage
 
     def has_cached_token_usage_data(self) -> bool:
         """Whether any call captured cached input tokens."""
-        return any(call.cached_tokens_in is not None for call in self._calls)
+        return self._has_cached_token_usage
 
     def call_count_by_model(self) -> dict[str, int]:
         """Get call counts grouped by model name."""
@@ -248,13 +268,7 @@ class MetricsCollector:
         Returns:
             Dictionary mapping waypoint ID to total cost.
         """
-        result: dict[str, float] = {}
-        for call in self._calls:
-            if call.waypoint_id and call.cost_usd is not None:
-                result[call.waypoint_id] = (
-                    result.get(call.waypoint_id, 0) + call.cost_usd
-                )
-        return result
+        return dict(self._cost_by_waypoint)
 
     def tokens_by_phase(self) -> dict[str, tuple[int, int]]:
         """Get token breakdown by phase.
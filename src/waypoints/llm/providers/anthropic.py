@@ -1,8 +1,6 @@
 """Anthropic LLM provider using Claude Agent SDK."""
 
-import asyncio
 import logging
-import os
 import time
 from collections.abc import AsyncIterator, Iterator
 from typing import TYPE_CHECKING
@@ -18,7 +16,6 @@ from claude_agent_sdk import (
 
 from waypoints.llm.providers.base import (
     MAX_RETRIES,
-    RETRY_DELAYS,
     LLMProvider,
     StreamChunk,
     StreamComplete,
@@ -26,6 +23,13 @@ from waypoints.llm.providers.base import (
     classify_api_error,
     is_retryable_error,
 )
+from waypoints.llm.providers.client_pool import run_on_shared_loop
+from waypoints.llm.scheduler import (
+    CallPriority,
+    estimate_tokens,
+    get_llm_scheduler,
+    priority_for,
+)
 from waypoints.llm.tools import execute_tool
 
 if TYPE_CHECKING:
@@ -179,7 +183,9 @@ class AnthropicProvider(LLMProvider):
         enforce_configured_budget(metrics_collector)
 
         try:
-            for result in self._run_agent_query(prompt, system):
+            for result in self._run_agent_query(
+                prompt, system, priority=priority_for(phase)
+            ):
                 if isinstance(result, StreamComplete):
                     cost = result.cost_usd
                     tokens_in = result.tokens_in
@@ -211,6 +217,18 @@ class AnthropicProvider(LLMProvider):
                 )
                 metrics_collector.record(call)
 
+    def _auth_env(self) -> dict[str, str]:
+        """Environment overrides for the SDK's CLI subprocess.
+
+        Auth is passed per query rather than by mutating ``os.environ``, so
+        concurrent calls with different auth modes cannot interfere.
+        """
+        if self.use_web_auth:
+            return {"ANTHROPIC_API_KEY": ""}  # Force web auth (always)
+        if self.api_key:
+            return {"ANTHROPIC_API_KEY": self.api_key}
+        return {}
+
     def _format_messages_as_prompt(self, messages: list[dict[str, str]]) -> str:
         """Format message history as a prompt for the agent."""
         if not messages:
@@ -228,92 +246,87 @@ class AnthropicProvider(LLMProvider):
         return "\n\n".join(parts)
 
     def _run_agent_query(
-        self, prompt: str, system: str
+        self,
+        prompt: str,
+        system: str,
+        *,
+        priority: CallPriority = CallPriority.CHART,
     ) -> Iterator[StreamChunk | StreamComplete]:
         """Run agent query and yield text chunks, then StreamComplete."""
-        env_backup: str | None = None
 
-        if self.use_web_auth:
-            # Clear API key to force web auth (always, when web auth is enabled)
-            env_backup = os.environ.pop("ANTHROPIC_API_KEY", None)
-        elif self.api_key:
-            # Use provided API key (only when NOT using web auth)
-            env_backup = os.environ.get("ANTHROPIC_API_KEY")
-            os.environ["ANTHROPIC_API_KEY"] = self.api_key
-
-        loop = asyncio.new_event_loop()
-        try:
-
-            async def collect_results() -> tuple[
-                list[str], float | None, int | None, int | None, int | None
-            ]:
-                chunks: list[str] = []
-                cost: float | None = None
-                tokens_in: int | None = None
-                tokens_out: int | None = None
-                cached_tokens_in: int | None = None
-                options = ClaudeAgentOptions(
-                    allowed_tools=[],
-                    system_prompt=system if system else None,
-                )
-                logger.info("Starting agent query")
-                async for message in query(prompt=prompt, options=options):
-                    if isinstance(message, AssistantMessage):
-                        usage_in, usage_out = _extract_usage_from_message(message)
-                        if usage_in is not None:
-                            tokens_in = (tokens_in or 0) + usage_in
-                        if usage_out is not None:
-                            tokens_out = (tokens_out or 0) + usage_out
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                chunks.append(block.text)
-                                logger.debug("Got chunk: %d chars", len(block.text))
-                    elif isinstance(message, ResultMessage):
-                        cost = message.total_cost_usd
-                        cached_tokens_in = _extract_cached_input_tokens(
-                            getattr(message, "usage", None)
-                        )
-                        logger.debug(
-                            (
-                                "ResultMessage usage=%r input=%r output=%r "
-                                "total_input=%r total_output=%r"
-                            ),
-                            getattr(message, "usage", None),
-                            getattr(message, "input_tokens", None),
-                            getattr(message, "output_tokens", None),
-                            getattr(message, "total_input_tokens", None),
-                            getattr(message, "total_output_tokens", None),
-                        )
-                        total_in, total_out = _extract_token_usage(message)
-                        if total_in is not None:
-                            tokens_in = total_in
-                        if total_out is not None:
-                            tokens_out = total_out
-                        logger.info("Query complete, cost: $%.4f", cost or 0)
-                return chunks, cost, tokens_in, tokens_out, cached_tokens_in
-
-            chunks, cost, tokens_in, tokens_out, cached_tokens_in = (
-                loop.run_until_complete(collect_results())
+        async def collect_results() -> tuple[
+            list[str], float | None, int | None, int | None, int | None
+        ]:
+            chunks: list[str] = []
+            cost: float | None = None
+            tokens_in: int | None = None
+            tokens_out: int | None = None
+            cached_tokens_in: int | None = None
+            options = ClaudeAgentOptions(
+                allowed_tools=[],
+                system_prompt=system if system else None,
+                env=self._auth_env(),
             )
-            logger.info("Got %d chunks total", len(chunks))
-
-            full_text = ""
-            for chunk in chunks:
-                full_text += chunk
-                yield StreamChunk(text=chunk)
-
-            yield StreamComplete(
-                full_text=full_text,
-                cost_usd=cost,
-                tokens_in=tokens_in,
-                tokens_out=tokens_out,
-                cached_tokens_in=cached_tokens_in,
+            logger.info("Starting agent query")
+            async for message in query(prompt=prompt, options=options):
+                if isinstance(message, AssistantMessage):
+                    usage_in, usage_out = _extract_usage_from_message(message)
+                    if usage_in is not None:
+                        tokens_in = (tokens_in or 0) + usage_in
+                    if usage_out is not None:
+                        tokens_out = (tokens_out or 0) + usage_out
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            chunks.append(block.text)
+                            logger.debug("Got chunk: %d chars", len(block.text))
+                elif isinstance(message, ResultMessage):
+                    cost = message.total_cost_usd
+                    cached_tokens_in = _extract_cached_input_tokens(
+                        getattr(message, "usage", None)
+                    )
+                    logger.debug(
+                        (
+                            "ResultMessage usage=%r input=%r output=%r "
+                            "total_input=%r total_output=%r"
+                        ),
+                        getattr(message, "usage", None),
+                        getattr(message, "input_tokens", None),
+                        getattr(message, "output_tokens", None),
+                        getattr(message, "total_input_tokens", None),
+                        getattr(message, "total_output_tokens", None),
+                    )
+                    total_in, total_out = _extract_token_usage(message)
+                    if total_in is not None:
+                        tokens_in = total_in
+                    if total_out is not None:
+                        tokens_out = total_out
+                    logger.info("Query complete, cost: $%.4f", cost or 0)
+            return chunks, cost, tokens_in, tokens_out, cached_tokens_in
+
+        with get_llm_scheduler().lease(
+            self.provider_name,
+            self.model,
+            priority=priority,
+            estimated_tokens=estimate_tokens(system + prompt),
+        ) as lease:
+            chunks, cost, tokens_in, tokens_out, cached_tokens_in = run_on_shared_loop(
+                collect_results()
             )
-        finally:
-            loop.close()
-            # Restore env var if we removed it
-            if env_backup is not None:
-                os.environ["ANTHROPIC_API_KEY"] = env_backup
+            lease.record_usage(tokens_in, tokens_out)
+        logger.info("Got %d chunks total", len(chunks))
+
+        full_text = ""
+        for chunk in chunks:
+            full_text += chunk
+            yield StreamChunk(text=chunk)
+
+        yield StreamComplete(
+            full_text=full_text,
+            cost_usd=cost,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cached_tokens_in=cached_tokens_in,
+        )
 
     async def agent_query(
         self,
@@ -328,12 +341,7 @@ class AnthropicProvider(LLMProvider):
         waypoint_id: str | None = None,
     ) -> AsyncIterator[StreamChunk | StreamToolUse | StreamComplete]:
         """Run an agentic query with tool use."""
-        env_config: dict[str, str] = {}
-        if self.use_web_auth:
-            env_config["ANTHROPIC_API_KEY"] = ""  # Force web auth (always)
-        elif self.api_key:
-            env_config["ANTHROPIC_API_KEY"] = self.api_key
-
+        env_config = self._auth_env()
         options = ClaudeAgentOptions(
             allowed_tools=allowed_tools or [],
             system_prompt=system_prompt,
@@ -351,17 +359,18 @@ class AnthropicProvider(LLMProvider):
         final_cached_tokens_in: int | None = None
         last_error: Exception | None = None
 
+        scheduler = get_llm_scheduler()
+        priority = priority_for(phase, tool_role)
         for attempt in range(MAX_RETRIES + 1):
             if attempt > 0:
-                delay = RETRY_DELAYS[min(attempt - 1, len(RETRY_DELAYS) - 1)]
+                # The failed session paused the shared lane; the next one
+                # waits out that backoff alongside every other caller.
                 logger.warning(
-                    "Retrying agent_query after %ds (attempt %d/%d): %s",
-                    delay,
+                    "Retrying agent_query (attempt %d/%d): %s",
                     attempt + 1,
                     MAX_RETRIES + 1,
                     last_error,
                 )
-                await asyncio.sleep(delay)
 
             from waypoints.llm.metrics import enforce_configured_budget
 
@@ -376,56 +385,65 @@ class AnthropicProvider(LLMProvider):
             has_yielded = False
 
             try:
-                async for message in query(prompt=prompt, options=options):
-                    if isinstance(message, AssistantMessage):
-                        usage_in, usage_out = _extract_usage_from_message(message)
-                        if usage_in is not None:
-                            tokens_in = (tokens_in or 0) + usage_in
-                        if usage_out is not None:
-                            tokens_out = (tokens_out or 0) + usage_out
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                full_text += block.text
-                                has_yielded = True
-                                yield StreamChunk(text=block.text)
-                            elif isinstance(block, ToolUseBlock):
-                                has_yielded = True
-                                tool_name = TOOL_NAME_MAP.get(
-                                    block.name.lower(), block.name
-                                )
-                                tool_output = execute_tool(
-                                    tool_name,
-                                    block.input,
-                                    cwd,
-                                    tool_role=tool_role,
-                                )
-                                yield StreamToolUse(
-                                    tool_name=block.name,
-                                    tool_input=block.input,
-                                    tool_output=tool_output,
-                                )
-                    elif isinstance(message, ResultMessage):
-                        cost = message.total_cost_usd
-                        session_id = getattr(message, "session_id", None)
-                        cached_tokens_in = _extract_cached_input_tokens(
-                            getattr(message, "usage", None)
-                        )
-                        logger.debug(
-                            (
-                                "ResultMessage usage=%r input=%r output=%r "
-                                "total_input=%r total_output=%r"
-                            ),
-                            getattr(message, "usage", None),
-                            getattr(message, "input_tokens", None),
-                            getattr(message, "output_tokens", None),
-                            getattr(message, "total_input_tokens", None),
-                            getattr(message, "total_output_tokens", None),
-                        )
-                        total_in, total_out = _extract_token_usage(message)
-                        if total_in is not None:
-                            tokens_in = total_in
-                        if total_out is not None:
-                            tokens_out = total_out
+                # The SDK runs the whole tool loop itself, so requests cannot
+                # be leased one by one; the session is admitted, not held.
+                async with scheduler.session_async(
+                    self.provider_name,
+                    self.model,
+                    priority=priority,
+                    estimated_tokens=estimate_tokens(prompt),
+                ) as lease:
+                    async for message in query(prompt=prompt, options=options):
+                        if isinstance(message, AssistantMessage):
+                            usage_in, usage_out = _extract_usage_from_message(message)
+                            if usage_in is not None:
+                                tokens_in = (tokens_in or 0) + usage_in
+                            if usage_out is not None:
+                                tokens_out = (tokens_out or 0) + usage_out
+                            for block in message.content:
+                                if isinstance(block, TextBlock):
+                                    full_text += block.text
+                                    has_yielded = True
+                                    yield StreamChunk(text=block.text)
+                                elif isinstance(block, ToolUseBlock):
+                                    has_yielded = True
+                                    tool_name = TOOL_NAME_MAP.get(
+                                        block.name.lower(), block.name
+                                    )
+                                    tool_output = execute_tool(
+                                        tool_name,
+                                        block.input,
+                                        cwd,
+                                        tool_role=tool_role,
+                                    )
+                                    yield StreamToolUse(
+                                        tool_name=block.name,
+                                        tool_input=block.input,
+                                        tool_output=tool_output,
+                                    )
+                        elif isinstance(message, ResultMessage):
+                            cost = message.total_cost_usd
+                            session_id = getattr(message, "session_id", None)
+                            cached_tokens_in = _extract_cached_input_tokens(
+                                getattr(message, "usage", None)
+                            )
+                            logger.debug(
+                                (
+                                    "ResultMessage usage=%r input=%r output=%r "
+                                    "total_input=%r total_output=%r"
+                                ),
+                                getattr(message, "usage", None),
+                                getattr(message, "input_tokens", None),
+                                getattr(message, "output_tokens", None),
+                                getattr(message, "total_input_tokens", None),
+                                getattr(message, "total_output_tokens", None),
+                            )
+                            total_in, total_out = _extract_token_usage(message)
+                            if total_in is not None:
+                                tokens_in = total_in
+                            if total_out is not None:
+                                tokens_out = total_out
+                    lease.record_usage(tokens_in, tokens_out)
 
                 final_cost = cost
                 final_tokens_in = tokens_in
@@ -0,0 +1,168 @@
+"""Shared provider SDK clients and event loop.
+
+Creating an SDK client per request throws away its HTTP connection pool, so
+every short call (iteration triage, for example) pays connection setup
+again. Clients here are keyed by provider, a credential digest and base URL,
+and reused across ``ChatClient`` instances, phases and waypoints:
+
+- sync clients are shared process-wide (the SDK clients are thread-safe);
+- async clients are shared per event loop, since their connections belong
+  to the loop that opened them;
+- synchronous callers that need to drive a coroutine submit it to one
+  long-lived background loop instead of creating a loop per call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import logging
+import threading
+import weakref
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class ClientKey:
+    """Identity of a reusable client; the credential is stored only as a digest."""
+
+    provider: str
+    credential_digest: str
+    base_url: str | None = None
+
+    @classmethod
+    def create(
+        cls, provider: str, credential: str, base_url: str | None = None
+    ) -> ClientKey:
+        digest = hashlib.sha256(credential.encode("utf-8")).hexdigest()[:16]
+        return cls(provider=provider, credential_digest=digest, base_url=base_url)
+
+
+class ProviderClientPool:
+    """Process-wide cache of provider SDK clients."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[ClientKey, Any] = {}
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[ClientKey, Any]
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def size(self) -> int:
+        """Number of live clients across sync and async caches."""
+        with self._lock:
+            return len(self._clients) + sum(
+                len(clients) for clients in self._async_clients.values()
+            )
+
+    def get_client(self, key: ClientKey, factory: Callable[[], Any]) -> Any:
+        """Return the shared sync client for ``key``, creating it once."""
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+                logger.debug("Created %s client (%s)", key.provider, key.base_url)
+            return client
+
+    def get_async_client(self, key: ClientKey, factory: Callable[[], Any]) -> Any:
+        """Return the async client for ``key`` on the running event loop.
+
+        Outside a running loop there is nothing safe to share, so a fresh
+        client is returned.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return factory()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = factory()
+                clients[key] = client
+                logger.debug("Created async %s client (%s)", key.provider, key.base_url)
+            return client
+
+    def close(self) -> None:
+        """Close sync clients and forget every cached client."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    logger.debug("Ignoring client close failure", exc_info=True)
+
+
+class _BackgroundLoop:
+    """One event loop on a daemon thread, started on first use."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the shared loop and block until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        if not thread.is_alive():
+            loop.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="waypoints-provider-loop",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+
+_CLIENT_POOL = ProviderClientPool()
+_SHARED_LOOP = _BackgroundLoop()
+
+
+def get_client_pool() -> ProviderClientPool:
+    """Return the process-wide provider client pool."""
+    return _CLIENT_POOL
+
+
+def run_on_shared_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion on the shared provider event loop."""
+    return _SHARED_LOOP.run(coro)
+
+
+def close_provider_clients() -> None:
+    """Release pooled clients and stop the shared loop."""
+    _CLIENT_POOL.close()
+    _SHARED_LOOP.close()
+
+
+atexit.register(close_provider_clients)
@@ -1,6 +1,5 @@
 """OpenAI LLM provider."""
 
-import asyncio
 import json
 import logging
 import os
@@ -15,7 +14,6 @@ from waypoints.llm.prompt_cache import (
 )
 from waypoints.llm.providers.base import (
     MAX_RETRIES,
-    RETRY_DELAYS,
     LLMProvider,
     StreamChunk,
     StreamComplete,
@@ -23,6 +21,8 @@ from waypoints.llm.providers.base import (
     classify_api_error,
     is_retryable_error,
 )
+from waypoints.llm.providers.client_pool import ClientKey, get_client_pool
+from waypoints.llm.scheduler import estimate_tokens, get_llm_scheduler, priority_for
 from waypoints.llm.tools import execute_tool
 
 if TYPE_CHECKING:
@@ -36,7 +36,10 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "read_file",
-            "description": "Read the contents of a file at the given path.",
+            "description": (
+                "Read the contents of a file at the given path. Large files "
+                "are cut off; use offset and limit to read further lines."
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -44,6 +47,14 @@ TOOL_DEFINITIONS: list[dict[str, Any]] = [
                         "type": "string",
                         "description": "Absolute path to the file to read",
                     },
+                    "offset": {
+                        "type": "integer",
+                        "description": "1-based line number to start reading at",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of lines to read",
+                    },
                 },
                 "required": ["file_path"],
             },
@@ -236,29 +247,39 @@ class OpenAIProvider(LLMProvider):
         super().__init__(model=model, api_key=api_key)
         logger.info("OpenAIProvider initialized (model=%s)", model)
 
-    def _get_client(self) -> Any:
-        """Get an OpenAI client instance."""
-        from openai import OpenAI
-
+    def _resolve_api_key(self) -> str:
         api_key = self.api_key or os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(
                 "OpenAI API key required. Set OPENAI_API_KEY env var or configure "
                 "in settings."
             )
-        return OpenAI(api_key=api_key)
+        return api_key
+
+    def _client_key(self, api_key: str) -> ClientKey:
+        # The SDK reads OPENAI_BASE_URL itself; key on it so clients pointed
+        # at different endpoints are never shared.
+        return ClientKey.create(
+            self.provider_name, api_key, os.environ.get("OPENAI_BASE_URL")
+        )
+
+    def _get_client(self) -> Any:
+        """Get the pooled OpenAI client for this provider's credentials."""
+        from openai import OpenAI
+
+        api_key = self._resolve_api_key()
+        return get_client_pool().get_client(
+            self._client_key(api_key), lambda: OpenAI(api_key=api_key)
+        )
 
     def _get_async_client(self) -> Any:
-        """Get an async OpenAI client instance."""
+        """Get the pooled async OpenAI client for the running event loop."""
         from openai import AsyncOpenAI
 
-        api_key = self.api_key or os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OpenAI API key required. Set OPENAI_API_KEY env var or configure "
-                "in settings."
-            )
-        return AsyncOpenAI(api_key=api_key)
+        api_key = self._resolve_api_key()
+        return get_client_pool().get_async_client(
+            self._client_key(api_key), lambda: AsyncOpenAI(api_key=api_key)
+        )
 
     def stream_message(
         self,
@@ -305,33 +326,43 @@ class OpenAIProvider(LLMProvider):
 
             # Stream completion
             full_text = ""
-            stream = client.chat.completions.create(
-                model=self.model,
-                messages=api_messages,
-                max_tokens=max_tokens,
-                stream=True,
-                stream_options={"include_usage": True},
-                prompt_cache_key=cache_key,
-                prompt_cache_retention=PROMPT_CACHE_RETENTION,
+            estimated = max_tokens + sum(
+                estimate_tokens(m.get("content", "")) for m in api_messages
             )
+            with get_llm_scheduler().lease(
+                self.provider_name,
+                self.model,
+                priority=priority_for(phase),
+                estimated_tokens=estimated,
+            ) as lease:
+                stream = client.chat.completions.create(
+                    model=self.model,
+                    messages=api_messages,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    prompt_cache_key=cache_key,
+                    prompt_cache_retention=PROMPT_CACHE_RETENTION,
+                )
 
-            for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    text = chunk.choices[0].delta.content
-                    full_text += text
-                    yield StreamChunk(text=text)
-                if getattr(chunk, "usage", None):
-                    tokens_in, tokens_out, cached_tokens_in = _extract_usage_tokens(
-                        chunk.usage
-                    )
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        text = chunk.choices[0].delta.content
+                        full_text += text
+                        yield StreamChunk(text=text)
+                    if getattr(chunk, "usage", None):
+                        tokens_in, tokens_out, cached_tokens_in = _extract_usage_tokens(
+                            chunk.usage
+                        )
 
-            yield StreamComplete(
-                full_text=full_text,
-                cost_usd=None,
-                tokens_in=tokens_in,
-                tokens_out=tokens_out,
-                cached_tokens_in=cached_tokens_in,
-            )
+                lease.record_usage(tokens_in, tokens_out)
+                yield StreamComplete(
+                    full_text=full_text,
+                    cost_usd=None,
+                    tokens_in=tokens_in,
+                    tokens_out=tokens_out,
+                    cached_tokens_in=cached_tokens_in,
+                )
 
         except Exception as e:
             logger.exception("Error in stream_message: %s", e)
@@ -408,17 +439,18 @@ class OpenAIProvider(LLMProvider):
                 if tool_lower in all_allowed or mapped_lower in all_allowed:
                     tools.append(tool_def)
 
+        scheduler = get_llm_scheduler()
+        priority = priority_for(phase, tool_role)
         for attempt in range(MAX_RETRIES + 1):
             if attempt > 0:
-                delay = RETRY_DELAYS[min(attempt - 1, len(RETRY_DELAYS) - 1)]
+                # The failed lease paused the shared lane; the next lease
+                # waits out that backoff alongside every other caller.
                 logger.warning(
-                    "Retrying agent_query after %ds (attempt %d/%d): %s",
-                    delay,
+                    "Retrying agent_query (attempt %d/%d): %s",
                     attempt + 1,
                     MAX_RETRIES + 1,
                     last_error,
                 )
-                await asyncio.sleep(delay)
 
             from waypoints.llm.metrics import enforce_configured_budget
 
@@ -435,17 +467,24 @@ class OpenAIProvider(LLMProvider):
                     enforce_configured_budget(metrics_collector)
 
                     # Make API call
-                    response = await client.chat.completions.create(
-                        model=self.model,
-                        messages=messages,
-                        tools=tools if tools else None,
-                        max_tokens=16000,
-                        prompt_cache_key=cache_key,
-                        prompt_cache_retention=PROMPT_CACHE_RETENTION,
-                    )
-                    tokens_in, tokens_out, cached_tokens_in = _extract_usage_tokens(
-                        response.usage
-                    )
+                    async with scheduler.lease_async(
+                        self.provider_name,
+                        self.model,
+                        priority=priority,
+                        estimated_tokens=estimate_tokens(json.dumps(messages)),
+                    ) as lease:
+                        response = await client.chat.completions.create(
+                            model=self.model,
+                            messages=messages,
+                            tools=tools if tools else None,
+                            max_tokens=16000,
+                            prompt_cache_key=cache_key,
+                            prompt_cache_retention=PROMPT_CACHE_RETENTION,
+                        )
+                        tokens_in, tokens_out, cached_tokens_in = _extract_usage_tokens(
+                            response.usage
+                        )
+                        lease.record_usage(tokens_in, tokens_out)
                     if (
                         tokens_in is not None
                         or tokens_out is not None
@@ -0,0 +1,285 @@
+"""Scripted LLM provider that replays recorded transcripts.
+
+Used by the benchmark harness to drive the real FLY loop (executor and
+receipt finalizer) without a network-backed model. Each call consumes the
+next recorded turn for its role, sleeps for the configured latency, and
+yields the recorded text and tool events. ``Write`` and ``Edit`` tool calls
+are applied to the working directory so downstream provenance, stack
+detection and host validation see the same files a real run would.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from waypoints.llm.providers.base import (
+    LLMProvider,
+    StreamChunk,
+    StreamComplete,
+    StreamToolUse,
+)
+
+if TYPE_CHECKING:
+    from waypoints.llm.metrics import MetricsCollector
+
+logger = logging.getLogger(__name__)
+
+CHAT_ROLE = "chat"
+DEFAULT_AGENT_ROLE = "builder"
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptedLatency:
+    """Simulated model latency applied while replaying a turn."""
+
+    first_event_ms: float = 0.0
+    per_event_ms: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScriptedLatency":
+        return cls(
+            first_event_ms=float(data.get("first_event_ms", 0.0)),
+            per_event_ms=float(data.get("per_event_ms", 0.0)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptedTurn:
+    """One recorded model response.
+
+    Events are dicts of the form ``{"type": "text", "text": ...}`` or
+    ``{"type": "tool_use", "tool_name": ..., "tool_input": {...},
+    "tool_output": ...}``.
+    """
+
+    role: str
+    events: tuple[dict[str, Any], ...]
+    session_id: str | None = None
+    cost_usd: float | None = None
+    tokens_in: int | None = None
+    tokens_out: int | None = None
+    cached_tokens_in: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScriptedTurn":
+        events = data.get("events", [])
+        if not isinstance(events, list):
+            raise ValueError("Scripted turn events must be a list")
+        return cls(
+            role=str(data.get("role", DEFAULT_AGENT_ROLE)),
+            events=tuple(dict(event) for event in events),
+            session_id=data.get("session_id"),
+            cost_usd=data.get("cost_usd"),
+            tokens_in=data.get("tokens_in"),
+            tokens_out=data.get("tokens_out"),
+            cached_tokens_in=data.get("cached_tokens_in"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScriptedTranscript:
+    """Ordered turns to replay, grouped by role at replay time."""
+
+    turns: tuple[ScriptedTurn, ...]
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScriptedTranscript":
+        turns = data.get("turns")
+        if not isinstance(turns, list):
+            raise ValueError("Scripted transcript must contain a 'turns' list")
+        return cls(turns=tuple(ScriptedTurn.from_dict(turn) for turn in turns))
+
+    @classmethod
+    def load(cls, path: Path) -> "ScriptedTranscript":
+        return cls.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+@dataclass
+class ScriptedUsage:
+    """Replay accounting, split by role."""
+
+    calls: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    latency_seconds: dict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
+    @property
+    def total_latency_seconds(self) -> float:
+        return sum(self.latency_seconds.values())
+
+
+class ScriptedProvider(LLMProvider):
+    """Replays a :class:`ScriptedTranscript` with configurable latency."""
+
+    provider_name = "scripted"
+
+    def __init__(
+        self,
+        transcript: ScriptedTranscript,
+        *,
+        latency: ScriptedLatency | None = None,
+        model: str = "scripted",
+        apply_file_tools: bool = True,
+    ) -> None:
+        super().__init__(model=model)
+        self.latency = latency or ScriptedLatency()
+        self.apply_file_tools = apply_file_tools
+        self.usage = ScriptedUsage()
+        self._queues: dict[str, deque[ScriptedTurn]] = defaultdict(deque)
+        for turn in transcript.turns:
+            self._queues[turn.role].append(turn)
+
+    def remaining_turns(self) -> dict[str, int]:
+        """Unconsumed turns per role."""
+        return {role: len(queue) for role, queue in self._queues.items() if queue}
+
+    def _next_turn(self, role: str) -> ScriptedTurn:
+        queue = self._queues.get(role)
+        if not queue:
+            raise RuntimeError(f"Scripted transcript exhausted for role '{role}'")
+        return queue.popleft()
+
+    def _delay_seconds(self, index: int) -> float:
+        delay_ms = self.latency.first_event_ms if index == 0 else 0.0
+        return (delay_ms + self.latency.per_event_ms) / 1000.0
+
+    def stream_message(
+        self,
+        messages: list[dict[str, str]],
+        system: str = "",
+        max_tokens: int = 4096,
+        metrics_collector: "MetricsCollector | None" = None,
+        phase: str = "unknown",
+    ) -> Iterator[StreamChunk | StreamComplete]:
+        """Replay the next ``chat`` turn."""
+        turn = self._next_turn(CHAT_ROLE)
+        start_time = time.perf_counter()
+        full_text = ""
+        self.usage.calls[CHAT_ROLE] += 1
+        for index, event in enumerate(turn.events):
+            delay = self._delay_seconds(index)
+            if delay:
+                time.sleep(delay)
+                self.usage.latency_seconds[CHAT_ROLE] += delay
+            if event.get("type") == "text":
+                text = str(event.get("text", ""))
+                full_text += text
+                yield StreamChunk(text=text)
+
+        self._record_metrics(metrics_collector, turn, phase, None, start_time)
+        yield self._complete(turn, full_text)
+
+    async def agent_query(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        allowed_tools: list[str] | None = None,
+        cwd: str | None = None,
+        tool_role: str | None = None,
+        resume_session_id: str | None = None,
+        metrics_collector: "MetricsCollector | None" = None,
+        phase: str = "fly",
+        waypoint_id: str | None = None,
+    ) -> AsyncIterator[StreamChunk | StreamToolUse | StreamComplete]:
+        """Replay the next turn recorded for ``tool_role``."""
+        role = tool_role or DEFAULT_AGENT_ROLE
+        turn = self._next_turn(role)
+        root = Path(cwd) if cwd else Path.cwd()
+        start_time = time.perf_counter()
+        full_text = ""
+        self.usage.calls[role] += 1
+
+        for index, event in enumerate(turn.events):
+            delay = self._delay_seconds(index)
+            if delay:
+                await asyncio.sleep(delay)
+                self.usage.latency_seconds[role] += delay
+
+            event_type = event.get("type")
+            if event_type == "text":
+                text = str(event.get("text", ""))
+                full_text += text
+                yield StreamChunk(text=text)
+            elif event_type == "tool_use":
+                tool_name = str(event.get("tool_name", ""))
+                tool_input = dict(event.get("tool_input") or {})
+                if isinstance(tool_input.get("file_path"), str):
+                    tool_input["file_path"] = str(root / tool_input["file_path"])
+                if self.apply_file_tools:
+                    _apply_file_tool(root, tool_name, tool_input)
+                yield StreamToolUse(
+                    tool_name=tool_name,
+                    tool_input=tool_input,
+                    tool_output=event.get("tool_output"),
+                )
+            else:
+                raise ValueError(f"Unknown scripted event type: {event_type}")
+
+        self._record_metrics(metrics_collector, turn, phase, waypoint_id, start_time)
+        yield self._complete(turn, full_text)
+
+    def _complete(self, turn: ScriptedTurn, full_text: str) -> StreamComplete:
+        return StreamComplete(
+            full_text=full_text,
+            cost_usd=turn.cost_usd,
+            tokens_in=turn.tokens_in,
+            tokens_out=turn.tokens_out,
+            cached_tokens_in=turn.cached_tokens_in,
+            session_id=turn.session_id,
+        )
+
+    def _record_metrics(
+        self,
+        metrics_collector: "MetricsCollector | None",
+        turn: ScriptedTurn,
+        phase: str,
+        waypoint_id: str | None,
+        start_time: float,
+    ) -> None:
+        if metrics_collector is None:
+            return
+        from waypoints.llm.metrics import LLMCall
+
+        metrics_collector.record(
+            LLMCall.create(
+                phase=phase,
+                cost_usd=turn.cost_usd,
+                latency_ms=int((time.perf_counter() - start_time) * 1000),
+                model=self.model,
+                waypoint_id=waypoint_id,
+                tokens_in=turn.tokens_in,
+                tokens_out=turn.tokens_out,
+                cached_tokens_in=turn.cached_tokens_in,
+            )
+        )
+
+
+def _apply_file_tool(root: Path, tool_name: str, tool_input: dict[str, Any]) -> None:
+    """Apply a recorded Write/Edit to disk, confined to ``root``."""
+    if tool_name not in {"Write", "Edit"}:
+        return
+    raw_path = tool_input.get("file_path")
+    if not isinstance(raw_path, str):
+        return
+    target = Path(raw_path).resolve()
+    if not target.is_relative_to(root.resolve()):
+        logger.warning("Scripted %s outside %s ignored: %s", tool_name, root, target)
+        return
+
+    if tool_name == "Write":
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(str(tool_input.get("content", "")), encoding="utf-8")
+        return
+
+    old = str(tool_input.get("old_string", ""))
+    new = str(tool_input.get("new_string", ""))
+    content = target.read_text(encoding="utf-8")
+    if old not in content:
+        raise ValueError(f"Scripted Edit target text not found in {target}")
+    target.write_text(content.replace(old, new, 1), encoding="utf-8")
@@ -0,0 +1,271 @@
+"""Content-addressed cache for LLM chat responses.
+
+Entries are keyed by a digest of everything that determines a response
+(provider, model, system prompt, messages, tool set, token limit), so a
+repeated request can be replayed from disk without calling the provider.
+The cache is opt-in: commands enable it explicitly via
+``enable_response_cache`` or the ``WAYPOINTS_LLM_RESPONSE_CACHE`` env var.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from waypoints.config.paths import get_paths
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_KEY_VERSION = "v1"
+RESPONSE_CACHE_ENV_VAR = "WAYPOINTS_LLM_RESPONSE_CACHE"
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A stored LLM response with its original usage metadata."""
+
+    full_text: str
+    cost_usd: float | None = None
+    tokens_in: int | None = None
+    tokens_out: int | None = None
+    cached_tokens_in: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "full_text": self.full_text,
+            "cost_usd": self.cost_usd,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "cached_tokens_in": self.cached_tokens_in,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedResponse:
+        return cls(
+            full_text=str(data.get("full_text", "")),
+            cost_usd=data.get("cost_usd"),
+            tokens_in=data.get("tokens_in"),
+            tokens_out=data.get("tokens_out"),
+            cached_tokens_in=data.get("cached_tokens_in"),
+        )
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_response_cache_key(
+    *,
+    provider: str,
+    model: str,
+    system: str,
+    messages: Sequence[dict[str, str]],
+    tools: Sequence[str] = (),
+    max_tokens: int | None = None,
+) -> str:
+    """Build a content-addressed key for an LLM request.
+
+    System prompt and messages are hashed separately so the key material
+    stays small; the tool set is order-insensitive.
+    """
+    messages_json = json.dumps(list(messages), sort_keys=True, ensure_ascii=False)
+    material = json.dumps(
+        {
+            "version": RESPONSE_CACHE_KEY_VERSION,
+            "provider": provider,
+            "model": model,
+            "system": _sha256(system),
+            "messages": _sha256(messages_json),
+            "tools": sorted(set(tools)),
+            "max_tokens": max_tokens,
+        },
+        sort_keys=True,
+    )
+    return _sha256(material)
+
+
+def default_response_cache_dir() -> Path:
+    """Default cache location under the workspace config directory."""
+    return get_paths().workspace_config / "cache" / "llm-responses"
+
+
+class ResponseCache:
+    """On-disk response store with size-based, least-recently-used eviction.
+
+    Each entry is a small JSON file sharded by key prefix. Hits refresh the
+    entry's mtime, and eviction removes the oldest entries first once the
+    total size exceeds ``max_bytes``. The total is scanned once and then
+    tracked per write, so ``put`` only walks the directory when the budget
+    is exceeded; entries written by other processes are picked up at that
+    rescan.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        self._root = root or default_response_cache_dir()
+        self._max_bytes = max(0, max_bytes)
+        self._size: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def root(self) -> Path:
+        """Directory holding cache entries."""
+        return self._root
+
+    @property
+    def max_bytes(self) -> int:
+        """Size budget enforced by eviction."""
+        return self._max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for a key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Discarding unreadable cache entry %s: %s", path, exc)
+            path.unlink(missing_ok=True)
+            self._size = None
+            self.misses += 1
+            return None
+        if not isinstance(raw, dict):
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return CachedResponse.from_dict(raw)
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        """Store a response atomically, evicting once over the size budget."""
+        if self._size is None:
+            self._size = self.size_bytes()
+        path = self._entry_path(key)
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(response.to_dict(), handle, ensure_ascii=False)
+            written = Path(temp_name).stat().st_size
+            Path(temp_name).replace(path)
+        except OSError as exc:
+            logger.warning("Failed to write cache entry %s: %s", path, exc)
+            return
+        self._size += written - previous
+        if self._size > self._max_bytes:
+            self.evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        if not self._root.exists():
+            return entries
+        for path in self._root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size_bytes(self) -> int:
+        """Total size of stored entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """Remove least-recently-used entries until under budget.
+
+        Returns:
+            Number of entries removed.
+        """
+        budget = self._max_bytes if max_bytes is None else max(0, max_bytes)
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        self._size = total
+        if total <= budget:
+            return 0
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= budget:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._size = total
+        logger.info("Evicted %d response cache entries from %s", removed, self._root)
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number removed."""
+        return self.evict(max_bytes=0)
+
+
+_active_cache: ResponseCache | None = None
+
+
+def enable_response_cache(cache: ResponseCache | None = None) -> ResponseCache:
+    """Enable the process-wide response cache.
+
+    Also exports ``WAYPOINTS_LLM_RESPONSE_CACHE`` so child ``waypoints``
+    processes (e.g. flight test drivers) share the same cache directory.
+    """
+    global _active_cache
+    _active_cache = cache or ResponseCache()
+    os.environ[RESPONSE_CACHE_ENV_VAR] = str(_active_cache.root)
+    logger.info("LLM response cache enabled at %s", _active_cache.root)
+    return _active_cache
+
+
+def disable_response_cache() -> None:
+    """Disable the process-wide response cache."""
+    global _active_cache
+    _active_cache = None
+    os.environ.pop(RESPONSE_CACHE_ENV_VAR, None)
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the active response cache, if any.
+
+    Honors ``WAYPOINTS_LLM_RESPONSE_CACHE`` when no cache was enabled in
+    process: ``1``/``true`` selects the default directory, any other value
+    is treated as the cache directory.
+    """
+    global _active_cache
+    if _active_cache is not None:
+        return _active_cache
+
+    raw = os.environ.get(RESPONSE_CACHE_ENV_VAR, "").strip()
+    if not raw or raw.lower() in {"0", "false", "no", "off"}:
+        return None
+    root = None if raw.lower() in {"1", "true", "yes", "on"} else Path(raw)
+    _active_cache = ResponseCache(root)
+    return _active_cache
@@ -0,0 +1,491 @@
+"""Process-wide scheduler for LLM calls.
+
+Each provider/model pair gets a lane that every caller in the process
+shares, so parallel workloads (verification, genspec regeneration, batch
+runs) draw on one view of the quota instead of retrying independently:
+
+- optional token buckets for requests/min and tokens/min;
+- an AIMD concurrency limit: each success grows it by ``1/limit``, and a
+  rate-limit or overload error halves it (once per congestion window);
+- a shared pause: a throttled call blocks the whole lane until the reset
+  time the API reported, or a jittered backoff, so waiters resume one
+  priority-ordered slot at a time instead of retrying together;
+- priority classes: FLY builder, then verifier, then planning (CHART and
+  other interactive phases), then triage.
+
+Providers wrap each API request in :meth:`LLMScheduler.lease` (sync) or
+:meth:`LLMScheduler.lease_async`. A lease exited with a retryable API error
+reports congestion; its caller's next attempt waits in the lane.
+
+Agent sessions whose SDK issues many requests internally (the Claude agent
+SDK runs its own tool loop) cannot be leased per request. They enter through
+:meth:`LLMScheduler.session_async`, which admits the session like one request
+and then frees the slot, so a long session with tool calls does not hold
+concurrency. Its token usage and any throttling it hits are still reported
+to the lane, but its individual requests are not paced.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import IntEnum
+
+from waypoints.llm.providers.base import (
+    RETRY_DELAYS,
+    APIErrorType,
+    classify_api_error,
+    extract_reset_datetime,
+    is_retryable_error,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MAX_CONCURRENCY = 16
+# Reset times further out than this are quota/budget resets, not rate-limit
+# windows; they are left to the budget-wait flow instead of pausing a lane.
+MAX_RESET_WAIT_SECONDS = 300.0
+
+
+class CallPriority(IntEnum):
+    """Scheduling class; lower values are served first."""
+
+    BUILDER = 0
+    VERIFIER = 1
+    CHART = 2
+    TRIAGE = 3
+
+
+def priority_for(phase: str, tool_role: str | None = None) -> CallPriority:
+    """Map a metrics phase and optional FLY tool role to a priority class."""
+    if tool_role == "verifier":
+        return CallPriority.VERIFIER
+    if tool_role == "builder":
+        return CallPriority.BUILDER
+    if "triage" in phase:
+        return CallPriority.TRIAGE
+    if phase == "fly":
+        return CallPriority.BUILDER
+    return CallPriority.CHART
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate used to pre-debit the tokens/min bucket."""
+    return max(1, len(text) // 4)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimits:
+    """Limits for one provider/model lane; ``None`` means unlimited."""
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+    initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+
+
+@dataclass(frozen=True, slots=True)
+class LaneStats:
+    """Point-in-time view of one lane."""
+
+    concurrency_limit: float
+    in_flight: int
+    waiting: int
+    paused_for_seconds: float
+    throttle_events: int
+    granted: int
+
+
+class _TokenBucket:
+    """Per-minute bucket that may go into debt when actual usage is higher."""
+
+    def __init__(self, per_minute: int | None, now: float) -> None:
+        self._capacity = float(per_minute) if per_minute else None
+        self._tokens = self._capacity or 0.0
+        self._updated = now
+
+    def delay(self, amount: int, now: float) -> float:
+        """Seconds until ``amount`` can be taken (0 when available)."""
+        if self._capacity is None:
+            return 0.0
+        self._refill(now)
+        needed = min(float(amount), self._capacity)
+        if self._tokens >= needed:
+            return 0.0
+        return (needed - self._tokens) * 60.0 / self._capacity
+
+    def take(self, amount: int) -> None:
+        if self._capacity is not None:
+            self._tokens -= amount
+
+    def _refill(self, now: float) -> None:
+        assert self._capacity is not None
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(
+            self._capacity, self._tokens + elapsed * self._capacity / 60.0
+        )
+
+
+@dataclass(eq=False)
+class _Waiter:
+    priority: int
+    seq: int
+    tokens: int
+    notify: Callable[[], None]
+    granted: bool = False
+
+    def __lt__(self, other: _Waiter) -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class _Lane:
+    """Scheduling state for one provider/model pair. Guarded by its lock."""
+
+    def __init__(self, limits: RateLimits, clock: Callable[[], float]) -> None:
+        now = clock()
+        self.lock = threading.Lock()
+        self.limits = limits
+        self.clock = clock
+        self.limit = float(max(1, limits.initial_concurrency))
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.epoch = 0
+        self.consecutive_throttles = 0
+        self.throttle_events = 0
+        self.granted = 0
+        self.waiters: list[_Waiter] = []
+        self.requests = _TokenBucket(limits.requests_per_minute, now)
+        self.tokens = _TokenBucket(limits.tokens_per_minute, now)
+
+    def pump(self, caller: _Waiter | None = None) -> float | None:
+        """Grant head waiters while capacity allows.
+
+        Returns seconds until the head could be granted, or ``None`` when
+        only a release can make progress. When the head is blocked by a
+        pause or an empty bucket, it is woken (unless it is ``caller``,
+        which gets the delay directly) so it waits with that timeout rather
+        than for a release that may never come.
+        """
+        now = self.clock()
+        while self.waiters:
+            if self.in_flight >= int(self.limit):
+                return None
+            head = self.waiters[0]
+            if now < self.paused_until:
+                wait = self.paused_until - now
+            else:
+                wait = max(
+                    self.requests.delay(1, now), self.tokens.delay(head.tokens, now)
+                )
+            if wait > 0:
+                if head is not caller:
+                    head.notify()
+                return wait
+            heapq.heappop(self.waiters)
+            self.requests.take(1)
+            self.tokens.take(head.tokens)
+            self.in_flight += 1
+            self.granted += 1
+            head.granted = True
+            head.notify()
+        return None
+
+    def release(self, lease: Lease) -> None:
+        self.in_flight -= 1
+        if lease.usage is not None:
+            self.tokens.take(lease.usage - lease.estimated_tokens)
+        if lease.congestion is not None:
+            self._on_congestion(lease.epoch, lease.congestion)
+        elif not lease.failed:
+            self.consecutive_throttles = 0
+            self.limit = min(
+                float(self.limits.max_concurrency), self.limit + 1.0 / self.limit
+            )
+        self.pump()
+
+    def settle_session(self, lease: Lease) -> None:
+        """Account for a finished agent session admitted without a slot."""
+        if lease.usage is not None:
+            self.tokens.take(lease.usage - lease.estimated_tokens)
+        if lease.congestion is not None:
+            self._on_congestion(lease.epoch, lease.congestion)
+            self.pump()
+
+    def _on_congestion(self, epoch: int, pause: float) -> None:
+        self.throttle_events += 1
+        self.consecutive_throttles += 1
+        # Calls admitted before the last decrease report the same congestion.
+        if epoch >= self.epoch:
+            self.limit = max(1.0, self.limit / 2)
+            self.epoch += 1
+        self.paused_until = max(self.paused_until, self.clock() + pause)
+        logger.warning(
+            "LLM lane throttled; pausing %.1fs (concurrency limit %.1f)",
+            pause,
+            self.limit,
+        )
+
+    def stats(self) -> LaneStats:
+        return LaneStats(
+            concurrency_limit=self.limit,
+            in_flight=self.in_flight,
+            waiting=len(self.waiters),
+            paused_for_seconds=max(0.0, self.paused_until - self.clock()),
+            throttle_events=self.throttle_events,
+            granted=self.granted,
+        )
+
+
+@dataclass(eq=False)
+class Lease:
+    """Permission to make one API request; report usage before exiting."""
+
+    estimated_tokens: int
+    epoch: int
+    usage: int | None = None
+    failed: bool = False
+    congestion: float | None = field(default=None, repr=False)
+
+    def record_usage(self, tokens_in: int | None, tokens_out: int | None) -> None:
+        """Replace the token estimate with actual usage, when reported."""
+        if tokens_in is None and tokens_out is None:
+            return
+        self.usage = (tokens_in or 0) + (tokens_out or 0)
+
+
+class LLMScheduler:
+    """Shared admission control for LLM calls across the process."""
+
+    def __init__(
+        self,
+        *,
+        limits: Callable[[str, str], RateLimits] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = limits or _configured_limits
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._lanes: dict[tuple[str, str], _Lane] = {}
+        self._seq = itertools.count()
+
+    def stats(self, provider: str, model: str) -> LaneStats:
+        """Current state of the lane for ``provider``/``model``."""
+        lane = self._lane(provider, model)
+        with lane.lock:
+            return lane.stats()
+
+    @contextmanager
+    def lease(
+        self,
+        provider: str,
+        model: str,
+        *,
+        priority: CallPriority = CallPriority.CHART,
+        estimated_tokens: int = 0,
+    ) -> Iterator[Lease]:
+        """Block until the lane admits one request, then hold it."""
+        lane = self._lane(provider, model)
+        event = threading.Event()
+        waiter = self._enqueue(lane, priority, estimated_tokens, event.set)
+        try:
+            delay = self._pump(lane, waiter)
+            while not waiter.granted:
+                event.wait(timeout=delay)
+                event.clear()
+                delay = self._pump(lane, waiter)
+        except BaseException:
+            self._abandon(lane, waiter)
+            raise
+        lease = Lease(estimated_tokens=estimated_tokens, epoch=lane.epoch)
+        try:
+            yield lease
+        except BaseException as exc:
+            lease.failed = True
+            lease.congestion = _congestion_pause(exc, lane)
+            raise
+        finally:
+            with lane.lock:
+                lane.release(lease)
+
+    @asynccontextmanager
+    async def lease_async(
+        self,
+        provider: str,
+        model: str,
+        *,
+        priority: CallPriority = CallPriority.CHART,
+        estimated_tokens: int = 0,
+    ) -> AsyncIterator[Lease]:
+        """Async variant of :meth:`lease`; waiting never blocks the loop."""
+        lane = self._lane(provider, model)
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+
+        def _notify() -> None:
+            loop.call_soon_threadsafe(event.set)
+
+        waiter = self._enqueue(lane, priority, estimated_tokens, _notify)
+        try:
+            delay = self._pump(lane, waiter)
+            while not waiter.granted:
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                event.clear()
+                delay = self._pump(lane, waiter)
+        except BaseException:
+            self._abandon(lane, waiter)
+            raise
+        lease = Lease(estimated_tokens=estimated_tokens, epoch=lane.epoch)
+        try:
+            yield lease
+        except BaseException as exc:
+            lease.failed = True
+            lease.congestion = _congestion_pause(exc, lane)
+            raise
+        finally:
+            with lane.lock:
+                lane.release(lease)
+
+    @asynccontextmanager
+    async def session_async(
+        self,
+        provider: str,
+        model: str,
+        *,
+        priority: CallPriority = CallPriority.CHART,
+        estimated_tokens: int = 0,
+    ) -> AsyncIterator[Lease]:
+        """Admit a multi-request agent session without holding a slot for it.
+
+        The session waits in the lane like a single request (pauses, buckets
+        and priority order apply), then releases its slot before running.
+        Usage recorded on the yielded lease and retryable errors raised from
+        the session are reported to the lane when it exits.
+        """
+        lane = self._lane(provider, model)
+        async with self.lease_async(
+            provider, model, priority=priority, estimated_tokens=estimated_tokens
+        ) as admission:
+            pass
+        lease = Lease(estimated_tokens=estimated_tokens, epoch=admission.epoch)
+        try:
+            yield lease
+        except BaseException as exc:
+            lease.failed = True
+            lease.congestion = _congestion_pause(exc, lane)
+            raise
+        finally:
+            with lane.lock:
+                lane.settle_session(lease)
+
+    def _lane(self, provider: str, model: str) -> _Lane:
+        key = (provider, model)
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = _Lane(self._limits(provider, model), self._clock)
+                self._lanes[key] = lane
+            return lane
+
+    def _enqueue(
+        self,
+        lane: _Lane,
+        priority: CallPriority,
+        estimated_tokens: int,
+        notify: Callable[[], None],
+    ) -> _Waiter:
+        waiter = _Waiter(int(priority), next(self._seq), estimated_tokens, notify)
+        with lane.lock:
+            heapq.heappush(lane.waiters, waiter)
+        return waiter
+
+    def _pump(self, lane: _Lane, waiter: _Waiter) -> float | None:
+        with lane.lock:
+            return lane.pump(waiter)
+
+    def _abandon(self, lane: _Lane, waiter: _Waiter) -> None:
+        """Withdraw a cancelled waiter, returning its slot if it was granted."""
+        with lane.lock:
+            if waiter.granted:
+                lane.in_flight -= 1
+                lane.pump()
+            elif waiter in lane.waiters:
+                lane.waiters.remove(waiter)
+                heapq.heapify(lane.waiters)
+                lane.pump()
+
+
+def _congestion_pause(exc: BaseException, lane: _Lane) -> float | None:
+    """Seconds to pause the lane for ``exc``, or None if it is not congestion."""
+    if not isinstance(exc, Exception):
+        return None
+    error_type = classify_api_error(exc)
+    if not is_retryable_error(error_type):
+        return None
+    reset = _retry_after_seconds(exc)
+    if reset is None and error_type is APIErrorType.RATE_LIMITED:
+        reset_at = extract_reset_datetime(str(exc))
+        if reset_at is not None:
+            reset = (reset_at - datetime.now(UTC)).total_seconds()
+    if reset is not None and 0 < reset <= MAX_RESET_WAIT_SECONDS:
+        return reset
+    index = min(lane.consecutive_throttles, len(RETRY_DELAYS) - 1)
+    # Jitter spreads resumption across processes sharing the same quota.
+    return RETRY_DELAYS[index] * random.uniform(0.8, 1.2)
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    """Read a ``Retry-After`` header from SDK errors that carry a response."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    raw = headers.get("retry-after")
+    try:
+        return float(raw) if raw is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _configured_limits(provider: str, model: str) -> RateLimits:
+    from waypoints.config.settings import settings
+
+    configured = settings.llm_rate_limits
+    raw = configured.get(f"{provider}/{model}") or configured.get(provider) or {}
+    return RateLimits(
+        requests_per_minute=_positive_int(raw.get("requests_per_minute")),
+        tokens_per_minute=_positive_int(raw.get("tokens_per_minute")),
+        initial_concurrency=_positive_int(raw.get("initial_concurrency"))
+        or DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency=_positive_int(raw.get("max_concurrency"))
+        or DEFAULT_MAX_CONCURRENCY,
+    )
+
+
+def _positive_int(value: object) -> int | None:
+    try:
+        number = int(value)  # type: ignore[call-overload]
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+_SCHEDULER = LLMScheduler()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Return the process-wide LLM scheduler."""
+    return _SCHEDULER
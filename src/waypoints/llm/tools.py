@@ -1,7 +1,21 @@
-"""Shared tool execution for LLM providers."""
-
+"""Shared tool execution for LLM providers.
+
+Tool results go straight into the model context, so they are bounded per
+tool. Oversized ``bash``/``grep`` output is reduced to a head and tail
+excerpt and the full text is spilled to ``sessions/tool-output/``, which
+``read_file`` may page through with ``offset``/``limit``. ``read_file``
+reads files in bounded chunks and stops at its budget; a line longer than
+the budget is cut off with a marker and spilled, wrapped into short lines,
+so it can be paged the same way.
+"""
+
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+from uuid import uuid4
 
 from waypoints.memory import (
     IMMUTABLE_BLOCKED_TOP_LEVEL_DIRS,
@@ -32,6 +46,209 @@ ROLE_TOOL_ALLOWLIST: dict[str, tuple[str, ...]] = {
 
 MUTATING_TOOLS = frozenset({"write_file", "edit_file"})
 
+# Per-tool output budgets, as multiples of
+# settings.fly_context_tool_output_budget_chars.
+TOOL_OUTPUT_BUDGET_MULTIPLIERS: dict[str, int] = {
+    "read_file": 4,
+    "bash": 2,
+    "grep": 2,
+}
+MIN_TOOL_OUTPUT_CHARS = 1000
+TOOL_OUTPUT_SPILL_DIRNAME = "tool-output"
+MAX_SPILL_FILES = 50
+# Spilled long lines are rewrapped at this width so offset/limit can page them.
+LONG_LINE_WRAP_CHARS = 200
+
+
+@dataclass(frozen=True, slots=True)
+class BoundedOutput:
+    """Tool output reduced to fit a character budget."""
+
+    text: str
+    original_chars: int
+    truncated: bool = False
+    spill_path: Path | None = None
+
+
+def tool_output_budget_chars(tool_name: str) -> int:
+    """Return the character budget for one tool's output."""
+    from waypoints.config.settings import settings
+
+    multiplier = TOOL_OUTPUT_BUDGET_MULTIPLIERS.get(tool_name, 1)
+    base = settings.fly_context_tool_output_budget_chars * multiplier
+    return max(base, MIN_TOOL_OUTPUT_CHARS)
+
+
+def spill_dir_for(cwd: str | None) -> Path:
+    """Return the directory holding full output of truncated tool results."""
+    if cwd is None:
+        return Path(tempfile.gettempdir()) / f"waypoints-{TOOL_OUTPUT_SPILL_DIRNAME}"
+    return Path(cwd).resolve() / "sessions" / TOOL_OUTPUT_SPILL_DIRNAME
+
+
+def bound_tool_output(
+    tool_name: str, output: str, *, budget_chars: int, spill_dir: Path
+) -> BoundedOutput:
+    """Keep head and tail of ``output`` within budget, spilling the rest.
+
+    The full output is written to ``spill_dir`` so nothing is lost; the
+    returned text names the spill file.
+    """
+    if len(output) <= budget_chars:
+        return BoundedOutput(text=output, original_chars=len(output))
+
+    spill_path: Path | None
+    try:
+        spill_path = _write_spill_file(tool_name, output, spill_dir)
+    except OSError:
+        spill_path = None
+    head_chars = budget_chars // 3
+    tail_chars = budget_chars - head_chars
+    omitted = len(output) - head_chars - tail_chars
+    where = f"full output: {spill_path}" if spill_path else "full output not saved"
+    marker = f"\n... ({omitted} chars omitted of {len(output)}; {where}) ...\n"
+    return BoundedOutput(
+        text=output[:head_chars] + marker + output[-tail_chars:],
+        original_chars=len(output),
+        truncated=True,
+        spill_path=spill_path,
+    )
+
+
+def _write_spill_file(
+    tool_name: str, output: str | Iterable[str], spill_dir: Path
+) -> Path:
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+    path = spill_dir / f"{tool_name}-{stamp}-{uuid4().hex[:8]}.txt"
+    with path.open("w", encoding="utf-8") as handle:
+        handle.writelines([output] if isinstance(output, str) else output)
+    spills = sorted(spill_dir.glob("*.txt"), key=lambda item: item.stat().st_mtime)
+    for stale in spills[:-MAX_SPILL_FILES]:
+        stale.unlink(missing_ok=True)
+    return path
+
+
+def _read_file_lines(
+    path: Path,
+    *,
+    offset: int | None,
+    limit: int | None,
+    budget_chars: int,
+    spill_dir: Path,
+) -> str:
+    """Read a line range of ``path`` without loading the whole file.
+
+    ``offset`` is the 1-based first line. Reading stops after ``limit``
+    lines or once ``budget_chars`` is reached; a trailing note then tells
+    the model how to continue. Nothing past that point is read, and no line
+    is held in memory beyond the budget.
+    """
+    start = max(offset or 1, 1)
+    parts: list[str] = []
+    used = 0
+    last_line = start - 1
+    more = False
+    with path.open(encoding="utf-8") as handle:
+        for _ in range(start - 1):
+            if not _skip_line(handle, budget_chars):
+                return f"(offset {start} is past the end of the file)"
+        while True:
+            if limit is not None and last_line - start + 1 >= limit:
+                more = bool(handle.readline(1))
+                break
+            line = handle.readline(budget_chars)
+            if not line:
+                break
+            if line.endswith("\n") or len(line) < budget_chars:
+                if parts and used + len(line) > budget_chars:
+                    more = True
+                    break
+                parts.append(line)
+                used += len(line)
+                last_line += 1
+                continue
+            if parts:
+                more = True
+                break
+            last_line += 1
+            rest = handle.readline(budget_chars)
+            if rest in ("", "\n"):
+                parts.append(line + rest)
+                used += len(line + rest)
+                continue
+            parts.append(_truncate_long_line(handle, line, rest, last_line, spill_dir))
+            more = bool(handle.readline(1))
+            break
+    text = "".join(parts)
+    if more:
+        text += (
+            f"\n... (showing lines {start}-{last_line}; more lines follow; "
+            f"use offset={last_line + 1} and limit to read more)"
+        )
+    elif not parts and start > 1:
+        text = f"(offset {start} is past the end of the file)"
+    return text
+
+
+def _skip_line(handle: TextIO, chunk_chars: int) -> bool:
+    """Consume one line in bounded chunks; False if already at end of file."""
+    consumed = False
+    while chunk := handle.readline(chunk_chars):
+        consumed = True
+        if chunk.endswith("\n"):
+            break
+    return consumed
+
+
+def _truncate_long_line(
+    handle: TextIO, head: str, rest: str, line_no: int, spill_dir: Path
+) -> str:
+    """Show the start of an over-budget line and spill all of it, wrapped."""
+    seen = [0]
+    try:
+        spill_path = _write_spill_file(
+            "read_file",
+            _wrapped_line(handle, [head, rest], len(head), seen),
+            spill_dir,
+        )
+    except OSError:
+        _skip_line(handle, len(head))
+        detail = "full line not saved"
+    else:
+        detail = (
+            f"{seen[0]} chars in total; full line wrapped at "
+            f"{LONG_LINE_WRAP_CHARS} chars per line: {spill_path}"
+        )
+    return f"{head}\n... (line {line_no} truncated at {len(head)} chars; {detail})"
+
+
+def _wrapped_line(
+    handle: TextIO, first: list[str], chunk_chars: int, seen: list[int]
+) -> Iterator[str]:
+    """Yield the rest of the current line rewrapped, counting its chars."""
+    pending = ""
+    chunks = iter(first)
+    while True:
+        chunk = next(chunks, None)
+        if chunk is None:
+            chunk = handle.readline(chunk_chars)
+        ended = not chunk or chunk.endswith("\n")
+        chunk = chunk.removesuffix("\n")
+        seen[0] += len(chunk)
+        pending += chunk
+        while len(pending) >= LONG_LINE_WRAP_CHARS:
+            yield pending[:LONG_LINE_WRAP_CHARS] + "\n"
+            pending = pending[LONG_LINE_WRAP_CHARS:]
+        if ended:
+            break
+    if pending:
+        yield pending + "\n"
+
+
+def _is_spill_path(path: Path, cwd: str | None) -> bool:
+    return cwd is not None and path.is_relative_to(spill_dir_for(cwd))
+
 
 def _access_denied(message: str) -> str:
     """Create a normalized tool error for blocked paths."""
@@ -99,6 +316,18 @@ def _normalize_tool_name(name: str) -> str:
     return alias_map.get(lowered, lowered)
 
 
+def _optional_int(value: Any) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
+
+
 def allowed_tools_for_role(role: str) -> tuple[str, ...]:
     """Resolve tool allowlist for a role identifier."""
     return ROLE_TOOL_ALLOWLIST.get(role.lower(), ())
@@ -148,11 +377,19 @@ def execute_tool(
         blocked_dirs = _resolve_blocked_top_level_dirs(cwd)
         if normalized_name == "read_file":
             path = _resolve_tool_path(arguments["file_path"], cwd)
-            if (error := _check_path_policy(path, cwd, blocked_dirs)) is not None:
+            if not _is_spill_path(path, cwd) and (
+                error := _check_path_policy(path, cwd, blocked_dirs)
+            ):
                 return _access_denied(error)
             if not path.exists():
                 return f"Error: File not found: {path}"
-            return path.read_text(encoding="utf-8")
+            return _read_file_lines(
+                path,
+                offset=_optional_int(arguments.get("offset")),
+                limit=_optional_int(arguments.get("limit")),
+                budget_chars=tool_output_budget_chars("read_file"),
+                spill_dir=spill_dir_for(cwd),
+            )
 
         if normalized_name == "write_file":
             path = _resolve_tool_path(arguments["file_path"], cwd)
@@ -206,6 +443,13 @@ def execute_tool(
             event_summary = _format_timeout_events(timeout_events)
             if event_summary:
                 output += f"\n{event_summary}"
+            bounded = bound_tool_output(
+                "bash",
+                output,
+                budget_chars=tool_output_budget_chars("bash"),
+                spill_dir=spill_dir_for(cwd),
+            )
+            output = bounded.text
             if result.effective_exit_code != 0:
                 output += f"\nExit code: {result.effective_exit_code}"
             return output or "(no output)"
@@ -261,7 +505,14 @@ def execute_tool(
                 if len(results) >= 100:
                     break
 
-            return "\n".join(results) or "(no matches)"
+            if not results:
+                return "(no matches)"
+            return bound_tool_output(
+                "grep",
+                "\n".join(results),
+                budget_chars=tool_output_budget_chars("grep"),
+                spill_dir=spill_dir_for(cwd),
+            ).text
 
         return f"Error: Unknown tool: {name}"
 
@@ -9,14 +9,7 @@ import sys
 from collections.abc import Sequence
 
 from waypoints.cli.app import run as run_cli
-from waypoints.cli.commands.compare import cmd_compare as _cmd_compare
-from waypoints.cli.commands.export import cmd_export as _cmd_export
-from waypoints.cli.commands.import_cmd import cmd_import as _cmd_import
-from waypoints.cli.commands.memory import cmd_memory as _cmd_memory
-from waypoints.cli.commands.run import cmd_run as _cmd_run
-from waypoints.cli.commands.tui import cmd_tui as _cmd_tui
-from waypoints.cli.commands.verify import cmd_verify as _cmd_verify
-from waypoints.cli.commands.view import cmd_view as _cmd_view
+from waypoints.cli.commands import load_command
 from waypoints.cli.parser import parse_args as _parse_args
 from waypoints.config.paths import get_paths
 from waypoints.config.project_root import (
@@ -54,35 +47,35 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
 
 
 def cmd_export(args: argparse.Namespace) -> int:
-    return _cmd_export(args)
+    return load_command("export")(args)
 
 
 def cmd_import(args: argparse.Namespace) -> int:
-    return _cmd_import(args)
+    return load_command("import")(args)
 
 
 def cmd_run(args: argparse.Namespace) -> int:
-    return _cmd_run(args)
+    return load_command("run")(args)
 
 
 def cmd_compare(args: argparse.Namespace) -> int:
-    return _cmd_compare(args)
+    return load_command("compare")(args)
 
 
 def cmd_view(args: argparse.Namespace) -> int:
-    return _cmd_view(args)
+    return load_command("view")(args)
 
 
 def cmd_verify(args: argparse.Namespace) -> int:
-    return _cmd_verify(args)
+    return load_command("verify")(args)
 
 
 def cmd_memory(args: argparse.Namespace) -> int:
-    return _cmd_memory(args)
+    return load_command("memory")(args)
 
 
 def cmd_tui(args: argparse.Namespace) -> int:
-    return _cmd_tui(args)
+    return load_command("tui")(args)
 
 
 def main() -> None:
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -14,6 +17,7 @@ STACK_PROFILE_FILENAME = "stack-profile.v1.json"
 DIRECTORY_MAP_FILENAME = "directory-map.v1.json"
 PROJECT_INDEX_FILENAME = "project-index.v1.json"
 POLICY_OVERRIDES_FILENAME = "policy-overrides.v1.json"
+SCAN_CACHE_FILENAME = "scan-cache.v1.json"
 
 DirectoryRole = Literal[
     "source",
@@ -106,6 +110,7 @@ class StackProfile:
     generated_at_utc: str
     stack_types: tuple[str, ...]
     manifest_paths: tuple[str, ...]
+    generation: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize stack profile."""
@@ -114,6 +119,7 @@ class StackProfile:
             "generated_at_utc": self.generated_at_utc,
             "stack_types": list(self.stack_types),
             "manifest_paths": list(self.manifest_paths),
+            "generation": self.generation,
         }
 
     @classmethod
@@ -126,6 +132,7 @@ class StackProfile:
             generated_at_utc=str(data.get("generated_at_utc", "")),
             stack_types=tuple(str(item) for item in raw_types),
             manifest_paths=tuple(str(item) for item in raw_manifests),
+            generation=_optional_str(data.get("generation")),
         )
 
 
@@ -136,6 +143,7 @@ class DirectoryMap:
     schema_version: str
     generated_at_utc: str
     records: tuple[ProjectDirectoryRecord, ...]
+    generation: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize directory map."""
@@ -143,6 +151,7 @@ class DirectoryMap:
             "schema_version": self.schema_version,
             "generated_at_utc": self.generated_at_utc,
             "records": [record.to_dict() for record in self.records],
+            "generation": self.generation,
         }
 
     @classmethod
@@ -158,6 +167,7 @@ class DirectoryMap:
             schema_version=str(data.get("schema_version", MEMORY_SCHEMA_VERSION)),
             generated_at_utc=str(data.get("generated_at_utc", "")),
             records=records,
+            generation=_optional_str(data.get("generation")),
         )
 
 
@@ -174,6 +184,7 @@ class ProjectMemoryIndex:
     focus_top_level_dirs: tuple[str, ...]
     source_branch: str | None = None
     policy_overrides_digest: str | None = None
+    generation: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize project index."""
@@ -187,6 +198,7 @@ class ProjectMemoryIndex:
             "focus_top_level_dirs": list(self.focus_top_level_dirs),
             "source_branch": self.source_branch,
             "policy_overrides_digest": self.policy_overrides_digest,
+            "generation": self.generation,
         }
 
     @classmethod
@@ -216,6 +228,7 @@ class ProjectMemoryIndex:
                 if data.get("policy_overrides_digest") is not None
                 else None
             ),
+            generation=_optional_str(data.get("generation")),
         )
 
 
@@ -228,6 +241,68 @@ class ProjectMemory:
     directory_map: DirectoryMap
 
 
+@dataclass(slots=True, frozen=True)
+class _DirectoryStackScan:
+    """Cached stack markers for one directory, valid while its mtime holds."""
+
+    mtime_ns: int
+    stack_types: tuple[str, ...]
+    manifests: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class _ScanCache:
+    """Per-directory stack detection results keyed by root-relative path."""
+
+    generation: str | None = None
+    directories: dict[str, _DirectoryStackScan] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "schema_version": MEMORY_SCHEMA_VERSION,
+            "generation": self.generation,
+            "directories": {
+                rel: {
+                    "mtime_ns": scan.mtime_ns,
+                    "stack_types": list(scan.stack_types),
+                    "manifests": list(scan.manifests),
+                }
+                for rel, scan in sorted(self.directories.items())
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_ScanCache":
+        directories: dict[str, _DirectoryStackScan] = {}
+        raw = data.get("directories", {})
+        if isinstance(raw, dict):
+            for rel, item in raw.items():
+                if not isinstance(item, dict):
+                    continue
+                directories[str(rel)] = _DirectoryStackScan(
+                    mtime_ns=int(item.get("mtime_ns", -1)),
+                    stack_types=tuple(str(x) for x in item.get("stack_types", [])),
+                    manifests=tuple(str(x) for x in item.get("manifests", [])),
+                )
+        return cls(
+            generation=_optional_str(data.get("generation")),
+            directories=directories,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _WarmMemory:
+    """In-process memory reused while its filesystem stamp is unchanged."""
+
+    memory: ProjectMemory
+    scan_cache: _ScanCache
+    stamp: tuple[object, ...]
+
+
+# Resolved project root -> last loaded or built memory in this process.
+_WARM_MEMORY: dict[Path, _WarmMemory] = {}
+
+
 @dataclass(slots=True, frozen=True)
 class PolicyOverrides:
     """Project-authored top-level directory policy overrides."""
@@ -263,30 +338,54 @@ def policy_overrides_path(project_root: Path) -> Path:
 def load_or_build_project_memory(
     project_root: Path, *, force_refresh: bool = False
 ) -> ProjectMemory:
-    """Load memory files or rebuild if missing/stale."""
+    """Load memory files or rebuild if missing/stale.
+
+    Repeat calls in one process return the cached memory after a few
+    ``stat`` calls when nothing relevant changed. Otherwise a rebuild reuses
+    stack detection for directories whose mtime is unchanged and
+    classification for unchanged top-level entries, and files are rewritten
+    only when the resulting policy differs.
+    """
     root = project_root.resolve()
+    warm = None if force_refresh else _WARM_MEMORY.get(root)
+    if warm is not None and warm.stamp == _warm_stamp(root, warm.scan_cache):
+        return warm.memory
+
     current_branch = _detect_current_branch(root)
     current_overrides = load_policy_overrides(root)
     current_overrides_digest = _policy_overrides_digest(current_overrides)
 
+    previous: ProjectMemory | None = None
+    scan_cache = _ScanCache()
     if not force_refresh:
-        loaded = _try_load_memory(root)
-        if loaded is not None:
-            current_fingerprint = _compute_top_level_fingerprint(root)
-            if (
-                loaded.index.top_level_fingerprint == current_fingerprint
-                and loaded.index.source_branch == current_branch
-                and loaded.index.policy_overrides_digest == current_overrides_digest
-            ):
-                return loaded
-
-    built = _build_memory(
+        previous = _try_load_memory(root)
+        if previous is not None:
+            generation = previous.index.generation
+            if warm is not None and warm.memory.index.generation == generation:
+                scan_cache = warm.scan_cache
+            else:
+                scan_cache = _load_scan_cache(root, generation)
+
+    built, built_cache = _build_memory(
         root,
         current_branch=current_branch,
         overrides=current_overrides,
         overrides_digest=current_overrides_digest,
+        previous=previous,
+        scan_cache=scan_cache,
     )
-    _persist_memory(root, built)
+    if previous is not None and _memory_content(previous) == _memory_content(built):
+        built = previous
+        built_cache = replace(built_cache, generation=previous.index.generation)
+        if built_cache != scan_cache:
+            _persist_files(root, [(SCAN_CACHE_FILENAME, built_cache.to_dict())])
+    else:
+        built, built_cache = _with_generation(built, built_cache, uuid.uuid4().hex)
+        _persist_memory(root, built, built_cache)
+
+    stamp = _warm_stamp(root, built_cache)
+    if stamp is not None:
+        _WARM_MEMORY[root] = _WarmMemory(built, built_cache, stamp)
     return built
 
 
@@ -308,10 +407,28 @@ def _build_memory(
     current_branch: str | None,
     overrides: PolicyOverrides,
     overrides_digest: str,
-) -> ProjectMemory:
-    """Build memory data from the current project filesystem."""
+    previous: ProjectMemory | None = None,
+    scan_cache: _ScanCache | None = None,
+) -> tuple[ProjectMemory, _ScanCache]:
+    """Build memory data from the current project filesystem.
+
+    ``previous`` records are reused for top-level entries whose name and
+    kind are unchanged when the detected stacks (which drive the ignore
+    set) are the same.
+    """
     now = datetime.now(UTC).isoformat()
-    stack_profile = _build_stack_profile(project_root, now)
+    stack_profile, built_cache = _build_stack_profile(
+        project_root, now, scan_cache or _ScanCache()
+    )
+    reusable: dict[tuple[str, str], ProjectDirectoryRecord] = {}
+    if (
+        previous is not None
+        and previous.stack_profile.stack_types == stack_profile.stack_types
+    ):
+        reusable = {
+            (record.name, record.kind): record
+            for record in previous.directory_map.records
+        }
     ignored_roots_from_stack = set(_GENERIC_IGNORED_DIRS)
     for stack_type in stack_profile.stack_types:
         ignored_roots_from_stack.update(
@@ -323,8 +440,13 @@ def _build_memory(
     ignored_roots: set[str] = set(IMMUTABLE_BLOCKED_TOP_LEVEL_DIRS)
     focus_roots: set[str] = set()
 
+    fingerprint_lines: list[str] = []
     for entry in sorted(project_root.iterdir(), key=lambda item: item.name):
-        record = _classify_top_level_entry(entry, ignored_roots_from_stack)
+        kind = "dir" if entry.is_dir() else "file"
+        fingerprint_lines.append(f"{kind}:{entry.name}")
+        record = reusable.get((entry.name, kind)) or _classify_top_level_entry(
+            entry, ignored_roots_from_stack
+        )
         records.append(record)
         if record.blocked_for_tools and record.kind == "dir":
             blocked_roots.add(record.name)
@@ -349,40 +471,71 @@ def _build_memory(
         schema_version=MEMORY_SCHEMA_VERSION,
         generated_at_utc=now,
         project_root=str(project_root),
-        top_level_fingerprint=_compute_top_level_fingerprint(project_root),
+        top_level_fingerprint=_fingerprint_lines(fingerprint_lines),
         blocked_top_level_dirs=tuple(sorted(blocked_roots)),
         ignored_top_level_dirs=tuple(sorted(ignored_roots)),
         focus_top_level_dirs=tuple(sorted(focus_roots)),
         source_branch=current_branch,
         policy_overrides_digest=overrides_digest,
     )
-    return ProjectMemory(
+    memory = ProjectMemory(
         index=index,
         stack_profile=stack_profile,
         directory_map=directory_map,
     )
+    return memory, built_cache
 
 
-def _build_stack_profile(project_root: Path, generated_at: str) -> StackProfile:
+def _build_stack_profile(
+    project_root: Path, generated_at: str, scan_cache: _ScanCache
+) -> tuple[StackProfile, _ScanCache]:
     """Build stack profile by scanning manifests."""
-    stack_types, manifest_paths = _scan_stack_signals(project_root)
-    return StackProfile(
+    stack_types, manifest_paths, built_cache = _scan_stack_signals(
+        project_root, scan_cache
+    )
+    profile = StackProfile(
         schema_version=MEMORY_SCHEMA_VERSION,
         generated_at_utc=generated_at,
         stack_types=tuple(stack_types),
         manifest_paths=tuple(sorted(manifest_paths)),
     )
+    return profile, built_cache
+
 
+def _scan_stack_signals(
+    project_root: Path, scan_cache: _ScanCache | None = None
+) -> tuple[list[str], set[str], _ScanCache]:
+    """Detect stack types and manifests at root, then depth-1 subdirectories.
 
-def _scan_stack_signals(project_root: Path) -> tuple[list[str], set[str]]:
-    """Detect stack types and manifests at root, then depth-1 subdirectories."""
+    Stack markers are detected by file presence, so a directory whose mtime
+    matches ``scan_cache`` reuses its cached result without probing files.
+    """
+    cached = scan_cache.directories if scan_cache is not None else {}
     stack_types: set[str] = set()
     manifest_paths: set[str] = set()
+    directories: dict[str, _DirectoryStackScan] = {}
     for directory in _stack_scan_directories(project_root):
-        discovered, manifests = _scan_stack_at_directory(project_root, directory)
-        stack_types.update(discovered)
-        manifest_paths.update(manifests)
-    return sorted(stack_types), manifest_paths
+        rel = "." if directory == project_root else directory.name
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            continue
+        scan = cached.get(rel)
+        if scan is None or scan.mtime_ns != mtime_ns:
+            discovered, manifests = _scan_stack_at_directory(project_root, directory)
+            scan = _DirectoryStackScan(
+                mtime_ns=mtime_ns,
+                stack_types=tuple(sorted(discovered)),
+                manifests=tuple(sorted(manifests)),
+            )
+        directories[rel] = scan
+        stack_types.update(scan.stack_types)
+        manifest_paths.update(scan.manifests)
+    built_cache = _ScanCache(
+        generation=scan_cache.generation if scan_cache is not None else None,
+        directories=directories,
+    )
+    return sorted(stack_types), manifest_paths, built_cache
 
 
 def _stack_scan_directories(project_root: Path) -> list[Path]:
@@ -690,10 +843,62 @@ def _compute_top_level_fingerprint(project_root: Path) -> str:
     for entry in sorted(project_root.iterdir(), key=lambda item: item.name):
         kind = "dir" if entry.is_dir() else "file"
         lines.append(f"{kind}:{entry.name}")
+    return _fingerprint_lines(lines)
+
+
+def _fingerprint_lines(lines: list[str]) -> str:
     joined = "\n".join(lines)
     return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:20]
 
 
+def _warm_stamp(
+    project_root: Path, scan_cache: _ScanCache
+) -> tuple[object, ...] | None:
+    """Cheap stat-based key covering every input to a memory build.
+
+    The root mtime covers top-level additions, removals and renames; each
+    scanned directory's mtime covers stack markers appearing or vanishing.
+    """
+    try:
+        parts: list[object] = [project_root.stat().st_mtime_ns]
+        for rel in sorted(scan_cache.directories):
+            parts.append((project_root / rel).stat().st_mtime_ns)
+    except OSError:
+        return None
+    parts.append(_file_stamp(policy_overrides_path(project_root)))
+    parts.append(_file_stamp(memory_dir(project_root) / PROJECT_INDEX_FILENAME))
+    parts.append(_detect_current_branch(project_root))
+    return tuple(parts)
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _memory_content(memory: ProjectMemory) -> tuple[object, ...]:
+    """Memory payload without timestamps or generation, for change detection."""
+    return (
+        replace(memory.index, generated_at_utc="", generation=None),
+        replace(memory.stack_profile, generated_at_utc="", generation=None),
+        replace(memory.directory_map, generated_at_utc="", generation=None),
+    )
+
+
+def _with_generation(
+    memory: ProjectMemory, scan_cache: _ScanCache, generation: str
+) -> tuple[ProjectMemory, _ScanCache]:
+    stamped = ProjectMemory(
+        index=replace(memory.index, generation=generation),
+        stack_profile=replace(memory.stack_profile, generation=generation),
+        directory_map=replace(memory.directory_map, generation=generation),
+    )
+    return stamped, replace(scan_cache, generation=generation)
+
+
 def _try_load_memory(project_root: Path) -> ProjectMemory | None:
     """Try loading existing memory files; return None if unavailable/invalid."""
     root = memory_dir(project_root)
@@ -716,6 +921,9 @@ def _try_load_memory(project_root: Path) -> ProjectMemory | None:
         and Path(index.project_root).resolve() != project_root.resolve()
     ):
         return None
+    # A set torn by an interrupted write mixes generations; rebuild it.
+    if not index.generation == stack_profile.generation == directory_map.generation:
+        return None
 
     return ProjectMemory(
         index=index,
@@ -724,24 +932,56 @@ def _try_load_memory(project_root: Path) -> ProjectMemory | None:
     )
 
 
-def _persist_memory(project_root: Path, memory: ProjectMemory) -> None:
-    """Persist memory payload under `.waypoints/memory`."""
-    root = memory_dir(project_root)
-    root.mkdir(parents=True, exist_ok=True)
-
-    _write_json(root / STACK_PROFILE_FILENAME, memory.stack_profile.to_dict())
-    _write_json(root / DIRECTORY_MAP_FILENAME, memory.directory_map.to_dict())
-    _write_json(root / PROJECT_INDEX_FILENAME, memory.index.to_dict())
+def _load_scan_cache(project_root: Path, generation: str | None) -> _ScanCache:
+    """Load the persisted scan cache if it belongs to ``generation``."""
+    try:
+        cache = _ScanCache.from_dict(
+            _read_json(memory_dir(project_root) / SCAN_CACHE_FILENAME)
+        )
+    except (OSError, json.JSONDecodeError, TypeError, ValueError):
+        return _ScanCache()
+    return cache if cache.generation == generation else _ScanCache()
 
 
-def _write_json(path: Path, payload: dict[str, Any]) -> None:
-    """Write deterministic JSON payload."""
-    path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
+def _persist_memory(
+    project_root: Path, memory: ProjectMemory, scan_cache: _ScanCache
+) -> None:
+    """Persist memory payload under `.waypoints/memory`.
+
+    The index is written last so readers never see it ahead of the files
+    it describes; all four files share one generation token.
+    """
+    _persist_files(
+        project_root,
+        [
+            (STACK_PROFILE_FILENAME, memory.stack_profile.to_dict()),
+            (DIRECTORY_MAP_FILENAME, memory.directory_map.to_dict()),
+            (SCAN_CACHE_FILENAME, scan_cache.to_dict()),
+            (PROJECT_INDEX_FILENAME, memory.index.to_dict()),
+        ],
     )
 
 
+def _persist_files(
+    project_root: Path, payloads: list[tuple[str, dict[str, Any]]]
+) -> None:
+    """Stage every payload in a temp file, then rename them into place in order."""
+    root = memory_dir(project_root)
+    root.mkdir(parents=True, exist_ok=True)
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for filename, payload in payloads:
+            fd, temp_name = tempfile.mkstemp(dir=root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+            staged.append((Path(temp_name), root / filename))
+        for temp_path, target in staged:
+            temp_path.replace(target)
+    finally:
+        for temp_path, _ in staged:
+            temp_path.unlink(missing_ok=True)
+
+
 def _read_json(path: Path) -> dict[str, Any]:
     """Read JSON object from disk."""
     data = json.loads(path.read_text(encoding="utf-8"))
@@ -750,6 +990,10 @@ def _read_json(path: Path) -> dict[str, Any]:
     return data
 
 
+def _optional_str(value: Any) -> str | None:
+    return str(value) if value is not None else None
+
+
 def _safe_role(value: Any) -> DirectoryRole:
     """Convert dynamic role value into a known role literal."""
     known: set[str] = {
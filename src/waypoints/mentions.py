@@ -10,7 +10,7 @@ import json
 import logging
 import re
 from collections.abc import Iterator
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -72,6 +72,21 @@ class ProcessingResult:
     error: str | None = None
 
 
+@dataclass
+class SectionEdit:
+    """Outcome of processing every mention in one document section.
+
+    ``section_start``/``section_end`` refer to the document the mentions were
+    found in, so edits for different sections can be merged in any order.
+    """
+
+    section_start: int
+    section_end: int
+    updated_section: str
+    resolved: list[Mention] = field(default_factory=list)
+    failed: list[tuple[Mention, str]] = field(default_factory=list)
+
+
 @dataclass
 class CommentLogEntry:
     """Entry for comment history log."""
@@ -238,23 +253,27 @@ def mark_mention_resolved(document: str, mention: Mention) -> str:
         Updated document with mention marked resolved.
     """
     lines = document.split("\n")
-    original_line = lines[mention.mention_line]
-
-    # Extract the @waypoints: ... part
-    match = MENTION_PATTERN.match(original_line)
-    if not match:
+    resolved_line = _resolved_mention_line(lines[mention.mention_line])
+    if resolved_line is None:
         # Line doesn't match pattern anymore (maybe already resolved)
         return document
 
+    lines[mention.mention_line] = resolved_line
+    return "\n".join(lines)
+
+
+def _resolved_mention_line(line: str) -> str | None:
+    """Return the resolved form of a mention line, or None if it is not one."""
+    match = MENTION_PATTERN.match(line)
+    if not match:
+        return None
+
     indent = match.group(1)
     instruction = match.group(2)
     timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S")
 
     # Create resolved format
-    resolved_line = f"{indent}[resolved]: # (@waypoints: {instruction} - {timestamp})"
-    lines[mention.mention_line] = resolved_line
-
-    return "\n".join(lines)
+    return f"{indent}[resolved]: # (@waypoints: {instruction} - {timestamp})"
 
 
 def replace_section(
@@ -376,6 +395,96 @@ def process_mention(
         )
 
 
+# --- Batch Processing ---
+
+# Sections processed concurrently by default when resolving a batch
+MAX_CONCURRENT_SECTIONS = 4
+
+
+def group_mentions_by_section(mentions: list[Mention]) -> list[list[Mention]]:
+    """Group mentions by the section that contains them, in document order.
+
+    Sections from ``parse_sections`` never overlap, so each group can be
+    processed independently of the others. Mentions within one group edit the
+    same text and must run one after another.
+    """
+    groups: dict[tuple[int, int], list[Mention]] = {}
+    for mention in mentions:
+        key = (mention.section_start, mention.section_end)
+        groups.setdefault(key, []).append(mention)
+    return [groups[key] for key in sorted(groups)]
+
+
+def process_section_mentions(
+    mentions: list[Mention],
+    full_document: str,
+    client: "ChatClient",
+) -> SectionEdit:
+    """Apply every mention in one section, feeding each edit into the next.
+
+    All mentions must come from the same section of ``full_document``.
+    Failures are recorded on the returned edit rather than raised, so one
+    bad instruction does not discard the others.
+    """
+    first = mentions[0]
+    edit = SectionEdit(
+        section_start=first.section_start,
+        section_end=first.section_end,
+        updated_section=first.original_section,
+    )
+    for mention in mentions:
+        current = replace(mention, original_section=edit.updated_section)
+        result: ProcessingResult | None = None
+        try:
+            for item in process_mention(current, full_document, client):
+                if isinstance(item, ProcessingResult):
+                    result = item
+        except Exception as e:
+            logger.exception("Error processing mention: %s", e)
+            result = ProcessingResult(success=False, error=str(e))
+
+        if result is not None and result.success and result.updated_section:
+            edit.updated_section = result.updated_section
+            edit.resolved.append(mention)
+        else:
+            error = result.error if result is not None else None
+            edit.failed.append((mention, error or "Unknown error"))
+    return edit
+
+
+def apply_section_edits(document: str, edits: list[SectionEdit]) -> str:
+    """Merge section edits into the document they were computed against.
+
+    Edits are spliced bottom-up by their original line ranges, so applying
+    them in any order (and re-applying earlier ones alongside a late result)
+    yields the same document. Each edited section keeps a resolved marker for
+    every applied mention and the original line of every failed one, so
+    failures can be retried.
+    """
+    lines = document.split("\n")
+    for edit in sorted(edits, key=lambda e: e.section_start, reverse=True):
+        if not edit.resolved:
+            continue
+        instructions = {m.instruction for m in edit.resolved} | {
+            m.instruction for m, _ in edit.failed
+        }
+        section_lines = [
+            line
+            for line in edit.updated_section.rstrip("\n").split("\n")
+            if not (
+                (match := MENTION_PATTERN.match(line))
+                and match.group(2).strip() in instructions
+            )
+        ]
+        for mention in edit.resolved:
+            resolved = _resolved_mention_line(lines[mention.mention_line])
+            if resolved is not None:
+                section_lines.append(resolved)
+        section_lines.extend(lines[m.mention_line] for m, _ in edit.failed)
+        lines[edit.section_start : edit.section_end] = section_lines
+    return "\n".join(lines)
+
+
 # --- Comment Logging ---
 
 
@@ -414,7 +523,10 @@ def save_document_version(
     document_type: str,
     content: str,
 ) -> Path:
-    """Save a new timestamped version of a document.
+    """Save a new version of a document.
+
+    Versions are recorded in the docs directory's version store; only the
+    latest one is kept as a timestamped working file.
 
     Args:
         docs_path: Path to the docs directory.
@@ -424,13 +536,9 @@ def save_document_version(
     Returns:
         Path to the saved file.
     """
-    docs_path.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-    filename = f"{document_type}-{timestamp}.md"
-    file_path = docs_path / filename
+    from waypoints.models.document_store import DocumentVersionStore
 
-    file_path.write_text(content, encoding="utf-8")
+    file_path = DocumentVersionStore(docs_path).save(document_type, content)
     logger.info("Saved document version: %s", file_path)
 
     return file_path
@@ -0,0 +1,298 @@
+"""Project-local content-addressed store for evidence files.
+
+Validation runs capture the full stdout/stderr of every command, and LAND
+iteration requests snapshot every file they mention. Reruns of a large test
+suite produce the same multi-megabyte logs over and over. The blob store
+keeps each distinct content once under ``.waypoints/blobs/<aa>/<sha256>``;
+receipts and attachments get hardlinks to the blob, so their human-readable
+paths keep working without duplicating bytes.
+
+Blobs are read-only once written. A blob is live while something links to it
+(``st_nlink > 1``) or a receipt references its path; ``gc`` removes the rest
+and can zstd-compress cold blobs into ``<sha256>.zst``. Receipts keep the
+plain blob path as a digest reference, so readers go through
+:meth:`BlobStore.resolve` or :meth:`BlobStore.readable_path` rather than
+opening it directly.
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIRNAME = "blobs"
+READABLE_DIRNAME = "waypoints-blobs"
+COMPRESSED_SUFFIX = ".zst"
+COMPRESS_MIN_BYTES = 64 * 1024
+_HASH_CHUNK_BYTES = 1024 * 1024
+_FICLONE = 0x40049409  # Linux ioctl: share extents with the source (reflink)
+
+
+class BlobCompressionUnavailableError(RuntimeError):
+    """Raised when zstd compression is requested but unsupported."""
+
+
+@dataclass(frozen=True, slots=True)
+class BlobGCStats:
+    """Outcome of a blob store garbage collection pass."""
+
+    scanned: int = 0
+    removed: int = 0
+    freed_bytes: int = 0
+    compressed: int = 0
+    compressed_saved_bytes: int = 0
+
+
+def blob_store_for(project_path: Path) -> BlobStore:
+    """Return the blob store of the project at ``project_path``."""
+    return BlobStore(project_path / ".waypoints" / BLOBS_DIRNAME)
+
+
+class BlobStore:
+    """Deduplicated, read-only blobs keyed by SHA-256."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    # ─── Queries ──────────────────────────────────────────────────────
+
+    def path(self, digest: str) -> Path | None:
+        """Return the file holding ``digest`` (plain or compressed), if any."""
+        plain = self._plain_path(digest)
+        if plain.exists():
+            return plain
+        compressed = plain.with_name(plain.name + COMPRESSED_SUFFIX)
+        return compressed if compressed.exists() else None
+
+    def digest_of(self, path: Path) -> str | None:
+        """Return the digest if ``path`` names a blob in this store."""
+        try:
+            relative = path.resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return None
+        name = relative.name.removesuffix(COMPRESSED_SUFFIX)
+        return name if len(relative.parts) == 2 and _is_digest(name) else None
+
+    def resolve(self, path: Path) -> Path:
+        """Return the file currently holding what ``path`` names.
+
+        A path into this store may name a blob that ``gc`` has since
+        compressed; other paths are returned unchanged.
+        """
+        digest = self.digest_of(path)
+        if digest is None:
+            return path
+        return self.path(digest) or path
+
+    def readable_path(self, path: Path) -> Path:
+        """Return a plain file with the content ``path`` names.
+
+        Compressed blobs are decompressed into a temporary copy.
+        """
+        current = self.resolve(path)
+        if current.suffix != COMPRESSED_SUFFIX:
+            return current
+        digest = current.name.removesuffix(COMPRESSED_SUFFIX)
+        target = Path(tempfile.gettempdir()) / READABLE_DIRNAME / digest
+        return target if target.exists() else self.materialize(digest, target)
+
+    def read_bytes(self, digest: str) -> bytes:
+        """Return blob content, decompressing if needed."""
+        path = self.path(digest)
+        if path is None:
+            raise FileNotFoundError(digest)
+        if path.suffix == COMPRESSED_SUFFIX:
+            return bytes(_zstd().decompress(path.read_bytes()))
+        return path.read_bytes()
+
+    def digests(self) -> Iterator[tuple[str, Path]]:
+        """Yield ``(digest, path)`` for every stored blob."""
+        if not self.root.exists():
+            return
+        for shard in sorted(self.root.iterdir()):
+            if not shard.is_dir():
+                continue
+            for path in sorted(shard.iterdir()):
+                name = path.name.removesuffix(COMPRESSED_SUFFIX)
+                if _is_digest(name):
+                    yield name, path
+
+    # ─── Writing ──────────────────────────────────────────────────────
+
+    def put_bytes(self, data: bytes) -> str:
+        """Store ``data`` unless present; return its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        if self.path(digest) is None:
+            target = self._plain_path(digest)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                self._commit(Path(tmp_name), target)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        return digest
+
+    def put_file(self, source: Path) -> str:
+        """Store a copy of ``source`` unless present; return its digest.
+
+        The source is cloned (reflink) where the filesystem supports it and
+        copied otherwise; it is never hardlinked, since the caller may keep
+        editing it.
+        """
+        digest = _file_digest(source)
+        if self.path(digest) is None:
+            target = self._plain_path(digest)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+            os.close(fd)
+            try:
+                _clone_file(source, Path(tmp_name))
+                self._commit(Path(tmp_name), target)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        return digest
+
+    def materialize(self, digest: str, target: Path) -> Path:
+        """Make ``target`` a read-only file holding blob ``digest``.
+
+        Hardlinks when possible; falls back to a copy across filesystems or
+        for compressed blobs.
+        """
+        source = self.path(digest)
+        if source is None:
+            raise FileNotFoundError(digest)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            if target.samefile(source):
+                return target
+            target.unlink()
+        if source.suffix != COMPRESSED_SUFFIX:
+            try:
+                os.link(source, target)
+                return target
+            except OSError as exc:
+                if exc.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                    raise
+        target.write_bytes(self.read_bytes(digest))
+        target.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        return target
+
+    # ─── Maintenance ──────────────────────────────────────────────────
+
+    def gc(
+        self,
+        referenced: set[str],
+        *,
+        compress: bool = False,
+        dry_run: bool = False,
+    ) -> BlobGCStats:
+        """Delete unreferenced blobs; optionally compress cold ones.
+
+        Args:
+            referenced: Digests referenced by path (e.g. compacted receipts).
+                Blobs hardlinked elsewhere are always kept.
+            compress: Zstd-compress kept blobs that no other file links to
+                and that are at least ``COMPRESS_MIN_BYTES``. Their plain
+                path stops existing; readers resolve it with
+                :meth:`resolve` or :meth:`readable_path`.
+            dry_run: Report what would change without touching files.
+        """
+        zstd = _zstd() if compress else None
+        scanned = removed = freed = compressed = saved = 0
+        for digest, path in list(self.digests()):
+            scanned += 1
+            info = path.stat()
+            if info.st_nlink > 1:
+                continue
+            if digest not in referenced:
+                removed += 1
+                freed += info.st_size
+                if not dry_run:
+                    path.unlink()
+                continue
+            if (
+                zstd is None
+                or path.suffix == COMPRESSED_SUFFIX
+                or info.st_size < COMPRESS_MIN_BYTES
+            ):
+                continue
+            packed = bytes(zstd.compress(path.read_bytes()))
+            if len(packed) >= info.st_size:
+                continue
+            compressed += 1
+            saved += info.st_size - len(packed)
+            if not dry_run:
+                target = path.with_name(path.name + COMPRESSED_SUFFIX)
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(packed)
+                self._commit(Path(tmp_name), target)
+                path.unlink()
+        stats = BlobGCStats(
+            scanned=scanned,
+            removed=removed,
+            freed_bytes=freed,
+            compressed=compressed,
+            compressed_saved_bytes=saved,
+        )
+        logger.info("Blob GC for %s: %s", self.root, stats)
+        return stats
+
+    def _plain_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _commit(self, tmp_path: Path, target: Path) -> None:
+        tmp_path.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        os.replace(tmp_path, target)
+
+
+def _file_digest(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _clone_file(source: Path, target: Path) -> None:
+    """Copy ``source`` to ``target``, sharing extents when supported."""
+    if sys.platform == "linux":
+        import fcntl
+
+        with source.open("rb") as src, target.open("wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return
+            except OSError:
+                pass
+    shutil.copyfile(source, target)
+
+
+def _is_digest(name: str) -> bool:
+    return len(name) == 64 and all(c in "0123456789abcdef" for c in name)
+
+
+def _zstd() -> ModuleType:
+    try:
+        from compression import zstd
+    except ImportError as exc:
+        raise BlobCompressionUnavailableError(
+            "zstd compression requires Python built with compression.zstd"
+        ) from exc
+    return zstd
@@ -0,0 +1,317 @@
+"""Content-addressed version history for SHAPE documents.
+
+Idea briefs and product specs are edited iteratively (mentions, inline
+edits, regeneration), and each save used to leave another full
+``<type>-<timestamp>.md`` copy behind. The store keeps history under
+``docs/.versions/`` instead:
+
+- ``objects/<digest>.z`` holds each distinct version once, zlib-compressed:
+  either a full snapshot or a line delta against the version saved before
+  it, with a full snapshot at least every ``FULL_SNAPSHOT_INTERVAL`` saves;
+- ``index.json`` records, per document type, the latest digest, the working
+  file that holds it, and the version history.
+
+Only the latest version stays in ``docs/`` as a ``<type>-<timestamp>.md``
+working file, so tools that read the docs directory keep working. Looking up
+the latest file is a single ``stat`` while the docs directory is unchanged
+since the index was written; files added behind the store's back (imports,
+manual copies) trigger one rescan that repairs the pointer.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIRNAME = ".versions"
+INDEX_FILENAME = "index.json"
+INDEX_SCHEMA_VERSION = 1
+FULL_SNAPSHOT_INTERVAL = 10
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentVersion:
+    """One saved version of a document."""
+
+    digest: str
+    saved_at: str
+    file: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {"digest": self.digest, "saved_at": self.saved_at, "file": self.file}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DocumentVersion:
+        return cls(
+            digest=str(data["digest"]),
+            saved_at=str(data.get("saved_at", "")),
+            file=str(data.get("file", "")),
+        )
+
+
+class DocumentVersionStore:
+    """Deduplicated, delta-compressed versions of the documents in ``docs/``."""
+
+    def __init__(self, docs_path: Path) -> None:
+        self.docs_path = docs_path
+        self._versions_path = docs_path / VERSIONS_DIRNAME
+        self._objects_path = self._versions_path / "objects"
+        self._index_path = self._versions_path / INDEX_FILENAME
+
+    # ─── Queries ──────────────────────────────────────────────────────
+
+    def latest_path(self, doc_type: str) -> Path | None:
+        """Return the working file holding the latest ``doc_type`` version."""
+        index = self._load_index()
+        entry = index["documents"].get(doc_type)
+        if entry is not None and index.get("docs_mtime_ns") == self._docs_mtime_ns():
+            return self.docs_path / str(entry["file"])
+
+        newest = _newest_working_file(self.docs_path, doc_type)
+        if newest is not None and self._versions_path.exists():
+            self._resync(index)
+        return newest
+
+    def history(self, doc_type: str) -> list[DocumentVersion]:
+        """Return saved versions of ``doc_type``, oldest first."""
+        entry = self._load_index()["documents"].get(doc_type)
+        if entry is None:
+            return []
+        return [DocumentVersion.from_dict(item) for item in entry["history"]]
+
+    def load(self, digest: str) -> str:
+        """Reconstruct the text of a stored version."""
+        chain: list[dict[str, Any]] = []
+        current = digest
+        while True:
+            record = self._read_object(current)
+            chain.append(record)
+            if "full" in record:
+                break
+            current = record["base"]
+        text: str = chain.pop()["full"]
+        while chain:
+            text = _apply_delta(text, chain.pop()["ops"])
+        return text
+
+    # ─── Saving ───────────────────────────────────────────────────────
+
+    def save(self, doc_type: str, content: str, *, path: Path | None = None) -> Path:
+        """Record ``content`` as the latest ``doc_type`` version.
+
+        Saving the content that is already latest writes nothing. Otherwise
+        the version is stored (once per distinct content), ``content`` is
+        written to ``path`` or a new timestamped working file, and the
+        previous working file is removed if it still holds the version the
+        store recorded, since that version is now recoverable from history.
+
+        Returns:
+            Path to the working file holding ``content``.
+        """
+        self._objects_path.mkdir(parents=True, exist_ok=True)
+        digest = _digest(content)
+        index = self._load_index()
+        entry: dict[str, Any] | None = index["documents"].get(doc_type)
+        previous_file = self.docs_path / str(entry["file"]) if entry else None
+        target = path or self.docs_path / f"{doc_type}-{_timestamp()}.md"
+
+        if (
+            entry is not None
+            and entry["latest"] == digest
+            and previous_file is not None
+            and previous_file.exists()
+            and (path is None or path == previous_file)
+            and _digest(_read_text(previous_file)) == digest
+        ):
+            return previous_file
+
+        depth = self._store_object(digest, content, entry)
+        _atomic_write(target, content)
+        if (
+            entry is not None
+            and previous_file is not None
+            and previous_file != target
+            and previous_file.exists()
+            and _digest(_read_text(previous_file)) == entry["latest"]
+        ):
+            previous_file.unlink()
+
+        history = entry["history"] if entry else []
+        history.append(
+            DocumentVersion(
+                digest=digest,
+                saved_at=datetime.now(UTC).isoformat(),
+                file=target.name,
+            ).to_dict()
+        )
+        index["documents"][doc_type] = {
+            "latest": digest,
+            "file": target.name,
+            "depth": depth,
+            "history": history,
+        }
+        index["docs_mtime_ns"] = self._docs_mtime_ns()
+        self._write_index(index)
+        logger.info("Saved %s version %s to %s", doc_type, digest[:12], target.name)
+        return target
+
+    # ─── Objects ──────────────────────────────────────────────────────
+
+    def _store_object(
+        self, digest: str, content: str, entry: dict[str, Any] | None
+    ) -> int:
+        """Store ``content`` unless present; return its delta-chain depth."""
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            return self._object_depth(digest)
+
+        record: dict[str, Any] = {"full": content}
+        depth = 0
+        if entry is not None and entry.get("depth", 0) + 1 < FULL_SNAPSHOT_INTERVAL:
+            try:
+                base_text = self.load(entry["latest"])
+            except (OSError, ValueError, KeyError, zlib.error):
+                logger.warning("Version %s unreadable; storing full", entry["latest"])
+            else:
+                ops = _compute_delta(base_text, content)
+                delta: dict[str, Any] = {"base": entry["latest"], "ops": ops}
+                if len(json.dumps(ops)) < len(content):
+                    record = delta
+                    depth = entry.get("depth", 0) + 1
+
+        payload = zlib.compress(json.dumps(record).encode("utf-8"))
+        _atomic_write_bytes(object_path, payload)
+        return depth
+
+    def _object_depth(self, digest: str) -> int:
+        depth = 0
+        record = self._read_object(digest)
+        while "full" not in record:
+            depth += 1
+            record = self._read_object(record["base"])
+        return depth
+
+    def _read_object(self, digest: str) -> dict[str, Any]:
+        raw = zlib.decompress(self._object_path(digest).read_bytes())
+        record: dict[str, Any] = json.loads(raw)
+        return record
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects_path / f"{digest}.z"
+
+    # ─── Index ────────────────────────────────────────────────────────
+
+    def _load_index(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {"schema_version": INDEX_SCHEMA_VERSION, "documents": {}}
+        if (
+            not isinstance(data, dict)
+            or data.get("schema_version") != INDEX_SCHEMA_VERSION
+            or not isinstance(data.get("documents"), dict)
+        ):
+            return {"schema_version": INDEX_SCHEMA_VERSION, "documents": {}}
+        return data
+
+    def _write_index(self, index: dict[str, Any]) -> None:
+        _atomic_write(self._index_path, json.dumps(index, indent=2) + "\n")
+
+    def _resync(self, index: dict[str, Any]) -> None:
+        """Point each tracked document at its newest working file on disk."""
+        for doc_type, entry in index["documents"].items():
+            newest = _newest_working_file(self.docs_path, doc_type)
+            if newest is not None:
+                entry["file"] = newest.name
+        index["docs_mtime_ns"] = self._docs_mtime_ns()
+        try:
+            self._write_index(index)
+        except OSError as exc:
+            logger.warning("Failed to update document index: %s", exc)
+
+    def _docs_mtime_ns(self) -> int | None:
+        try:
+            return self.docs_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+def latest_document_path(docs_path: Path, doc_type: str) -> Path | None:
+    """Return the latest ``<doc_type>-*.md`` working file, if any."""
+    if not docs_path.exists():
+        return None
+    return DocumentVersionStore(docs_path).latest_path(doc_type)
+
+
+def _newest_working_file(docs_path: Path, doc_type: str) -> Path | None:
+    matching = sorted(docs_path.glob(f"{doc_type}-*.md"), reverse=True)
+    return matching[0] if matching else None
+
+
+def _compute_delta(base: str, content: str) -> list[Any]:
+    """Line delta: ``[start, end]`` copies base lines, strings are new text."""
+    base_lines = base.splitlines(keepends=True)
+    new_lines = content.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, new_lines, autojunk=False)
+    ops: list[Any] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif tag in ("replace", "insert"):
+            ops.append("".join(new_lines[j1:j2]))
+    return ops
+
+
+def _apply_delta(base: str, ops: list[Any]) -> str:
+    base_lines = base.splitlines(keepends=True)
+    parts: list[str] = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        else:
+            parts.extend(base_lines[op[0] : op[1]])
+    return "".join(parts)
+
+
+def _digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _timestamp() -> str:
+    return datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+
+
+def _read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _atomic_write(path: Path, content: str) -> None:
+    _atomic_write_bytes(path, content.encode("utf-8"))
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from waypoints.config.project_root import get_projects_root
+from waypoints.models.document_store import latest_document_path
 
 if TYPE_CHECKING:
     from waypoints.models.journey import Journey, JourneyState
@@ -278,11 +279,11 @@ class Project:
         docs_dir = self.get_docs_path()
 
         # Find the latest product spec file
-        spec_files = sorted(docs_dir.glob("product-spec*.md"), reverse=True)
-        if not spec_files:
+        spec_file = latest_document_path(docs_dir, "product-spec")
+        if spec_file is None:
             return []
 
-        spec_content = spec_files[0].read_text(encoding="utf-8")
+        spec_content = spec_file.read_text(encoding="utf-8")
 
         # Look for Features section (various heading formats)
         # Match: ## Features, ## 5. Features, ## Key Features, etc.
@@ -380,23 +381,18 @@ class Project:
                 logger.debug("Not a git repo and auto-init disabled")
                 return
 
-        # Stage all project files
-        git.stage_project_files(self.slug)
-
-        # Commit
+        # Stage all project files, commit, and tag with phase name and timestamp
         commit_msg = message_template.format(slug=self.slug)
-        result = git.commit(commit_msg)
+        tag_name = None
+        if config.create_phase_tags:
+            timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+            tag_name = f"{self.slug}/{phase_name}-{timestamp}"
+        result = git.commit_all(
+            commit_msg, tag_name=tag_name, tag_message=f"Phase: {phase_name}"
+        )
 
-        if result.success and "Nothing to commit" not in result.message:
+        if result.success and result.commit_hash:
             logger.info("Milestone commit: %s", commit_msg)
-
-            # Tag with phase name and timestamp
-            if config.create_phase_tags:
-                timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-                tag_name = f"{self.slug}/{phase_name}-{timestamp}"
-                tag_result = git.tag(tag_name, f"Phase: {phase_name}")
-                if tag_result.success:
-                    logger.info("Created tag: %s", tag_name)
         elif not result.success:
             logger.error("Milestone commit failed: %s", result.message)
 
@@ -27,6 +27,7 @@ from waypoints.llm.validation import (
 )
 from waypoints.models import FlightPlan, Waypoint, WaypointStatus
 from waypoints.orchestration.types import ChunkCallback
+from waypoints.runtime.stream_snapshot import StreamSnapshotWriter
 from waypoints.spec import compute_spec_hash, extract_spec_section_headings
 
 if TYPE_CHECKING:
@@ -222,18 +223,16 @@ class ChartPhase:
                 phase="chart",
             )
 
-        full_response = ""
-        snapshot_path = self._chart_snapshot_path(snapshot_label)
-        for result in self._coord.llm.stream_message(
-            messages=[{"role": "user", "content": prompt}],
-            system=CHART_SYSTEM_PROMPT,
-        ):
-            if isinstance(result, StreamChunk):
-                full_response += result.text
-                self._persist_stream_snapshot(snapshot_path, full_response)
-                if on_chunk:
-                    on_chunk(result.text)
-        return full_response
+        with StreamSnapshotWriter(self._chart_snapshot_path(snapshot_label)) as snap:
+            for result in self._coord.llm.stream_message(
+                messages=[{"role": "user", "content": prompt}],
+                system=CHART_SYSTEM_PROMPT,
+            ):
+                if isinstance(result, StreamChunk):
+                    snap.append(result.text)
+                    if on_chunk:
+                        on_chunk(result.text)
+        return snap.content
 
     def generate_waypoint(
         self,
@@ -290,17 +289,16 @@ class ChartPhase:
         logger.info("Generating waypoint from description: %s", description[:100])
 
         # Stream response from LLM
-        full_response = ""
-        snapshot_path = self._chart_snapshot_path("add-waypoint")
-        for result in self._coord.llm.stream_message(
-            messages=[{"role": "user", "content": prompt}],
-            system=CHART_SYSTEM_PROMPT,
-        ):
-            if isinstance(result, StreamChunk):
-                full_response += result.text
-                self._persist_stream_snapshot(snapshot_path, full_response)
-                if on_chunk:
-                    on_chunk(result.text)
+        with StreamSnapshotWriter(self._chart_snapshot_path("add-waypoint")) as snap:
+            for result in self._coord.llm.stream_message(
+                messages=[{"role": "user", "content": prompt}],
+                system=CHART_SYSTEM_PROMPT,
+            ):
+                if isinstance(result, StreamChunk):
+                    snap.append(result.text)
+                    if on_chunk:
+                        on_chunk(result.text)
+        full_response = snap.content
 
         # Validate the response
         validation = validate_single_waypoint(
@@ -388,17 +386,16 @@ class ChartPhase:
         logger.info("Generating reprioritization suggestion")
 
         # Stream response from LLM
-        full_response = ""
-        snapshot_path = self._chart_snapshot_path("reprioritize")
-        for result in self._coord.llm.stream_message(
-            messages=[{"role": "user", "content": prompt}],
-            system=CHART_SYSTEM_PROMPT,
-        ):
-            if isinstance(result, StreamChunk):
-                full_response += result.text
-                self._persist_stream_snapshot(snapshot_path, full_response)
-                if on_chunk:
-                    on_chunk(result.text)
+        with StreamSnapshotWriter(self._chart_snapshot_path("reprioritize")) as snap:
+            for result in self._coord.llm.stream_message(
+                messages=[{"role": "user", "content": prompt}],
+                system=CHART_SYSTEM_PROMPT,
+            ):
+                if isinstance(result, StreamChunk):
+                    snap.append(result.text)
+                    if on_chunk:
+                        on_chunk(result.text)
+        full_response = snap.content
 
         # Validate response
         root_ids = {wp.id for wp in root_waypoints}
@@ -470,13 +467,6 @@ class ChartPhase:
         chart_dir.mkdir(parents=True, exist_ok=True)
         return chart_dir / f"{safe_label}-{timestamp}.stream.txt"
 
-    def _persist_stream_snapshot(self, path: Path, content: str) -> None:
-        """Persist current stream content for crash recovery/debugging."""
-        try:
-            path.write_text(content, encoding="utf-8")
-        except OSError as exc:
-            logger.warning("Failed to persist chart stream snapshot %s: %s", path, exc)
-
     def _next_waypoint_id(self) -> str:
         """Generate next available waypoint ID."""
         if self._coord.flight_plan is None:
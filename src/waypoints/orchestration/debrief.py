@@ -6,13 +6,12 @@ service. The panel becomes a thin wrapper that calls this service
 and populates widgets with the returned data.
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
-from typing import Any
 
 from waypoints.fly.execution_log import ExecutionLog as ExecutionLogData
 from waypoints.fly.execution_log import ExecutionLogReader
+from waypoints.git.receipt_index import ReceiptEntry, ReceiptIndex
 from waypoints.git.service import GitService
 from waypoints.llm.metrics import MetricsCollector
 from waypoints.models.flight_plan import FlightPlan
@@ -213,19 +212,13 @@ class DebriefService:
             parts.append(token_summary)
 
         # 4. Quality gates outcome
-        receipts_path = self._project.get_path() / "receipts"
-        if receipts_path.exists():
-            receipts = list(receipts_path.glob("*.json"))
-            if receipts:
-                passed, failed = self._count_receipt_status(receipts)
-                if failed == 0 and passed > 0:
-                    parts.append(
-                        f"All {passed} quality gate receipts passed verification."
-                    )
-                elif passed > 0 or failed > 0:
-                    parts.append(
-                        f"{passed} receipts passed, {failed} failed verification."
-                    )
+        receipts = ReceiptIndex(self._project.get_path() / "receipts").entries()
+        if receipts:
+            passed, failed = self._count_receipt_status(receipts)
+            if failed == 0 and passed > 0:
+                parts.append(f"All {passed} quality gate receipts passed verification.")
+            elif passed > 0 or failed > 0:
+                parts.append(f"{passed} receipts passed, {failed} failed verification.")
 
         # 5. Top spender
         try:
@@ -248,23 +241,10 @@ class DebriefService:
 
         return " ".join(parts)
 
-    def _count_receipt_status(self, receipts: list[Any]) -> tuple[int, int]:
-        """Count passed and failed receipts."""
-        passed = 0
-        failed = 0
-        for path in receipts:
-            try:
-                data = json.loads(path.read_text())
-                checklist = data.get("checklist", [])
-                all_passed = all(
-                    item.get("status") in ("passed", "skipped") for item in checklist
-                )
-                if all_passed:
-                    passed += 1
-                else:
-                    failed += 1
-            except Exception:
-                continue
+    def _count_receipt_status(self, receipts: list[ReceiptEntry]) -> tuple[int, int]:
+        """Count passed and failed receipts, skipping unreadable ones."""
+        passed = sum(1 for entry in receipts if entry.valid is True)
+        failed = sum(1 for entry in receipts if entry.valid is False)
         return passed, failed
 
     # ─── Stats ────────────────────────────────────────────────────────
@@ -531,25 +511,10 @@ class DebriefService:
 
         receipts_path = self._project.get_path() / "receipts"
         if receipts_path.exists():
-            receipts = list(receipts_path.glob("*.json"))
+            receipts = ReceiptIndex(receipts_path).entries()
             if receipts:
                 lines.append(f"├─ {len(receipts)} receipt(s) found")
-                passed = 0
-                failed = 0
-                for receipt_path in receipts:
-                    try:
-                        data = json.loads(receipt_path.read_text())
-                        checklist = data.get("checklist", [])
-                        all_passed = all(
-                            item.get("status") in ("passed", "skipped")
-                            for item in checklist
-                        )
-                        if all_passed:
-                            passed += 1
-                        else:
-                            failed += 1
-                    except Exception:
-                        continue
+                passed, failed = self._count_receipt_status(receipts)
                 lines.append(f"└─ {passed} passed, {failed} failed")
             else:
                 lines.append("└─ No quality receipts")
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Matches the default abbreviation of `git rev-parse --short`.
+SHORT_HASH_LENGTH = 7
+
 
 def _prepare_git_repo(
     git: GitService, *, auto_init: bool
@@ -71,17 +74,20 @@ def _commit_with_staging(
     slug: str,
     waypoint_title: str,
     initialized_repo: bool,
+    tag_name: str | None = None,
 ) -> CommitResult:
-    """Stage project files and perform commit."""
-    git.stage_project_files(slug)
-
+    """Stage project files, commit, and tag in one batched git operation."""
     commit_msg = f"feat({slug}): Complete {waypoint_title}"
-    result = git.commit(commit_msg)
-    if result.success:
+    result = git.commit_all(
+        commit_msg,
+        tag_name=tag_name,
+        tag_message=f"Completed waypoint: {waypoint_title}",
+    )
+    if result.success and result.commit_hash:
         return CommitResult(
             committed=True,
             message=commit_msg,
-            commit_hash=git.get_head_commit(),
+            commit_hash=result.commit_hash[:SHORT_HASH_LENGTH],
             initialized_repo=initialized_repo,
         )
 
@@ -124,20 +130,17 @@ def commit_waypoint(
             return receipt_failure
 
     slug = project.slug
+    tag_name = f"{slug}/{waypoint.id}" if config.create_waypoint_tags else None
     commit_result = _commit_with_staging(
         git,
         slug=slug,
         waypoint_title=waypoint.title,
         initialized_repo=initialized,
+        tag_name=tag_name,
     )
     if not commit_result.committed:
         return commit_result
 
-    tag_name = None
-    if config.create_waypoint_tags:
-        tag_name = f"{slug}/{waypoint.id}"
-        git.tag(tag_name, f"Completed waypoint: {waypoint.title}")
-
     logger.info("Committed waypoint %s: %s", waypoint.id, commit_result.message)
     return CommitResult(
         committed=commit_result.committed,
@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import re
 import shlex
-import shutil
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 from waypoints.llm import ChatClient, StreamChunk
+from waypoints.models.blob_store import blob_store_for
 from waypoints.models.iteration_request import (
     IterationAttachmentRecord,
     IterationIntent,
@@ -86,15 +85,6 @@ def _looks_like_path(token: str) -> bool:
     return "/" in token or "\\" in token
 
 
-def _sha256(path: Path) -> str:
-    """Compute SHA256 for a file."""
-    hasher = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
-
-
 @dataclass(frozen=True, slots=True)
 class IterationAttachment:
     """Materialized evidence attachment stored in project-local snapshot."""
@@ -289,16 +279,20 @@ class IterationRequestService:
         return found
 
     def ingest_attachments(self, request_text: str) -> list[IterationAttachment]:
-        """Copy mentioned files into project-local evidence storage."""
+        """Snapshot mentioned files into project-local evidence storage.
+
+        Content is stored once in the project blob store; each attachment is
+        a read-only link to it, so re-attaching the same file costs no space.
+        """
         attachments: list[IterationAttachment] = []
         self.evidence_dir.mkdir(parents=True, exist_ok=True)
+        blobs = blob_store_for(self.project_path)
 
         for source in self.extract_existing_files(request_text):
-            digest = _sha256(source)
+            digest = blobs.put_file(source)
             stamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
             filename = f"{stamp}-{digest[:10]}-{source.name}"
-            stored = self.evidence_dir / filename
-            shutil.copy2(source, stored)
+            stored = blobs.materialize(digest, self.evidence_dir / filename)
 
             attachments.append(
                 IterationAttachment(
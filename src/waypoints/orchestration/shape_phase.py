@@ -23,6 +23,7 @@ from waypoints.llm.prompts import (
     SUMMARY_SYSTEM_PROMPT,
 )
 from waypoints.models import DialogueHistory, Message, MessageRole, SessionWriter
+from waypoints.models.document_store import DocumentVersionStore
 from waypoints.orchestration.types import ChunkCallback
 
 if TYPE_CHECKING:
@@ -329,12 +330,8 @@ class ShapePhase:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
         docs_dir = self._coord.project.get_docs_path()
-        docs_dir.mkdir(parents=True, exist_ok=True)
-        file_path = docs_dir / f"{doc_type}-{timestamp}.md"
-        file_path.write_text(content)
-        return file_path
+        return DocumentVersionStore(docs_dir).save(doc_type, content)
 
     def _generate_project_summary(self, content: str, source: str) -> None:
         """Generate and save project summary from content.
@@ -118,8 +118,12 @@ class CommandRunner:
         category: str | None = None,
         command_key: str | None = None,
         on_event: Callable[[CommandEvent], None] | None = None,
+        input_text: str | None = None,
     ) -> CommandResult:
-        """Run a command according to centralized timeout policy."""
+        """Run a command according to centralized timeout policy.
+
+        ``input_text`` is written to the command's stdin when given.
+        """
         policy = self._policy_registry.policy_for(domain)
         resolved_cwd = Path(cwd).resolve() if cwd is not None else None
         command_text = _format_command(command)
@@ -168,6 +172,7 @@ class CommandRunner:
                     timeout_seconds,
                 ),
                 on_event=on_event,
+                input_text=input_text,
             )
             attempts.append(attempt_result)
             self._timeout_history.record(
@@ -215,6 +220,7 @@ class CommandRunner:
         terminate_grace_seconds: float,
         warning_after_seconds: float | None,
         on_event: Callable[[CommandEvent], None] | None,
+        input_text: str | None = None,
     ) -> CommandAttemptResult:
         command_text = _format_command(command)
         started_at = time.perf_counter()
@@ -226,6 +232,7 @@ class CommandRunner:
             cwd=str(cwd) if cwd is not None else None,
             env=dict(env) if env is not None else None,
             executable=executable,
+            stdin=subprocess.PIPE if input_text is not None else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
@@ -240,10 +247,14 @@ class CommandRunner:
 
         try:
             if warning_after_seconds is None:
-                stdout, stderr = process.communicate(timeout=timeout_seconds)
+                stdout, stderr = process.communicate(
+                    input=input_text, timeout=timeout_seconds
+                )
             else:
                 try:
-                    stdout, stderr = process.communicate(timeout=warning_after_seconds)
+                    stdout, stderr = process.communicate(
+                        input=input_text, timeout=warning_after_seconds
+                    )
                 except subprocess.TimeoutExpired as exc:
                     warning_emitted = True
                     stdout = _decode_stream(exc.stdout)
@@ -0,0 +1,480 @@
+"""Shared filesystem watcher with a sequence-numbered change journal.
+
+Consumers that used to rescan a project tree (provenance snapshots, the Fly
+screen's git status refresh) instead remember a journal sequence number and
+ask "what changed since seq N". On Linux the watcher reads inotify events
+through ``ctypes``; elsewhere, or when inotify is unavailable or out of
+watches, it falls back to diffing ``stat`` walks.
+
+The watcher has no background thread: events are drained whenever a
+consumer calls :meth:`WorkspaceWatcher.changes_since`, so results always
+include every change made before the call.
+"""
+
+from __future__ import annotations
+
+import atexit
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Literal, Protocol
+
+logger = logging.getLogger(__name__)
+
+type ChangeKind = Literal["created", "modified", "deleted"]
+type WatcherBackendName = Literal["auto", "inotify", "poll"]
+
+DEFAULT_IGNORED_DIRS: Final[frozenset[str]] = frozenset(
+    {
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        "__pycache__",
+        "node_modules",
+        # Blob store, export cache and validation snapshots.
+        ".waypoints",
+    }
+)
+# Directories whose direct entries are watched but not their subtrees:
+# ``.git/index``, ``HEAD`` and ``COMMIT_EDITMSG`` change on every stage and
+# commit, while ``.git/objects`` would cost thousands of watches.
+DEFAULT_SHALLOW_DIRS: Final[frozenset[str]] = frozenset({".git"})
+DEFAULT_MAX_TRACKED_PATHS: Final[int] = 10_000
+# Shared watchers kept open at once; inotify instances are a per-user limit.
+MAX_SHARED_WATCHERS: Final[int] = 8
+
+
+@dataclass(frozen=True, slots=True)
+class FileChange:
+    """Latest recorded change to one path, relative to the watch root."""
+
+    seq: int
+    path: str
+    kind: ChangeKind
+    is_dir: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeSet:
+    """Changes recorded after a sequence number.
+
+    ``complete`` is False when the journal cannot vouch for the whole range
+    (events overflowed or were evicted); callers must then rescan and
+    continue from ``seq``.
+    """
+
+    seq: int
+    changes: tuple[FileChange, ...]
+    complete: bool = True
+
+    @property
+    def paths(self) -> frozenset[str]:
+        """Distinct changed paths."""
+        return frozenset(change.path for change in self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes) or not self.complete
+
+
+class ChangeJournal:
+    """Bounded, per-path-coalesced journal of filesystem changes.
+
+    Each path keeps only its latest change, so memory is bounded by the
+    number of distinct paths touched rather than by event volume. When the
+    path cap is reached the oldest entries are evicted and queries older
+    than the eviction point report an incomplete change set.
+    """
+
+    def __init__(self, max_paths: int = DEFAULT_MAX_TRACKED_PATHS) -> None:
+        self._max_paths = max_paths
+        self._entries: OrderedDict[str, FileChange] = OrderedDict()
+        self._seq = 0
+        # Queries for sequence numbers below this cannot be answered exactly.
+        self._floor = 0
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the most recent change."""
+        return self._seq
+
+    def record(self, path: str, kind: ChangeKind, *, is_dir: bool = False) -> int:
+        """Record a change and return its sequence number.
+
+        Coalesced kinds describe the net effect: a file created and then
+        written stays ``created``; one deleted and recreated is ``modified``.
+        """
+        self._seq += 1
+        previous = self._entries.pop(path, None)
+        if previous is not None:
+            if previous.kind == "created" and kind == "modified":
+                kind = "created"
+            elif previous.kind == "deleted" and kind == "created":
+                kind = "modified"
+        self._entries[path] = FileChange(self._seq, path, kind, is_dir)
+        while len(self._entries) > self._max_paths:
+            _, evicted = self._entries.popitem(last=False)
+            self._floor = max(self._floor, evicted.seq)
+        return self._seq
+
+    def mark_lost(self) -> None:
+        """Record that events were lost; earlier sequences become inexact."""
+        self._seq += 1
+        self._floor = self._seq
+
+    def since(self, seq: int) -> ChangeSet:
+        """Return the latest change per path recorded after ``seq``."""
+        found: list[FileChange] = []
+        for change in reversed(self._entries.values()):
+            if change.seq <= seq:
+                break
+            found.append(change)
+        found.reverse()
+        return ChangeSet(
+            seq=self._seq,
+            changes=tuple(found),
+            complete=seq >= self._floor,
+        )
+
+
+class _Backend(Protocol):
+    def drain(self, journal: ChangeJournal) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _walk_dirs(
+    root: Path, ignored: frozenset[str], shallow: frozenset[str]
+) -> list[tuple[Path, bool]]:
+    """Directories to watch as ``(path, recursive)`` pairs."""
+    found: list[tuple[Path, bool]] = [(root, True)]
+    for current, dirs, _ in os.walk(root, topdown=True, followlinks=False):
+        kept: list[str] = []
+        for name in dirs:
+            if name in ignored:
+                continue
+            path = Path(current) / name
+            if name in shallow:
+                found.append((path, False))
+                continue
+            kept.append(name)
+            found.append((path, True))
+        dirs[:] = kept
+    return found
+
+
+class _PollingBackend:
+    """Portable fallback: diff ``(mtime_ns, size)`` across stat walks."""
+
+    def __init__(
+        self, root: Path, ignored: frozenset[str], shallow: frozenset[str]
+    ) -> None:
+        self._root = root
+        self._ignored = ignored
+        self._shallow = shallow
+        self._state = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int, bool]]:
+        state: dict[str, tuple[int, int, bool]] = {}
+        for directory, recursive in _walk_dirs(
+            self._root, self._ignored, self._shallow
+        ):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir and (not recursive or entry.name in self._ignored):
+                    continue
+                rel = Path(entry.path).relative_to(self._root).as_posix()
+                state[rel] = (stat.st_mtime_ns, stat.st_size, is_dir)
+        return state
+
+    def drain(self, journal: ChangeJournal) -> None:
+        current = self._scan()
+        previous = self._state
+        for path, info in current.items():
+            before = previous.get(path)
+            if before is None:
+                journal.record(path, "created", is_dir=info[2])
+            elif before != info and not info[2]:
+                journal.record(path, "modified")
+        for path, info in previous.items():
+            if path not in current:
+                journal.record(path, "deleted", is_dir=info[2])
+        self._state = current
+
+    def close(self) -> None:
+        self._state = {}
+
+
+# inotify(7) constants.
+_IN_MODIFY: Final[int] = 0x00000002
+_IN_CLOSE_WRITE: Final[int] = 0x00000008
+_IN_MOVED_FROM: Final[int] = 0x00000040
+_IN_MOVED_TO: Final[int] = 0x00000080
+_IN_CREATE: Final[int] = 0x00000100
+_IN_DELETE: Final[int] = 0x00000200
+_IN_DELETE_SELF: Final[int] = 0x00000400
+_IN_MOVE_SELF: Final[int] = 0x00000800
+_IN_Q_OVERFLOW: Final[int] = 0x00004000
+_IN_IGNORED: Final[int] = 0x00008000
+_IN_ONLYDIR: Final[int] = 0x01000000
+_IN_ISDIR: Final[int] = 0x40000000
+_IN_NONBLOCK: Final[int] = os.O_NONBLOCK
+_IN_CLOEXEC: Final[int] = os.O_CLOEXEC
+_WATCH_MASK: Final[int] = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE: Final[int] = 64 * 1024
+
+
+class _InotifyUnavailableError(OSError):
+    """inotify cannot be used on this platform or for this tree."""
+
+
+class _InotifyBackend:
+    """Linux backend reading inotify events without a helper thread."""
+
+    def __init__(
+        self, root: Path, ignored: frozenset[str], shallow: frozenset[str]
+    ) -> None:
+        if not sys.platform.startswith("linux"):
+            raise _InotifyUnavailableError("inotify requires Linux")
+        libc_name = ctypes.util.find_library("c")
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            self._add_watch = libc.inotify_add_watch
+            init = libc.inotify_init1
+        except (OSError, AttributeError) as exc:
+            raise _InotifyUnavailableError(str(exc)) from exc
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._add_watch.restype = ctypes.c_int
+
+        self._root = root
+        self._ignored = ignored
+        self._shallow = shallow
+        self._fd = init(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise _InotifyUnavailableError(os.strerror(ctypes.get_errno()))
+        # watch descriptor -> (directory relative to root, recursive)
+        self._watches: dict[int, tuple[str, bool]] = {}
+        try:
+            for directory, recursive in _walk_dirs(root, ignored, shallow):
+                self._watch(directory, recursive)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, directory: Path, recursive: bool) -> None:
+        wd = self._add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            if errno in (2, 20):  # ENOENT, ENOTDIR: raced with a delete.
+                return
+            raise _InotifyUnavailableError(errno, os.strerror(errno))
+        rel = directory.relative_to(self._root).as_posix()
+        self._watches[wd] = ("" if rel == "." else rel, recursive)
+
+    def drain(self, journal: ChangeJournal) -> None:
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return
+            self._apply(data, journal)
+
+    def _apply(self, data: bytes, journal: ChangeJournal) -> None:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                journal.mark_lost()
+                continue
+            watch = self._watches.get(wd)
+            if watch is None:
+                continue
+            if mask & _IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            base, recursive = watch
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF) or not raw_name:
+                continue
+            name = os.fsdecode(raw_name)
+            is_dir = bool(mask & _IN_ISDIR)
+            if is_dir and (name in self._ignored or not recursive):
+                continue
+            rel = f"{base}/{name}" if base else name
+
+            if mask & (_IN_DELETE | _IN_MOVED_FROM):
+                journal.record(rel, "deleted", is_dir=is_dir)
+            elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                journal.record(rel, "created", is_dir=is_dir)
+                if is_dir:
+                    self._watch_new_tree(self._root / rel, journal)
+            elif not is_dir:
+                journal.record(rel, "modified")
+
+    def _watch_new_tree(self, directory: Path, journal: ChangeJournal) -> None:
+        # Entries created before the new watch existed produced no events.
+        try:
+            for path, recursive in _walk_dirs(directory, self._ignored, self._shallow):
+                self._watch(path, recursive)
+                if path != directory:
+                    rel = path.relative_to(self._root).as_posix()
+                    journal.record(rel, "created", is_dir=True)
+            for current, dirs, files in os.walk(directory):
+                dirs[:] = [
+                    d for d in dirs if d not in self._ignored and d not in self._shallow
+                ]
+                for filename in files:
+                    file_path = Path(current) / filename
+                    journal.record(
+                        file_path.relative_to(self._root).as_posix(), "created"
+                    )
+        except OSError:
+            journal.mark_lost()
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._watches.clear()
+
+
+class WorkspaceWatcher:
+    """Tracks changes under a root directory and answers "changed since N"."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        backend: WatcherBackendName = "auto",
+        ignored_dirs: frozenset[str] = DEFAULT_IGNORED_DIRS,
+        shallow_dirs: frozenset[str] = DEFAULT_SHALLOW_DIRS,
+        max_tracked_paths: int = DEFAULT_MAX_TRACKED_PATHS,
+    ) -> None:
+        self.root = root.resolve()
+        self._journal = ChangeJournal(max_tracked_paths)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._backend = self._open_backend(backend, ignored_dirs, shallow_dirs)
+
+    @property
+    def backend_name(self) -> str:
+        """``"inotify"`` or ``"poll"``."""
+        return "inotify" if isinstance(self._backend, _InotifyBackend) else "poll"
+
+    @property
+    def seq(self) -> int:
+        """Current journal position, after draining pending events."""
+        with self._lock:
+            self._drain()
+            return self._journal.seq
+
+    def changes_since(self, seq: int) -> ChangeSet:
+        """Return changes recorded after ``seq`` (use 0 for "ever")."""
+        with self._lock:
+            self._drain()
+            return self._journal.since(seq)
+
+    def close(self) -> None:
+        """Release OS resources; later queries report incomplete changes."""
+        with self._lock:
+            self._closed = True
+            self._backend.close()
+
+    def _drain(self) -> None:
+        if self._closed:
+            self._journal.mark_lost()
+            return
+        try:
+            self._backend.drain(self._journal)
+        except OSError as exc:
+            logger.warning("Watcher for %s lost events: %s", self.root, exc)
+            self._journal.mark_lost()
+
+    def _open_backend(
+        self,
+        backend: WatcherBackendName,
+        ignored: frozenset[str],
+        shallow: frozenset[str],
+    ) -> _Backend:
+        if backend in ("auto", "inotify"):
+            try:
+                return _InotifyBackend(self.root, ignored, shallow)
+            except _InotifyUnavailableError as exc:
+                if backend == "inotify":
+                    raise
+                logger.debug(
+                    "inotify unavailable for %s (%s); polling instead", self.root, exc
+                )
+        return _PollingBackend(self.root, ignored, shallow)
+
+
+_watchers: OrderedDict[Path, WorkspaceWatcher] = OrderedDict()
+_watchers_lock = threading.Lock()
+
+
+def get_workspace_watcher(root: Path) -> WorkspaceWatcher | None:
+    """Return the shared watcher for ``root``, or None if it is not a directory.
+
+    The least recently used watcher is closed once more than
+    ``MAX_SHARED_WATCHERS`` roots are watched.
+    """
+    resolved = root.resolve()
+    evicted: list[WorkspaceWatcher] = []
+    with _watchers_lock:
+        watcher = _watchers.get(resolved)
+        if watcher is not None:
+            _watchers.move_to_end(resolved)
+            return watcher
+        if not resolved.is_dir():
+            return None
+        watcher = WorkspaceWatcher(resolved)
+        _watchers[resolved] = watcher
+        while len(_watchers) > MAX_SHARED_WATCHERS:
+            evicted.append(_watchers.popitem(last=False)[1])
+    for old in evicted:
+        old.close()
+    return watcher
+
+
+def close_workspace_watchers() -> None:
+    """Close every shared watcher."""
+    with _watchers_lock:
+        watchers = list(_watchers.values())
+        _watchers.clear()
+    for watcher in watchers:
+        watcher.close()
+
+
+atexit.register(close_workspace_watchers)
@@ -0,0 +1,184 @@
+"""Incremental on-disk snapshots and UI throttling for streamed LLM output.
+
+Generated documents arrive as many small chunks. Rewriting the whole
+accumulated text to disk, and pushing it to the UI, on every chunk makes a
+20-50 KB document cost O(n^2) bytes written and marshalled. Instead:
+
+- ``StreamSnapshotWriter`` appends buffered deltas to an open file, flushing
+  when enough time has passed or enough text is pending, and finalizes the
+  file atomically once the full content is known;
+- ``FrameThrottle`` caps how often streaming text is pushed to a widget.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_FLUSH_CHARS = 8192
+DEFAULT_FRAME_INTERVAL_SECONDS = 1 / 30
+
+
+class StreamSnapshotWriter:
+    """Append-only snapshot of streamed text, for crash recovery.
+
+    Write failures are logged once and further writes are skipped, so a full
+    disk never interrupts generation itself.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        flush_chars: int = DEFAULT_FLUSH_CHARS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = path
+        self._flush_interval = flush_interval
+        self._flush_chars = flush_chars
+        self._clock = clock
+        self._chunks: list[str] = []
+        self._pending: list[str] = []
+        self._pending_chars = 0
+        self._last_flush = clock()
+        self._file: TextIO | None = None
+        self._failed = False
+
+    @property
+    def content(self) -> str:
+        """All text appended so far."""
+        return "".join(self._chunks)
+
+    def append(self, text: str) -> None:
+        """Record a streamed delta, flushing when a threshold is crossed."""
+        if not text:
+            return
+        self._chunks.append(text)
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if (
+            self._pending_chars >= self._flush_chars
+            or self._clock() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending deltas to the end of the snapshot file."""
+        self._last_flush = self._clock()
+        if not self._pending or self._failed:
+            return
+        pending = "".join(self._pending)
+        self._pending.clear()
+        self._pending_chars = 0
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("w", encoding="utf-8")
+            self._file.write(pending)
+            self._file.flush()
+        except OSError as exc:
+            self._fail(exc)
+
+    def finalize(self, content: str | None = None) -> None:
+        """Flush and close; atomically replace the file with ``content`` if given.
+
+        The final text can differ from the streamed deltas (for example after
+        whitespace cleanup), so it is written to a sibling temp file and moved
+        into place; readers see either the streamed snapshot or the final
+        document, never a mix.
+        """
+        if content is None or content == self.content:
+            self.close()
+            return
+        self._pending.clear()
+        self._pending_chars = 0
+        self._close_file()
+        if self._failed:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(content)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as exc:
+            self._fail(exc)
+
+    def close(self) -> None:
+        """Flush pending text and close the snapshot file."""
+        self.flush()
+        self._close_file()
+
+    def discard(self) -> None:
+        """Close and delete the snapshot once the content is saved elsewhere."""
+        self._pending.clear()
+        self._pending_chars = 0
+        self._close_file()
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as exc:
+            self._fail(exc)
+
+    def __enter__(self) -> StreamSnapshotWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.close()
+        except OSError as exc:
+            self._fail(exc)
+        finally:
+            self._file = None
+
+    def _fail(self, exc: OSError) -> None:
+        if not self._failed:
+            logger.warning("Failed to persist stream snapshot %s: %s", self.path, exc)
+        self._failed = True
+
+
+class FrameThrottle:
+    """Rate limiter for pushing streaming updates to the UI."""
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_FRAME_INTERVAL_SECONDS,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval = interval
+        self._clock = clock
+        self._last: float | None = None
+
+    def ready(self) -> bool:
+        """Return True (and start a new frame) if an update is due."""
+        now = self._clock()
+        if self._last is not None and now - self._last < self._interval:
+            return False
+        self._last = now
+        return True
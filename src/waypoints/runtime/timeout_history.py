@@ -5,6 +5,7 @@ from __future__ import annotations
 import atexit
 import json
 import logging
+import threading
 from collections import defaultdict, deque
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -193,6 +194,8 @@ class PersistentTimeoutHistory(TimeoutHistory):
         self._storage_path = storage_path
         self._autosave_every = max(1, autosave_every)
         self._pending_writes = 0
+        # Commands may be recorded from worker threads (parallel flight tests).
+        self._lock = threading.RLock()
 
     @classmethod
     def open(
@@ -219,24 +222,26 @@ class PersistentTimeoutHistory(TimeoutHistory):
 
     def record(self, key: str, duration_seconds: float, timed_out: bool) -> None:
         """Record one command attempt and trigger periodic persistence."""
-        super().record(key, duration_seconds, timed_out)
-        self._pending_writes += 1
-        if self._pending_writes >= self._autosave_every:
-            self.flush()
+        with self._lock:
+            super().record(key, duration_seconds, timed_out)
+            self._pending_writes += 1
+            if self._pending_writes >= self._autosave_every:
+                self.flush()
 
     def flush(self) -> None:
         """Persist pending updates to disk."""
-        if self._pending_writes == 0 and self._storage_path.exists():
-            return
-        try:
-            self.save(self._storage_path)
-            self._pending_writes = 0
-        except OSError as exc:
-            logger.warning(
-                "Failed to persist timeout history %s: %s",
-                self._storage_path,
-                exc,
-            )
+        with self._lock:
+            if self._pending_writes == 0 and self._storage_path.exists():
+                return
+            try:
+                self.save(self._storage_path)
+                self._pending_writes = 0
+            except OSError as exc:
+                logger.warning(
+                    "Failed to persist timeout history %s: %s",
+                    self._storage_path,
+                    exc,
+                )
 
 
 def build_command_key(
@@ -6,6 +6,7 @@ import re
 from dataclasses import dataclass
 from pathlib import Path
 
+from waypoints.models.document_store import latest_document_path
 from waypoints.models.flight_plan import FlightPlan
 from waypoints.models.waypoint import Waypoint
 from waypoints.spec.context import compute_spec_hash
@@ -79,13 +80,18 @@ def load_project_spec_text(project_root: Path) -> str:
 
     Priority:
     1. docs/product-spec.md
-    2. newest docs/product-spec*.md
+    2. latest version recorded by the docs version store
+    3. newest docs/product-spec*.md
     """
     docs_path = project_root / "docs"
     canonical = docs_path / "product-spec.md"
     if canonical.exists():
         return canonical.read_text(encoding="utf-8")
 
+    latest = latest_document_path(docs_path, "product-spec")
+    if latest is not None and latest.exists():
+        return latest.read_text(encoding="utf-8")
+
     candidates = sorted(
         docs_path.glob("product-spec*.md"),
         key=lambda path: path.stat().st_mtime,
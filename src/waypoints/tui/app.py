@@ -253,18 +253,12 @@ class WaypointsApp(App[None]):
         Returns:
             Document content as string, or None if not found.
         """
-        docs_path = project.get_docs_path()
-        if not docs_path.exists():
-            return None
-
-        # Find all matching files and get the latest by name (timestamp in filename)
-        pattern = f"{doc_type}-*.md"
-        matching_files = sorted(docs_path.glob(pattern), reverse=True)
+        from waypoints.models.document_store import latest_document_path
 
-        if not matching_files:
+        latest_file = latest_document_path(project.get_docs_path(), doc_type)
+        if latest_file is None:
             return None
 
-        latest_file = matching_files[0]
         logger.info("Loading %s from %s", doc_type, latest_file.name)
         return latest_file.read_text()
 
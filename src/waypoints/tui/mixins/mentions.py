@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
 
@@ -11,16 +12,17 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import TextArea
 
-from waypoints.llm.client import ChatClient, StreamChunk
+from waypoints.llm.client import ChatClient
 from waypoints.mentions import (
+    MAX_CONCURRENT_SECTIONS,
     CommentLogEntry,
     Mention,
-    ProcessingResult,
+    SectionEdit,
+    apply_section_edits,
     find_mentions,
+    group_mentions_by_section,
     log_comment,
-    mark_mention_resolved,
-    process_mention,
-    replace_section,
+    process_section_mentions,
     save_document_version,
 )
 
@@ -109,7 +111,8 @@ class MentionProcessingMixin:
     # Instance state for mention processing
     _mentions_processing: bool = False
     _pending_mentions: list[Mention]
-    _current_mention_index: int = 0
+    _mention_base_document: str = ""
+    _section_edits: list[SectionEdit]
     _llm_client: ChatClient | None = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
@@ -120,7 +123,8 @@ class MentionProcessingMixin:
         """Initialize mention processing state. Call in __init__ or on_mount."""
         self._mentions_processing = False
         self._pending_mentions = []
-        self._current_mention_index = 0
+        self._mention_base_document = ""
+        self._section_edits = []
         self._llm_client = None
 
     def _get_llm_client(self) -> ChatClient:
@@ -155,7 +159,8 @@ class MentionProcessingMixin:
             return
 
         self._pending_mentions = mentions
-        self._current_mention_index = 0
+        self._mention_base_document = screen.document_content
+        self._section_edits = []
         self._mentions_processing = True
 
         screen.notify(f"Processing {len(mentions)} mention(s)...")
@@ -165,90 +170,61 @@ class MentionProcessingMixin:
             screen.document_type,
         )
 
-        self._process_next_mention()
+        self._process_mention_sections()
 
     @work(thread=True)
-    def _process_next_mention(self) -> None:
-        """Process the next pending mention in a background thread."""
-        screen = cast(Any, self)
-
-        if self._current_mention_index >= len(self._pending_mentions):
-            # All done
-            cast(Screen[Any], self).app.call_from_thread(
-                self._finalize_mention_processing
-            )
-            return
-
-        mention = self._pending_mentions[self._current_mention_index]
-        logger.info(
-            "Processing mention %d/%d: %s",
-            self._current_mention_index + 1,
-            len(self._pending_mentions),
-            mention.instruction[:50],
-        )
+    def _process_mention_sections(self) -> None:
+        """Process mentions in a background thread, one task per section.
 
-        # Get current document state (may have been updated by previous mentions)
-        current_doc = screen.document_content
-
-        # Process with LLM
+        Sections never overlap, so their mentions are sent to the LLM
+        concurrently (bounded by ``MAX_CONCURRENT_SECTIONS``); mentions that
+        share a section run in order within their task. Each finished section
+        is merged on the main thread as soon as it arrives.
+        """
+        app = cast(Screen[Any], self).app
+        groups = group_mentions_by_section(self._pending_mentions)
+        base_document = self._mention_base_document
         client = self._get_llm_client()
-        updated_section: str = ""
-        success = False
-        error_msg: str | None = None
-
-        try:
-            for result in process_mention(mention, current_doc, client):
-                if isinstance(result, StreamChunk):
-                    # Accumulate response
-                    updated_section += result.text
-                elif isinstance(result, ProcessingResult):
-                    success = result.success
-                    if success:
-                        updated_section = result.updated_section or ""
-                    else:
-                        error_msg = result.error
-        except Exception as e:
-            logger.exception("Error processing mention: %s", e)
-            success = False
-            error_msg = str(e)
-
-        # Apply results on main thread
-        if success and updated_section:
-            cast(Screen[Any], self).app.call_from_thread(
-                self._apply_mention_result,
-                mention,
-                updated_section,
-            )
-        else:
-            cast(Screen[Any], self).app.call_from_thread(
-                self._handle_mention_error,
-                mention,
-                error_msg or "Unknown error",
-            )
 
-        # Process next mention
-        self._current_mention_index += 1
-        self._process_next_mention()
-
-    def _apply_mention_result(
-        self,
-        mention: Mention,
-        updated_section: str,
-    ) -> None:
-        """Apply the LLM result to the document (runs on main thread)."""
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_SECTIONS, len(groups)),
+            thread_name_prefix="waypoints-mentions",
+        ) as pool:
+            futures = {
+                pool.submit(process_section_mentions, group, base_document, client): (
+                    group
+                )
+                for group in groups
+            }
+            for future in as_completed(futures):
+                try:
+                    edit = future.result()
+                except Exception as e:
+                    logger.exception("Error processing mention section: %s", e)
+                    for mention in futures[future]:
+                        app.call_from_thread(
+                            self._handle_mention_error, mention, str(e)
+                        )
+                    continue
+                app.call_from_thread(self._apply_section_edit, edit)
+
+        app.call_from_thread(self._finalize_mention_processing)
+
+    def _apply_section_edit(self, edit: SectionEdit) -> None:
+        """Merge one section's result into the document (runs on main thread).
+
+        The document is rebuilt from the snapshot the mentions were found in
+        plus every section merged so far, so results may land in any order
+        without clobbering each other.
+        """
         screen = cast(Any, self)
-        current_doc = screen.document_content
-        lines_before = mention.section_end - mention.section_start
-
-        # 1. Replace section content
-        new_doc = replace_section(current_doc, mention, updated_section)
-
-        # 2. Mark mention as resolved
-        # Note: Line numbers may have shifted, so we need to find the mention again
-        # For now, we mark it resolved in the updated section
-        new_doc = mark_mention_resolved(new_doc, mention)
+        for mention, error in edit.failed:
+            self._handle_mention_error(mention, error)
+        if not edit.resolved:
+            return
 
-        # 3. Update document content and display
+        self._section_edits.append(edit)
+        new_doc = apply_section_edits(self._mention_base_document, self._section_edits)
         screen.document_content = new_doc
         screen._update_mention_display(new_doc)
 
@@ -265,25 +241,25 @@ class MentionProcessingMixin:
         except Exception:
             pass
 
-        # 4. Count lines in new section
-        new_section_lines = updated_section.count("\n") + 1
-        lines_after = new_section_lines
-
-        # 5. Log the comment
-        entry = CommentLogEntry(
-            timestamp=_get_timestamp(),
-            section=mention.section_heading or "(preamble)",
-            instruction=mention.instruction,
-            lines_before=lines_before,
-            lines_after=lines_after,
-        )
-        log_comment(screen._get_docs_path(), screen.document_type, entry)
+        section = edit.resolved[0].section_heading or "(preamble)"
+        lines_before = edit.section_end - edit.section_start
+        lines_after = edit.updated_section.count("\n") + 1
+        for mention in edit.resolved:
+            entry = CommentLogEntry(
+                timestamp=_get_timestamp(),
+                section=section,
+                instruction=mention.instruction,
+                lines_before=lines_before,
+                lines_after=lines_after,
+            )
+            log_comment(screen._get_docs_path(), screen.document_type, entry)
 
         logger.info(
-            "Applied mention result: %d -> %d lines in section '%s'",
+            "Applied %d mention(s): %d -> %d lines in section '%s'",
+            len(edit.resolved),
             lines_before,
             lines_after,
-            mention.section_heading or "(preamble)",
+            section,
         )
 
     def _handle_mention_error(
@@ -309,7 +285,8 @@ class MentionProcessingMixin:
         count = len(self._pending_mentions)
         self._mentions_processing = False
         self._pending_mentions = []
-        self._current_mention_index = 0
+        self._mention_base_document = ""
+        self._section_edits = []
 
         # Save new document version
         docs_path = screen._get_docs_path()
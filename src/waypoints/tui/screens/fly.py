@@ -31,6 +31,7 @@ from waypoints.fly.intervention import (
 )
 from waypoints.git import GitConfig, ReceiptValidator
 from waypoints.models import JourneyState, Project
+from waypoints.models.blob_store import blob_store_for
 from waypoints.models.flight_plan import FlightPlan
 from waypoints.models.waypoint import Waypoint, WaypointStatus
 from waypoints.orchestration import JourneyCoordinator
@@ -41,11 +42,13 @@ from waypoints.orchestration.types import NextAction
 from waypoints.tui.screens.fly_controller import FlyController
 from waypoints.tui.screens.fly_metrics_runtime import LiveMetricsOverlay
 from waypoints.tui.screens.fly_progress import apply_progress_update
+from waypoints.tui.screens.fly_progress_bus import ProgressBus
 from waypoints.tui.screens.fly_projections import (
+    ExecutionTimeProjection,
     build_completion_status_projection,
     build_project_metrics_projection,
 )
-from waypoints.tui.screens.fly_runtime import ExecutionState, get_git_status_summary
+from waypoints.tui.screens.fly_runtime import ExecutionState, GitStatusRefresher
 from waypoints.tui.screens.fly_session import FlySession
 from waypoints.tui.screens.fly_status import derive_state_message, format_countdown
 from waypoints.tui.screens.fly_timers import (
@@ -138,6 +141,9 @@ class FlyScreen(Screen[None]):
         # Track live criteria completion for cross-check with receipt
         self._live_criteria_completed: set[int] = set()
         self._live_metrics = LiveMetricsOverlay()
+        self._progress_bus = ProgressBus()
+        self._execution_time = ExecutionTimeProjection(project)
+        self._git_status = GitStatusRefresher(project.get_path())
 
     def _ensure_session(self) -> FlySession:
         session = getattr(self, "_session", None)
@@ -265,9 +271,11 @@ class FlyScreen(Screen[None]):
         wp_count = len(self.flight_plan.waypoints)
         logger.info("FlyScreen mounted with %d waypoints", wp_count)
 
-        # Start git status polling
+        # Check git status whenever the workspace watcher reports changes
         self._update_git_status()
-        self._git_status_timer = self.set_interval(10.0, self._update_git_status)
+        self._git_status_timer = self.set_interval(
+            self._git_status.interval_seconds, self._update_git_status
+        )
 
         # Update project metrics (cost and time)
         self._update_project_metrics()
@@ -283,10 +291,13 @@ class FlyScreen(Screen[None]):
         git_timer = getattr(self, "_git_status_timer", None)
         if git_timer:
             git_timer.stop()
+        self._execution_time.close()
 
     def _update_git_status(self) -> None:
         """Update git status indicator in the left panel."""
-        status = get_git_status_summary(self.project.get_path())
+        status = self._git_status.refresh()
+        if status is None:
+            return
         list_panel = self.query_one(WaypointListPanel)
         list_panel.update_git_status(status)
 
@@ -295,6 +306,7 @@ class FlyScreen(Screen[None]):
         projection = build_project_metrics_projection(
             project=self.project,
             metrics_collector=self.waypoints_app.metrics_collector,
+            time_seconds=self._execution_time.time_seconds,
         )
         list_panel = self.query_one(WaypointListPanel)
         list_panel.update_project_metrics(
@@ -361,6 +373,7 @@ class FlyScreen(Screen[None]):
             waypoint_id=waypoint_id,
             project=self.project,
             metrics_collector=self.waypoints_app.metrics_collector,
+            time_seconds=self._execution_time.time_seconds,
         )
 
     def _apply_metrics_update(self, ctx: ExecutionContext) -> None:
@@ -803,6 +816,8 @@ class FlyScreen(Screen[None]):
         file_path = Path(path)
         if not file_path.is_absolute():
             file_path = self.project.get_path() / path
+        # Receipt outputs may point at evidence blobs that gc has compressed.
+        file_path = blob_store_for(self.project.get_path()).readable_path(file_path)
 
         # Push the preview modal
         self.app.push_screen(FilePreviewModal(file_path))
@@ -910,9 +925,24 @@ class FlyScreen(Screen[None]):
     def _on_execution_progress(self, ctx: ExecutionContext) -> None:
         """Handle progress updates from the executor.
 
-        Uses call_later to safely schedule UI updates from any thread context.
+        Updates are coalesced on the progress bus; only the first update of
+        each frame schedules a (rate-limited) flush on the main thread.
         """
-        self.app.call_later(self._update_progress_ui, ctx)
+        if self._progress_bus.publish(ctx):
+            self.app.call_later(self._schedule_progress_flush)
+
+    def _schedule_progress_flush(self) -> None:
+        """Flush now, or once the bus's minimum frame interval has elapsed."""
+        delay = self._progress_bus.flush_delay()
+        if delay > 0:
+            self.set_timer(delay, self._flush_progress)
+        else:
+            self._flush_progress()
+
+    def _flush_progress(self) -> None:
+        """Apply all coalesced progress updates (called on main thread)."""
+        for ctx in self._progress_bus.drain():
+            self._update_progress_ui(ctx)
 
     def _update_progress_ui(self, ctx: ExecutionContext) -> None:
         """Update UI with progress (called on main thread)."""
@@ -930,6 +960,18 @@ class FlyScreen(Screen[None]):
             return
 
         if event.worker.is_finished:
+            # Apply updates still queued so the log is complete before the
+            # result is rendered.
+            self._flush_progress()
+            stats = self._progress_bus.stats
+            logger.debug(
+                "Progress bus: %d published, %d delivered in %d flushes "
+                "(max pending %d)",
+                stats.published,
+                stats.delivered,
+                stats.flushes,
+                stats.max_pending,
+            )
             worker_error: BaseException | None = None
             worker_result: ExecutionResult | None = None
             if event.worker.state.name == "ERROR":
@@ -102,12 +102,14 @@ class LiveMetricsOverlay:
         waypoint_id: str,
         project: Project,
         metrics_collector: MetricsCollectorLike | None,
+        time_seconds: int | None = None,
     ) -> None:
         """Initialize live state from current persisted metrics baselines."""
         self.waypoint_id = waypoint_id
         projection = build_project_metrics_projection(
             project=project,
             metrics_collector=metrics_collector,
+            time_seconds=time_seconds,
         )
         self.project_cost = projection.cost
         self.project_tokens_in = projection.tokens_in or 0
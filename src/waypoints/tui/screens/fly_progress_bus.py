@@ -0,0 +1,196 @@
+"""Coalescing progress bus between the FLY executor and the Fly screen.
+
+The executor reports progress for every streamed chunk, tool call and
+metrics snapshot from its worker thread. Applying each one on the UI
+thread floods Textual's message queue during token bursts, so updates are
+queued here and drained at most ``max_rate_hz`` times per second:
+
+- consecutive ``streaming`` updates for the same waypoint iteration are
+  merged into one update carrying the concatenated text;
+- a ``metrics_updated`` snapshot whose cumulative totals cover an earlier
+  queued snapshot replaces it, absorbing the earlier snapshot's deltas so
+  totals the overlay accumulates from deltas still add up;
+- every other update is delivered unchanged and in order.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+
+from waypoints.fly.executor import ExecutionContext
+
+DEFAULT_MAX_RATE_HZ = 30.0
+
+# Cumulative fields in a `metrics_updated` payload. A newer snapshot can
+# replace an older one only if it reports every total the older one did;
+# snapshots carrying deltas alone are never dropped.
+_CUMULATIVE_METRIC_FIELDS = (
+    "waypoint_cost_usd",
+    "waypoint_tokens_in",
+    "waypoint_tokens_out",
+    "waypoint_cached_tokens_in",
+    "project_cost_usd",
+    "project_tokens_in",
+    "project_tokens_out",
+    "project_cached_tokens_in",
+)
+# Per-event fields the overlay adds up for any total a snapshot leaves out
+# (project totals when there is no metrics collector, for example).
+_DELTA_METRIC_FIELDS = (
+    "delta_cost_usd",
+    "delta_tokens_in",
+    "delta_tokens_out",
+    "delta_cached_tokens_in",
+)
+_KNOWN_METRIC_FLAGS = ("tokens_known", "cached_tokens_known")
+
+
+@dataclass
+class ProgressBusStats:
+    """Back-pressure counters for one progress bus."""
+
+    published: int = 0
+    delivered: int = 0
+    merged_text: int = 0
+    dropped_metrics: int = 0
+    flushes: int = 0
+    max_pending: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Updates absorbed by merging or dropping instead of delivered."""
+        return self.merged_text + self.dropped_metrics
+
+
+class ProgressBus:
+    """Thread-safe queue that coalesces execution progress per UI frame."""
+
+    def __init__(
+        self,
+        *,
+        max_rate_hz: float = DEFAULT_MAX_RATE_HZ,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: list[ExecutionContext] = []
+        self._flush_requested = False
+        self._last_flush: float | None = None
+        self.stats = ProgressBusStats()
+
+    @property
+    def pending_count(self) -> int:
+        """Updates queued for the next flush."""
+        with self._lock:
+            return len(self._pending)
+
+    def publish(self, ctx: ExecutionContext) -> bool:
+        """Queue one update.
+
+        Returns True when the caller should schedule a flush; further
+        updates published before that flush piggyback on it.
+        """
+        with self._lock:
+            self.stats.published += 1
+            if ctx.step == "streaming" and self._merge_streaming(ctx):
+                self.stats.merged_text += 1
+            else:
+                if ctx.step == "metrics_updated":
+                    ctx = self._drop_superseded_metrics(ctx)
+                self._pending.append(ctx)
+            self.stats.max_pending = max(self.stats.max_pending, len(self._pending))
+            if self._flush_requested:
+                return False
+            self._flush_requested = True
+            return True
+
+    def flush_delay(self) -> float:
+        """Seconds to wait before the next flush to respect the rate limit."""
+        with self._lock:
+            if self._last_flush is None:
+                return 0.0
+            elapsed = self._clock() - self._last_flush
+            return max(0.0, self._min_interval - elapsed)
+
+    def drain(self) -> list[ExecutionContext]:
+        """Take all queued updates, oldest first."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._flush_requested = False
+            self._last_flush = self._clock()
+            if pending:
+                self.stats.flushes += 1
+                self.stats.delivered += len(pending)
+            return pending
+
+    def _merge_streaming(self, ctx: ExecutionContext) -> bool:
+        if not self._pending:
+            return False
+        last = self._pending[-1]
+        if (
+            last.step != "streaming"
+            or last.waypoint.id != ctx.waypoint.id
+            or last.iteration != ctx.iteration
+        ):
+            return False
+        self._pending[-1] = replace(
+            ctx,
+            output=last.output + ctx.output,
+            criteria_completed=ctx.criteria_completed or last.criteria_completed,
+        )
+        return True
+
+    def _drop_superseded_metrics(self, ctx: ExecutionContext) -> ExecutionContext:
+        """Drop queued snapshots ``ctx`` covers; return ``ctx`` with their deltas."""
+        newer = _metrics_payload(ctx)
+        if newer is None:
+            return ctx
+        kept: list[ExecutionContext] = []
+        folded: dict[str, object] | None = None
+        for queued in self._pending:
+            older = _metrics_payload(queued) if queued.step == ctx.step else None
+            if older is not None and _supersedes(newer, older):
+                folded = _fold_metrics(folded or dict(newer), older)
+                self.stats.dropped_metrics += 1
+                continue
+            kept.append(queued)
+        self._pending = kept
+        if folded is None:
+            return ctx
+        return replace(ctx, metadata={**ctx.metadata, "metrics": folded})
+
+
+def _metrics_payload(ctx: ExecutionContext) -> dict[str, object] | None:
+    raw = ctx.metadata.get("metrics")
+    return raw if isinstance(raw, dict) else None
+
+
+def _supersedes(newer: dict[str, object], older: dict[str, object]) -> bool:
+    if newer.get("waypoint_id") != older.get("waypoint_id"):
+        return False
+    if newer.get("role") != older.get("role"):
+        return False
+    older_totals = [f for f in _CUMULATIVE_METRIC_FIELDS if older.get(f) is not None]
+    if not older_totals:
+        return False
+    return all(newer.get(field) is not None for field in older_totals)
+
+
+def _fold_metrics(
+    newer: dict[str, object], older: dict[str, object]
+) -> dict[str, object]:
+    """Add ``older``'s deltas and known flags into ``newer`` (mutated)."""
+    for field in _DELTA_METRIC_FIELDS:
+        value = older.get(field)
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            current = newer.get(field)
+            base = current if isinstance(current, int | float) else 0
+            newer[field] = base + value
+    for flag in _KNOWN_METRIC_FLAGS:
+        if older.get(flag) is True:
+            newer[flag] = True
+    return newer
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Protocol
 
-from waypoints.fly.execution_log import ExecutionLogReader
+from waypoints.fly.execution_log import (
+    ExecutionCompleted,
+    ExecutionLogReader,
+    subscribe_execution_completed,
+)
+from waypoints.fly.execution_rollup import ExecutionTimeRollup
 from waypoints.models.project import Project
 
 
@@ -82,12 +88,51 @@ def calculate_total_execution_time(project: Project) -> int:
     return total_seconds
 
 
+class ExecutionTimeProjection:
+    """Project execution time kept current from log completion events.
+
+    The first read cold-starts from the persisted rollup; afterwards each
+    completed execution adds its duration without rescanning logs.
+    """
+
+    def __init__(self, project: Project) -> None:
+        self._project = project
+        self._rollup: ExecutionTimeRollup | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+
+    @property
+    def time_seconds(self) -> int:
+        """Total completed execution time in seconds."""
+        return self._ensure_rollup().total_seconds
+
+    def close(self) -> None:
+        """Stop listening for completion events."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _ensure_rollup(self) -> ExecutionTimeRollup:
+        if self._rollup is None:
+            self._rollup = ExecutionTimeRollup.load(self._project)
+            self._unsubscribe = subscribe_execution_completed(self._on_completed)
+        return self._rollup
+
+    def _on_completed(self, event: ExecutionCompleted) -> None:
+        if self._rollup is not None:
+            self._rollup.record(event)
+
+
 def build_project_metrics_projection(
     *,
     project: Project,
     metrics_collector: MetricsCollectorLike | None,
+    time_seconds: int | None = None,
 ) -> ProjectMetricsProjection:
-    """Build project-wide cost/time/token metrics projection."""
+    """Build project-wide cost/time/token metrics projection.
+
+    Pass ``time_seconds`` from an :class:`ExecutionTimeProjection` to avoid
+    scanning every execution log.
+    """
     cost = 0.0
     tokens_in: int | None = None
     tokens_out: int | None = None
@@ -105,7 +150,11 @@ def build_project_metrics_projection(
 
     return ProjectMetricsProjection(
         cost=cost,
-        time_seconds=calculate_total_execution_time(project),
+        time_seconds=(
+            calculate_total_execution_time(project)
+            if time_seconds is None
+            else time_seconds
+        ),
         tokens_in=tokens_in,
         tokens_out=tokens_out,
         tokens_known=tokens_known,
@@ -6,6 +6,7 @@ from enum import Enum
 from pathlib import Path
 
 from waypoints.runtime import TimeoutDomain, get_command_runner
+from waypoints.runtime.fs_watcher import get_workspace_watcher
 
 
 class ExecutionState(Enum):
@@ -55,3 +56,29 @@ def get_git_status_summary(project_path: Path) -> str:
             return f"{branch} [yellow]●[/] {len(lines)} changed"
     except Exception:
         return ""
+
+
+class GitStatusRefresher:
+    """Re-runs ``git status`` only after the project watcher saw a change."""
+
+    def __init__(self, project_path: Path) -> None:
+        self._project_path = project_path
+        self._seq: int | None = None
+
+    @property
+    def interval_seconds(self) -> float:
+        """How often to check: journal checks are cheap under inotify."""
+        watcher = get_workspace_watcher(self._project_path)
+        if watcher is not None and watcher.backend_name == "inotify":
+            return 2.0
+        return 10.0
+
+    def refresh(self) -> str | None:
+        """Return a fresh status summary, or None if nothing changed."""
+        watcher = get_workspace_watcher(self._project_path)
+        if watcher is not None:
+            changes = watcher.changes_since(self._seq or 0)
+            if self._seq is not None and not changes:
+                return None
+            self._seq = changes.seq
+        return get_git_status_summary(self._project_path)
@@ -44,10 +44,10 @@ class GenSpecViewerScreen(Screen[None]):
         self._load_spec()
 
     def _load_spec(self) -> None:
-        from waypoints.genspec.viewer import load_genspec
+        from waypoints.genspec.viewer import open_genspec_index
 
         try:
-            spec, metadata, checksums = load_genspec(self._path)
+            index, metadata, checksums = open_genspec_index(self._path)
         except Exception as e:
             logger.exception("Failed to load genspec: %s", e)
             self.notify(f"Failed to load: {e}", severity="error")
@@ -55,8 +55,8 @@ class GenSpecViewerScreen(Screen[None]):
 
         source_label = "bundle" if metadata else "jsonl"
         browser = self.query_one("#genspec-browser", GenSpecBrowser)
-        browser.set_spec(
-            spec,
+        browser.set_index(
+            index,
             source_label=source_label,
             metadata=metadata,
             checksums=checksums,
@@ -17,7 +17,12 @@ if TYPE_CHECKING:
 
 from waypoints.models import JourneyState, Project
 from waypoints.models.dialogue import DialogueHistory
+from waypoints.models.document_store import (
+    DocumentVersionStore,
+    latest_document_path,
+)
 from waypoints.orchestration import JourneyCoordinator
+from waypoints.runtime.stream_snapshot import FrameThrottle, StreamSnapshotWriter
 from waypoints.tui.mixins import MentionProcessingMixin
 from waypoints.tui.screens.transition_guard import can_enter_state
 from waypoints.tui.widgets.dialogue import ThinkingIndicator
@@ -136,14 +141,11 @@ class IdeaBriefScreen(Screen[None]):
     def _get_latest_file_path(self) -> Path:
         """Get the path to the latest brief file."""
         docs_dir = self.project.get_docs_path()
-        pattern = "idea-brief-*.md"
-        matching_files = sorted(docs_dir.glob(pattern), reverse=True)
-
-        if matching_files:
-            return matching_files[0]
-        else:
-            timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-            return docs_dir / f"idea-brief-{timestamp}.md"
+        latest = latest_document_path(docs_dir, "idea-brief")
+        if latest is not None:
+            return latest
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        return docs_dir / f"idea-brief-{timestamp}.md"
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -183,14 +185,16 @@ class IdeaBriefScreen(Screen[None]):
         # Start thinking indicator
         self.app.call_from_thread(self._set_thinking, True)
 
-        accumulated_content = ""
+        snapshot = StreamSnapshotWriter(self._next_output_file_path())
+        frames = FrameThrottle()
 
         def on_chunk(chunk: str) -> None:
-            nonlocal accumulated_content
-            accumulated_content += chunk
-            self.brief_content = accumulated_content
-            self._persist_stream_snapshot()
-            self.app.call_from_thread(self._update_brief_display, accumulated_content)
+            snapshot.append(chunk)
+            if frames.ready():
+                self.brief_content = snapshot.content
+                self.app.call_from_thread(
+                    self._update_brief_display, self.brief_content
+                )
 
         try:
             # Coordinator generates brief, saves to disk, and generates summary
@@ -202,10 +206,19 @@ class IdeaBriefScreen(Screen[None]):
             self.app.call_from_thread(self.waypoints_app.update_header_cost)
 
             self.brief_content = brief_content
-            self._persist_stream_snapshot()
+            docs_dir = self.project.get_docs_path()
+            saved_path = latest_document_path(docs_dir, "idea-brief")
+            if saved_path is not None and saved_path != snapshot.path:
+                # The coordinator recorded the final version; drop the draft.
+                snapshot.discard()
+                self._stream_file_path = saved_path
+            else:
+                snapshot.finalize(brief_content)
+            self.app.call_from_thread(self._update_brief_display, brief_content)
             self.app.call_from_thread(self._finalize_brief)
 
         except Exception as e:
+            snapshot.close()
             self._is_generating = False
             logger.exception("Error generating brief: %s", e)
             self.brief_content = f"# Error\n\nFailed to generate brief: {e}"
@@ -224,13 +237,6 @@ class IdeaBriefScreen(Screen[None]):
             self._stream_file_path = docs_dir / f"idea-brief-{timestamp}.md"
         return self._stream_file_path
 
-    def _persist_stream_snapshot(self) -> None:
-        """Persist latest generated content to disk during streaming."""
-        try:
-            self._next_output_file_path().write_text(self.brief_content)
-        except OSError as e:
-            logger.exception("Failed to persist streamed brief: %s", e)
-
     def _set_thinking(self, thinking: bool) -> None:
         """Toggle the model status indicator."""
         self.query_one("#model-status", ModelStatusIndicator).set_thinking(thinking)
@@ -264,8 +270,9 @@ class IdeaBriefScreen(Screen[None]):
         """Save the brief content to disk (for edits)."""
         file_path = self._stream_file_path or self._get_latest_file_path()
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(self.brief_content)
+            file_path = DocumentVersionStore(file_path.parent).save(
+                "idea-brief", self.brief_content, path=file_path
+            )
             logger.info("Saved brief to %s", file_path)
             self.notify(f"Saved to {file_path.name}", severity="information")
         except OSError as e:
@@ -476,14 +483,11 @@ class IdeaBriefResumeScreen(Screen[None], MentionProcessingMixin):
     def _get_brief_file_path(self) -> Path:
         """Get the path to the latest brief file."""
         docs_dir = self.project.get_docs_path()
-        pattern = "idea-brief-*.md"
-        matching_files = sorted(docs_dir.glob(pattern), reverse=True)
-
-        if matching_files:
-            return matching_files[0]
-        else:
-            timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-            return docs_dir / f"idea-brief-{timestamp}.md"
+        latest = latest_document_path(docs_dir, "idea-brief")
+        if latest is not None:
+            return latest
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        return docs_dir / f"idea-brief-{timestamp}.md"
 
     def action_edit_external(self) -> None:
         """Open brief in external editor."""
@@ -503,6 +507,9 @@ class IdeaBriefResumeScreen(Screen[None], MentionProcessingMixin):
         """Reload content after external edit."""
         file_path = self._get_brief_file_path()
         self.brief_content = file_path.read_text()
+        DocumentVersionStore(file_path.parent).save(
+            "idea-brief", self.brief_content, path=file_path
+        )
 
         # Update display
         display = self.query_one("#brief-display", Markdown)
@@ -522,7 +529,9 @@ class IdeaBriefResumeScreen(Screen[None], MentionProcessingMixin):
         """Save the brief content to disk (overwriting latest)."""
         file_path = self._get_brief_file_path()
         try:
-            file_path.write_text(self.brief_content)
+            file_path = DocumentVersionStore(file_path.parent).save(
+                "idea-brief", self.brief_content, path=file_path
+            )
             logger.info("Saved brief to %s", file_path)
             self.notify(f"Saved to {file_path.name}", severity="information")
         except OSError as e:
@@ -17,7 +17,12 @@ if TYPE_CHECKING:
 
 from waypoints.models import JourneyState, Project
 from waypoints.models.dialogue import DialogueHistory
+from waypoints.models.document_store import (
+    DocumentVersionStore,
+    latest_document_path,
+)
 from waypoints.orchestration import JourneyCoordinator
+from waypoints.runtime.stream_snapshot import FrameThrottle, StreamSnapshotWriter
 from waypoints.tui.mixins import MentionProcessingMixin
 from waypoints.tui.screens.transition_guard import can_enter_state
 from waypoints.tui.widgets.dialogue import ThinkingIndicator
@@ -139,14 +144,11 @@ class ProductSpecScreen(Screen[None]):
     def _get_latest_file_path(self) -> Path:
         """Get the path to the latest spec file."""
         docs_dir = self.project.get_docs_path()
-        pattern = "product-spec-*.md"
-        matching_files = sorted(docs_dir.glob(pattern), reverse=True)
-
-        if matching_files:
-            return matching_files[0]
-        else:
-            timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-            return docs_dir / f"product-spec-{timestamp}.md"
+        latest = latest_document_path(docs_dir, "product-spec")
+        if latest is not None:
+            return latest
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        return docs_dir / f"product-spec-{timestamp}.md"
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -195,14 +197,14 @@ class ProductSpecScreen(Screen[None]):
         # Start thinking indicator
         self.app.call_from_thread(self._set_thinking, True)
 
-        accumulated_content = ""
+        snapshot = StreamSnapshotWriter(self._next_output_file_path())
+        frames = FrameThrottle()
 
         def on_chunk(chunk: str) -> None:
-            nonlocal accumulated_content
-            accumulated_content += chunk
-            self.spec_content = accumulated_content
-            self._persist_stream_snapshot()
-            self.app.call_from_thread(self._update_spec_display, accumulated_content)
+            snapshot.append(chunk)
+            if frames.ready():
+                self.spec_content = snapshot.content
+                self.app.call_from_thread(self._update_spec_display, self.spec_content)
 
         try:
             # Coordinator generates spec, saves to disk, and generates summary
@@ -214,10 +216,19 @@ class ProductSpecScreen(Screen[None]):
             self.app.call_from_thread(self.waypoints_app.update_header_cost)
 
             self.spec_content = spec_content
-            self._persist_stream_snapshot()
+            docs_dir = self.project.get_docs_path()
+            saved_path = latest_document_path(docs_dir, "product-spec")
+            if saved_path is not None and saved_path != snapshot.path:
+                # The coordinator recorded the final version; drop the draft.
+                snapshot.discard()
+                self._stream_file_path = saved_path
+            else:
+                snapshot.finalize(spec_content)
+            self.app.call_from_thread(self._update_spec_display, spec_content)
             self.app.call_from_thread(self._finalize_spec)
 
         except Exception as e:
+            snapshot.close()
             self._is_generating = False
             logger.exception("Error generating spec: %s", e)
             self.spec_content = f"# Error\n\nFailed to generate specification: {e}"
@@ -236,13 +247,6 @@ class ProductSpecScreen(Screen[None]):
             self._stream_file_path = docs_dir / f"product-spec-{timestamp}.md"
         return self._stream_file_path
 
-    def _persist_stream_snapshot(self) -> None:
-        """Persist latest generated content to disk during streaming."""
-        try:
-            self._next_output_file_path().write_text(self.spec_content)
-        except OSError as e:
-            logger.exception("Failed to persist streamed spec: %s", e)
-
     def _set_thinking(self, thinking: bool) -> None:
         """Toggle the model status indicator."""
         self.query_one("#model-status", ModelStatusIndicator).set_thinking(thinking)
@@ -276,8 +280,9 @@ class ProductSpecScreen(Screen[None]):
         """Save the spec content to disk (for edits)."""
         file_path = self._stream_file_path or self._get_latest_file_path()
         try:
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(self.spec_content)
+            file_path = DocumentVersionStore(file_path.parent).save(
+                "product-spec", self.spec_content, path=file_path
+            )
             logger.info("Saved spec to %s", file_path)
             self.notify(f"Saved to {file_path.name}", severity="information")
         except OSError as e:
@@ -484,14 +489,11 @@ class ProductSpecResumeScreen(Screen[None], MentionProcessingMixin):
     def _get_spec_file_path(self) -> Path:
         """Get the path to the latest spec file."""
         docs_dir = self.project.get_docs_path()
-        pattern = "product-spec-*.md"
-        matching_files = sorted(docs_dir.glob(pattern), reverse=True)
-
-        if matching_files:
-            return matching_files[0]
-        else:
-            timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-            return docs_dir / f"product-spec-{timestamp}.md"
+        latest = latest_document_path(docs_dir, "product-spec")
+        if latest is not None:
+            return latest
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        return docs_dir / f"product-spec-{timestamp}.md"
 
     def action_edit_external(self) -> None:
         """Open spec in external editor."""
@@ -511,6 +513,9 @@ class ProductSpecResumeScreen(Screen[None], MentionProcessingMixin):
         """Reload content after external edit."""
         file_path = self._get_spec_file_path()
         self.spec_content = file_path.read_text()
+        DocumentVersionStore(file_path.parent).save(
+            "product-spec", self.spec_content, path=file_path
+        )
 
         # Update display
         display = self.query_one("#spec-display", Markdown)
@@ -530,7 +535,9 @@ class ProductSpecResumeScreen(Screen[None], MentionProcessingMixin):
         """Save the spec content to disk (overwriting latest)."""
         file_path = self._get_spec_file_path()
         try:
-            file_path.write_text(self.spec_content)
+            file_path = DocumentVersionStore(file_path.parent).save(
+                "product-spec", self.spec_content, path=file_path
+            )
             logger.info("Saved spec to %s", file_path)
             self.notify(f"Saved to {file_path.name}", severity="information")
         except OSError as e:
@@ -2,17 +2,15 @@
 
 from typing import Any
 
-from rich.text import Text
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.message import Message
 from textual.screen import ModalScreen
-from textual.widgets import Button, Input, Markdown, Static, TextArea, Tree
-from textual.widgets.tree import TreeNode
+from textual.widgets import Button, Input, Markdown, Static, TextArea
 
 from waypoints.models.flight_plan import FlightPlan
-from waypoints.models.waypoint import Waypoint, WaypointStatus
+from waypoints.models.waypoint import Waypoint
 from waypoints.tui.widgets.flight_plan_styles import (
     ADD_WAYPOINT_MODAL_CSS,
     ADD_WAYPOINT_PREVIEW_MODAL_CSS,
@@ -20,304 +18,21 @@ from waypoints.tui.widgets.flight_plan_styles import (
     CONFIRM_DELETE_MODAL_CSS,
     DEBUG_WAYPOINT_MODAL_CSS,
     FLIGHT_PLAN_PANEL_CSS,
-    FLIGHT_PLAN_TREE_CSS,
     REPRIORITIZE_PREVIEW_MODAL_CSS,
     WAYPOINT_DETAIL_MODAL_CSS,
     WAYPOINT_EDIT_MODAL_CSS,
     WAYPOINT_MODAL_BASE_CSS,
     WAYPOINT_PREVIEW_PANEL_CSS,
 )
-
-
-class WaypointSelected(Message):
-    """Waypoint was selected (highlighted) in the flight plan."""
-
-    def __init__(self, waypoint_id: str) -> None:
-        self.waypoint_id = waypoint_id
-        super().__init__()
-
-
-class WaypointOpenDetail(Message):
-    """Request to open waypoint detail modal."""
-
-    def __init__(self, waypoint_id: str) -> None:
-        self.waypoint_id = waypoint_id
-        super().__init__()
-
-
-# Status icons and colors for waypoints
-STATUS_ICONS = {
-    WaypointStatus.COMPLETE: ("◉", "green"),
-    WaypointStatus.IN_PROGRESS: ("◎", "bold cyan"),
-    WaypointStatus.FAILED: ("✗", "bold red"),
-    WaypointStatus.SKIPPED: ("⊘", "yellow"),
-    WaypointStatus.PENDING: ("○", "dim"),
-}
-# Blink state icon (shown when blinking is "off")
-STATUS_ICONS_BLINK = {
-    WaypointStatus.COMPLETE: ("◉", "green"),
-    WaypointStatus.IN_PROGRESS: (" ", ""),  # Blinks to empty
-    WaypointStatus.FAILED: ("✗", "bold red"),
-    WaypointStatus.SKIPPED: ("⊘", "yellow"),
-    WaypointStatus.PENDING: ("○", "dim"),
-}
-EPIC_ICON = "◇"
-EPIC_COLOR = ""  # Neutral color (same as regular text)
-
-
-def _format_waypoint_label(
-    waypoint: Waypoint,
-    is_epic: bool = False,
-    epic_progress: tuple[int, int] | None = None,
-    width: int = 80,
-    blink_visible: bool = True,
-    cost: float | None = None,
-) -> Text:
-    """Format a waypoint for display in the tree.
-
-    Args:
-        waypoint: The waypoint to format.
-        is_epic: Whether this waypoint is an epic (has children).
-        epic_progress: Tuple of (complete_count, total_count) for epics.
-        width: Target width for padding (fills with spaces).
-        blink_visible: Whether to show the icon (for blink animation).
-        cost: Optional cost in USD to display.
-
-    Returns:
-        Rich Text object with colored icon.
-    """
-    result = Text()
-
-    # Get icon and color based on status
-    if is_epic:
-        icon = EPIC_ICON
-        icon_color = EPIC_COLOR
-    elif blink_visible:
-        icon, icon_color = STATUS_ICONS[waypoint.status]
-    else:
-        icon, icon_color = STATUS_ICONS_BLINK[waypoint.status]
-
-    # Add colored icon
-    result.append(icon, style=icon_color)
-    result.append(" ")
-
-    # Add waypoint ID and title
-    id_text = f"{waypoint.id}: "
-
-    # Build progress suffix for epics
-    progress_suffix = ""
-    if is_epic and epic_progress:
-        complete, total = epic_progress
-        progress_suffix = f" ({complete}/{total})"
-
-    debug_suffix = ""
-    if waypoint.debug_of:
-        debug_suffix = f" (debug of {waypoint.debug_of})"
-
-    # Build cost suffix for completed waypoints
-    cost_suffix = ""
-    if cost is not None and cost > 0:
-        cost_suffix = f" [${cost:.2f}]"
-
-    # Calculate max title length (accounting for icon + space + id + progress + cost)
-    used_width = (
-        2 + len(id_text) + len(progress_suffix) + len(debug_suffix) + len(cost_suffix)
-    )
-    max_title_len = width - used_width
-
-    title = waypoint.title
-    if len(title) > max_title_len:
-        title = title[: max_title_len - 3] + "..."
-
-    result.append(id_text)
-    result.append(title)
-
-    # Add progress suffix for epics (in dim style)
-    if progress_suffix:
-        result.append(progress_suffix, style="dim")
-
-    if debug_suffix:
-        result.append(debug_suffix, style="dim")
-
-    # Add cost suffix (in green for visibility)
-    if cost_suffix:
-        result.append(cost_suffix, style="green")
-
-    # Pad to full width
-    current_len = (
-        2
-        + len(id_text)
-        + len(title)
-        + len(progress_suffix)
-        + len(debug_suffix)
-        + len(cost_suffix)
-    )
-    if current_len < width:
-        result.append(" " * (width - current_len))
-
-    return result
-
-
-class FlightPlanTree(Tree[Waypoint]):
-    """Tree widget for displaying the flight plan."""
-
-    DEFAULT_CSS = FLIGHT_PLAN_TREE_CSS
-
-    BINDINGS = [
-        Binding("j", "cursor_down", "Down", show=False),
-        Binding("k", "cursor_up", "Up", show=False),
-    ]
-
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__("PLAN", **kwargs)
-        self._flight_plan: FlightPlan | None = None
-        self._cost_by_waypoint: dict[str, float] = {}
-        # Hide the root node - we just want to show waypoints
-        self.show_root = False
-        # Blink state for active waypoints
-        self._blink_visible: bool = True
-        self._blink_timer: object = None
-
-    def on_mount(self) -> None:
-        """Start the blink timer for active waypoints."""
-        self._blink_timer = self.set_interval(0.5, self._toggle_blink)
-
-    def _toggle_blink(self) -> None:
-        """Toggle visibility of IN_PROGRESS waypoint icons."""
-        self._blink_visible = not self._blink_visible
-        self._update_active_labels()
-
-    def update_flight_plan(
-        self,
-        flight_plan: FlightPlan,
-        cost_by_waypoint: dict[str, float] | None = None,
-    ) -> None:
-        """Update the tree with a new flight plan.
-
-        Args:
-            flight_plan: The flight plan to display.
-            cost_by_waypoint: Optional dict mapping waypoint ID to cost in USD.
-        """
-        self._flight_plan = flight_plan
-        self._cost_by_waypoint = cost_by_waypoint or {}
-        self._rebuild_tree()
-
-    def _rebuild_tree(self) -> None:
-        """Rebuild the tree from the flight plan."""
-        if not self._flight_plan:
-            return
-
-        # Clear existing nodes
-        self.root.remove_children()
-
-        # Build a map of parent_id -> children for efficient lookup
-        children_map: dict[str | None, list[Waypoint]] = {}
-        for wp in self._flight_plan.waypoints:
-            parent = wp.parent_id
-            if parent not in children_map:
-                children_map[parent] = []
-            children_map[parent].append(wp)
-
-        # Add root-level waypoints (those with no parent)
-        def add_children(
-            parent_node: TreeNode[Waypoint], parent_id: str | None
-        ) -> None:
-            for wp in children_map.get(parent_id, []):
-                fp = self._flight_plan
-                is_epic = fp.is_epic(wp.id) if fp else False
-
-                # Calculate epic progress if this is an epic
-                epic_progress = None
-                if is_epic and fp:
-                    children = fp.get_children(wp.id)
-                    complete = sum(
-                        1 for c in children if c.status == WaypointStatus.COMPLETE
-                    )
-                    epic_progress = (complete, len(children))
-
-                # Get cost for this waypoint
-                wp_cost = self._cost_by_waypoint.get(wp.id)
-
-                label = _format_waypoint_label(
-                    wp,
-                    is_epic=is_epic,
-                    epic_progress=epic_progress,
-                    blink_visible=self._blink_visible,
-                    cost=wp_cost,
-                )
-
-                # Check if this waypoint has children
-                has_children = wp.id in children_map
-
-                if has_children:
-                    # Add as expandable node
-                    child_node = parent_node.add(label, data=wp, expand=True)
-                    add_children(child_node, wp.id)
-                else:
-                    # Add as leaf node
-                    parent_node.add_leaf(label, data=wp)
-
-        add_children(self.root, None)
-
-        # Expand all nodes by default
-        self.root.expand_all()
-
-    def _update_active_labels(self) -> None:
-        """Update labels for IN_PROGRESS waypoints (for blink animation)."""
-        if not self._flight_plan:
-            return
-
-        def update_node(node: TreeNode[Waypoint]) -> None:
-            if node.data and node.data.status == WaypointStatus.IN_PROGRESS:
-                fp = self._flight_plan
-                is_epic = fp.is_epic(node.data.id) if fp else False
-
-                # Calculate epic progress if this is an epic
-                epic_progress = None
-                if is_epic and fp:
-                    children = fp.get_children(node.data.id)
-                    complete = sum(
-                        1 for c in children if c.status == WaypointStatus.COMPLETE
-                    )
-                    epic_progress = (complete, len(children))
-
-                # Get cost for this waypoint
-                wp_cost = self._cost_by_waypoint.get(node.data.id)
-
-                label = _format_waypoint_label(
-                    node.data,
-                    is_epic=is_epic,
-                    epic_progress=epic_progress,
-                    blink_visible=self._blink_visible,
-                    cost=wp_cost,
-                )
-                node.set_label(label)
-            for child in node.children:
-                update_node(child)
-
-        for child in self.root.children:
-            update_node(child)
-
-    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted[Waypoint]) -> None:
-        """Handle node highlight - emit WaypointSelected for preview update."""
-        if event.node.data:
-            self.post_message(WaypointSelected(event.node.data.id))
-
-    def on_tree_node_selected(self, event: Tree.NodeSelected[Waypoint]) -> None:
-        """Handle node selection (Enter) - emit WaypointOpenDetail."""
-        if event.node.data:
-            self.post_message(WaypointOpenDetail(event.node.data.id))
-
-    def select_first(self) -> None:
-        """Highlight the first waypoint in the tree (for initial preview)."""
-        # Get the first child of root (first waypoint)
-        if self.root.children:
-            first_node = self.root.children[0]
-            # Move cursor to highlight (not select - that opens detail modal)
-            self.move_cursor(first_node)
-            # Emit message for preview update
-            if first_node.data:
-                self.post_message(WaypointSelected(first_node.data.id))
+from waypoints.tui.widgets.flight_plan_tree import (
+    FlightPlanTree as FlightPlanTree,
+)
+from waypoints.tui.widgets.flight_plan_tree import (
+    WaypointOpenDetail as WaypointOpenDetail,
+)
+from waypoints.tui.widgets.flight_plan_tree import (
+    WaypointSelected as WaypointSelected,
+)
 
 
 class FlightPlanPanel(Vertical):
@@ -0,0 +1,339 @@
+"""Flight plan tree widget shared by CHART and FLY."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from rich.text import Text
+from textual.binding import Binding
+from textual.message import Message
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+from waypoints.models.flight_plan import FlightPlan
+from waypoints.models.waypoint import Waypoint, WaypointStatus
+from waypoints.tui.widgets.flight_plan_styles import FLIGHT_PLAN_TREE_CSS
+
+
+class WaypointSelected(Message):
+    """Waypoint was selected (highlighted) in the flight plan."""
+
+    def __init__(self, waypoint_id: str) -> None:
+        self.waypoint_id = waypoint_id
+        super().__init__()
+
+
+class WaypointOpenDetail(Message):
+    """Request to open waypoint detail modal."""
+
+    def __init__(self, waypoint_id: str) -> None:
+        self.waypoint_id = waypoint_id
+        super().__init__()
+
+
+# Status icons and colors for waypoints
+STATUS_ICONS = {
+    WaypointStatus.COMPLETE: ("◉", "green"),
+    WaypointStatus.IN_PROGRESS: ("◎", "bold cyan"),
+    WaypointStatus.FAILED: ("✗", "bold red"),
+    WaypointStatus.SKIPPED: ("⊘", "yellow"),
+    WaypointStatus.PENDING: ("○", "dim"),
+}
+# Blink state icon (shown when blinking is "off")
+STATUS_ICONS_BLINK = {
+    WaypointStatus.COMPLETE: ("◉", "green"),
+    WaypointStatus.IN_PROGRESS: (" ", ""),  # Blinks to empty
+    WaypointStatus.FAILED: ("✗", "bold red"),
+    WaypointStatus.SKIPPED: ("⊘", "yellow"),
+    WaypointStatus.PENDING: ("○", "dim"),
+}
+EPIC_ICON = "◇"
+EPIC_COLOR = ""  # Neutral color (same as regular text)
+
+
+def _format_waypoint_label(
+    waypoint: Waypoint,
+    is_epic: bool = False,
+    epic_progress: tuple[int, int] | None = None,
+    width: int = 80,
+    blink_visible: bool = True,
+    cost: float | None = None,
+) -> Text:
+    """Format a waypoint for display in the tree.
+
+    Args:
+        waypoint: The waypoint to format.
+        is_epic: Whether this waypoint is an epic (has children).
+        epic_progress: Tuple of (complete_count, total_count) for epics.
+        width: Target width for padding (fills with spaces).
+        blink_visible: Whether to show the icon (for blink animation).
+        cost: Optional cost in USD to display.
+
+    Returns:
+        Rich Text object with colored icon.
+    """
+    result = Text()
+
+    # Get icon and color based on status
+    if is_epic:
+        icon = EPIC_ICON
+        icon_color = EPIC_COLOR
+    elif blink_visible:
+        icon, icon_color = STATUS_ICONS[waypoint.status]
+    else:
+        icon, icon_color = STATUS_ICONS_BLINK[waypoint.status]
+
+    # Add colored icon
+    result.append(icon, style=icon_color)
+    result.append(" ")
+
+    # Add waypoint ID and title
+    id_text = f"{waypoint.id}: "
+
+    # Build progress suffix for epics
+    progress_suffix = ""
+    if is_epic and epic_progress:
+        complete, total = epic_progress
+        progress_suffix = f" ({complete}/{total})"
+
+    debug_suffix = ""
+    if waypoint.debug_of:
+        debug_suffix = f" (debug of {waypoint.debug_of})"
+
+    # Build cost suffix for completed waypoints
+    cost_suffix = ""
+    if cost is not None and cost > 0:
+        cost_suffix = f" [${cost:.2f}]"
+
+    # Calculate max title length (accounting for icon + space + id + progress + cost)
+    used_width = (
+        2 + len(id_text) + len(progress_suffix) + len(debug_suffix) + len(cost_suffix)
+    )
+    max_title_len = width - used_width
+
+    title = waypoint.title
+    if len(title) > max_title_len:
+        title = title[: max_title_len - 3] + "..."
+
+    result.append(id_text)
+    result.append(title)
+
+    # Add progress suffix for epics (in dim style)
+    if progress_suffix:
+        result.append(progress_suffix, style="dim")
+
+    if debug_suffix:
+        result.append(debug_suffix, style="dim")
+
+    # Add cost suffix (in green for visibility)
+    if cost_suffix:
+        result.append(cost_suffix, style="green")
+
+    # Pad to full width
+    current_len = (
+        2
+        + len(id_text)
+        + len(title)
+        + len(progress_suffix)
+        + len(debug_suffix)
+        + len(cost_suffix)
+    )
+    if current_len < width:
+        result.append(" " * (width - current_len))
+
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class _PlanLayout:
+    """Parent/child structure and epic progress derived in one pass."""
+
+    children: dict[str | None, list[Waypoint]]
+    epic_progress: dict[str, tuple[int, int]]
+
+    @classmethod
+    def build(cls, flight_plan: FlightPlan) -> "_PlanLayout":
+        children: dict[str | None, list[Waypoint]] = {}
+        for wp in flight_plan.waypoints:
+            children.setdefault(wp.parent_id, []).append(wp)
+        epic_progress = {
+            parent_id: (
+                sum(1 for c in kids if c.status == WaypointStatus.COMPLETE),
+                len(kids),
+            )
+            for parent_id, kids in children.items()
+            if parent_id is not None
+        }
+        return cls(children=children, epic_progress=epic_progress)
+
+
+class FlightPlanTree(Tree[Waypoint]):
+    """Tree widget for displaying the flight plan.
+
+    Updates are applied as diffs against the nodes already on screen: each
+    waypoint keeps its node, which is relabelled only when its rendering
+    inputs change and re-created only when it moves, so expansion and
+    cursor state survive status changes.
+    """
+
+    DEFAULT_CSS = FLIGHT_PLAN_TREE_CSS
+
+    BINDINGS = [
+        Binding("j", "cursor_down", "Down", show=False),
+        Binding("k", "cursor_up", "Up", show=False),
+    ]
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__("PLAN", **kwargs)
+        self._flight_plan: FlightPlan | None = None
+        self._cost_by_waypoint: dict[str, float] = {}
+        self._layout: _PlanLayout | None = None
+        self._waypoint_nodes: dict[str, TreeNode[Waypoint]] = {}
+        self._label_keys: dict[str, tuple[object, ...]] = {}
+        # Hide the root node - we just want to show waypoints
+        self.show_root = False
+        # Blink state for active waypoints
+        self._blink_visible: bool = True
+        self._blink_timer: object = None
+
+    def on_mount(self) -> None:
+        """Start the blink timer for active waypoints."""
+        self._blink_timer = self.set_interval(0.5, self._toggle_blink)
+
+    def _toggle_blink(self) -> None:
+        """Toggle visibility of IN_PROGRESS waypoint icons."""
+        self._blink_visible = not self._blink_visible
+        self._update_active_labels()
+
+    def update_flight_plan(
+        self,
+        flight_plan: FlightPlan,
+        cost_by_waypoint: dict[str, float] | None = None,
+    ) -> None:
+        """Update the tree with a new flight plan.
+
+        Args:
+            flight_plan: The flight plan to display.
+            cost_by_waypoint: Optional dict mapping waypoint ID to cost in USD.
+        """
+        self._flight_plan = flight_plan
+        self._cost_by_waypoint = cost_by_waypoint or {}
+        self._layout = _PlanLayout.build(flight_plan)
+
+        cursor = self.cursor_node
+        cursor_line = self.cursor_line
+        self._sync_children(self.root, None)
+        if cursor is not None and cursor.data is not None:
+            node = self._waypoint_nodes.get(cursor.data.id)
+            if node is not None and node.line != cursor_line:
+                self.move_cursor(node)
+
+    def _sync_children(
+        self, parent_node: TreeNode[Waypoint], parent_id: str | None
+    ) -> None:
+        """Reconcile ``parent_node``'s children with the plan layout."""
+        assert self._layout is not None
+        desired = self._layout.children.get(parent_id, [])
+        desired_ids = {wp.id for wp in desired}
+
+        for child in list(parent_node.children):
+            child_id = child.data.id if child.data else None
+            if (
+                child_id not in desired_ids
+                or self._waypoint_nodes.get(child_id) is not child
+            ):
+                self._remove_node(child)
+
+        for position, wp in enumerate(desired):
+            siblings = parent_node.children
+            node = self._waypoint_nodes.get(wp.id)
+            if node is not None and (
+                position >= len(siblings) or siblings[position] is not node
+            ):
+                # Moved (reordered or reparented): re-create at its new slot.
+                self._remove_node(node)
+                node = None
+            if node is None:
+                node = parent_node.add(
+                    self._label_for(wp),
+                    data=wp,
+                    before=position if position < len(parent_node.children) else None,
+                    expand=True,
+                )
+                self._waypoint_nodes[wp.id] = node
+            else:
+                node.data = wp
+                self._refresh_label(node, wp)
+            node.allow_expand = wp.id in self._layout.children
+            self._sync_children(node, wp.id)
+
+    def _remove_node(self, node: TreeNode[Waypoint]) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if (
+                current.data is not None
+                and self._waypoint_nodes.get(current.data.id) is current
+            ):
+                del self._waypoint_nodes[current.data.id]
+                self._label_keys.pop(current.data.id, None)
+            stack.extend(current.children)
+        node.remove()
+
+    def _label_key(self, wp: Waypoint) -> tuple[object, ...]:
+        assert self._layout is not None
+        progress = self._layout.epic_progress.get(wp.id)
+        blinking = progress is None and wp.status == WaypointStatus.IN_PROGRESS
+        return (
+            wp.status,
+            wp.title,
+            wp.debug_of,
+            progress,
+            self._cost_by_waypoint.get(wp.id),
+            self._blink_visible if blinking else True,
+        )
+
+    def _label_for(self, wp: Waypoint) -> Text:
+        assert self._layout is not None
+        self._label_keys[wp.id] = self._label_key(wp)
+        progress = self._layout.epic_progress.get(wp.id)
+        return _format_waypoint_label(
+            wp,
+            is_epic=progress is not None,
+            epic_progress=progress,
+            blink_visible=self._blink_visible,
+            cost=self._cost_by_waypoint.get(wp.id),
+        )
+
+    def _refresh_label(self, node: TreeNode[Waypoint], wp: Waypoint) -> None:
+        if self._label_keys.get(wp.id) != self._label_key(wp):
+            node.set_label(self._label_for(wp))
+
+    def _update_active_labels(self) -> None:
+        """Update labels for IN_PROGRESS waypoints (for blink animation)."""
+        if not self._flight_plan or self._layout is None:
+            return
+        for node in self._waypoint_nodes.values():
+            wp = node.data
+            if wp is not None and wp.status == WaypointStatus.IN_PROGRESS:
+                self._refresh_label(node, wp)
+
+    def on_tree_node_highlighted(self, event: Tree.NodeHighlighted[Waypoint]) -> None:
+        """Handle node highlight - emit WaypointSelected for preview update."""
+        if event.node.data:
+            self.post_message(WaypointSelected(event.node.data.id))
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected[Waypoint]) -> None:
+        """Handle node selection (Enter) - emit WaypointOpenDetail."""
+        if event.node.data:
+            self.post_message(WaypointOpenDetail(event.node.data.id))
+
+    def select_first(self) -> None:
+        """Highlight the first waypoint in the tree (for initial preview)."""
+        # Get the first child of root (first waypoint)
+        if self.root.children:
+            first_node = self.root.children[0]
+            # Move cursor to highlight (not select - that opens detail modal)
+            self.move_cursor(first_node)
+            # Emit message for preview update
+            if first_node.data:
+                self.post_message(WaypointSelected(first_node.data.id))
@@ -12,7 +12,7 @@ from textual.widgets import Static
 from waypoints.models.flight_plan import FlightPlan
 from waypoints.models.waypoint import Waypoint, WaypointStatus
 from waypoints.tui.utils import format_token_count
-from waypoints.tui.widgets.flight_plan import FlightPlanTree
+from waypoints.tui.widgets.flight_plan_tree import FlightPlanTree
 
 
 def format_project_metrics(
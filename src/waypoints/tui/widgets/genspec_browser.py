@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any
 
 from textual.app import ComposeResult
@@ -9,7 +10,13 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen
 from textual.widgets import Static, Tree
+from textual.widgets.tree import TreeNode
 
+from waypoints.genspec.index import (
+    ArtifactIndexEntry,
+    GenSpecIndex,
+    StepIndexEntry,
+)
 from waypoints.genspec.spec import (
     Artifact,
     BundleChecksums,
@@ -44,6 +51,81 @@ PHASE_DISPLAY_NAMES = {
     "fly": "Fly",
 }
 
+PHASE_ORDER = [
+    "spark",
+    "shape_qa",
+    "shape_brief",
+    "shape_spec",
+    "chart",
+    "chart_breakdown",
+    "chart_add",
+    "fly",
+]
+
+# Indexed phases with more steps than this start collapsed and are only
+# populated when the user expands them.
+LAZY_EXPAND_LIMIT = 100
+
+
+def _phase_label(phase_name: str, step_count: int, phase_cost: float) -> Any:
+    from rich.text import Text
+
+    icon = PHASE_ICONS.get(phase_name, "○")
+    display_name = PHASE_DISPLAY_NAMES.get(
+        phase_name, phase_name.replace("_", " ").title()
+    )
+    label = Text()
+    label.append(f"{icon} ")
+    label.append(display_name)
+    label.append(f" ({step_count})", style="dim")
+    if phase_cost > 0:
+        label.append(f" ${phase_cost:.2f}", style="green")
+    return label
+
+
+def _step_label(
+    phase_name: str,
+    timestamp: datetime,
+    context: dict[str, Any],
+    cost_usd: float | None,
+) -> Any:
+    from rich.text import Text
+
+    step_label = Text()
+    # For FLY steps, show waypoint ID and iteration
+    if phase_name == "fly" and context:
+        wp_id = context.get("waypoint_id", "")
+        iteration = context.get("iteration", 1)
+        reason = context.get("iteration_reason", "")
+        step_label.append(f"  {wp_id} ")
+        step_label.append(f"iter {iteration}", style="cyan")
+        if reason and reason not in ("initial", "continue"):
+            step_label.append(f" ({reason})", style="yellow")
+    else:
+        step_label.append(f"  {timestamp.strftime('%H:%M:%S')}")
+
+    if cost_usd:
+        step_label.append(f" ${cost_usd:.3f}", style="green")
+    return step_label
+
+
+def _artifact_label(artifact_type: str, chars: int) -> Any:
+    from rich.text import Text
+
+    art_label = Text()
+    art_label.append(f"  {artifact_type.replace('_', ' ').title()}")
+    art_label.append(f" ({chars:,} chars)", style="dim")
+    return art_label
+
+
+def _artifacts_header_label(count: int) -> Any:
+    from rich.text import Text
+
+    artifacts_label = Text()
+    artifacts_label.append("📦 Artifacts")
+    artifacts_label.append(f" ({count})", style="dim")
+    return artifacts_label
+
 
 class GenSpecTree(Tree[Any]):
     """Tree widget for browsing generative spec phases, steps, and artifacts."""
@@ -85,35 +167,23 @@ class GenSpecTree(Tree[Any]):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__("SPEC", **kwargs)
         self._spec: GenerativeSpec | None = None
+        self._index: GenSpecIndex | None = None
         self.show_root = False
 
     def update_spec(self, spec: GenerativeSpec | None) -> None:
         """Update the tree with a generative spec."""
-        from rich.text import Text
-
         self._spec = spec
+        self._index = None
         self.root.remove_children()
 
         if not spec:
             return
 
-        # Phase ordering
-        phase_order = [
-            "spark",
-            "shape_qa",
-            "shape_brief",
-            "shape_spec",
-            "chart",
-            "chart_breakdown",
-            "chart_add",
-            "fly",
-        ]
-
         # Add phases with their steps
         summary = spec.summary()
         phases = summary.get("phases", {})
 
-        for phase_name in phase_order:
+        for phase_name in PHASE_ORDER:
             if phase_name not in phases:
                 continue
 
@@ -126,66 +196,108 @@ class GenSpecTree(Tree[Any]):
             # Calculate total cost for this phase
             phase_cost = sum(s.metadata.cost_usd for s in steps if s.metadata.cost_usd)
 
-            # Format phase label
-            icon = PHASE_ICONS.get(phase_name, "○")
-            display_name = PHASE_DISPLAY_NAMES.get(
-                phase_name, phase_name.replace("_", " ").title()
-            )
-            label = Text()
-            label.append(f"{icon} ")
-            label.append(display_name)
-            label.append(f" ({len(steps)})", style="dim")
-            if phase_cost > 0:
-                label.append(f" ${phase_cost:.2f}", style="green")
-
             # Add phase as expandable node
             phase_data = {"type": "phase", "name": phase_name}
-            phase_node = self.root.add(label, data=phase_data)
+            phase_node = self.root.add(
+                _phase_label(phase_name, len(steps), phase_cost), data=phase_data
+            )
 
             # Add steps under this phase
             for step in steps:
-                step_label = Text()
-                timestamp = step.timestamp.strftime("%H:%M:%S")
-
-                # For FLY steps, show waypoint ID and iteration
-                if phase_name == "fly" and step.input.context:
-                    ctx = step.input.context
-                    wp_id = ctx.get("waypoint_id", "")
-                    iteration = ctx.get("iteration", 1)
-                    reason = ctx.get("iteration_reason", "")
-                    step_label.append(f"  {wp_id} ")
-                    step_label.append(f"iter {iteration}", style="cyan")
-                    if reason and reason not in ("initial", "continue"):
-                        step_label.append(f" ({reason})", style="yellow")
-                else:
-                    step_label.append(f"  {timestamp}")
-
-                if step.metadata.cost_usd:
-                    step_label.append(f" ${step.metadata.cost_usd:.3f}", style="green")
+                step_label = _step_label(
+                    phase_name,
+                    step.timestamp,
+                    step.input.context or {},
+                    step.metadata.cost_usd,
+                )
                 phase_node.add_leaf(step_label, data={"type": "step", "step": step})
 
         # Add artifacts section
         if spec.artifacts:
-            artifacts_label = Text()
-            artifacts_label.append("📦 Artifacts")
-            artifacts_label.append(f" ({len(spec.artifacts)})", style="dim")
             artifacts_node = self.root.add(
-                artifacts_label, data={"type": "artifacts_header"}
+                _artifacts_header_label(len(spec.artifacts)),
+                data={"type": "artifacts_header"},
             )
 
             for artifact in spec.artifacts:
-                art_label = Text()
-                atype = artifact.artifact_type.value.replace("_", " ").title()
-                chars = len(artifact.content)
-                art_label.append(f"  {atype}")
-                art_label.append(f" ({chars:,} chars)", style="dim")
                 artifacts_node.add_leaf(
-                    art_label, data={"type": "artifact", "artifact": artifact}
+                    _artifact_label(
+                        artifact.artifact_type.value, len(artifact.content)
+                    ),
+                    data={"type": "artifact", "artifact": artifact},
                 )
 
         # Expand all by default
         self.root.expand_all()
 
+    def update_index(self, index: GenSpecIndex | None) -> None:
+        """Update the tree from a genspec index.
+
+        Only phase and artifact nodes are created up front; step leaves are
+        added the first time a phase is expanded, and large phases start
+        collapsed.
+        """
+        self._spec = None
+        self._index = index
+        self.root.remove_children()
+
+        if not index:
+            return
+
+        phase_counts = index.phase_counts()
+        for phase_name in PHASE_ORDER:
+            if phase_name not in phase_counts:
+                continue
+
+            entries = index.steps_by_phase(Phase(phase_name))
+            phase_cost = sum(e.cost_usd for e in entries if e.cost_usd)
+            phase_node = self.root.add(
+                _phase_label(phase_name, len(entries), phase_cost),
+                data={
+                    "type": "phase",
+                    "name": phase_name,
+                    "entries": entries,
+                    "populated": False,
+                },
+                expand=False,
+            )
+            if len(entries) <= LAZY_EXPAND_LIMIT:
+                self._populate_phase(phase_node)
+                phase_node.expand()
+
+        if index.artifacts:
+            artifacts_node = self.root.add(
+                _artifacts_header_label(len(index.artifacts)),
+                data={"type": "artifacts_header"},
+                expand=True,
+            )
+            for entry in index.artifacts:
+                artifacts_node.add_leaf(
+                    _artifact_label(entry.artifact_type.value, entry.chars),
+                    data={"type": "artifact_ref", "entry": entry},
+                )
+
+        self.root.expand()
+
+    def _populate_phase(self, node: TreeNode[Any]) -> None:
+        """Add step leaves for an indexed phase node, once."""
+        data = node.data
+        if not data or data.get("type") != "phase" or data.get("populated", True):
+            return
+        data["populated"] = True
+        entries: list[StepIndexEntry] = data["entries"]
+        for entry in entries:
+            node.add_leaf(
+                _step_label(
+                    data["name"], entry.timestamp, entry.context, entry.cost_usd
+                ),
+                data={"type": "step_ref", "entry": entry},
+            )
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[Any]) -> None:
+        """Populate indexed phases lazily on first expansion."""
+        self._populate_phase(event.node)
+
     def select_first(self) -> None:
         """Select the first item in the tree."""
         if self.root.children:
@@ -370,6 +482,45 @@ class GenSpecPreviewPanel(VerticalScroll):
 
     def show_phase(self, phase_name: str, spec: GenerativeSpec) -> None:
         """Display a phase summary."""
+        try:
+            phase_enum = Phase(phase_name)
+            steps = spec.get_steps_by_phase(phase_enum)
+        except Exception:
+            steps = []
+
+        self._show_phase_summary(
+            phase_name,
+            step_count=len(steps),
+            total_cost=sum(s.metadata.cost_usd for s in steps if s.metadata.cost_usd),
+            total_tokens_in=sum(
+                s.metadata.tokens_in for s in steps if s.metadata.tokens_in
+            ),
+            total_tokens_out=sum(
+                s.metadata.tokens_out for s in steps if s.metadata.tokens_out
+            ),
+        )
+
+    def show_phase_entries(
+        self, phase_name: str, entries: list[StepIndexEntry]
+    ) -> None:
+        """Display a phase summary from index entries."""
+        self._show_phase_summary(
+            phase_name,
+            step_count=len(entries),
+            total_cost=sum(e.cost_usd for e in entries if e.cost_usd),
+            total_tokens_in=sum(e.tokens_in for e in entries if e.tokens_in),
+            total_tokens_out=sum(e.tokens_out for e in entries if e.tokens_out),
+        )
+
+    def _show_phase_summary(
+        self,
+        phase_name: str,
+        *,
+        step_count: int,
+        total_cost: float,
+        total_tokens_in: int,
+        total_tokens_out: int,
+    ) -> None:
         self._current_data = None
         placeholder = self.query_one("#preview-placeholder")
         content = self.query_one("#preview-content", Vertical)
@@ -381,25 +532,11 @@ class GenSpecPreviewPanel(VerticalScroll):
             phase_name, phase_name.replace("_", " ").title()
         )
         content.mount(Static(f"Phase: {display_name}", classes="section-header"))
+        content.mount(Static(f"Steps: {step_count}", classes="meta-line"))
 
-        try:
-            phase_enum = Phase(phase_name)
-            steps = spec.get_steps_by_phase(phase_enum)
-        except Exception:
-            steps = []
-
-        content.mount(Static(f"Steps: {len(steps)}", classes="meta-line"))
-
-        total_cost = sum(s.metadata.cost_usd for s in steps if s.metadata.cost_usd)
         if total_cost > 0:
             content.mount(Static(f"Total Cost: ${total_cost:.2f}", classes="meta-line"))
 
-        total_tokens_in = sum(
-            s.metadata.tokens_in for s in steps if s.metadata.tokens_in
-        )
-        total_tokens_out = sum(
-            s.metadata.tokens_out for s in steps if s.metadata.tokens_out
-        )
         if total_tokens_in or total_tokens_out:
             content.mount(
                 Static(
@@ -565,6 +702,7 @@ class GenSpecBrowser(Horizontal):
     ) -> None:
         super().__init__(**kwargs)
         self._spec: GenerativeSpec | None = None
+        self._index: GenSpecIndex | None = None
         self._metadata: BundleMetadata | None = None
         self._checksums: BundleChecksums | None = None
         self._source_label: str | None = None
@@ -591,6 +729,7 @@ class GenSpecBrowser(Horizontal):
     ) -> None:
         """Set the spec data for the browser."""
         self._spec = spec
+        self._index = None
         self._metadata = metadata
         self._checksums = checksums
         self._source_label = source_label
@@ -604,6 +743,31 @@ class GenSpecBrowser(Horizontal):
         if select_first:
             tree.select_first()
 
+    def set_index(
+        self,
+        index: GenSpecIndex | None,
+        *,
+        source_label: str | None = None,
+        metadata: BundleMetadata | None = None,
+        checksums: BundleChecksums | None = None,
+        select_first: bool = False,
+    ) -> None:
+        """Browse an indexed genspec, loading step bodies on selection."""
+        self._spec = None
+        self._index = index
+        self._metadata = metadata
+        self._checksums = checksums
+        self._source_label = source_label
+
+        tree = self.query_one("#genspec-tree", GenSpecTree)
+        preview = self.query_one("#genspec-preview", GenSpecPreviewPanel)
+        tree.update_index(index)
+        preview.clear()
+        preview.set_placeholder(self._build_placeholder_text())
+
+        if select_first:
+            tree.select_first()
+
     def focus_tree(self) -> None:
         """Focus the tree widget."""
         tree = self.query_one("#genspec-tree", GenSpecTree)
@@ -613,7 +777,7 @@ class GenSpecBrowser(Horizontal):
         """Update preview when tree cursor moves."""
         preview = self.query_one("#genspec-preview", GenSpecPreviewPanel)
 
-        if not event.node.data or self._spec is None:
+        if not event.node.data or (self._spec is None and self._index is None):
             preview.clear()
             return
 
@@ -622,7 +786,13 @@ class GenSpecBrowser(Horizontal):
             preview.show_step(data["step"])
         elif data.get("type") == "artifact":
             preview.show_artifact(data["artifact"])
-        elif data.get("type") == "phase":
+        elif data.get("type") == "step_ref" and self._index is not None:
+            preview.show_step(self._index.load_step(data["entry"]))
+        elif data.get("type") == "artifact_ref" and self._index is not None:
+            preview.show_artifact(self._index.load_artifact(data["entry"]))
+        elif data.get("type") == "phase" and "entries" in data:
+            preview.show_phase_entries(data["name"], data["entries"])
+        elif data.get("type") == "phase" and self._spec is not None:
             preview.show_phase(data["name"], self._spec)
         else:
             preview.clear()
@@ -637,6 +807,12 @@ class GenSpecBrowser(Horizontal):
             self._show_step_detail(data["step"])
         elif data.get("type") == "artifact":
             self._show_artifact_detail(data["artifact"])
+        elif data.get("type") == "step_ref" and self._index is not None:
+            entry: StepIndexEntry = data["entry"]
+            self._show_step_detail(self._index.load_step(entry))
+        elif data.get("type") == "artifact_ref" and self._index is not None:
+            artifact_entry: ArtifactIndexEntry = data["entry"]
+            self._show_artifact_detail(self._index.load_artifact(artifact_entry))
         # For phases/headers, tree handles expand/collapse automatically
 
     def _show_step_detail(self, step: GenerativeStep) -> None:
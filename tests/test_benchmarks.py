@@ -0,0 +1,64 @@
+"""Tests for the scripted-provider FLY benchmark harness."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from waypoints.benchmarks import (
+    build_report,
+    compare_to_baseline,
+    discover_fixtures,
+    run_fixture,
+)
+
+FIXTURES_ROOT = Path(__file__).resolve().parents[1] / "benchmarks" / "fixtures"
+
+
+def test_discover_fixtures_loads_l1_todo_cli() -> None:
+    fixtures = {fixture.name: fixture for fixture in discover_fixtures(FIXTURES_ROOT)}
+
+    fixture = fixtures["L1-todo-cli"]
+    assert "Todo CLI" in fixture.idea
+    assert fixture.waypoint["id"] == "WP-001"
+    assert fixture.transcript_path.is_file()
+
+
+def test_run_fixture_drives_executor_to_success(tmp_path: Path) -> None:
+    fixture = next(
+        f for f in discover_fixtures(FIXTURES_ROOT) if f.name == "L1-todo-cli"
+    )
+
+    sample = run_fixture(fixture, work_dir=tmp_path, latency_scale=0.0)
+
+    assert sample.result == "success"
+    assert sample.llm_calls.get("builder") == 1
+    assert sample.model_latency_seconds == 0.0
+    assert sample.file_writes > 0
+    assert {"prepare", "builder", "host_validation"} <= set(sample.phases)
+    assert (tmp_path / "src" / "todo_cli" / "cli.py").exists()
+    assert list((tmp_path / "receipts").glob("*.json"))
+
+
+def _report(wall: float, opens: int) -> dict[str, object]:
+    return {
+        "fixtures": {
+            "demo": {"summary": {"wall_seconds": wall, "file_opens": opens}},
+        }
+    }
+
+
+def test_compare_to_baseline_flags_only_significant_growth() -> None:
+    baseline = _report(wall=1.0, opens=100)
+
+    assert compare_to_baseline(_report(wall=1.1, opens=110), baseline) == []
+    regressions = compare_to_baseline(_report(wall=2.0, opens=103), baseline)
+
+    assert [(r.fixture, r.metric) for r in regressions] == [("demo", "wall_seconds")]
+    assert regressions[0].ratio == 2.0
+
+
+def test_build_report_is_keyed_by_fixture() -> None:
+    report = build_report([])
+
+    assert report["schema_version"] == 1
+    assert report["fixtures"] == {}
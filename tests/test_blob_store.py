@@ -0,0 +1,96 @@
+"""Tests for the content-addressed evidence blob store and gc command."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from waypoints.cli.commands.gc import cmd_gc
+from waypoints.config.settings import settings
+from waypoints.models import blob_store
+from waypoints.models.blob_store import BlobStore, blob_store_for
+from waypoints.models.project import Project
+
+
+def test_put_deduplicates_and_materializes_read_only_links(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    source = tmp_path / "pytest.log"
+    source.write_text("collected 500 items\n")
+
+    digest = store.put_file(source)
+    assert store.put_bytes(source.read_bytes()) == digest
+    assert len(list(store.digests())) == 1
+
+    first = store.materialize(digest, tmp_path / "a" / "out.txt")
+    second = store.materialize(digest, tmp_path / "b" / "out.txt")
+
+    blob = store.path(digest)
+    assert blob is not None and blob.stat().st_nlink == 3
+    assert first.samefile(second)
+    assert second.read_text() == "collected 500 items\n"
+    assert not first.stat().st_mode & 0o222
+    source.write_text("edited later")
+    assert store.read_bytes(digest) == b"collected 500 items\n"
+
+
+def test_gc_keeps_linked_and_referenced_blobs(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    linked = store.put_bytes(b"linked")
+    store.materialize(linked, tmp_path / "receipt.stdout.txt")
+    referenced = store.put_bytes(b"referenced")
+    orphan = store.put_bytes(b"orphan")
+
+    dry = store.gc({referenced}, dry_run=True)
+    assert (dry.scanned, dry.removed) == (3, 1)
+    assert store.path(orphan) is not None
+
+    stats = store.gc({referenced})
+    assert stats.freed_bytes == len(b"orphan")
+    assert store.path(orphan) is None
+    assert store.path(linked) is not None and store.path(referenced) is not None
+
+
+def test_gc_compresses_cold_referenced_blobs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("compression.zstd")
+    monkeypatch.setattr(blob_store, "COMPRESS_MIN_BYTES", 10)
+    store = BlobStore(tmp_path / "blobs")
+    digest = store.put_bytes(b"log line\n" * 1000)
+
+    stats = store.gc({digest}, compress=True)
+
+    blob = store.path(digest)
+    assert stats.compressed == 1
+    assert blob is not None and blob.suffix == ".zst"
+    assert store.read_bytes(digest) == b"log line\n" * 1000
+
+    # Receipts still hold the plain path; readers resolve it through the store.
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    receipt_ref = tmp_path / "receipts" / ".." / "blobs" / digest[:2] / digest
+    assert store.resolve(receipt_ref) == blob
+    readable = store.readable_path(receipt_ref)
+    assert readable.read_bytes() == b"log line\n" * 1000
+    assert store.readable_path(receipt_ref) == readable
+
+
+def test_cmd_gc_removes_orphans_for_project(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    settings.project_directory = tmp_path
+    project = Project.create("Blob GC")
+    store = blob_store_for(project.get_path())
+    kept = store.put_bytes(b"kept")
+    store.materialize(kept, project.get_path() / "evidence" / "kept.txt")
+    orphan = store.put_bytes(b"orphan")
+
+    exit_code = cmd_gc(
+        argparse.Namespace(project=project.slug, dry_run=False, compress=False)
+    )
+
+    assert exit_code == 0
+    assert store.path(orphan) is None and store.path(kept) is not None
+    assert "removed 1/2 blobs" in capsys.readouterr().out
@@ -35,3 +35,9 @@ def test_parse_args_memory_refresh_spec_context() -> None:
 def test_parse_args_import_rejects_invalid_mode() -> None:
     with pytest.raises(SystemExit):
         _ = parse_args(["import", "spec.genspec.jsonl", "--mode", "invalid"])
+
+
+def test_parse_args_verify_response_cache_flag() -> None:
+    args = parse_args(["verify", "genspec-dir", "--response-cache"])
+    assert args.command == "verify"
+    assert args.response_cache is True
@@ -0,0 +1,125 @@
+"""Tests for lazy CLI command loading and startup profiling."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from waypoints.cli import app as cli_app
+from waypoints.cli import commands
+from waypoints.cli.startup_profile import (
+    format_startup_report,
+    parse_importtime,
+    profile_startup,
+)
+
+_IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   encodings
+import time:      1500 |       1500 |       textual.widgets
+import time:      2000 |       3500 |     textual
+import time:       500 |       4000 |   waypoints.tui
+import time:       250 |       4250 | waypoints
+some unrelated warning
+"""
+
+
+def _imported_modules(code: str) -> set[str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_cli_entrypoint_skips_command_dependencies() -> None:
+    modules = _imported_modules("import waypoints.main")
+
+    heavy = {"textual", "waypoints.tui.app", "waypoints.fly.executor", "openai"}
+    assert not heavy & modules
+    assert "waypoints.cli.commands.memory" not in modules
+
+
+def test_load_command_imports_only_the_selected_handler() -> None:
+    modules = _imported_modules(
+        "from waypoints.cli.commands import load_command\nload_command('tui')"
+    )
+
+    assert "waypoints.cli.commands.tui" in modules
+    assert "waypoints.cli.commands.export" not in modules
+    assert "textual" not in modules
+
+
+def test_command_attributes_resolve_lazily() -> None:
+    from waypoints.cli.commands.memory import cmd_memory
+
+    assert commands.cmd_memory is cmd_memory
+    with pytest.raises(AttributeError):
+        commands.cmd_missing  # noqa: B018
+    with pytest.raises(KeyError):
+        commands.load_command("missing")
+
+
+def test_dispatch_routes_unknown_and_missing_commands_to_tui(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dispatched: list[str] = []
+
+    def _load(name: str):  # type: ignore[no-untyped-def]
+        def _handler(args: argparse.Namespace) -> int:
+            dispatched.append(name)
+            return 0
+
+        return _handler
+
+    monkeypatch.setattr(cli_app, "load_command", _load)
+
+    cli_app.dispatch(argparse.Namespace(command=None))
+    cli_app.dispatch(argparse.Namespace(command="memory"))
+
+    assert dispatched == ["tui", "memory"]
+
+
+def test_parse_importtime_tracks_depth_and_ignores_noise() -> None:
+    timings = parse_importtime(_IMPORTTIME_SAMPLE)
+
+    assert [t.module for t in timings] == [
+        "_io",
+        "encodings",
+        "textual.widgets",
+        "textual",
+        "waypoints.tui",
+        "waypoints",
+    ]
+    assert [t.depth for t in timings] == [2, 1, 3, 2, 1, 0]
+    assert timings[2].package == "textual"
+
+
+def test_startup_report_rolls_up_packages() -> None:
+    report = format_startup_report("view", parse_importtime(_IMPORTTIME_SAMPLE))
+
+    assert "`waypoints view`" in report
+    assert "6 modules, 4.2 ms total" in report
+    package_lines = report.split("By package (self time):\n")[1].splitlines()
+    assert package_lines[0].split() == ["3.5", "ms", "textual"]
+
+
+def test_profile_startup_reports_without_running_command() -> None:
+    out = io.StringIO()
+
+    assert profile_startup("memory", top=5, stream=out) == 0
+
+    report = out.getvalue()
+    assert "Startup import profile for `waypoints memory`" in report
+    assert "waypoints" in report
@@ -0,0 +1,137 @@
+"""Tests for pooled provider clients and the shared provider loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Any
+
+import pytest
+
+from waypoints.llm.providers import client_pool
+from waypoints.llm.providers.anthropic import AnthropicProvider
+from waypoints.llm.providers.base import StreamComplete
+from waypoints.llm.providers.client_pool import (
+    ClientKey,
+    ProviderClientPool,
+    run_on_shared_loop,
+)
+from waypoints.llm.providers.openai import OpenAIProvider
+
+
+class _FakeClient:
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_sync_clients_are_shared_per_key() -> None:
+    pool = ProviderClientPool()
+    created: list[str] = []
+
+    def _factory(label: str) -> Any:
+        created.append(label)
+        return _FakeClient(label)
+
+    key = ClientKey.create("openai", "secret-a")
+    first = pool.get_client(key, lambda: _factory("a"))
+    again = pool.get_client(
+        ClientKey.create("openai", "secret-a"), lambda: _factory("x")
+    )
+    other = pool.get_client(
+        ClientKey.create("openai", "secret-b"), lambda: _factory("b")
+    )
+    routed = pool.get_client(
+        ClientKey.create("openai", "secret-a", "http://proxy"), lambda: _factory("c")
+    )
+
+    assert first is again
+    assert other is not first and routed is not first
+    assert created == ["a", "b", "c"]
+    assert "secret" not in repr(key)
+
+    pool.close()
+    assert first.closed and other.closed
+    assert pool.size == 0
+
+
+def test_async_clients_are_scoped_to_their_event_loop() -> None:
+    pool = ProviderClientPool()
+    key = ClientKey.create("openai", "secret")
+
+    async def _pair() -> tuple[Any, Any]:
+        first = pool.get_async_client(key, lambda: object())
+        return first, pool.get_async_client(key, lambda: object())
+
+    first, second = asyncio.run(_pair())
+    third, _ = asyncio.run(_pair())
+
+    assert first is second
+    assert third is not first
+    assert pool.get_async_client(key, lambda: "fresh") == "fresh"
+
+
+def test_shared_loop_is_reused_across_calls() -> None:
+    async def _loop_identity() -> tuple[int, str]:
+        return id(asyncio.get_running_loop()), threading.current_thread().name
+
+    first = run_on_shared_loop(_loop_identity())
+    second = run_on_shared_loop(_loop_identity())
+
+    assert first == second
+    assert first[1] == "waypoints-provider-loop"
+
+
+def test_openai_provider_instances_share_pooled_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(client_pool, "_CLIENT_POOL", ProviderClientPool())
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+
+    first = OpenAIProvider(api_key="test-key")._get_client()
+    second = OpenAIProvider(model="gpt-4o", api_key="test-key")._get_client()
+    other = OpenAIProvider(api_key="other-key")._get_client()
+
+    assert first is second
+    assert other is not first
+
+
+def test_anthropic_stream_passes_auth_without_touching_environ(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class FakeResultMessage:
+        total_cost_usd = 0.01
+        usage = None
+
+    captured: list[dict[str, str]] = []
+    seen_env: list[str | None] = []
+
+    async def fake_query(*, prompt: str, options: Any):  # type: ignore[no-untyped-def]
+        del prompt
+        captured.append(dict(options.env))
+        seen_env.append(os.environ.get("ANTHROPIC_API_KEY"))
+        yield FakeResultMessage()
+
+    monkeypatch.setattr(
+        "waypoints.llm.providers.anthropic.ResultMessage", FakeResultMessage
+    )
+    monkeypatch.setattr("waypoints.llm.providers.anthropic.query", fake_query)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "ambient-key")
+
+    for provider in (
+        AnthropicProvider(use_web_auth=True),
+        AnthropicProvider(api_key="explicit-key", use_web_auth=False),
+    ):
+        items = list(provider.stream_message([{"role": "user", "content": "hi"}]))
+        assert isinstance(items[-1], StreamComplete)
+
+    assert captured == [
+        {"ANTHROPIC_API_KEY": ""},
+        {"ANTHROPIC_API_KEY": "explicit-key"},
+    ]
+    assert seen_env == ["ambient-key", "ambient-key"]
+    assert os.environ["ANTHROPIC_API_KEY"] == "ambient-key"
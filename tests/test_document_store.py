@@ -0,0 +1,96 @@
+"""Tests for the content-addressed SHAPE document version store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from waypoints.models import document_store
+from waypoints.models.document_store import (
+    DocumentVersionStore,
+    latest_document_path,
+)
+
+
+def _spec(revision: int) -> str:
+    body = "\n".join(f"Requirement {i}: the system shall do {i}." for i in range(200))
+    return f"# Product Spec\n\nRevision {revision}\n\n{body}\n"
+
+
+def _objects(docs: Path) -> list[Path]:
+    return sorted((docs / ".versions" / "objects").iterdir())
+
+
+def test_identical_saves_are_deduplicated(tmp_path: Path) -> None:
+    store = DocumentVersionStore(tmp_path)
+
+    first = store.save("product-spec", _spec(1))
+    second = store.save("product-spec", _spec(1))
+
+    assert first == second
+    assert len(store.history("product-spec")) == 1
+    assert len(_objects(tmp_path)) == 1
+
+
+def test_edits_keep_one_working_file_and_delta_history(tmp_path: Path) -> None:
+    store = DocumentVersionStore(tmp_path)
+    paths = [
+        store.save("product-spec", _spec(rev), path=tmp_path / f"product-spec-{rev}.md")
+        for rev in range(3)
+    ]
+
+    assert sorted(tmp_path.glob("product-spec-*.md")) == [paths[-1]]
+    assert store.latest_path("product-spec") == paths[-1]
+    history = store.history("product-spec")
+    assert [store.load(v.digest) for v in history] == [_spec(r) for r in range(3)]
+    objects = tmp_path / ".versions" / "objects"
+    full, *deltas = [(objects / f"{v.digest}.z").stat().st_size for v in history]
+    assert len(_objects(tmp_path)) == 3
+    assert all(size < full for size in deltas)
+
+
+def test_full_snapshot_bounds_delta_chain(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(document_store, "FULL_SNAPSHOT_INTERVAL", 3)
+    store = DocumentVersionStore(tmp_path)
+
+    for rev in range(7):
+        store.save("idea-brief", _spec(rev), path=tmp_path / "idea-brief-1.md")
+
+    depths = [store._object_depth(v.digest) for v in store.history("idea-brief")]
+    assert depths == [0, 1, 2, 0, 1, 2, 0]
+    assert store.load(store.history("idea-brief")[5].digest) == _spec(5)
+
+
+def test_latest_path_uses_index_until_docs_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = DocumentVersionStore(tmp_path)
+    saved = store.save("product-spec", _spec(1), path=tmp_path / "product-spec-1.md")
+
+    def _no_scan(*_: object) -> None:
+        raise AssertionError("index lookup should not scan the docs directory")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(document_store, "_newest_working_file", _no_scan)
+        assert latest_document_path(tmp_path, "product-spec") == saved
+
+    imported = tmp_path / "product-spec-99999999-999999.md"
+    imported.write_text("imported")
+    assert latest_document_path(tmp_path, "product-spec") == imported
+
+    with monkeypatch.context() as patch:
+        patch.setattr(document_store, "_newest_working_file", _no_scan)
+        assert latest_document_path(tmp_path, "product-spec") == imported
+
+
+def test_latest_path_falls_back_to_legacy_files(tmp_path: Path) -> None:
+    (tmp_path / "idea-brief-20260101-000000.md").write_text("old")
+    (tmp_path / "idea-brief-20260201-000000.md").write_text("new")
+
+    latest = latest_document_path(tmp_path, "idea-brief")
+
+    assert latest is not None and latest.read_text() == "new"
+    assert latest_document_path(tmp_path / "missing", "idea-brief") is None
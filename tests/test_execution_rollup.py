@@ -0,0 +1,155 @@
+"""Tests for the persisted execution-time rollup."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from waypoints.fly import execution_rollup
+from waypoints.fly.execution_log import (
+    ExecutionCompleted,
+    ExecutionLogReader,
+    ExecutionLogWriter,
+    subscribe_execution_completed,
+)
+from waypoints.fly.execution_rollup import ExecutionTimeRollup
+from waypoints.models.waypoint import Waypoint
+from waypoints.tui.screens.fly_projections import ExecutionTimeProjection
+
+
+class _Project:
+    def __init__(self, path: Path, slug: str = "demo") -> None:
+        self._path = path
+        self.slug = slug
+
+    def get_path(self) -> Path:
+        return self._path
+
+    def get_sessions_path(self) -> Path:
+        sessions = self._path / "sessions"
+        sessions.mkdir(parents=True, exist_ok=True)
+        return sessions
+
+
+def _write_log(project: _Project, name: str, seconds: int | None) -> Path:
+    fly_dir = project.get_sessions_path() / "fly"
+    fly_dir.mkdir(parents=True, exist_ok=True)
+    started = datetime(2026, 3, 1, 12, 0, 0, tzinfo=UTC)
+    lines = [
+        {
+            "type": "header",
+            "execution_id": name,
+            "waypoint_id": "WP-001",
+            "waypoint_title": "Demo",
+            "started_at": started.isoformat(),
+        }
+    ]
+    if seconds is not None:
+        completed = started + timedelta(seconds=seconds)
+        lines.append(
+            {
+                "type": "completion",
+                "result": "success",
+                "completed_at": completed.isoformat(),
+            }
+        )
+    path = fly_dir / f"{name}.jsonl"
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+    return path
+
+
+def _count_loads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    loaded: list[Path] = []
+    original = ExecutionLogReader.load.__func__  # type: ignore[attr-defined]
+
+    def _load(cls: type[ExecutionLogReader], path: Path):  # type: ignore[no-untyped-def]
+        loaded.append(path)
+        return original(cls, path)
+
+    monkeypatch.setattr(execution_rollup.ExecutionLogReader, "load", classmethod(_load))
+    return loaded
+
+
+def test_cold_start_rereads_only_changed_logs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    project = _Project(tmp_path)
+    _write_log(project, "wp001-a", 30)
+    _write_log(project, "wp001-b", 12)
+    open_log = _write_log(project, "wp002-a", None)
+
+    assert ExecutionTimeRollup.load(project).total_seconds == 42  # type: ignore[arg-type]
+
+    loaded = _count_loads(monkeypatch)
+    assert ExecutionTimeRollup.load(project).total_seconds == 42  # type: ignore[arg-type]
+    assert loaded == []
+
+    _write_log(project, "wp002-a", 8)
+    rollup = ExecutionTimeRollup.load(project)  # type: ignore[arg-type]
+    assert rollup.total_seconds == 50
+    assert loaded == [open_log]
+
+
+def test_cold_start_drops_deleted_logs(tmp_path: Path) -> None:
+    project = _Project(tmp_path)
+    _write_log(project, "wp001-a", 30)
+    stale = _write_log(project, "wp001-b", 12)
+    ExecutionTimeRollup.load(project)  # type: ignore[arg-type]
+
+    stale.unlink()
+
+    assert ExecutionTimeRollup.load(project).total_seconds == 30  # type: ignore[arg-type]
+
+
+def test_unreadable_rollup_falls_back_to_scanning(tmp_path: Path) -> None:
+    project = _Project(tmp_path)
+    _write_log(project, "wp001-a", 30)
+    rollup = ExecutionTimeRollup(project)  # type: ignore[arg-type]
+    rollup.path.write_text("{not json")
+
+    assert ExecutionTimeRollup.load(project).total_seconds == 30  # type: ignore[arg-type]
+
+
+def test_record_updates_total_and_ignores_other_projects(tmp_path: Path) -> None:
+    project = _Project(tmp_path)
+    _write_log(project, "wp001-a", 30)
+    rollup = ExecutionTimeRollup.load(project)  # type: ignore[arg-type]
+    new_log = _write_log(project, "wp002-a", 5)
+
+    assert (
+        rollup.record(ExecutionCompleted("other", new_log, "WP-002", "success", 99))
+        is False
+    )
+    assert rollup.record(ExecutionCompleted("demo", new_log, "WP-002", "success", 5))
+    assert rollup.total_seconds == 35
+    assert ExecutionTimeRollup.load(project).total_seconds == 35  # type: ignore[arg-type]
+
+
+def test_writer_completion_reaches_projection(tmp_path: Path) -> None:
+    project = _Project(tmp_path)
+    _write_log(project, "wp001-a", 30)
+    projection = ExecutionTimeProjection(project)  # type: ignore[arg-type]
+    assert projection.time_seconds == 30
+
+    events: list[ExecutionCompleted] = []
+    unsubscribe = subscribe_execution_completed(events.append)
+    try:
+        writer = ExecutionLogWriter(
+            project,  # type: ignore[arg-type]
+            Waypoint(id="WP-002", title="Next", objective="Do it"),
+        )
+        writer.started_at -= timedelta(seconds=20)
+        writer.log_completion("success")
+    finally:
+        unsubscribe()
+        projection.close()
+
+    assert [event.waypoint_id for event in events] == ["WP-002"]
+    assert events[0].log_path == writer.file_path
+    assert projection.time_seconds == 50
+
+    writer.log_completion("success")
+    assert projection.time_seconds == 50
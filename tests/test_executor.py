@@ -1,5 +1,6 @@
 """Unit tests for WaypointExecutor."""
 
+import asyncio
 import copy
 import json
 from datetime import datetime
@@ -11,8 +12,8 @@ import pytest
 
 from waypoints.config.settings import settings
 from waypoints.fly.clarification_runtime import extract_clarification_payloads
+from waypoints.fly.evidence import CRITERION_PATTERN
 from waypoints.fly.executor import (
-    CRITERION_PATTERN,
     MAX_CLARIFICATION_ROUNDS,
     ExecutionContext,
     ExecutionResult,
@@ -22,6 +23,8 @@ from waypoints.fly.executor import (
     _extract_file_operation,
 )
 from waypoints.fly.intervention import InterventionNeededError, InterventionType
+from waypoints.fly.protocol import FlyRole, GuidancePacket
+from waypoints.fly.receipt_finalizer import ReceiptFinalizer
 from waypoints.fly.stack import ValidationCommand
 from waypoints.fly.types import _LoopState
 from waypoints.git.config import Checklist
@@ -754,6 +757,69 @@ async def test_execute_resumes_session_and_uses_protocol_nudge(
     assert "<waypoint-complete>WP-1</waypoint-complete>" in calls[1]["prompt"]
 
 
+class _CapturingFinalizer:
+    """Finalize stub that records the criteria handed to it."""
+
+    def __init__(self) -> None:
+        self.kwargs: dict[str, object] = {}
+
+    async def finalize(self, **kwargs: object) -> bool:
+        self.kwargs = kwargs
+        return True
+
+
+@pytest.mark.anyio
+async def test_execute_parses_tags_split_across_stream_chunks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Tags and the completion marker may straddle chunk boundaries."""
+    output = (
+        "<validation><command>pytest -q</command><exit-code>0</exit-code>"
+        "<output>1 passed</output></validation>"
+        "<acceptance-criterion><index>0</index><status>verified</status>"
+        "<text>Criterion 1</text><evidence>test_one</evidence>"
+        "</acceptance-criterion>"
+        "<waypoint-complete>WP-1</waypoint-complete>"
+    )
+
+    async def fake_agent_query(**_: object):
+        for start in range(0, len(output), 7):
+            yield StreamChunk(text=output[start : start + 7])
+        yield StreamComplete(full_text=output)
+
+    finalizer = _CapturingFinalizer()
+    monkeypatch.setattr("waypoints.fly.executor.agent_query", fake_agent_query)
+    monkeypatch.setattr(WaypointExecutor, "_make_finalizer", lambda self: finalizer)
+    monkeypatch.setattr(
+        WaypointExecutor,
+        "_resolve_validation_commands",
+        lambda self, project_path, checklist: [],
+    )
+    progress: list[ExecutionContext] = []
+    waypoint = Waypoint(
+        id="WP-1",
+        title="Split tags",
+        objective="Parse streamed tags incrementally",
+        acceptance_criteria=["Criterion 1"],
+    )
+    executor = WaypointExecutor(
+        project=_TestProject(tmp_path),
+        waypoint=waypoint,
+        spec="spec",
+        on_progress=progress.append,
+    )
+
+    result = await executor.execute()
+
+    assert result == ExecutionResult.SUCCESS
+    captured = finalizer.kwargs["captured_criteria"]
+    assert isinstance(captured, dict)
+    assert captured[0].evidence == "test_one"
+    assert finalizer.kwargs["reported_validation_commands"] == ["pytest -q"]
+    streamed = [ctx for ctx in progress if ctx.step == "streaming"]
+    assert streamed[-1].criteria_completed == {0}
+
+
 @pytest.mark.anyio
 async def test_execute_surfaces_failed_bash_command_in_intervention(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Path
@@ -1302,6 +1368,12 @@ class TestExecutionContext:
         assert ctx.metadata["role"] == "builder"
 
 
+@pytest.fixture
+def anyio_backend() -> str:
+    """The finalizer overlaps work with asyncio tasks and worker threads."""
+    return "asyncio"
+
+
 class DummyLogWriter:
     """Lightweight log writer stub for finalize tests."""
 
@@ -1748,6 +1820,177 @@ async def test_finalize_skips_verifier_when_gate_disabled(
     assert result is True
 
 
+def _speculation_fixture(
+    tmp_path: Path, command: str
+) -> tuple[ReceiptFinalizer, DummyLogWriter, list[ValidationCommand], CapturedEvidence]:
+    project = SimpleNamespace(get_path=lambda: tmp_path)
+    waypoint = Waypoint(
+        id="WP-794",
+        title="Speculative verifier",
+        objective="Overlap verifier with host validation",
+        acceptance_criteria=[],
+    )
+    executor = WaypointExecutor(project=project, waypoint=waypoint, spec="spec")
+    log_writer = DummyLogWriter()
+    executor._log_writer = log_writer
+    builder_evidence = CapturedEvidence(
+        command=command,
+        exit_code=0,
+        stdout="builder evidence",
+        stderr="",
+        captured_at=datetime.now(),
+    )
+    validation_commands = [
+        ValidationCommand(name="tests", command=command, category="test")
+    ]
+    return executor._make_finalizer(), log_writer, validation_commands, builder_evidence
+
+
+@pytest.mark.anyio
+async def test_finalize_starts_verifier_before_host_validation_finishes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    prompts: list[str] = []
+    receipts_at_start: list[int] = []
+
+    async def fake_agent_query(**kwargs: object):
+        prompts.append(str(kwargs["prompt"]))
+        receipts_at_start.append(len(list(tmp_path.glob("receipts/*.json"))))
+        yield StreamChunk(
+            text='<receipt-verdict status="valid">looks good</receipt-verdict>'
+        )
+
+    monkeypatch.setattr("waypoints.fly.receipt_finalizer.agent_query", fake_agent_query)
+    command = "python -c \"import time; time.sleep(0.2); print('host evidence')\""
+    finalizer, log_writer, commands, evidence = _speculation_fixture(tmp_path, command)
+
+    result = await finalizer.finalize(
+        project_path=tmp_path,
+        captured_criteria={},
+        validation_commands=commands,
+        reported_validation_commands=[],
+        tool_validation_categories={"tests": evidence},
+    )
+
+    assert result is True
+    assert receipts_at_start == [0]
+    assert "builder evidence" in prompts[0]
+    assert log_writer.validated is not None
+    receipt_path, valid, reason = log_writer.validated
+    assert receipt_path.endswith(".json") and valid and reason == "looks good"
+
+
+@pytest.mark.anyio
+async def test_finalize_cancels_speculative_verifier_on_host_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cancelled: list[bool] = []
+
+    async def fake_agent_query(**_: object):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        yield StreamChunk(text="unreachable")
+
+    monkeypatch.setattr("waypoints.fly.receipt_finalizer.agent_query", fake_agent_query)
+    command = 'python -c "import sys; sys.exit(3)"'
+    finalizer, log_writer, commands, evidence = _speculation_fixture(tmp_path, command)
+    logged_artifacts: list[object] = []
+    log_writer.log_protocol_artifact = logged_artifacts.append  # type: ignore[attr-defined]
+    packet = GuidancePacket(waypoint_id="WP-794", produced_by_role=FlyRole.ORCHESTRATOR)
+    monkeypatch.setattr(
+        finalizer, "_build_verifier_guidance_packet", lambda _path: packet
+    )
+
+    result = await finalizer.finalize(
+        project_path=tmp_path,
+        captured_criteria={},
+        validation_commands=commands,
+        reported_validation_commands=[],
+        tool_validation_categories={"tests": evidence},
+    )
+
+    assert result is False
+    assert cancelled == [True]
+    assert logged_artifacts == []
+    assert "Host validation failed" in finalizer.last_failure_summary()
+    assert log_writer.validated is not None
+    assert log_writer.validated[1] is False
+
+
+@pytest.mark.anyio
+async def test_finalize_reverifies_final_receipt_when_speculation_errors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    prompts: list[str] = []
+
+    async def fake_agent_query(**kwargs: object):
+        prompts.append(str(kwargs["prompt"]))
+        if len(prompts) == 1:
+            raise RuntimeError("provider unavailable")
+        yield StreamChunk(
+            text='<receipt-verdict status="valid">host looks good</receipt-verdict>'
+        )
+
+    monkeypatch.setattr("waypoints.fly.receipt_finalizer.agent_query", fake_agent_query)
+    command = "python -c \"print('host evidence')\""
+    finalizer, log_writer, commands, evidence = _speculation_fixture(tmp_path, command)
+
+    result = await finalizer.finalize(
+        project_path=tmp_path,
+        captured_criteria={},
+        validation_commands=commands,
+        reported_validation_commands=[],
+        tool_validation_categories={"tests": evidence},
+    )
+
+    assert result is True
+    assert len(prompts) == 2
+    assert "host evidence" in prompts[1]
+    assert log_writer.validated is not None
+    assert log_writer.validated[2] == "host looks good"
+
+
+@pytest.mark.anyio
+async def test_finalize_validates_frozen_snapshot_while_workspace_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    data_file = tmp_path / "data.txt"
+    data_file.write_text("frozen", encoding="utf-8")
+
+    async def fake_agent_query(**_: object):
+        data_file.write_text("edited", encoding="utf-8")
+        yield StreamChunk(
+            text='<receipt-verdict status="valid">looks good</receipt-verdict>'
+        )
+
+    monkeypatch.setattr("waypoints.fly.receipt_finalizer.agent_query", fake_agent_query)
+    command = (
+        "python -c \"import time; time.sleep(0.2); print(open('data.txt').read())\""
+    )
+    finalizer, _, commands, evidence = _speculation_fixture(tmp_path, command)
+    snapshot = copy.deepcopy(settings._data)
+    try:
+        settings._data["fly"] = {"multi_agent": {"isolated_validation": True}}
+        result = await finalizer.finalize(
+            project_path=tmp_path,
+            captured_criteria={},
+            validation_commands=commands,
+            reported_validation_commands=[],
+            tool_validation_categories={"tests": evidence},
+        )
+    finally:
+        settings._data = snapshot
+
+    assert result is True
+    receipt = ChecklistReceipt.load(next(tmp_path.glob("receipts/*.json")))
+    assert receipt.checklist[0].stdout.strip() == "frozen"
+    assert data_file.read_text(encoding="utf-8") == "edited"
+    assert list((tmp_path / ".waypoints" / "snapshots").iterdir()) == []
+
+
 class _ArtifactLogWriter:
     def __init__(self) -> None:
         self.artifacts: list[object] = []
@@ -1770,7 +2013,7 @@ def test_extract_clarification_payloads_parses_structured_tags(tmp_path: Path) -
     assert payloads[0]["question"] == "Which config file is canonical?"
 
 
-def test_handle_clarification_requests_logs_request_and_response(
+def test_streamed_clarification_request_logs_request_and_response(
     tmp_path: Path,
 ) -> None:
     project = SimpleNamespace(get_path=lambda: tmp_path)
@@ -1785,21 +2028,21 @@ def test_handle_clarification_requests_logs_request_and_response(
     executor._log_writer = log_writer
 
     loop_state = _LoopState(
-        full_output=(
+        output_chunks=[
             "<clarification-request>"
             '{"question":"Need direction","confidence":0.2}'
             "</clarification-request>"
-        )
+        ]
     )
 
-    executor._handle_clarification_requests(loop_state)
+    executor._consume_protocol_tags(loop_state)
 
     assert loop_state.clarification_rounds == 1
     assert loop_state.unresolved_clarification is False
     assert len(log_writer.artifacts) == 2
 
 
-def test_handle_clarification_requests_marks_exhaustion(tmp_path: Path) -> None:
+def test_streamed_clarification_request_marks_exhaustion(tmp_path: Path) -> None:
     project = SimpleNamespace(get_path=lambda: tmp_path)
     waypoint = Waypoint(
         id="WP-882",
@@ -1813,14 +2056,14 @@ def test_handle_clarification_requests_marks_exhaustion(tmp_path: Path) -> None:
 
     loop_state = _LoopState(
         clarification_rounds=MAX_CLARIFICATION_ROUNDS,
-        full_output=(
+        output_chunks=[
             "<clarification-request>"
             '{"question":"Need direction","confidence":0.2}'
             "</clarification-request>"
-        ),
+        ],
     )
 
-    executor._handle_clarification_requests(loop_state)
+    executor._consume_protocol_tags(loop_state)
 
     assert loop_state.clarification_exhausted is True
     assert loop_state.unresolved_clarification is True
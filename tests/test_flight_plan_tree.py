@@ -0,0 +1,97 @@
+"""Tests for diff-based FlightPlanTree updates."""
+
+from __future__ import annotations
+
+import pytest
+from textual.app import App, ComposeResult
+
+from waypoints.models.flight_plan import FlightPlan
+from waypoints.models.waypoint import Waypoint, WaypointStatus
+from waypoints.tui.widgets.flight_plan_tree import FlightPlanTree
+
+
+class _TreeApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield FlightPlanTree(id="tree")
+
+
+def _plan(*waypoints: Waypoint) -> FlightPlan:
+    return FlightPlan(waypoints=list(waypoints))
+
+
+def _ids(tree: FlightPlanTree) -> list[tuple[int, str]]:
+    rows: list[tuple[int, str]] = []
+
+    def walk(node: object, depth: int) -> None:
+        for child in node.children:  # type: ignore[attr-defined]
+            rows.append((depth, child.data.id))
+            walk(child, depth + 1)
+
+    walk(tree.root, 0)
+    return rows
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_status_change_relabels_in_place_and_keeps_state() -> None:
+    epic = Waypoint(id="WP-1", title="Epic", objective="o")
+    child_a = Waypoint(id="WP-1a", title="A", objective="o", parent_id="WP-1")
+    child_b = Waypoint(id="WP-1b", title="B", objective="o", parent_id="WP-1")
+    other = Waypoint(id="WP-2", title="Other", objective="o")
+    plan = _plan(epic, child_a, child_b, other)
+
+    async with _TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(FlightPlanTree)
+        tree.update_flight_plan(plan)
+        await pilot.pause()
+        nodes_before = dict(tree._waypoint_nodes)
+        tree.move_cursor(nodes_before["WP-2"])
+        nodes_before["WP-1"].collapse()
+
+        child_a.status = WaypointStatus.COMPLETE
+        tree.update_flight_plan(plan, {"WP-1a": 0.5})
+        await pilot.pause()
+
+        assert tree._waypoint_nodes == nodes_before
+        assert not nodes_before["WP-1"].is_expanded
+        assert tree.cursor_node is nodes_before["WP-2"]
+        assert "(1/2)" in str(nodes_before["WP-1"].label)
+        assert "[$0.50]" in str(nodes_before["WP-1a"].label)
+
+
+@pytest.mark.anyio
+async def test_insert_remove_and_move_apply_minimal_changes() -> None:
+    first = Waypoint(id="WP-1", title="First", objective="o")
+    second = Waypoint(id="WP-2", title="Second", objective="o")
+    third = Waypoint(id="WP-3", title="Third", objective="o")
+
+    async with _TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(FlightPlanTree)
+        tree.update_flight_plan(_plan(first, second, third))
+        await pilot.pause()
+        kept = tree._waypoint_nodes["WP-1"]
+
+        moved = Waypoint(id="WP-3", title="Third", objective="o", parent_id="WP-1")
+        inserted = Waypoint(id="WP-0", title="Zero", objective="o")
+        tree.update_flight_plan(_plan(inserted, first, moved))
+        await pilot.pause()
+
+        assert _ids(tree) == [(0, "WP-0"), (0, "WP-1"), (1, "WP-3")]
+        assert tree._waypoint_nodes["WP-1"] is kept
+        assert kept.allow_expand
+        assert "WP-2" not in tree._waypoint_nodes
+        assert "◇" in str(kept.label)
+        before = dict(tree._waypoint_nodes)
+
+        tree.update_flight_plan(_plan(first, inserted))
+        await pilot.pause()
+
+        assert _ids(tree) == [(0, "WP-1"), (0, "WP-0")]
+        assert tree._waypoint_nodes["WP-0"] is before["WP-0"]
+        leaf = tree._waypoint_nodes["WP-1"]
+        assert not leaf.allow_expand
+        assert "○ WP-1" in str(leaf.label)
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from waypoints.flight_tests import runner as runner_module
+from waypoints.flight_tests.result_cache import FlightTestResultCache
 from waypoints.flight_tests.runner import (
     FlightTestCase,
+    FlightTestResult,
     FlightTestStatus,
     discover_flight_tests,
     execute_flight_tests,
     parse_level_selector,
     validate_flight_test_case,
 )
+from waypoints.runtime.timeout_history import TimeoutHistory
 
 
 def _write(path: Path, content: str) -> None:
@@ -97,3 +102,116 @@ def test_execute_flight_tests_runs_smoke_test(tmp_path: Path) -> None:
     assert len(results) == 1
     assert results[0].status == FlightTestStatus.PASSED
     assert results[0].return_code == 0
+
+
+def _make_case(
+    suite_root: Path, generated_root: Path, case_id: str, script: str
+) -> FlightTestCase:
+    case_path = suite_root / case_id
+    _write(case_path / "input" / "idea.txt", "hello")
+    _write(case_path / "expected" / "smoke_test.sh", script)
+    (generated_root / case_id).mkdir(parents=True, exist_ok=True)
+    return next(c for c in discover_flight_tests(suite_root) if c.case_id == case_id)
+
+
+def test_execute_flight_tests_parallel_isolates_tmpdir_and_keeps_order(
+    tmp_path: Path,
+) -> None:
+    suite_root = tmp_path / "suite"
+    generated_root = tmp_path / "generated"
+    script = (
+        "#!/usr/bin/env bash\n"
+        'test "$TMPDIR" = "$WAYPOINTS_FLIGHT_TEST_TMPDIR" || exit 3\n'
+        'test -z "$(ls -A "$TMPDIR")" || exit 4\n'
+        'touch "$TMPDIR/marker"\n'
+        "sleep 0.2\n"
+    )
+    cases = [
+        _make_case(suite_root, generated_root, case_id, script)
+        for case_id in ("L0-alpha", "L0-beta", "L1-gamma")
+    ]
+
+    results = execute_flight_tests(
+        cases,
+        generated_projects_root=generated_root,
+        execute=True,
+        timeout_seconds=10,
+        jobs=3,
+        timeout_history=TimeoutHistory(),
+    )
+
+    assert [result.case.case_id for result in results] == [
+        "L0-alpha",
+        "L0-beta",
+        "L1-gamma",
+    ]
+    assert [result.status for result in results] == [FlightTestStatus.PASSED] * 3
+    assert all(result.duration_seconds for result in results)
+
+
+def test_execute_flight_tests_orders_longest_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    suite_root = tmp_path / "suite"
+    generated_root = tmp_path / "generated"
+    script = "#!/usr/bin/env bash\nexit 0\n"
+    fast = _make_case(suite_root, generated_root, "L0-fast", script)
+    slow = _make_case(suite_root, generated_root, "L0-slow", script)
+    new = _make_case(suite_root, generated_root, "L0-new", script)
+    history = TimeoutHistory()
+    for case, duration in ((fast, 1.0), (slow, 30.0)):
+        history.record(
+            runner_module._smoke_test_key(case, generated_root / case.case_id),
+            duration,
+            False,
+        )
+
+    started: list[str] = []
+    original = runner_module._run_smoke_test
+
+    def _recording_run(case: FlightTestCase, **kwargs: Any) -> FlightTestResult:
+        started.append(case.case_id)
+        return original(case, **kwargs)
+
+    monkeypatch.setattr(runner_module, "_run_smoke_test", _recording_run)
+
+    execute_flight_tests(
+        [fast, slow, new],
+        generated_projects_root=generated_root,
+        execute=True,
+        timeout_seconds=10,
+        timeout_history=history,
+    )
+
+    assert started == ["L0-new", "L0-slow", "L0-fast"]
+
+
+def test_execute_flight_tests_skips_unchanged_passing_cases(tmp_path: Path) -> None:
+    suite_root = tmp_path / "suite"
+    generated_root = tmp_path / "generated"
+    case = _make_case(
+        suite_root,
+        generated_root,
+        "L0-hello-world",
+        '#!/usr/bin/env bash\necho run >> "$WAYPOINTS_FLIGHT_TEST_PROJECT/../runs"\n',
+    )
+    cache_path = tmp_path / "cache.json"
+
+    def _run() -> FlightTestStatus:
+        results = execute_flight_tests(
+            [case],
+            generated_projects_root=generated_root,
+            execute=True,
+            timeout_seconds=10,
+            result_cache=FlightTestResultCache(cache_path),
+            timeout_history=TimeoutHistory(),
+        )
+        return results[0].status
+
+    assert _run() == FlightTestStatus.PASSED
+    assert _run() == FlightTestStatus.SKIPPED
+    assert (generated_root / "runs").read_text().count("run") == 1
+
+    _write(generated_root / case.case_id / "main.py", "print('changed')\n")
+    assert _run() == FlightTestStatus.PASSED
+    assert (generated_root / "runs").read_text().count("run") == 2
@@ -33,7 +33,7 @@ class _GitStub:
         commit_success: bool = True,
         commit_message: str = "ok",
         reset_success: bool = True,
-        head_commit: str | None = "deadbeef",
+        head_commit: str | None = "deadbeef0123",
     ) -> None:
         self._is_repo = is_repo
         self._commit_success = commit_success
@@ -41,7 +41,6 @@ class _GitStub:
         self._reset_success = reset_success
         self._head_commit = head_commit
         self.init_calls = 0
-        self.stage_calls: list[str] = []
         self.commit_calls: list[str] = []
         self.tag_calls: list[tuple[str, str]] = []
         self.reset_calls: list[str] = []
@@ -54,22 +53,25 @@ class _GitStub:
         self._is_repo = True
         return SimpleNamespace(success=True, message="init ok")
 
-    def stage_project_files(self, slug: str) -> None:
-        self.stage_calls.append(slug)
-
-    def commit(self, message: str) -> SimpleNamespace:
+    def commit_all(
+        self,
+        message: str,
+        *,
+        tag_name: str | None = None,
+        tag_message: str | None = None,
+    ) -> SimpleNamespace:
         self.commit_calls.append(message)
+        if self._commit_success and tag_name:
+            self.tag_calls.append((tag_name, tag_message or tag_name))
         return SimpleNamespace(
             success=self._commit_success,
             message=self._commit_message,
+            commit_hash=self._head_commit if self._commit_success else None,
         )
 
     def get_head_commit(self) -> str | None:
         return self._head_commit
 
-    def tag(self, name: str, message: str) -> None:
-        self.tag_calls.append((name, message))
-
     def reset_hard(self, tag: str) -> SimpleNamespace:
         self.reset_calls.append(tag)
         return SimpleNamespace(success=self._reset_success, message="reset")
@@ -88,7 +90,6 @@ def test_commit_waypoint_respects_auto_commit_disabled(tmp_path: Path) -> None:
 
     assert result.committed is False
     assert result.message == "Auto-commit disabled"
-    assert git.stage_calls == []
     assert git.commit_calls == []
 
 
@@ -116,7 +117,7 @@ def test_commit_waypoint_creates_tag_when_enabled(tmp_path: Path) -> None:
     result = commit_waypoint(project, _waypoint(), git_config=config, git_service=git)
 
     assert result.committed is True
-    assert result.commit_hash == "deadbeef"
+    assert result.commit_hash == "deadbee"
     assert result.tag_name == "demo/WP-101"
     assert git.tag_calls == [("demo/WP-101", "Completed waypoint: Ship it")]
 
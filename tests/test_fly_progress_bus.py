@@ -0,0 +1,145 @@
+"""Tests for the Fly screen progress bus."""
+
+from __future__ import annotations
+
+import pytest
+
+from waypoints.fly.executor import ExecutionContext
+from waypoints.models.waypoint import Waypoint
+from waypoints.tui.screens.fly_progress_bus import ProgressBus
+
+WAYPOINT = Waypoint(id="WP-1", title="Bus", objective="Coalesce progress")
+
+
+def _context(
+    step: str,
+    output: str = "",
+    *,
+    iteration: int = 1,
+    criteria_completed: set[int] | None = None,
+    metadata: dict[str, object] | None = None,
+) -> ExecutionContext:
+    return ExecutionContext(
+        waypoint=WAYPOINT,
+        iteration=iteration,
+        total_iterations=10,
+        step=step,
+        output=output,
+        criteria_completed=criteria_completed or set(),
+        metadata=metadata or {},
+    )
+
+
+def _metrics(**fields: object) -> ExecutionContext:
+    payload: dict[str, object] = {"role": "builder", "waypoint_id": "WP-1"}
+    payload.update(fields)
+    return _context("metrics_updated", metadata={"metrics": payload})
+
+
+def test_publish_requests_one_flush_per_frame() -> None:
+    bus = ProgressBus()
+
+    assert bus.publish(_context("executing")) is True
+    assert bus.publish(_context("tool_use", "Read: a.py")) is False
+    assert [ctx.step for ctx in bus.drain()] == ["executing", "tool_use"]
+    assert bus.publish(_context("stage", "plan")) is True
+
+
+def test_adjacent_streaming_updates_merge_text() -> None:
+    bus = ProgressBus()
+
+    bus.publish(_context("streaming", "Hel"))
+    bus.publish(_context("streaming", "lo", criteria_completed={0}))
+    bus.publish(_context("tool_use", "Bash: ls"))
+    bus.publish(_context("streaming", " world"))
+    bus.publish(_context("streaming", "!", iteration=2))
+
+    delivered = bus.drain()
+
+    assert [(ctx.step, ctx.output) for ctx in delivered] == [
+        ("streaming", "Hello"),
+        ("tool_use", "Bash: ls"),
+        ("streaming", " world"),
+        ("streaming", "!"),
+    ]
+    assert delivered[0].criteria_completed == {0}
+    assert bus.stats.merged_text == 1
+    assert bus.stats.published == 5
+    assert bus.stats.delivered == 4
+
+
+def test_cumulative_metrics_snapshots_supersede_older_ones() -> None:
+    bus = ProgressBus()
+
+    bus.publish(_metrics(delta_cost_usd=0.1, waypoint_cost_usd=0.1))
+    bus.publish(_context("streaming", "text"))
+    bus.publish(_metrics(delta_cost_usd=0.2, waypoint_cost_usd=0.3))
+    bus.publish(_metrics(delta_cost_usd=0.05))
+    bus.publish(_metrics(role="verifier", waypoint_cost_usd=0.4))
+
+    delivered = bus.drain()
+
+    costs = [
+        ctx.metadata["metrics"] for ctx in delivered if ctx.step == "metrics_updated"
+    ]
+    assert costs == [
+        {
+            "role": "builder",
+            "waypoint_id": "WP-1",
+            "delta_cost_usd": pytest.approx(0.3),
+            "waypoint_cost_usd": 0.3,
+        },
+        {"role": "builder", "waypoint_id": "WP-1", "delta_cost_usd": 0.05},
+        {"role": "verifier", "waypoint_id": "WP-1", "waypoint_cost_usd": 0.4},
+    ]
+    assert bus.stats.dropped_metrics == 1
+    assert bus.stats.coalesced == 1
+
+
+def test_superseded_metrics_keep_deltas_for_missing_project_totals() -> None:
+    """Without a metrics collector project totals come from deltas alone."""
+    bus = ProgressBus()
+
+    bus.publish(
+        _metrics(
+            delta_cost_usd=0.1,
+            delta_tokens_in=100,
+            waypoint_cost_usd=0.1,
+            waypoint_tokens_in=100,
+            tokens_known=True,
+        )
+    )
+    bus.publish(
+        _metrics(
+            delta_cost_usd=0.2,
+            delta_tokens_in=50,
+            waypoint_cost_usd=0.3,
+            waypoint_tokens_in=150,
+        )
+    )
+
+    (delivered,) = bus.drain()
+
+    payload = delivered.metadata["metrics"]
+    assert isinstance(payload, dict)
+    assert payload["delta_cost_usd"] == pytest.approx(0.3)
+    assert payload["delta_tokens_in"] == 150
+    assert payload["waypoint_tokens_in"] == 150
+    assert payload["tokens_known"] is True
+    assert payload.get("project_cost_usd") is None
+    assert bus.stats.dropped_metrics == 1
+
+
+def test_flush_delay_enforces_max_rate() -> None:
+    now = [100.0]
+    bus = ProgressBus(max_rate_hz=10.0, clock=lambda: now[0])
+
+    assert bus.flush_delay() == 0.0
+    bus.publish(_context("executing"))
+    bus.drain()
+    now[0] += 0.04
+
+    assert abs(bus.flush_delay() - 0.06) < 1e-9
+    now[0] += 0.1
+    assert bus.flush_delay() == 0.0
+    assert bus.stats.flushes == 1
@@ -0,0 +1,143 @@
+"""Tests for the shared filesystem watcher and change journal."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from waypoints.runtime import fs_watcher
+from waypoints.runtime.fs_watcher import (
+    ChangeJournal,
+    WatcherBackendName,
+    WorkspaceWatcher,
+    get_workspace_watcher,
+)
+
+
+@pytest.fixture(params=["inotify", "poll"])
+def watcher(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Iterator[WorkspaceWatcher]:
+    backend: WatcherBackendName = request.param
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("a = 1\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "refs").mkdir()
+    try:
+        instance = WorkspaceWatcher(tmp_path, backend=backend)
+    except OSError:
+        pytest.skip("inotify unavailable")
+    yield instance
+    instance.close()
+
+
+def test_journal_coalesces_per_path_and_answers_since() -> None:
+    journal = ChangeJournal()
+    first = journal.record("a.py", "created")
+    journal.record("b.py", "created")
+    journal.record("a.py", "modified")
+    journal.record("c.py", "deleted")
+    journal.record("c.py", "created")
+
+    everything = journal.since(0)
+    assert [(c.path, c.kind) for c in everything.changes] == [
+        ("b.py", "created"),
+        ("a.py", "created"),
+        ("c.py", "modified"),
+    ]
+    assert journal.since(first).paths == {"a.py", "b.py", "c.py"}
+    assert not journal.since(journal.seq)
+
+
+def test_journal_reports_incomplete_after_eviction_or_loss() -> None:
+    journal = ChangeJournal(max_paths=2)
+    journal.record("a.py", "created")
+    journal.record("b.py", "created")
+    journal.record("c.py", "created")
+
+    assert journal.since(0).complete is False
+    assert journal.since(1).complete is True
+
+    seq = journal.seq
+    journal.mark_lost()
+    lost = journal.since(seq)
+    assert lost.complete is False
+    assert bool(lost) is True
+    assert journal.since(journal.seq).complete is True
+
+
+def test_watcher_records_file_changes(
+    watcher: WorkspaceWatcher, tmp_path: Path
+) -> None:
+    start = watcher.seq
+
+    (tmp_path / "src" / "app.py").write_text("a = 22\n")
+    (tmp_path / "README.md").write_text("hi\n")
+    (tmp_path / "node_modules" / "dep.js").write_text("ignored\n")
+
+    changes = watcher.changes_since(start)
+    kinds = {change.path: change.kind for change in changes.changes}
+    assert changes.complete
+    assert kinds["src/app.py"] == "modified"
+    assert kinds["README.md"] == "created"
+    assert "node_modules/dep.js" not in kinds
+    assert not watcher.changes_since(changes.seq)
+
+
+def test_watcher_sees_files_in_new_directories(
+    watcher: WorkspaceWatcher, tmp_path: Path
+) -> None:
+    start = watcher.seq
+
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (nested / "mod.py").write_text("m = 1\n")
+    first = watcher.changes_since(start)
+    (nested / "mod.py").write_text("m = 22\n")
+    second = watcher.changes_since(first.seq)
+
+    assert "pkg/sub/mod.py" in first.paths
+    assert second.paths == {"pkg/sub/mod.py"}
+
+
+def test_watcher_tracks_git_metadata_shallowly(
+    watcher: WorkspaceWatcher, tmp_path: Path
+) -> None:
+    start = watcher.seq
+
+    (tmp_path / ".git" / "index").write_text("index\n")
+    (tmp_path / ".git" / "refs" / "main").write_text("ref\n")
+
+    assert watcher.changes_since(start).paths == {".git/index"}
+
+
+def test_watcher_records_deletions(watcher: WorkspaceWatcher, tmp_path: Path) -> None:
+    start = watcher.seq
+    (tmp_path / "src" / "app.py").unlink()
+
+    changes = watcher.changes_since(start)
+
+    assert [(c.path, c.kind) for c in changes.changes] == [("src/app.py", "deleted")]
+
+
+def test_shared_watchers_evict_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fs_watcher.close_workspace_watchers()
+    monkeypatch.setattr(fs_watcher, "MAX_SHARED_WATCHERS", 2)
+    roots = [tmp_path / name for name in ("a", "b", "c")]
+    for root in roots:
+        root.mkdir()
+
+    first = get_workspace_watcher(roots[0])
+    assert first is not None
+    assert get_workspace_watcher(roots[0]) is first
+    get_workspace_watcher(roots[1])
+    get_workspace_watcher(roots[2])
+
+    assert first.changes_since(first.seq).complete is False
+    assert get_workspace_watcher(tmp_path / "missing") is None
+    fs_watcher.close_workspace_watchers()
@@ -646,3 +646,67 @@ def test_import_from_bundle_checksum_mismatch(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="Checksum mismatch"):
         import_from_file(tampered_path)
+
+
+def _build_multi_step_spec(step_count: int) -> GenerativeSpec:
+    spec = GenerativeSpec(
+        version="1.0",
+        waypoints_version="0.1.0",
+        source_project="lazy-import",
+        created_at=datetime.now(),
+        initial_idea="Idea",
+    )
+    spec.steps = [
+        GenerativeStep(
+            step_id=f"step-{index:03d}",
+            phase=Phase.FLY,
+            timestamp=datetime.now(),
+            input=StepInput(user_prompt=f"prompt {index}"),
+            output=StepOutput(content=f"output {index}", output_type=OutputType.TEXT),
+        )
+        for index in range(1, step_count + 1)
+    ]
+    spec.artifacts = [Artifact(artifact_type=ArtifactType.IDEA_BRIEF, content="Brief")]
+    return spec
+
+
+@pytest.mark.parametrize("bundle", [False, True])
+def test_iter_steps_streams_steps_in_order(tmp_path: Path, bundle: bool) -> None:
+    """Steps can be iterated lazily from JSONL files and bundles."""
+    from waypoints.genspec.exporter import export_bundle, export_to_file
+    from waypoints.genspec.importer import iter_steps
+
+    spec = _build_multi_step_spec(5)
+    path = tmp_path / ("spec.genspec.zip" if bundle else "spec.genspec.jsonl")
+    if bundle:
+        export_bundle(spec, path)
+    else:
+        export_to_file(spec, path)
+
+    steps = iter_steps(path)
+
+    assert next(steps).step_id == "step-001"
+    assert [step.step_id for step in steps] == [
+        "step-002",
+        "step-003",
+        "step-004",
+        "step-005",
+    ]
+
+
+def test_import_outline_counts_steps_without_parsing(tmp_path: Path) -> None:
+    """Outline import keeps header and artifacts but only counts steps."""
+    from waypoints.genspec.exporter import export_bundle
+    from waypoints.genspec.importer import import_from_file, import_outline
+
+    path = tmp_path / "spec.genspec.zip"
+    export_bundle(_build_multi_step_spec(3), path)
+
+    outline = import_outline(path)
+    without_steps = import_from_file(path, include_steps=False)
+
+    assert outline.step_count == 3
+    assert outline.spec.steps == []
+    assert outline.spec.get_artifact(ArtifactType.IDEA_BRIEF) is not None
+    assert without_steps.steps == []
+    assert without_steps.source_project == "lazy-import"
@@ -7,7 +7,11 @@ import zipfile
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
+from waypoints.genspec import exporter
 from waypoints.genspec.exporter import export_bundle
+from waypoints.genspec.importer import import_from_file
 from waypoints.genspec.spec import (
     Artifact,
     ArtifactType,
@@ -150,3 +154,68 @@ def test_cli_export_bundle(tmp_path: Path) -> None:
 
     assert cmd_export(args) == 0
     assert output_path.exists()
+
+
+def test_export_bundle_compress_level_is_configurable(tmp_path: Path) -> None:
+    spec = _build_spec()
+    spec.steps[0].output = StepOutput(content="x" * 20000, output_type=OutputType.TEXT)
+    stored = tmp_path / "stored.zip"
+    deflated = tmp_path / "deflated.zip"
+
+    export_bundle(spec, stored, compresslevel=0)
+    export_bundle(spec, deflated, compresslevel=9)
+
+    assert deflated.stat().st_size < stored.stat().st_size
+    with zipfile.ZipFile(stored) as archive:
+        checksums = json.loads(archive.read("checksums.json").decode("utf-8"))
+        genspec_hash = hashlib.sha256(archive.read("genspec.jsonl")).hexdigest()
+    assert checksums["files"]["genspec.jsonl"] == genspec_hash
+
+
+def test_export_bundle_output_does_not_depend_on_chunking(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = _build_spec()
+    spec.steps[0].output = StepOutput(content="x" * 20000, output_type=OutputType.TEXT)
+    whole = tmp_path / "whole.zip"
+    chunked = tmp_path / "chunked.zip"
+
+    export_bundle(spec, whole)
+    monkeypatch.setattr(exporter, "_BUNDLE_CHUNK_BYTES", 64)
+    export_bundle(spec, chunked)
+
+    assert chunked.read_bytes() == whole.read_bytes()
+    with zipfile.ZipFile(chunked) as archive:
+        checksums = json.loads(archive.read("checksums.json").decode("utf-8"))
+        genspec_hash = hashlib.sha256(archive.read("genspec.jsonl")).hexdigest()
+    assert checksums["files"]["genspec.jsonl"] == genspec_hash
+
+
+def test_zstd_bundle_round_trips(tmp_path: Path) -> None:
+    if not hasattr(zipfile, "ZIP_ZSTANDARD"):
+        pytest.skip("zipfile lacks Zstandard support")
+    bundle_path = tmp_path / "bundle.zip"
+
+    export_bundle(_build_spec(), bundle_path, compression="zstd")
+
+    with zipfile.ZipFile(bundle_path) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {
+            zipfile.ZIP_ZSTANDARD
+        }
+    assert import_from_file(bundle_path).source_project == "demo-project"
+
+
+def test_import_rejects_tampered_artifact(tmp_path: Path) -> None:
+    original_path = tmp_path / "bundle.zip"
+    export_bundle(_build_spec(), original_path)
+    with zipfile.ZipFile(original_path) as original:
+        entries = {name: original.read(name) for name in original.namelist()}
+    entries["artifacts/idea-brief.md"] = b"# Rewritten\n"
+
+    tampered_path = tmp_path / "tampered.zip"
+    with zipfile.ZipFile(tampered_path, mode="w") as tampered:
+        for name, content in entries.items():
+            tampered.writestr(name, content)
+
+    with pytest.raises(ValueError, match="Checksum mismatch for artifacts/idea-brief"):
+        import_from_file(tampered_path)
@@ -0,0 +1,102 @@
+"""Tests for incremental genspec export via the per-source step cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from waypoints.config.settings import settings
+from waypoints.fly.execution_log import ExecutionLogWriter
+from waypoints.genspec import exporter
+from waypoints.genspec.exporter import export_project
+from waypoints.genspec.spec import GenerativeSpec
+from waypoints.models.dialogue import Message, MessageRole
+from waypoints.models.project import Project
+from waypoints.models.session import SessionWriter
+from waypoints.models.waypoint import Waypoint
+
+
+def _steps(spec: GenerativeSpec) -> list[dict[str, object]]:
+    return [step.to_dict() for step in spec.steps]
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Project:
+    settings.project_directory = tmp_path
+    project = Project.create("Export Cache", idea="A habit tracker")
+    sessions = project.get_sessions_path()
+    qa = SessionWriter(
+        project, "ideation", "s1", file_path=sessions / "ideation-20260101-000000.jsonl"
+    )
+    for role, content in [
+        (MessageRole.USER, "A habit tracker"),
+        (MessageRole.ASSISTANT, "Who is it for?"),
+        (MessageRole.USER, "Students"),
+        (MessageRole.ASSISTANT, "What platforms?"),
+    ]:
+        qa.append_message(Message(role=role, content=content))
+    brief = SessionWriter(
+        project,
+        "idea-brief",
+        "s2",
+        file_path=sessions / "idea-brief-20260101-000100.jsonl",
+    )
+    brief.append_message(Message(role=MessageRole.USER, content="Write the brief"))
+    brief.append_message(Message(role=MessageRole.ASSISTANT, content="# Brief"))
+
+    for wp_id in ("WP-001", "WP-002"):
+        log = ExecutionLogWriter(
+            project, Waypoint(id=wp_id, title=f"Build {wp_id}", objective="Build")
+        )
+        log.log_iteration_start(1, f"Implement {wp_id}")
+        log.log_iteration_start(2, f"Fix {wp_id}")
+    return project
+
+
+def test_second_export_reuses_every_source(
+    project: Project, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = export_project(project)
+
+    def _no_parse(*_: object) -> None:
+        raise AssertionError("unchanged sources should come from the cache")
+
+    monkeypatch.setattr(exporter, "_convert_session_file", _no_parse)
+    monkeypatch.setattr(exporter, "_convert_fly_log", _no_parse)
+    second = export_project(project)
+
+    assert _steps(second) == _steps(first)
+    assert [s.step_id for s in second.steps] == [f"step-{n:03d}" for n in range(1, 9)]
+
+
+def test_changed_log_is_reconverted_and_renumbered(project: Project) -> None:
+    export_project(project)
+    fly_logs = sorted((project.get_sessions_path() / "fly").glob("*.jsonl"))
+    with fly_logs[0].open("a", encoding="utf-8") as handle:
+        handle.write(
+            '{"type": "iteration_start", "iteration": 3, "prompt": "Retry", '
+            '"timestamp": "2026-01-01T00:10:00+00:00"}\n'
+        )
+
+    cached = export_project(project)
+
+    assert _steps(cached) == _steps(export_project(project, use_cache=False))
+    assert [s.input.user_prompt for s in cached.steps[-5:]] == [
+        "Implement WP-001",
+        "Fix WP-001",
+        "Retry",
+        "Implement WP-002",
+        "Fix WP-002",
+    ]
+
+
+def test_cache_entries_of_deleted_sources_are_pruned(project: Project) -> None:
+    export_project(project)
+    cache_dir = project.get_path() / ".waypoints" / "export-cache"
+    assert len(list(cache_dir.glob("*.json"))) == 4
+
+    next((project.get_sessions_path() / "fly").glob("wp002-*.jsonl")).unlink()
+    export_project(project)
+
+    assert len(list(cache_dir.glob("*.json"))) == 3
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from waypoints.genspec.exporter import export_bundle, export_to_file
+from waypoints.genspec.index import (
+    build_genspec_index,
+    index_path_for,
+    load_genspec_index,
+)
+from waypoints.genspec.spec import (
+    Artifact,
+    ArtifactType,
+    GenerativeSpec,
+    GenerativeStep,
+    OutputType,
+    Phase,
+    StepInput,
+    StepMetadata,
+    StepOutput,
+)
+
+
+def _build_spec() -> GenerativeSpec:
+    created_at = datetime(2026, 1, 19, 23, 52, 10)
+    spec = GenerativeSpec(
+        version="1.0",
+        waypoints_version="0.1.0",
+        source_project="index-project",
+        created_at=created_at,
+        initial_idea="Index idea",
+    )
+    spec.steps.append(
+        GenerativeStep(
+            step_id="step-001",
+            phase=Phase.SHAPE_QA,
+            timestamp=created_at,
+            input=StepInput(user_prompt="Qu’est-ce que c’est ?"),
+            output=StepOutput(content="Un visualiseur ✓", output_type=OutputType.TEXT),
+            metadata=StepMetadata(cost_usd=0.25, tokens_in=100, tokens_out=50),
+        )
+    )
+    for iteration in (1, 2):
+        spec.steps.append(
+            GenerativeStep(
+                step_id=f"fly-{iteration}",
+                phase=Phase.FLY,
+                timestamp=created_at,
+                input=StepInput(
+                    user_prompt=f"Build WP-001 attempt {iteration}",
+                    context={
+                        "waypoint_id": "WP-001",
+                        "iteration": iteration,
+                        "iteration_reason": "retry",
+                        "large": "x" * 1000,
+                    },
+                ),
+                output=StepOutput(
+                    content=f"done {iteration}", output_type=OutputType.TEXT
+                ),
+            )
+        )
+    spec.artifacts.append(
+        Artifact(
+            artifact_type=ArtifactType.IDEA_BRIEF,
+            content="# Brief\n",
+            file_path="docs/idea-brief.md",
+            timestamp=created_at,
+        )
+    )
+    return spec
+
+
+def _write(spec: GenerativeSpec, tmp_path: Path, bundle: bool) -> Path:
+    path = tmp_path / ("spec.genspec.zip" if bundle else "spec.genspec.jsonl")
+    if bundle:
+        export_bundle(spec, path)
+    else:
+        export_to_file(spec, path)
+    return path
+
+
+@pytest.mark.parametrize("bundle", [False, True])
+def test_index_loads_steps_by_offset(tmp_path: Path, bundle: bool) -> None:
+    spec = _build_spec()
+    path = _write(spec, tmp_path, bundle)
+
+    index = build_genspec_index(path)
+
+    assert index.header.source_project == "index-project"
+    assert index.phase_counts() == {"shape_qa": 1, "fly": 2}
+    assert index.member == ("genspec.jsonl" if bundle else None)
+    first = index.steps[0]
+    assert first.cost_usd == 0.25
+    assert index.load_step(first) == spec.steps[0]
+    fly_entries = index.steps_by_phase(Phase.FLY)
+    assert fly_entries[1].context == {
+        "waypoint_id": "WP-001",
+        "iteration": 2,
+        "iteration_reason": "retry",
+    }
+    assert index.load_step(fly_entries[1]).step_id == "fly-2"
+    artifact = index.load_artifact(index.artifacts[0])
+    assert artifact.content == "# Brief\n"
+    assert index.artifacts[0].chars == len("# Brief\n")
+
+
+def test_bundle_member_is_extracted_once_for_paging(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = _build_spec()
+    index = build_genspec_index(_write(spec, tmp_path, bundle=True))
+    opened: list[str] = []
+    real_open = zipfile.ZipFile.open
+
+    def _counting_open(
+        self: zipfile.ZipFile, name: str, *args: Any, **kwargs: Any
+    ) -> IO[bytes]:
+        opened.append(name)
+        return real_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", _counting_open)
+    loaded = [index.load_step(entry).step_id for entry in reversed(index.steps)]
+    index.load_artifact(index.artifacts[0])
+
+    assert loaded == [step.step_id for step in reversed(spec.steps)]
+    assert opened == ["genspec.jsonl"]
+
+
+def test_index_cache_is_reused_until_source_changes(tmp_path: Path) -> None:
+    spec = _build_spec()
+    path = _write(spec, tmp_path, bundle=False)
+
+    first = load_genspec_index(path)
+    cache_path = index_path_for(path)
+    assert cache_path.exists()
+
+    cached = load_genspec_index(path)
+    assert [entry.to_dict() for entry in cached.steps] == [
+        entry.to_dict() for entry in first.steps
+    ]
+    assert cached.load_step(cached.steps[0]) == spec.steps[0]
+
+    spec.steps = spec.steps[:1]
+    export_to_file(spec, path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    rebuilt = load_genspec_index(path)
+    assert len(rebuilt.steps) == 1
+
+
+def test_index_rejects_non_genspec(tmp_path: Path) -> None:
+    path = tmp_path / "other.jsonl"
+    path.write_text('{"_schema": "other"}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Invalid schema"):
+        load_genspec_index(path, use_cache=False)
+    assert not index_path_for(path).exists()
@@ -102,3 +102,23 @@ def test_cli_view(tmp_path: Path, capsys) -> None:
     assert cmd_view(args) == 0
     captured = capsys.readouterr()
     assert "GenSpec View" in captured.out
+
+
+def test_viewer_outline_reports_step_count_without_steps(tmp_path: Path) -> None:
+    from waypoints.genspec.viewer import load_genspec_outline
+
+    spec = _build_spec()
+    path = tmp_path / "spec.genspec.zip"
+    export_bundle(spec, path)
+
+    outline, metadata, _ = load_genspec_outline(path)
+    output = render_view(
+        outline.spec,
+        metadata,
+        None,
+        ViewOptions(show_steps=False),
+        step_count=outline.step_count,
+    )
+
+    assert outline.spec.steps == []
+    assert "Steps: 1" in output
@@ -335,6 +335,156 @@ class TestGitService:
         assert result.success is True
 
 
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _init_repo(repo: Path) -> None:
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@test.com")
+    _git(repo, "config", "user.name", "Test")
+
+
+class TestGitServiceCommitAll:
+    """Tests for the batched status/stage/commit/tag path."""
+
+    def test_commits_every_change_and_tags(self, tmp_path: Path) -> None:
+        """Initial and follow-up commits match `git add . && git commit`."""
+        _init_repo(tmp_path)
+        (tmp_path / "keep.txt").write_text("v1")
+        (tmp_path / "gone.txt").write_text("bye")
+        (tmp_path / "old.txt").write_text("moved")
+        service = GitService(tmp_path)
+
+        first = service.commit_all("first")
+        (tmp_path / "keep.txt").write_text("v2")
+        (tmp_path / "gone.txt").unlink()
+        (tmp_path / "old.txt").rename(tmp_path / "new.txt")
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+        second = service.commit_all("second", tag_name="demo/WP-001")
+
+        assert first.success and second.success
+        assert _git(tmp_path, "rev-parse", "HEAD").strip() == second.commit_hash
+        assert _git(tmp_path, "rev-parse", "HEAD~1").strip() == first.commit_hash
+        assert _git(tmp_path, "status", "--porcelain") == ""
+        assert _git(tmp_path, "ls-files").split() == [
+            "keep.txt",
+            "new.txt",
+            "src/app.py",
+        ]
+        assert _git(tmp_path, "log", "-1", "--format=%s").strip() == "second"
+        tagged = _git(tmp_path, "rev-parse", "demo/WP-001^{commit}").strip()
+        assert tagged == second.commit_hash
+        assert "commit: second" in _git(tmp_path, "reflog", "-1")
+        assert [t.command for t in second.timings] == [
+            "rev-parse",
+            "status",
+            "update-index",
+            "config",
+            "write-tree",
+            "commit-tree",
+            "update-ref",
+            "tag",
+        ]
+
+    def test_skips_local_waypoints_storage(self, tmp_path: Path) -> None:
+        """Blobs, export cache and snapshots under .waypoints stay untracked."""
+        (tmp_path / ".gitignore").write_text("*.log\n.waypoints/debug.log\n")
+        service = GitService(tmp_path)
+        service.init_repo()
+        _git(tmp_path, "config", "user.email", "test@test.com")
+        _git(tmp_path, "config", "user.name", "Test")
+        for name in ("blobs/ab", "export-cache", "snapshots/snapshot-1"):
+            (tmp_path / ".waypoints" / name).mkdir(parents=True)
+            (tmp_path / ".waypoints" / name / "data").write_text("x")
+        (tmp_path / "app.py").write_text("print('hi')\n")
+
+        result = service.commit_all("first")
+
+        assert result.success is True
+        assert _git(tmp_path, "ls-files").split() == [".gitignore", "app.py"]
+
+    def test_skips_local_storage_with_an_older_gitignore(self, tmp_path: Path) -> None:
+        """Existing projects whose .gitignore predates the entries are covered."""
+        _init_repo(tmp_path)
+        (tmp_path / ".gitignore").write_text(".waypoints/debug.log\n")
+        _git(tmp_path, "add", ".gitignore")
+        _git(tmp_path, "commit", "-m", "old project")
+        service = GitService(tmp_path)
+        assert "Already" in service.init_repo().message
+        for name in ("blobs/aa", "export-cache", "snapshots/snapshot-1"):
+            (tmp_path / ".waypoints" / name).mkdir(parents=True)
+            (tmp_path / ".waypoints" / name / "data").write_text("x")
+        (tmp_path / "app.py").write_text("print('hi')\n")
+
+        result = service.commit_all("m")
+
+        assert result.success is True
+        assert _git(tmp_path, "ls-files").split() == [".gitignore", "app.py"]
+
+    def test_nothing_to_commit_runs_one_scan(self, tmp_path: Path) -> None:
+        """A clean tree stops after the status scan."""
+        _init_repo(tmp_path)
+
+        result = GitService(tmp_path).commit_all("empty")
+
+        assert result.success is True
+        assert result.message == "Nothing to commit"
+        assert [t.command for t in result.timings] == ["rev-parse", "status"]
+
+    def test_installed_hooks_still_run(self, tmp_path: Path) -> None:
+        """With a pre-commit hook the commit goes through `git commit`."""
+        _init_repo(tmp_path)
+        hook = tmp_path / ".git" / "hooks" / "pre-commit"
+        hook.write_text("#!/bin/sh\necho 'rejected by hook' >&2\nexit 1\n")
+        hook.chmod(0o755)
+        (tmp_path / "file.txt").write_text("x")
+
+        result = GitService(tmp_path).commit_all("blocked")
+
+        assert result.success is False
+        assert "rejected by hook" in result.message
+
+    def test_signed_commits_go_through_git_commit(self, tmp_path: Path) -> None:
+        """With commit.gpgsign set the commit is signed like `git commit`."""
+        _init_repo(tmp_path)
+        fake_gpg = tmp_path / "fake-gpg"
+        fake_gpg.write_text(
+            "#!/bin/sh\n"
+            "cat >/dev/null\n"
+            "echo '[GNUPG:] SIG_CREATED D 1 8 00 0 FAKE' >&2\n"
+            "printf -- '-----BEGIN PGP SIGNATURE-----\\nfake\\n"
+            "-----END PGP SIGNATURE-----\\n'\n"
+        )
+        fake_gpg.chmod(0o755)
+        _git(tmp_path, "config", "commit.gpgsign", "true")
+        _git(tmp_path, "config", "user.signingkey", "FAKE")
+        _git(tmp_path, "config", "gpg.program", str(fake_gpg))
+        (tmp_path / "file.txt").write_text("x")
+
+        result = GitService(tmp_path).commit_all("signed")
+
+        assert result.success is True
+        assert "gpgsig" in _git(tmp_path, "cat-file", "-p", "HEAD")
+        assert "commit" in [t.command for t in result.timings]
+
+    def test_stages_only_below_working_dir(self, tmp_path: Path) -> None:
+        """Like `git add .`, changes outside the working dir stay unstaged."""
+        _init_repo(tmp_path)
+        project = tmp_path / "projects" / "demo"
+        project.mkdir(parents=True)
+        (project / "plan.json").write_text("{}")
+        (tmp_path / "elsewhere.txt").write_text("x")
+
+        result = GitService(project).commit_all("demo")
+
+        assert result.success is True
+        assert _git(tmp_path, "ls-files").split() == ["projects/demo/plan.json"]
+
+
 class TestGitConfig:
     """Tests for GitConfig."""
 
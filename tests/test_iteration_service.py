@@ -58,6 +58,21 @@ def test_ingest_attachments_copies_to_evidence_snapshot(tmp_path: Path) -> None:
     assert len(attachment.sha256) == 64
 
 
+def test_ingest_attachments_shares_storage_for_same_content(tmp_path: Path) -> None:
+    """Re-attaching unchanged content links to one stored copy."""
+    project_path = tmp_path / "project"
+    project_path.mkdir()
+    (project_path / "trace.log").write_text("Traceback ...")
+
+    service = IterationRequestService(project_path)
+    first = service.ingest_attachments("./trace.log")[0]
+    (project_path / "trace.log").write_text("Traceback ...")
+    second = service.ingest_attachments("see ./trace.log again")[0]
+
+    assert first.sha256 == second.sha256
+    assert first.stored_path.samefile(second.stored_path)
+
+
 def test_build_waypoint_description_appends_attachment_manifest() -> None:
     """Prompt assembly includes evidence file references when attachments exist."""
     attachment = IterationAttachment(
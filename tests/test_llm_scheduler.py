@@ -0,0 +1,223 @@
+"""Tests for the process-wide LLM call scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from waypoints.llm import scheduler as scheduler_module
+from waypoints.llm.providers.base import StreamComplete
+from waypoints.llm.providers.openai import OpenAIProvider
+from waypoints.llm.scheduler import (
+    CallPriority,
+    LLMScheduler,
+    RateLimits,
+    priority_for,
+)
+
+
+class _RateLimitError(Exception):
+    def __init__(self, retry_after: float) -> None:
+        super().__init__("Error code: 429 - rate limit exceeded")
+        self.response = SimpleNamespace(headers={"retry-after": str(retry_after)})
+
+
+def _scheduler(**limits: int) -> LLMScheduler:
+    return LLMScheduler(limits=lambda provider, model: RateLimits(**limits))
+
+
+def test_priority_for_maps_roles_and_phases() -> None:
+    assert priority_for("fly", "builder") is CallPriority.BUILDER
+    assert priority_for("fly", "verifier") is CallPriority.VERIFIER
+    assert priority_for("fly") is CallPriority.BUILDER
+    assert priority_for("chart") is CallPriority.CHART
+    assert priority_for("land-iterate-triage") is CallPriority.TRIAGE
+
+
+def test_waiters_are_admitted_in_priority_order() -> None:
+    scheduler = _scheduler(initial_concurrency=1, max_concurrency=1)
+    order: list[str] = []
+
+    def _call(name: str, priority: CallPriority) -> None:
+        with scheduler.lease("openai", "m", priority=priority):
+            order.append(name)
+
+    with scheduler.lease("openai", "m"):
+        threads = [
+            threading.Thread(target=_call, args=("triage", CallPriority.TRIAGE)),
+            threading.Thread(target=_call, args=("chart", CallPriority.CHART)),
+            threading.Thread(target=_call, args=("builder", CallPriority.BUILDER)),
+        ]
+        for thread in threads:
+            thread.start()
+            while scheduler.stats("openai", "m").waiting < threads.index(thread) + 1:
+                time.sleep(0.001)
+
+    for thread in threads:
+        thread.join(timeout=5)
+    assert order == ["builder", "chart", "triage"]
+
+
+def test_aimd_grows_on_success_and_halves_once_per_window() -> None:
+    scheduler = _scheduler(initial_concurrency=4, max_concurrency=8)
+    for _ in range(4):
+        with scheduler.lease("openai", "m"):
+            pass
+    grown = scheduler.stats("openai", "m").concurrency_limit
+    assert 4.9 < grown < 5.0
+
+    # Two calls admitted in the same window both hit 429: one decrease.
+    with pytest.raises(_RateLimitError):
+        with scheduler.lease("openai", "m"):
+            with pytest.raises(_RateLimitError):
+                with scheduler.lease("openai", "m"):
+                    raise _RateLimitError(0.01)
+            raise _RateLimitError(0.01)
+
+    stats = scheduler.stats("openai", "m")
+    assert stats.concurrency_limit == pytest.approx(grown / 2)
+    assert stats.throttle_events == 2
+
+
+def test_throttle_pauses_the_shared_lane() -> None:
+    scheduler = _scheduler()
+    with pytest.raises(_RateLimitError):
+        with scheduler.lease("openai", "m"):
+            raise _RateLimitError(0.2)
+
+    assert scheduler.stats("openai", "m").paused_for_seconds > 0.1
+    started = time.monotonic()
+    with scheduler.lease("openai", "m"):
+        pass
+    assert time.monotonic() - started >= 0.15
+    # Other lanes are unaffected.
+    assert scheduler.stats("openai", "other").paused_for_seconds == 0
+
+
+def test_throttled_release_wakes_a_queued_waiter() -> None:
+    scheduler = _scheduler(initial_concurrency=1, max_concurrency=1)
+    granted_at: list[float] = []
+
+    def _call() -> None:
+        with scheduler.lease("openai", "m"):
+            granted_at.append(time.monotonic())
+
+    with pytest.raises(_RateLimitError):
+        with scheduler.lease("openai", "m"):
+            thread = threading.Thread(target=_call)
+            thread.start()
+            while scheduler.stats("openai", "m").waiting < 1:
+                time.sleep(0.001)
+            released = time.monotonic()
+            raise _RateLimitError(0.2)
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert granted_at and granted_at[0] - released >= 0.15
+
+
+def test_non_retryable_errors_do_not_adapt_concurrency() -> None:
+    scheduler = _scheduler(initial_concurrency=2)
+    with pytest.raises(ValueError):
+        with scheduler.lease("openai", "m"):
+            raise ValueError("bad request")
+
+    stats = scheduler.stats("openai", "m")
+    assert stats.concurrency_limit == 2
+    assert stats.throttle_events == 0
+    assert stats.in_flight == 0
+
+
+def test_token_bucket_waits_for_refill_and_tracks_debt() -> None:
+    bucket = scheduler_module._TokenBucket(60, now=0.0)
+    assert bucket.delay(60, now=0.0) == 0
+    bucket.take(60)
+    bucket.take(30)  # actual usage exceeded the estimate
+
+    assert bucket.delay(30, now=0.0) == pytest.approx(60.0)
+    assert bucket.delay(30, now=30.0) == pytest.approx(30.0)
+    assert scheduler_module._TokenBucket(None, now=0.0).delay(10**9, now=0.0) == 0
+
+
+def test_cancelled_async_waiter_releases_its_place() -> None:
+    scheduler = _scheduler(initial_concurrency=1, max_concurrency=1)
+
+    async def _scenario() -> int:
+        async with scheduler.lease_async("openai", "m"):
+            waiter = asyncio.create_task(_hold(scheduler))
+            await asyncio.sleep(0.01)
+            assert scheduler.stats("openai", "m").waiting == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+        async with scheduler.lease_async("openai", "m"):
+            return scheduler.stats("openai", "m").in_flight
+
+    assert asyncio.run(_scenario()) == 1
+    stats = scheduler.stats("openai", "m")
+    assert stats.waiting == 0 and stats.in_flight == 0
+
+
+def test_agent_session_is_admitted_without_holding_a_slot() -> None:
+    scheduler = _scheduler(initial_concurrency=1, max_concurrency=1)
+
+    async def _scenario() -> int:
+        async with scheduler.session_async("anthropic", "m") as lease:
+            # Another request gets the only slot while the session runs.
+            async with scheduler.lease_async("anthropic", "m"):
+                in_flight = scheduler.stats("anthropic", "m").in_flight
+            lease.record_usage(10, 5)
+        with pytest.raises(_RateLimitError):
+            async with scheduler.session_async("anthropic", "m"):
+                raise _RateLimitError(0.2)
+        return in_flight
+
+    assert asyncio.run(_scenario()) == 1
+    stats = scheduler.stats("anthropic", "m")
+    assert stats.in_flight == 0
+    assert stats.throttle_events == 1
+    assert stats.paused_for_seconds > 0.1
+
+
+async def _hold(scheduler: LLMScheduler) -> None:
+    async with scheduler.lease_async("openai", "m"):
+        await asyncio.sleep(10)
+
+
+def test_openai_agent_query_retries_through_scheduler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    scheduler = _scheduler()
+    monkeypatch.setattr(scheduler_module, "_SCHEDULER", scheduler)
+
+    class FakeCompletions:
+        calls = 0
+
+        async def create(self, **kwargs: object) -> object:
+            FakeCompletions.calls += 1
+            if FakeCompletions.calls == 1:
+                raise _RateLimitError(0.05)
+            message = SimpleNamespace(content="done", tool_calls=None)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=message, finish_reason="stop")],
+                usage=None,
+            )
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    provider = OpenAIProvider(model="m", api_key="test-key")
+    provider._get_async_client = lambda: client  # type: ignore[method-assign]
+
+    async def _run() -> list[object]:
+        return [item async for item in provider.agent_query(prompt="hi")]
+
+    items = asyncio.run(_run())
+
+    assert isinstance(items[-1], StreamComplete)
+    assert FakeCompletions.calls == 2
+    stats = scheduler.stats("openai", "m")
+    assert stats.throttle_events == 1
+    assert stats.granted == 2
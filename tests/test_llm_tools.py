@@ -1,9 +1,15 @@
 """Tests for shared LLM tool execution helpers."""
 
+import subprocess
 from pathlib import Path
 from sys import executable
 
-from waypoints.llm.tools import allowed_tools_for_role, execute_tool
+from waypoints.git.service import GitService
+from waypoints.llm.tools import (
+    allowed_tools_for_role,
+    execute_tool,
+    tool_output_budget_chars,
+)
 
 
 def test_execute_tool_bash_echo() -> None:
@@ -125,3 +131,92 @@ def test_allowed_tools_for_role_verifier_excludes_mutations() -> None:
     assert "read_file" in verifier_tools
     assert "write_file" not in verifier_tools
     assert "edit_file" not in verifier_tools
+
+
+def test_read_file_pages_large_files_by_line(tmp_path: Path) -> None:
+    """Read tool stops at its budget and honours offset/limit."""
+    log_file = tmp_path / "big.log"
+    log_file.write_text(
+        "".join(f"line {n:05d}\n" for n in range(1, 20001)), encoding="utf-8"
+    )
+
+    head = execute_tool("read_file", {"file_path": str(log_file)}, cwd=str(tmp_path))
+    page = execute_tool(
+        "read_file",
+        {"file_path": str(log_file), "offset": 101, "limit": 3},
+        cwd=str(tmp_path),
+    )
+
+    assert head.startswith("line 00001\n")
+    assert len(head) < tool_output_budget_chars("read_file") + 200
+    assert "more lines follow; use offset=" in head
+    assert page.startswith("line 00101\nline 00102\nline 00103\n")
+    assert "showing lines 101-103; more lines follow" in page
+
+
+def test_read_file_marks_and_spills_over_budget_lines(tmp_path: Path) -> None:
+    """A line longer than the budget is cut off visibly and spilled wrapped."""
+    budget = tool_output_budget_chars("read_file")
+    minified = tmp_path / "bundle.min.js"
+    long_line = "".join(f"{n:09d};" for n in range(budget // 2))
+    minified.write_text(f"{long_line}\nconsole.log(1);\n", encoding="utf-8")
+
+    result = execute_tool("read_file", {"file_path": str(minified)}, cwd=str(tmp_path))
+
+    assert result.startswith(long_line[:budget] + "\n")
+    assert f"line 1 truncated at {budget} chars; {len(long_line)} chars" in result
+    assert "use offset=2" in result
+    spills = list((tmp_path / "sessions" / "tool-output").glob("read_file-*.txt"))
+    assert len(spills) == 1 and str(spills[0]) in result
+    wrapped = spills[0].read_text(encoding="utf-8")
+    assert wrapped.replace("\n", "") == long_line
+    assert max(len(line) for line in wrapped.splitlines()) <= 200
+
+    rest = execute_tool(
+        "read_file", {"file_path": str(minified), "offset": 2}, cwd=str(tmp_path)
+    )
+    assert rest == "console.log(1);\n"
+
+
+def test_bash_output_keeps_head_and_tail_and_spills_rest(tmp_path: Path) -> None:
+    """Noisy commands are excerpted; the full output stays readable."""
+    command = f'"{executable}" -c "print(\'\\n\'.join(map(str, range(50000))))"'
+
+    result = execute_tool("bash", {"command": command}, cwd=str(tmp_path))
+
+    assert result.startswith("0\n1\n")
+    assert result.rstrip().endswith("49999")
+    assert len(result) < tool_output_budget_chars("bash") + 500
+    spills = list((tmp_path / "sessions" / "tool-output").glob("bash-*.txt"))
+    assert len(spills) == 1 and str(spills[0]) in result
+    assert spills[0].read_text(encoding="utf-8").count("\n") == 50000
+
+    spilled = execute_tool(
+        "read_file",
+        {"file_path": str(spills[0]), "offset": 25000, "limit": 1},
+        cwd=str(tmp_path),
+    )
+    assert spilled.startswith("24999\n")
+
+
+def test_spilled_output_is_not_committed(tmp_path: Path) -> None:
+    """Spill files stay out of waypoint commits, even with an old .gitignore."""
+    for args in (
+        ["init"],
+        ["config", "user.email", "test@test.com"],
+        ["config", "user.name", "Test"],
+    ):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+    (tmp_path / ".gitignore").write_text(".waypoints/debug.log\n")
+    command = f'"{executable}" -c "print(\'\\n\'.join(map(str, range(50000))))"'
+    execute_tool("bash", {"command": command}, cwd=str(tmp_path))
+    assert list((tmp_path / "sessions" / "tool-output").glob("bash-*.txt"))
+
+    result = GitService(tmp_path).commit_all("waypoint")
+
+    tracked = subprocess.run(
+        ["git", "ls-files"], cwd=tmp_path, check=True, capture_output=True, text=True
+    ).stdout.split()
+    assert result.success is True
+    assert ".gitignore" in tracked
+    assert not [path for path in tracked if path.startswith("sessions/")]
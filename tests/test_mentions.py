@@ -2,19 +2,41 @@
 
 import json
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
+from waypoints.llm.client import StreamChunk
 from waypoints.mentions import (
     CommentLogEntry,
     Mention,
+    SectionEdit,
+    apply_section_edits,
     find_mentions,
+    group_mentions_by_section,
     is_mention_resolved,
     log_comment,
     mark_mention_resolved,
     parse_sections,
+    process_section_mentions,
     replace_section,
     save_document_version,
 )
+from waypoints.models.document_store import DocumentVersionStore
+
+REVIEW_DOC = """# Spec
+
+## Alpha
+
+Alpha body.
+@waypoints: shorten alpha
+@waypoints: add alpha example
+
+## Beta
+
+Beta body.
+@waypoints: expand beta
+"""
 
 
 class TestParseSections:
@@ -280,6 +302,116 @@ Old last."""
         assert "Old last." not in result
 
 
+class _ScriptedClient:
+    """Fake chat client that answers each instruction with a new section."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.prompts: list[str] = []
+        self._fail_on = fail_on
+
+    def stream_message(self, messages: list[dict[str, str]], **_: Any) -> Iterator[Any]:
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        if self._fail_on and self._fail_on in prompt:
+            raise RuntimeError("model unavailable")
+        yield StreamChunk(text=f"## Section\n\nedit {len(self.prompts)}")
+
+
+class TestGroupMentionsBySection:
+    """Tests for grouping mentions into independent sections."""
+
+    def test_groups_in_document_order(self) -> None:
+        groups = group_mentions_by_section(find_mentions(REVIEW_DOC))
+
+        assert [[m.instruction for m in group] for group in groups] == [
+            ["shorten alpha", "add alpha example"],
+            ["expand beta"],
+        ]
+
+
+class TestProcessSectionMentions:
+    """Tests for resolving all mentions in one section."""
+
+    def test_chains_edits_within_section(self) -> None:
+        alpha = group_mentions_by_section(find_mentions(REVIEW_DOC))[0]
+        client = _ScriptedClient()
+
+        edit = process_section_mentions(alpha, REVIEW_DOC, client)  # type: ignore[arg-type]
+
+        assert "edit 1" in client.prompts[1]
+        assert edit.updated_section == "## Section\n\nedit 2"
+        assert [m.instruction for m in edit.resolved] == [
+            "shorten alpha",
+            "add alpha example",
+        ]
+        assert edit.failed == []
+
+    def test_records_failures_and_continues(self) -> None:
+        alpha = group_mentions_by_section(find_mentions(REVIEW_DOC))[0]
+        client = _ScriptedClient(fail_on="## Instruction\nshorten alpha")
+
+        edit = process_section_mentions(alpha, REVIEW_DOC, client)  # type: ignore[arg-type]
+
+        assert [m.instruction for m in edit.resolved] == ["add alpha example"]
+        assert [(m.instruction, error) for m, error in edit.failed] == [
+            ("shorten alpha", "model unavailable")
+        ]
+
+
+class TestApplySectionEdits:
+    """Tests for merging section results into the document."""
+
+    def _edits(self) -> list[SectionEdit]:
+        alpha, beta = group_mentions_by_section(find_mentions(REVIEW_DOC))
+        return [
+            SectionEdit(
+                section_start=alpha[0].section_start,
+                section_end=alpha[0].section_end,
+                updated_section="## Alpha\n\nShort alpha.\n\n",
+                resolved=alpha,
+            ),
+            SectionEdit(
+                section_start=beta[0].section_start,
+                section_end=beta[0].section_end,
+                updated_section="## Beta\n\nLonger beta.\nWith detail.",
+                resolved=beta,
+            ),
+        ]
+
+    def test_merge_is_order_independent(self) -> None:
+        edits = self._edits()
+
+        forward = apply_section_edits(REVIEW_DOC, edits)
+        backward = apply_section_edits(REVIEW_DOC, list(reversed(edits)))
+
+        strip = [line for line in forward.split("\n") if "[resolved]" not in line]
+        assert strip == [
+            line for line in backward.split("\n") if "[resolved]" not in line
+        ]
+        assert "Short alpha." in forward
+        assert "Longer beta." in forward
+        assert "Alpha body." not in forward
+        assert find_mentions(forward) == []
+        assert forward.count("[resolved]: # (@waypoints:") == 3
+
+    def test_keeps_failed_mentions_for_retry(self) -> None:
+        alpha = group_mentions_by_section(find_mentions(REVIEW_DOC))[0]
+        edit = SectionEdit(
+            section_start=alpha[0].section_start,
+            section_end=alpha[0].section_end,
+            updated_section="## Alpha\n\nShort alpha.",
+            resolved=[alpha[0]],
+            failed=[(alpha[1], "timeout")],
+        )
+
+        result = apply_section_edits(REVIEW_DOC, [edit])
+
+        assert [m.instruction for m in find_mentions(result)] == [
+            "add alpha example",
+            "expand beta",
+        ]
+
+
 class TestLogComment:
     """Tests for comment logging."""
 
@@ -351,8 +483,8 @@ class TestSaveDocumentVersion:
             assert docs_path.exists()
             assert result_path.exists()
 
-    def test_multiple_versions_have_different_names(self) -> None:
-        """Multiple saves create different files."""
+    def test_multiple_versions_keep_history_not_files(self) -> None:
+        """Older versions move into the version store."""
         import time
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -363,5 +495,8 @@ class TestSaveDocumentVersion:
             path2 = save_document_version(docs_path, "idea-brief", "Version 2")
 
             assert path1 != path2
-            assert path1.read_text() == "Version 1"
+            assert not path1.exists()
             assert path2.read_text() == "Version 2"
+            store = DocumentVersionStore(docs_path)
+            first = store.history("idea-brief")[0]
+            assert store.load(first.digest) == "Version 1"
@@ -148,6 +148,31 @@ class TestMetricsCollector:
         assert collector.total_calls == 3
         assert collector.total_cost == pytest.approx(0.18)
 
+    def test_totals_survive_reload(self, tmp_path: Path) -> None:
+        """Running totals match after recording and after reloading from disk."""
+        collector = MetricsCollector(MockProject(tmp_path))
+        assert collector.has_token_usage_data() is False
+        assert collector.has_cached_token_usage_data() is False
+
+        collector.record(
+            LLMCall.create(
+                phase="fly", cost_usd=0.25, latency_ms=10, tokens_in=100, tokens_out=40
+            )
+        )
+        collector.record(
+            LLMCall.create(
+                phase="fly", cost_usd=None, latency_ms=10, cached_tokens_in=30
+            )
+        )
+
+        for current in (collector, MetricsCollector(MockProject(tmp_path))):
+            assert current.total_cost == pytest.approx(0.25)
+            assert current.total_tokens_in == 100
+            assert current.total_tokens_out == 40
+            assert current.total_cached_tokens_in == 30
+            assert current.has_token_usage_data() is True
+            assert current.has_cached_token_usage_data() is True
+
     def test_cost_by_phase(self, tmp_path: Path) -> None:
         """Test aggregating cost by phase."""
         collector = MetricsCollector(MockProject(tmp_path))
@@ -3,11 +3,14 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from waypoints.memory import (
     format_directory_policy_for_prompt,
     load_or_build_project_memory,
     memory_dir,
     policy_overrides_path,
+    project_index,
     write_default_policy_overrides,
 )
 
@@ -87,6 +90,93 @@ def test_project_memory_applies_policy_overrides(tmp_path: Path) -> None:
     assert "generated" not in focus
 
 
+def _count_classifications(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    classified: list[str] = []
+    original = project_index._classify_top_level_entry
+
+    def _classify(entry: Path, ignored: set[str]):  # type: ignore[no-untyped-def]
+        classified.append(entry.name)
+        return original(entry, ignored)
+
+    monkeypatch.setattr(project_index, "_classify_top_level_entry", _classify)
+    return classified
+
+
+def test_project_memory_warm_load_skips_rebuild(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unchanged projects are served from the in-process cache."""
+    (tmp_path / "src").mkdir()
+    first = load_or_build_project_memory(tmp_path)
+    index_path = memory_dir(tmp_path) / "project-index.v1.json"
+    written = index_path.stat().st_mtime_ns
+
+    classified = _count_classifications(monkeypatch)
+    assert load_or_build_project_memory(tmp_path) is first
+    assert classified == []
+    assert index_path.stat().st_mtime_ns == written
+
+
+def test_project_memory_reclassifies_only_new_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Incremental rebuilds reuse records for unchanged top-level entries."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "docs").mkdir()
+    load_or_build_project_memory(tmp_path)
+    project_index._WARM_MEMORY.clear()
+
+    classified = _count_classifications(monkeypatch)
+    (tmp_path / "scripts").mkdir()
+    memory = load_or_build_project_memory(tmp_path)
+
+    assert "scripts" in classified
+    assert "src" not in classified
+    assert "docs" not in classified
+    assert "scripts" in {r.name for r in memory.directory_map.records}
+
+    classified.clear()
+    assert load_or_build_project_memory(tmp_path, force_refresh=True) is not memory
+    assert "src" in classified
+
+
+def test_project_memory_detects_nested_manifest(tmp_path: Path) -> None:
+    """A manifest added inside a depth-1 directory refreshes the stack."""
+    (tmp_path / "frontend").mkdir()
+    first = load_or_build_project_memory(tmp_path)
+    assert "javascript" not in first.stack_profile.stack_types
+
+    (tmp_path / "frontend" / "package.json").write_text("{}\n", encoding="utf-8")
+    refreshed = load_or_build_project_memory(tmp_path)
+
+    assert "javascript" in refreshed.stack_profile.stack_types
+    assert "frontend/package.json" in refreshed.stack_profile.manifest_paths
+
+
+def test_project_memory_files_share_generation(tmp_path: Path) -> None:
+    """A set with mismatched generations is treated as torn and rebuilt."""
+    (tmp_path / "src").mkdir()
+    memory = load_or_build_project_memory(tmp_path)
+    memory_root = memory_dir(tmp_path)
+    generations = {
+        json.loads(path.read_text(encoding="utf-8"))["generation"]
+        for path in memory_root.glob("*.v1.json")
+    }
+    assert generations == {memory.index.generation}
+    assert memory.index.generation is not None
+
+    stack_path = memory_root / "stack-profile.v1.json"
+    payload = json.loads(stack_path.read_text(encoding="utf-8"))
+    payload["generation"] = "stale"
+    stack_path.write_text(json.dumps(payload), encoding="utf-8")
+    project_index._WARM_MEMORY.clear()
+
+    rebuilt = load_or_build_project_memory(tmp_path)
+    assert rebuilt.index.generation not in {None, "stale"}
+    reread = json.loads(stack_path.read_text(encoding="utf-8"))
+    assert reread["generation"] == rebuilt.index.generation
+
+
 def test_write_default_policy_overrides_creates_template(tmp_path: Path) -> None:
     """Default override template can be initialized for manual editing."""
     path = write_default_policy_overrides(tmp_path)
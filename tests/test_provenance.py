@@ -2,10 +2,14 @@
 
 from pathlib import Path
 
+import pytest
+
 from waypoints.fly.provenance import (
     capture_workspace_snapshot,
+    refresh_workspace_snapshot,
     summarize_workspace_diff,
 )
+from waypoints.runtime.fs_watcher import WatcherBackendName, WorkspaceWatcher
 
 
 def test_workspace_diff_tracks_text_and_binary_changes(tmp_path: Path) -> None:
@@ -64,3 +68,48 @@ def test_workspace_diff_marks_indeterminate_large_text_changes(tmp_path: Path) -
 
     assert summary.files_modified == 1
     assert summary.indeterminate_text_files == 1
+
+
+@pytest.mark.parametrize("backend", ["inotify", "poll"])
+def test_refresh_snapshot_matches_full_capture(
+    tmp_path: Path, backend: WatcherBackendName
+) -> None:
+    """Watcher-driven refresh re-reads only changed files but agrees with a rescan."""
+    (tmp_path / "keep.py").write_text("x = 1\n", encoding="utf-8")
+    (tmp_path / "edit.py").write_text("y = 1\n", encoding="utf-8")
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "gone.py").write_text("z = 1\n", encoding="utf-8")
+    try:
+        watcher = WorkspaceWatcher(tmp_path, backend=backend)
+    except OSError:
+        pytest.skip("inotify unavailable")
+    try:
+        before = capture_workspace_snapshot(tmp_path, watcher=watcher)
+
+        (tmp_path / "edit.py").write_text("y = 22\n", encoding="utf-8")
+        (tmp_path / "new").mkdir()
+        (tmp_path / "new" / "added.py").write_text("n = 1\n", encoding="utf-8")
+        (tmp_path / "pkg" / "gone.py").unlink()
+        (tmp_path / "pkg").rmdir()
+        (tmp_path / "sessions").mkdir()
+        (tmp_path / "sessions" / "log.jsonl").write_text("{}\n", encoding="utf-8")
+
+        refreshed = refresh_workspace_snapshot(before, tmp_path, watcher)
+    finally:
+        watcher.close()
+
+    assert refreshed.files == capture_workspace_snapshot(tmp_path).files
+    assert refreshed.files["keep.py"] is before.files["keep.py"]
+    assert refreshed.watch_seq is not None and refreshed.watch_seq > 0
+
+
+def test_refresh_snapshot_rescans_when_watcher_lost_events(tmp_path: Path) -> None:
+    (tmp_path / "a.py").write_text("a = 1\n", encoding="utf-8")
+    watcher = WorkspaceWatcher(tmp_path, backend="poll")
+    before = capture_workspace_snapshot(tmp_path, watcher=watcher)
+    watcher.close()
+
+    (tmp_path / "b.py").write_text("b = 1\n", encoding="utf-8")
+    refreshed = refresh_workspace_snapshot(before, tmp_path, watcher)
+
+    assert set(refreshed.files) == {"a.py", "b.py"}
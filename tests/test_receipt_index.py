@@ -0,0 +1,99 @@
+"""Tests for the receipt manifest and compaction of old receipts."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from waypoints.git.receipt import CapturedEvidence, ChecklistReceipt, ReceiptBuilder
+from waypoints.git.receipt_index import KEEP_FULL_RECEIPTS, ReceiptIndex
+from waypoints.models.blob_store import blob_store_for
+
+
+@pytest.fixture
+def receipts_dir(tmp_path: Path) -> Path:
+    path = tmp_path / "receipts"
+    path.mkdir()
+    return path
+
+
+def _save(receipts_dir: Path, stem: str, *, exit_code: int = 0) -> Path:
+    builder = ReceiptBuilder(waypoint_id="WP-001", title="T", objective="O")
+    builder.capture(
+        "tests",
+        CapturedEvidence(
+            command="pytest",
+            exit_code=exit_code,
+            stdout="collected 500 items\n" + "." * 5000,
+            stderr="",
+            captured_at=datetime.now(UTC),
+        ),
+    )
+    receipt = builder.build(
+        output_dir=receipts_dir,
+        output_prefix=stem,
+        blob_store=blob_store_for(receipts_dir.parent),
+    )
+    path = receipts_dir / f"{stem}.json"
+    receipt.save(path)
+    ReceiptIndex(receipts_dir).record(path, receipt)
+    return path
+
+
+def test_latest_uses_manifest_without_rescanning(
+    receipts_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _save(receipts_dir, "wp001-20260108-100000")
+    latest = _save(receipts_dir, "wp001-20260108-120000", exit_code=1)
+
+    def _no_rescan(*_: object, **__: object) -> None:
+        raise AssertionError("fresh manifest should not rescan receipts")
+
+    monkeypatch.setattr(ReceiptIndex, "_rescan", _no_rescan)
+    index = ReceiptIndex(receipts_dir)
+
+    assert index.latest("WP-001") == latest
+    assert [e.valid for e in index.entries("wp-001")] == [True, False]
+    assert index.entries("WP-002") == []
+
+
+def test_old_receipts_are_compacted_to_blob_references(receipts_dir: Path) -> None:
+    paths = [_save(receipts_dir, f"wp001-20260108-1{i}0000") for i in range(5)]
+
+    entries = ReceiptIndex(receipts_dir).entries("WP-001")
+    assert [e.compact for e in entries] == [True, True, False, False, False]
+    assert len(list(blob_store_for(receipts_dir.parent).digests())) == 1
+    assert len(list(receipts_dir.glob("*.stdout.txt"))) == KEEP_FULL_RECEIPTS
+
+    compacted = ChecklistReceipt.load(paths[0])
+    item = compacted.checklist[0]
+    assert item.stdout == ""
+    assert (receipts_dir / item.stdout_path).read_text().startswith("collected 500")
+    assert "\n" not in paths[0].read_text()
+    assert entries[0].evidence_bytes == entries[-1].evidence_bytes
+    assert len(ReceiptIndex(receipts_dir).referenced_blobs()) == 1
+
+
+def test_manifest_resyncs_with_receipts_written_elsewhere(receipts_dir: Path) -> None:
+    first = _save(receipts_dir, "wp001-20260108-100000")
+    external = receipts_dir / "wp001-20260108-130000.json"
+    external.write_text(
+        json.dumps(
+            {
+                "waypoint_id": "WP-001",
+                "completed_at": "2026-01-08T13:00:00",
+                "checklist": [{"item": "lint", "status": "failed"}],
+            }
+        )
+    )
+    (receipts_dir / "wp002-20260108-100000.json").write_text("{not json")
+    first.unlink()
+
+    index = ReceiptIndex(receipts_dir)
+
+    assert index.latest("WP-001") == external
+    assert [e.file for e in index.entries("WP-001")] == [external.name]
+    assert [e.valid for e in index.entries()] == [False, None]
@@ -0,0 +1,167 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from waypoints.llm import client as client_module
+from waypoints.llm.client import ChatClient, StreamChunk, StreamComplete
+from waypoints.llm.response_cache import (
+    RESPONSE_CACHE_ENV_VAR,
+    CachedResponse,
+    ResponseCache,
+    build_response_cache_key,
+    disable_response_cache,
+    enable_response_cache,
+    get_response_cache,
+)
+
+
+class _CountingProvider:
+    provider_name = "fake"
+    model = "fake-model"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def stream_message(self, **_: object) -> Iterator[StreamChunk | StreamComplete]:
+        self.calls += 1
+        yield StreamChunk(text="hello ")
+        yield StreamChunk(text="world")
+        yield StreamComplete(full_text="hello world", cost_usd=0.25, tokens_in=10)
+
+
+@pytest.fixture(autouse=True)
+def _reset_active_cache() -> Iterator[None]:
+    disable_response_cache()
+    yield
+    disable_response_cache()
+
+
+def _key(**overrides: object) -> str:
+    params: dict[str, object] = {
+        "provider": "openai",
+        "model": "gpt-5.2",
+        "system": "sys",
+        "messages": [{"role": "user", "content": "hi"}],
+        "tools": ("Read", "Write"),
+        "max_tokens": 1024,
+    }
+    params.update(overrides)
+    return build_response_cache_key(**params)  # type: ignore[arg-type]
+
+
+def test_cache_key_is_stable_and_tool_order_insensitive() -> None:
+    assert _key() == _key(tools=("Write", "Read"))
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"provider": "anthropic"},
+        {"model": "gpt-4"},
+        {"system": "other"},
+        {"messages": [{"role": "user", "content": "bye"}]},
+        {"tools": ("Read",)},
+        {"max_tokens": 2048},
+    ],
+)
+def test_cache_key_changes_with_request_content(override: dict[str, object]) -> None:
+    assert _key() != _key(**override)
+
+
+def test_put_then_get_round_trips_response(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    cache.put("ab" * 32, CachedResponse(full_text="text", cost_usd=0.5))
+
+    cached = cache.get("ab" * 32)
+
+    assert cached == CachedResponse(full_text="text", cost_usd=0.5)
+    assert cache.get("cd" * 32) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evict_removes_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=10_000)
+    for index, key in enumerate(("aa" * 32, "bb" * 32, "cc" * 32)):
+        cache.put(key, CachedResponse(full_text="x" * 100))
+        path = tmp_path / key[:2] / f"{key}.json"
+        os.utime(path, (1000 + index, 1000 + index))
+    entry_size = cache.size_bytes() // 3
+
+    removed = cache.evict(max_bytes=entry_size * 2)
+
+    assert removed == 1
+    assert cache.get("aa" * 32) is None
+    assert cache.get("cc" * 32) is not None
+
+
+def test_put_scans_only_when_over_budget(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = ResponseCache(tmp_path, max_bytes=500)
+    scans: list[int] = []
+    entries = cache._entries
+
+    def _counting_entries() -> list[tuple[float, int, Path]]:
+        scans.append(1)
+        return entries()
+
+    monkeypatch.setattr(cache, "_entries", _counting_entries)
+    cache.put("aa" * 32, CachedResponse(full_text="x" * 100))
+    cache.put("aa" * 32, CachedResponse(full_text="y" * 100))
+    assert len(scans) == 1
+
+    cache.put("bb" * 32, CachedResponse(full_text="x" * 100))
+    assert len(scans) == 1
+    cache.put("cc" * 32, CachedResponse(full_text="x" * 100))
+
+    assert len(scans) == 2
+    assert cache.size_bytes() <= 500
+
+
+def test_chat_client_replays_cached_response(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    provider = _CountingProvider()
+    monkeypatch.setattr(client_module, "get_provider", lambda **_: provider)
+    enable_response_cache(ResponseCache(tmp_path))
+    messages = [{"role": "user", "content": "hi"}]
+
+    first = list(ChatClient().stream_message(messages=messages, system="s"))
+    second = list(ChatClient().stream_message(messages=messages, system="s"))
+
+    assert provider.calls == 1
+    assert [r.text for r in first if isinstance(r, StreamChunk)] == ["hello ", "world"]
+    assert second == [
+        StreamChunk(text="hello world"),
+        StreamComplete(full_text="hello world", cost_usd=0.0),
+    ]
+
+
+def test_chat_client_bypasses_cache_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    provider = _CountingProvider()
+    monkeypatch.setattr(client_module, "get_provider", lambda **_: provider)
+    messages = [{"role": "user", "content": "hi"}]
+
+    list(ChatClient().stream_message(messages=messages))
+    list(ChatClient().stream_message(messages=messages))
+
+    assert provider.calls == 2
+
+
+def test_env_var_enables_cache_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(RESPONSE_CACHE_ENV_VAR, str(tmp_path))
+
+    cache = get_response_cache()
+
+    assert cache is not None
+    assert cache.root == tmp_path
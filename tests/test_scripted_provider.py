@@ -0,0 +1,119 @@
+"""Tests for the scripted replay provider."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from waypoints.llm.client import agent_query, get_provider, use_provider
+from waypoints.llm.providers.base import StreamChunk, StreamComplete, StreamToolUse
+from waypoints.llm.providers.scripted import (
+    ScriptedLatency,
+    ScriptedProvider,
+    ScriptedTranscript,
+)
+
+
+def _transcript() -> ScriptedTranscript:
+    return ScriptedTranscript.from_dict(
+        {
+            "turns": [
+                {
+                    "role": "builder",
+                    "session_id": "s-1",
+                    "cost_usd": 0.5,
+                    "events": [
+                        {"type": "text", "text": "Writing. "},
+                        {
+                            "type": "tool_use",
+                            "tool_name": "Write",
+                            "tool_input": {
+                                "file_path": "src/app.py",
+                                "content": "VALUE = 1\n",
+                            },
+                            "tool_output": "ok",
+                        },
+                        {
+                            "type": "tool_use",
+                            "tool_name": "Edit",
+                            "tool_input": {
+                                "file_path": "src/app.py",
+                                "old_string": "1",
+                                "new_string": "2",
+                            },
+                        },
+                        {"type": "text", "text": "Done."},
+                    ],
+                },
+                {
+                    "role": "verifier",
+                    "events": [{"type": "text", "text": "valid"}],
+                },
+            ]
+        }
+    )
+
+
+def _collect(stream: AsyncIterator[object]) -> list[object]:
+    async def run() -> list[object]:
+        return [event async for event in stream]
+
+    return asyncio.run(run())
+
+
+def test_agent_query_replays_turn_and_applies_file_tools(tmp_path: Path) -> None:
+    provider = ScriptedProvider(
+        _transcript(), latency=ScriptedLatency(first_event_ms=1, per_event_ms=1)
+    )
+
+    events = _collect(
+        provider.agent_query(prompt="build", cwd=str(tmp_path), tool_role="builder")
+    )
+
+    assert [type(event) for event in events] == [
+        StreamChunk,
+        StreamToolUse,
+        StreamToolUse,
+        StreamChunk,
+        StreamComplete,
+    ]
+    write = events[1]
+    assert isinstance(write, StreamToolUse)
+    assert write.tool_input["file_path"] == str(tmp_path / "src" / "app.py")
+    complete = events[-1]
+    assert isinstance(complete, StreamComplete)
+    assert complete.full_text == "Writing. Done."
+    assert complete.session_id == "s-1"
+    assert complete.cost_usd == 0.5
+    assert (tmp_path / "src" / "app.py").read_text() == "VALUE = 2\n"
+    assert provider.usage.calls == {"builder": 1}
+    assert provider.usage.total_latency_seconds == pytest.approx(0.005)
+    assert provider.remaining_turns() == {"verifier": 1}
+
+
+def test_agent_query_raises_when_role_exhausted(tmp_path: Path) -> None:
+    provider = ScriptedProvider(_transcript())
+
+    with pytest.raises(RuntimeError, match="exhausted for role 'chat'"):
+        list(provider.stream_message([{"role": "user", "content": "hi"}]))
+    with pytest.raises(RuntimeError, match="exhausted for role 'planner'"):
+        _collect(
+            provider.agent_query(prompt="x", cwd=str(tmp_path), tool_role="planner")
+        )
+
+
+def test_use_provider_routes_agent_query(tmp_path: Path) -> None:
+    provider = ScriptedProvider(_transcript(), apply_file_tools=False)
+
+    with use_provider(provider):
+        assert get_provider() is provider
+        chunks = _collect(
+            agent_query(prompt="verify", cwd=str(tmp_path), tool_role="verifier")
+        )
+
+    assert isinstance(chunks[-1], StreamComplete)
+    assert chunks[-1].full_text == "valid"
+    assert provider.remaining_turns() == {"builder": 1}
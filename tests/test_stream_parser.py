@@ -0,0 +1,122 @@
+"""Tests for the incremental FLY stream protocol parser."""
+
+from __future__ import annotations
+
+import random
+
+from waypoints.fly.evidence import CRITERION_PATTERN, VALIDATION_PATTERN
+from waypoints.fly.protocol import ExecutionStage, parse_stage_reports
+from waypoints.fly.stream_parser import (
+    ClarificationTag,
+    CompletionMarkerScanner,
+    CriterionTag,
+    StageReportTag,
+    StreamProtocolParser,
+    ValidationTag,
+)
+
+OUTPUT = (
+    "Starting work.\n"
+    '<execution-stage>{"stage": "analyze", "success": true, "output": "read"}'
+    "</execution-stage>\n"
+    "<validation><command>pytest -q</command><exit-code>0</exit-code>"
+    "<output>3 passed</output></validation>\n"
+    "<acceptance-criterion broken>ignored</acceptance-criterion>\n"
+    "<acceptance-criterion><index>0</index><status>verified</status>"
+    "<text>Adds items</text><evidence>test_add</evidence>"
+    "</acceptance-criterion>\n"
+    '<clarification-request>{"question": "Which file?"}</clarification-request>\n'
+    "<execution-stage>not json</execution-stage>\n"
+    "<acceptance-criterion><index>1</index><status>failed</status>"
+    "<text>Lists items</text><evidence>missing</evidence>"
+    "</acceptance-criterion>\n"
+    "<validation><command>ruff check</command><exit-code>1</exit-code>"
+    "<output>E501</output></validation> trailing <valid"
+)
+
+
+def _feed_in_pieces(text: str, sizes: list[int]) -> list[object]:
+    parser = StreamProtocolParser()
+    tags: list[object] = []
+    pos = 0
+    for size in sizes:
+        tags.extend(parser.feed(text[pos : pos + size]))
+        pos += size
+    tags.extend(parser.feed(text[pos:]))
+    return tags
+
+
+def test_parser_emits_tags_once_in_stream_order() -> None:
+    tags = _feed_in_pieces(OUTPUT, [len(OUTPUT)])
+
+    assert [type(tag) for tag in tags] == [
+        StageReportTag,
+        ValidationTag,
+        CriterionTag,
+        ClarificationTag,
+        CriterionTag,
+        ValidationTag,
+    ]
+    stage = tags[0]
+    assert isinstance(stage, StageReportTag)
+    assert stage.report.stage is ExecutionStage.ANALYZE
+    clarification = tags[3]
+    assert isinstance(clarification, ClarificationTag)
+    assert clarification.payload == {"question": "Which file?"}
+
+
+def test_parser_matches_batch_patterns_for_any_chunking() -> None:
+    expected_validations = [
+        (command, int(code), output)
+        for command, code, output in VALIDATION_PATTERN.findall(OUTPUT)
+    ]
+    expected_criteria = [
+        (int(index), status, text, evidence)
+        for index, status, text, evidence in CRITERION_PATTERN.findall(OUTPUT)
+    ]
+    expected_stages = parse_stage_reports(OUTPUT)
+    rng = random.Random(7)
+
+    for _ in range(50):
+        sizes = [rng.randint(1, 40) for _ in range(len(OUTPUT) // 10)]
+        tags = _feed_in_pieces(OUTPUT, sizes)
+
+        assert [
+            (t.command, t.exit_code, t.output)
+            for t in tags
+            if isinstance(t, ValidationTag)
+        ] == expected_validations
+        assert [
+            (t.index, t.status, t.text, t.evidence)
+            for t in tags
+            if isinstance(t, CriterionTag)
+        ] == expected_criteria
+        assert [
+            t.report for t in tags if isinstance(t, StageReportTag)
+        ] == expected_stages
+
+
+def test_parser_waits_for_unclosed_tag_without_reemitting() -> None:
+    parser = StreamProtocolParser()
+
+    assert parser.feed("<validation><command>make test</command>") == []
+    assert parser.feed("<exit-code>2</exit-code><output>") == []
+    for _ in range(100):
+        assert parser.feed("log line\n") == []
+    tags = parser.feed("</output></validation>")
+
+    assert len(tags) == 1
+    tag = tags[0]
+    assert isinstance(tag, ValidationTag)
+    assert tag.exit_code == 2
+    assert tag.output.count("log line") == 100
+    assert parser.feed(" more text") == []
+
+
+def test_completion_marker_scanner_handles_split_marker() -> None:
+    scanner = CompletionMarkerScanner("<waypoint-complete>WP-1</waypoint-complete>")
+
+    assert scanner.feed("done <waypoint-comp") is False
+    assert scanner.feed("lete>WP-1</waypoint") is False
+    assert scanner.feed("-complete>") is True
+    assert scanner.feed("anything") is True
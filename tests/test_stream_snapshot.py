@@ -0,0 +1,87 @@
+"""Tests for append-based stream snapshots and UI frame throttling."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from waypoints.runtime.stream_snapshot import FrameThrottle, StreamSnapshotWriter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_writer_appends_deltas_on_size_or_time_threshold(tmp_path: Path) -> None:
+    clock = _Clock()
+    path = tmp_path / "docs" / "spec.md"
+    writer = StreamSnapshotWriter(path, flush_interval=1.0, flush_chars=10, clock=clock)
+
+    writer.append("# Spec\n")
+    assert not path.exists()
+
+    writer.append("Body text")
+    assert path.read_text() == "# Spec\nBody text"
+
+    writer.append("!")
+    clock.now = 1.5
+    writer.append("?")
+    assert path.read_text() == "# Spec\nBody text!?"
+
+    writer.append(" tail")
+    writer.close()
+    assert path.read_text() == writer.content == "# Spec\nBody text!? tail"
+
+
+def test_finalize_replaces_snapshot_with_final_content(tmp_path: Path) -> None:
+    path = tmp_path / "spec.md"
+    writer = StreamSnapshotWriter(path, flush_chars=1)
+    writer.append("  draft  ")
+
+    writer.finalize("final")
+
+    assert path.read_text() == "final"
+    assert [p.name for p in tmp_path.iterdir()] == ["spec.md"]
+
+
+def test_finalize_keeps_streamed_file_when_content_matches(tmp_path: Path) -> None:
+    path = tmp_path / "spec.md"
+    writer = StreamSnapshotWriter(path, flush_chars=1000)
+    writer.append("same")
+
+    writer.finalize("same")
+
+    assert path.read_text() == "same"
+
+
+def test_write_failures_are_logged_once_and_swallowed(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("not a directory")
+    writer = StreamSnapshotWriter(blocker / "spec.md", flush_chars=1)
+
+    writer.append("a")
+    writer.append("b")
+    writer.finalize("final")
+
+    assert writer.content == "ab"
+    failures = [r for r in caplog.records if "stream snapshot" in r.getMessage()]
+    assert len(failures) == 1
+
+
+def test_frame_throttle_limits_update_rate() -> None:
+    clock = _Clock()
+    throttle = FrameThrottle(0.1, clock=clock)
+
+    assert throttle.ready()
+    assert not throttle.ready()
+    clock.now = 0.05
+    assert not throttle.ready()
+    clock.now = 0.1
+    assert throttle.ready()
@@ -42,21 +42,21 @@ class _FakeRow:
 
 class _FakeBrowser:
     def __init__(self) -> None:
-        self.set_spec_calls: list[dict[str, Any]] = []
+        self.set_index_calls: list[dict[str, Any]] = []
         self.focused = False
 
-    def set_spec(
+    def set_index(
         self,
-        spec: Any,
+        index: Any,
         *,
         source_label: str,
         metadata: dict[str, Any] | None,
         checksums: dict[str, str],
         select_first: bool,
     ) -> None:
-        self.set_spec_calls.append(
+        self.set_index_calls.append(
             {
-                "spec": spec,
+                "index": index,
                 "source_label": source_label,
                 "metadata": metadata,
                 "checksums": checksums,
@@ -168,7 +168,7 @@ def test_genspec_viewer_load_spec_populates_browser(
     notifications: list[tuple[str, str]] = []
 
     monkeypatch.setattr(
-        "waypoints.genspec.viewer.load_genspec",
+        "waypoints.genspec.viewer.open_genspec_index",
         lambda _path: ({"version": 1}, None, {"manifest": "abc"}),
     )
     monkeypatch.setattr(screen, "query_one", lambda *_args, **_kwargs: browser)
@@ -183,8 +183,8 @@ def test_genspec_viewer_load_spec_populates_browser(
     screen._load_spec()
 
     assert notifications == []
-    assert len(browser.set_spec_calls) == 1
-    assert browser.set_spec_calls[0]["source_label"] == "jsonl"
+    assert len(browser.set_index_calls) == 1
+    assert browser.set_index_calls[0]["source_label"] == "jsonl"
     assert browser.focused is True
 
 
@@ -197,7 +197,7 @@ def test_genspec_viewer_load_spec_surfaces_error(
     def _raise(_path: Path) -> tuple[object, object, object]:
         raise ValueError("broken spec")
 
-    monkeypatch.setattr("waypoints.genspec.viewer.load_genspec", _raise)
+    monkeypatch.setattr("waypoints.genspec.viewer.open_genspec_index", _raise)
     monkeypatch.setattr(
         screen,
         "notify",
@@ -0,0 +1,69 @@
+"""Tests for frozen workspace snapshots used by host validation."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from waypoints.fly import workspace_snapshot
+from waypoints.fly.stack import ValidationCommand
+from waypoints.fly.workspace_snapshot import create_workspace_snapshot
+
+
+def test_snapshot_is_isolated_from_later_writes(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    module = tmp_path / "src" / "app.py"
+    module.write_text("VERSION = 1\n")
+    script = tmp_path / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    (tmp_path / "link.py").symlink_to("src/app.py")
+    for metadata in ("sessions", "receipts"):
+        (tmp_path / metadata).mkdir()
+        (tmp_path / metadata / "log.jsonl").write_text("{}\n")
+
+    snapshot = create_workspace_snapshot(tmp_path)
+    with module.open("r+") as handle:  # in-place rewrite, same inode
+        handle.write("VERSION = 2\n")
+
+    frozen = snapshot.path
+    assert frozen.is_relative_to(tmp_path / ".waypoints" / "snapshots")
+    assert (frozen / "src" / "app.py").read_text() == "VERSION = 1\n"
+    assert os.access(frozen / "run.sh", os.X_OK)
+    assert os.readlink(frozen / "link.py") == "src/app.py"
+    assert sorted(p.name for p in frozen.iterdir()) == ["link.py", "run.sh", "src"]
+    assert snapshot.method in ("reflink", "copy")
+
+    snapshot.remove()
+    assert not frozen.exists()
+
+
+def test_map_commands_moves_working_directories_into_snapshot(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "web").mkdir()
+    snapshot = create_workspace_snapshot(tmp_path)
+    commands = [
+        ValidationCommand(name="tests", command="npm test", category="test"),
+        ValidationCommand(
+            name="lint", command="eslint .", category="lint", cwd=tmp_path / "web"
+        ),
+    ]
+
+    mapped = snapshot.map_commands(commands)
+
+    assert mapped[0].cwd is None
+    assert mapped[1].cwd == snapshot.path / "web"
+    assert commands[1].cwd == tmp_path / "web"
+
+
+def test_stale_snapshots_are_removed(tmp_path: Path) -> None:
+    old = create_workspace_snapshot(tmp_path)
+    stale = time.time() - workspace_snapshot.STALE_SNAPSHOT_SECONDS - 60
+    os.utime(old.path, (stale, stale))
+
+    fresh = create_workspace_snapshot(tmp_path)
+
+    assert not old.path.exists()
+    assert fresh.path.exists()